@@ -5,11 +5,15 @@
 
 import os
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
 from langchain_openai import ChatOpenAI
 
 from bazi_calculator.core.calendar import BaziCalendar
+from bazi_calculator.core.chart_index import ChartIndex
+from bazi_calculator.core.lunar import LunarCalendar
+from bazi_calculator.core.solar_time import TrueSolarTime
 from bazi_calculator.core.wuxing import WuxingAnalyzer
+from bazi_calculator.core.wuxing_batch import BatchWuxingAnalyzer
 from bazi_calculator.tools.bazi.time_parser import parse_birth_time
 from bazi_calculator.tools.bazi.year_pillar import calculate_year_pillar
 from bazi_calculator.tools.bazi.month_pillar import calculate_month_pillar
@@ -24,11 +28,13 @@ class BaziAgent:
     整合所有八字计算工具，提供完整的八字计算和五行分析功能
     """
 
-    def __init__(self, llm: Optional[ChatOpenAI] = None):
+    def __init__(self, llm: Optional[ChatOpenAI] = None, chart_index: Optional[ChartIndex] = None):
         """初始化八字Agent
 
         Args:
             llm: 语言模型实例，如果为None则使用默认Qwen
+            chart_index: 八字区间索引，如果为None则读取环境变量 BAZI_CHART_INDEX
+                指定的索引文件；均未提供时逐次计算四柱
         """
         self.llm = llm or ChatOpenAI(
             model=os.getenv('QWEN_MODEL', 'qwen-flash'),
@@ -36,12 +42,16 @@ class BaziAgent:
             base_url=os.getenv('QWEN_BASE_URL'),
             temperature=0.3
         )
+        if chart_index is None and os.getenv('BAZI_CHART_INDEX'):
+            chart_index = ChartIndex.load(os.getenv('BAZI_CHART_INDEX'))
+        self.chart_index = chart_index
 
     def calculate_bazi(
         self,
         time_description: str,
         gender: str,
-        calendar_type: str = "公历"
+        calendar_type: str = "公历",
+        location: Optional[Union[str, float]] = None
     ) -> Dict[str, Any]:
         """计算完整的八字
 
@@ -49,6 +59,7 @@ class BaziAgent:
             time_description: 时间描述
             gender: 性别
             calendar_type: 历法类型
+            location: 出生地经度或城市名称，提供时按真太阳时排盘
 
         Returns:
             完整的八字结果
@@ -58,59 +69,37 @@ class BaziAgent:
             {"time_description": time_description, "gender": gender, "calendar_type": calendar_type}
         )
 
-        birth_date = datetime(
-            birth_info["year"],
-            birth_info["month"],
-            birth_info["day"],
-            birth_info["hour"],
-            birth_info["minute"],
-        )
-
-        # 计算四柱（直接调用核心函数，避免Tool装饰器的验证问题）
-        year_pillar = BaziCalendar.get_year_pillar(birth_date)
-        month_pillar = BaziCalendar.get_month_pillar(
-            birth_date,
-            year_pillar[0]  # gan
-        )
-        day_pillar = BaziCalendar.get_day_pillar(birth_date)
-        hour_pillar = BaziCalendar.get_hour_pillar(
-            birth_date,
-            day_pillar[0],  # gan
-        )
-
-        # 组装八字
-        bazi = {
-            "year": {
-                "gan": year_pillar[0],
-                "zhi": year_pillar[1],
-                "gan_wuxing": year_pillar[2],
-                "zhi_wuxing": year_pillar[3],
-                "full": year_pillar[0] + year_pillar[1]
-            },
-            "month": {
-                "gan": month_pillar[0],
-                "zhi": month_pillar[1],
-                "gan_wuxing": month_pillar[2],
-                "zhi_wuxing": month_pillar[3],
-                "full": month_pillar[0] + month_pillar[1],
-                "jieqi": month_pillar[4]
-            },
-            "day": {
-                "gan": day_pillar[0],
-                "zhi": day_pillar[1],
-                "gan_wuxing": day_pillar[2],
-                "zhi_wuxing": day_pillar[3],
-                "full": day_pillar[0] + day_pillar[1],
-                "day_master": day_pillar[0]
-            },
-            "hour": {
-                "gan": hour_pillar[0],
-                "zhi": hour_pillar[1],
-                "gan_wuxing": hour_pillar[2],
-                "zhi_wuxing": hour_pillar[3],
-                "full": hour_pillar[0] + hour_pillar[1]
-            },
-        }
+        # 农历输入先换算为公历再排盘
+        if birth_info.get("calendar_type") == "农历":
+            birth_date = LunarCalendar.to_solar_datetime(
+                birth_info["year"],
+                birth_info["month"],
+                birth_info["day"],
+                birth_info["hour"],
+                birth_info["minute"],
+                is_leap=birth_info.get("is_leap_month", False),
+            )
+        else:
+            birth_date = datetime(
+                birth_info["year"],
+                birth_info["month"],
+                birth_info["day"],
+                birth_info["hour"],
+                birth_info["minute"],
+            )
+
+        # 真太阳时修正
+        if location is not None:
+            birth_date = TrueSolarTime.correct(birth_date, location)
+            birth_info["true_solar_time"] = birth_date
+
+        # 计算四柱：索引覆盖的时刻一次查找，否则直接调用核心函数
+        if self.chart_index is not None and self.chart_index.covers(birth_date):
+            codes = self.chart_index.lookup_codes(birth_date)
+        else:
+            codes = BaziCalendar.get_chart_codes(birth_date)
+        bazi = BaziCalendar.codes_to_pillars(codes[:8], codes[8], birth_date, include_shensha=True)
+        del bazi["birth_info"]
 
         # 五行分析
         wuxing_analysis = WuxingAnalyzer.analyze_comprehensive(bazi)
@@ -121,6 +110,48 @@ class BaziAgent:
             "wuxing_analysis": wuxing_analysis,
         }
 
+    def calculate_bazi_hour_unknown(
+        self,
+        time_description: str,
+        gender: str,
+        calendar_type: str = "公历"
+    ) -> Dict[str, Any]:
+        """时辰未知时计算当日十二个时辰的八字
+
+        年、月、日柱只计算一次，十二个时辰的干支编码一次交给 BatchWuxingAnalyzer 做五行分析，
+        并汇总用神、喜神、强弱在各时辰间是否一致。
+
+        Args:
+            time_description: 时间描述（只取日期部分，可不含时辰）
+            gender: 性别
+            calendar_type: 历法类型
+
+        Returns:
+            包含 birth_info、variants（按时支排列，每项含 hour_zhi、bazi、
+            wuxing_analysis）与 summary（见 WuxingAnalyzer.summarize_stability）的字典
+        """
+        birth_info = parse_birth_time.invoke(
+            {"time_description": time_description, "gender": gender, "calendar_type": calendar_type}
+        )
+        birth_info["hour_unknown"] = True
+
+        variant_codes = BaziCalendar.get_hour_variant_codes(birth_info["date"])
+        bazis = []
+        for codes in variant_codes:
+            bazi = BaziCalendar.codes_to_pillars(codes[:8], codes[8], birth_info["date"])
+            del bazi["birth_info"]
+            bazis.append(bazi)
+        analyses = BatchWuxingAnalyzer.analyze([codes[:8] for codes in variant_codes]).to_dicts()
+
+        return {
+            "birth_info": birth_info,
+            "variants": [
+                {"hour_zhi": bazi["hour"]["zhi"], "bazi": bazi, "wuxing_analysis": analysis}
+                for bazi, analysis in zip(bazis, analyses)
+            ],
+            "summary": WuxingAnalyzer.summarize_stability(analyses),
+        }
+
     def format_bazi_result(self, result: Dict[str, Any]) -> str:
         """格式化八字结果为文本
 
@@ -145,6 +176,8 @@ class BaziAgent:
                     f"{birth_info['hour']:02d}时{birth_info['minute']:02d}分")
         output.append(f"性别：{birth_info['gender']}")
         output.append(f"历法：{birth_info.get('calendar_type', '公历')}")
+        if birth_info.get("true_solar_time"):
+            output.append(f"真太阳时：{birth_info['true_solar_time']:%Y-%m-%d %H:%M}")
 
         # 八字四柱
         output.append("\n【八字四柱】")
@@ -152,6 +185,10 @@ class BaziAgent:
         output.append(f"月柱：{bazi['month']['full']}（{bazi['month']['gan_wuxing']} {bazi['month']['zhi_wuxing']}）节气：{bazi['month']['jieqi']}")
         output.append(f"日柱：{bazi['day']['full']}（{bazi['day']['gan_wuxing']} {bazi['day']['zhi_wuxing']}）日主：{bazi['day']['gan']}")
         output.append(f"时柱：{bazi['hour']['full']}（{bazi['hour']['gan_wuxing']} {bazi['hour']['zhi_wuxing']}）")
+        if "nayin" in bazi["year"]:
+            output.append("纳音：" + " ".join(bazi[pillar]["nayin"] for pillar in ("year", "month", "day", "hour")))
+        if bazi.get("shensha"):
+            output.append(f"神煞：{'、'.join(bazi['shensha']['names']) or '无'}")
 
         # 五行分析
         output.append("\n【五行统计】")
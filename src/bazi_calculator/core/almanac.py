@@ -0,0 +1,171 @@
+"""黄历生成模块
+
+此模块按日生成黄历记录（年柱、月柱、日柱、所在节气及当日交节时刻）：
+节气每年只取一次（预计算表、节气历表或求解），日柱按六十日周期逐日递推，
+记录逐条生成，可边生成边写入 JSONL 或 CSV 文件。
+
+命令行生成：
+    python -m bazi_calculator.core.almanac --start 1900 --end 2099 --output almanac.jsonl
+"""
+
+import argparse
+import csv
+import json
+import time
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from bazi_calculator.core.calendar import BaziCalendar
+from bazi_calculator.core.ganzhi import GanzhiCalculator
+from bazi_calculator.core.jieqi import JieqiCalculator
+
+
+class Almanac:
+    """黄历生成器
+
+    提供逐日黄历记录的生成与 JSONL/CSV 输出功能。
+    """
+
+    # 记录字段（CSV 列顺序）
+    FIELDS = [
+        "date", "weekday", "year_pillar", "month_pillar", "day_pillar",
+        "jieqi", "crossing_jieqi", "crossing_time",
+    ]
+
+    # 输出格式
+    FORMATS = ("jsonl", "csv")
+
+    @staticmethod
+    def _iter_jieqi(year: int, jieqi_index: int) -> Iterator[Tuple[int, int, datetime]]:
+        """从指定节气起按时间顺序逐个生成节气，每年的节气只取一次
+
+        Yields:
+            (节气所属年份, 节气索引, 节气时刻) 元组
+        """
+        while True:
+            julian_days = JieqiCalculator._get_year_jieqi_jds(year)
+            for index in range(jieqi_index, 24):
+                yield year, index, JieqiCalculator._table_jd_to_datetime(julian_days[index])
+            year, jieqi_index = year + 1, 0
+
+    @staticmethod
+    def iter_days(start: date, end: date) -> Iterator[Dict[str, str]]:
+        """逐日生成黄历记录
+
+        年柱、月柱与所在节气取当日0时的值；当日有节气交接时，
+        crossing_jieqi、crossing_time 给出交接的节气与时刻，否则为空字符串。
+
+        Args:
+            start: 起始日期
+            end: 结束日期（不含）
+
+        Yields:
+            字段见 FIELDS 的记录字典，值均为字符串
+        """
+        day_start = datetime(start.year, start.month, start.day)
+        end_start = datetime(end.year, end.month, end.day)
+        if day_start >= end_start:
+            return
+
+        jieqi_year, jieqi_index = JieqiCalculator.locate_jieqi(day_start)
+        terms = Almanac._iter_jieqi(jieqi_year, jieqi_index)
+        next(terms)
+        next_year, next_index, next_time = next(terms)
+
+        year_gan, year_zhi = BaziCalendar.get_year_codes(jieqi_year)
+        month_gan, month_zhi = BaziCalendar.get_month_codes(year_gan, jieqi_index)
+        day_index = (day_start.toordinal() - BaziCalendar.BASE_ORDINAL) % 60
+
+        one_day = timedelta(days=1)
+        while day_start < end_start:
+            day_end = day_start + one_day
+            record = {
+                "date": day_start.strftime("%Y-%m-%d"),
+                "weekday": str(day_start.isoweekday()),
+                "year_pillar": GanzhiCalculator.TIANGAN[year_gan] + GanzhiCalculator.DIZHI[year_zhi],
+                "month_pillar": GanzhiCalculator.TIANGAN[month_gan] + GanzhiCalculator.DIZHI[month_zhi],
+                "day_pillar": GanzhiCalculator.JIAZI[day_index],
+                "jieqi": JieqiCalculator.JIEQI_NAMES[jieqi_index],
+                "crossing_jieqi": "",
+                "crossing_time": "",
+            }
+
+            # 两个节气相隔约15天，一天之内至多交接一次
+            if next_time < day_end:
+                record["crossing_jieqi"] = JieqiCalculator.JIEQI_NAMES[next_index]
+                record["crossing_time"] = next_time.strftime("%Y-%m-%d %H:%M:%S")
+                jieqi_year, jieqi_index = next_year, next_index
+                year_gan, year_zhi = BaziCalendar.get_year_codes(jieqi_year)
+                month_gan, month_zhi = BaziCalendar.get_month_codes(year_gan, jieqi_index)
+                next_year, next_index, next_time = next(terms)
+
+            yield record
+
+            day_start = day_end
+            day_index = (day_index + 1) % 60
+
+    @staticmethod
+    def iter_years(start_year: int, end_year: int) -> Iterator[Dict[str, str]]:
+        """逐日生成整年（公历）的黄历记录
+
+        Args:
+            start_year: 起始年份
+            end_year: 结束年份（含）
+
+        Yields:
+            记录字典，同 iter_days
+        """
+        return Almanac.iter_days(date(start_year, 1, 1), date(end_year + 1, 1, 1))
+
+    @staticmethod
+    def write(records: Iterable[Dict[str, str]], file: TextIO, fmt: str = "jsonl") -> int:
+        """将记录逐条写入文件
+
+        Args:
+            records: 记录迭代器
+            file: 已打开的文本文件（CSV 应以 newline="" 打开）
+            fmt: 输出格式，"jsonl" 或 "csv"
+
+        Returns:
+            写入的记录数
+
+        Raises:
+            ValueError: 无效的输出格式
+        """
+        if fmt not in Almanac.FORMATS:
+            raise ValueError(f"无效的输出格式: {fmt}")
+
+        count = 0
+        if fmt == "csv":
+            writer = csv.DictWriter(file, fieldnames=Almanac.FIELDS)
+            writer.writeheader()
+            for record in records:
+                writer.writerow(record)
+                count += 1
+        else:
+            for record in records:
+                file.write(json.dumps(record, ensure_ascii=False))
+                file.write("\n")
+                count += 1
+        return count
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """命令行入口：生成黄历文件"""
+    parser = argparse.ArgumentParser(description="生成黄历文件")
+    parser.add_argument("--start", type=int, default=1900, help="起始年份")
+    parser.add_argument("--end", type=int, default=2100, help="结束年份（含）")
+    parser.add_argument("--format", choices=Almanac.FORMATS, help="输出格式（默认按文件扩展名）")
+    parser.add_argument("--output", required=True, help="输出文件路径")
+    args = parser.parse_args(argv)
+
+    fmt = args.format or ("csv" if args.output.endswith(".csv") else "jsonl")
+    started = time.perf_counter()
+    with open(args.output, "w", encoding="utf-8", newline="") as file:
+        count = Almanac.write(Almanac.iter_years(args.start, args.end), file, fmt)
+    elapsed = time.perf_counter() - started
+    print(f"已生成 {args.start}-{args.end} 年黄历：{args.output}（{count} 天，耗时 {elapsed:.2f} 秒）")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,339 @@
+"""八字分析全表模块
+
+五行综合分析（WuxingAnalyzer.analyze_comprehensive）与格局判断
+（MingGeAnalyzer.determine_pattern）只取决于八个干支。年柱、日柱各有六十甲子，
+月干由年干与月支按五虎遁确定，时干由日干与时支按五鼠遁确定，因此可达的八字共
+60 × 12 × 60 × 12 = 518400 盘。此模块离线枚举全部八字，每盘保存一条16字节的记录，
+运行时由干支编码算出记录序号直接读取：
+
+    序号 = ((年柱甲子 × 12 + 月支) × 60 + 日柱甲子) × 12 + 时支
+
+记录字段（均为 uint8）：
+    wuxing_count[5]：五行数量，按 WUXING（金、木、水、火、土）
+    scores[6]：强弱评分的两倍（各分值均为0.5的整数倍），按 SCORE_NAMES
+    strength、yong_shen、xi_shen、ji_shen：强弱索引与用神、喜神、忌神五行编号
+    pattern：格局编号，见 MingGeAnalyzer.PATTERNS
+
+文件格式（小端序）：
+    文件头（32字节）：魔数 b"BZTABLE\\0"、格式版本（uint16）、记录字节数（uint16）、
+        记录数（uint32），其余填充
+    记录数组：记录数条记录
+
+读取时以内存映射方式打开文件，不做任何解码。
+
+命令行生成全表并测试查询吞吐量：
+    python -m bazi_calculator.core.analysis_table --output analysis.tbl --benchmark
+"""
+
+import argparse
+import mmap
+import struct
+import time
+from typing import BinaryIO, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from bazi_calculator.core.calendar import BaziCalendar
+from bazi_calculator.core.ganzhi import GanzhiCalculator
+from bazi_calculator.core.mingge import MingGeAnalyzer
+from bazi_calculator.core.wuxing_batch import BatchWuxingAnalyzer, WuxingColumns
+
+
+# 记录结构
+RECORD = np.dtype([
+    ("wuxing_count", "u1", (5,)),
+    ("scores", "u1", (6,)),
+    ("strength", "u1"),
+    ("yong_shen", "u1"),
+    ("xi_shen", "u1"),
+    ("ji_shen", "u1"),
+    ("pattern", "u1"),
+])
+
+# 可达八字总数
+SIZE = 60 * 12 * 60 * 12
+
+# 格局编号表
+PATTERNS = MingGeAnalyzer.PATTERNS
+
+# 五虎遁、五鼠遁编码表的数组形式；五虎遁按月支重排
+_WUHU_DUN_BY_ZHI = np.array(BaziCalendar.WUHU_DUN_CODES, dtype=np.intp)[:, (np.arange(12) - 2) % 12]
+_WUSHU_DUN_CODES = np.array(BaziCalendar.WUSHU_DUN_CODES, dtype=np.intp)
+
+
+class AnalysisTable:
+    """八字分析全表
+
+    records[i] 为序号 i 对应八字的分析记录。
+    """
+
+    # 文件魔数与格式版本
+    MAGIC = b"BZTABLE\0"
+    VERSION = 1
+
+    # 文件头结构
+    HEADER = struct.Struct("<8sHHI16x")
+
+    def __init__(self, records: np.ndarray):
+        """初始化全表
+
+        Args:
+            records: 按序号排列的记录数组（dtype 为 RECORD）
+        """
+        self.records = records
+        self._map: Optional[mmap.mmap] = None
+        self._file: Optional[BinaryIO] = None
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    @staticmethod
+    def index(codes: Sequence[int]) -> int:
+        """由干支编码计算记录序号
+
+        Args:
+            codes: (年干, 年支, 月干, 月支, 日干, 日支, 时干, 时支) 编码
+
+        Returns:
+            记录序号
+
+        Raises:
+            ValueError: 不可达的八字（干支阴阳不符或月干、时干不合五虎遁、五鼠遁）
+        """
+        year_gan, year_zhi, month_gan, month_zhi, day_gan, day_zhi, hour_gan, hour_zhi = codes[:8]
+        if year_gan % 2 != year_zhi % 2 or day_gan % 2 != day_zhi % 2 \
+                or month_gan != BaziCalendar.WUHU_DUN_CODES[year_gan][(month_zhi - 2) % 12] \
+                or hour_gan != BaziCalendar.WUSHU_DUN_CODES[day_gan][hour_zhi]:
+            raise ValueError(f"不可达的八字编码: {tuple(codes[:8])}")
+        year = GanzhiCalculator.get_jiazi_index(year_gan, year_zhi)
+        day = GanzhiCalculator.get_jiazi_index(day_gan, day_zhi)
+        return int(((year * 12 + month_zhi) * 60 + day) * 12 + hour_zhi)
+
+    @staticmethod
+    def index_many(codes: np.ndarray) -> np.ndarray:
+        """批量计算记录序号
+
+        Args:
+            codes: 形状为 (N, 8) 的干支编码数组（如 BaziColumns.codes）
+
+        Returns:
+            序号数组
+
+        Raises:
+            ValueError: 存在不可达的八字
+        """
+        codes = np.asarray(codes, dtype=np.intp).reshape(-1, 8)
+        year_gan, year_zhi, month_gan, month_zhi, day_gan, day_zhi, hour_gan, hour_zhi = codes.T
+        if np.any((year_gan % 2 != year_zhi % 2) | (day_gan % 2 != day_zhi % 2)
+                  | (month_gan != _WUHU_DUN_BY_ZHI[year_gan, month_zhi])
+                  | (hour_gan != _WUSHU_DUN_CODES[day_gan, hour_zhi])):
+            raise ValueError("存在不可达的八字编码")
+        year = (6 * year_gan - 5 * year_zhi) % 60
+        day = (6 * day_gan - 5 * day_zhi) % 60
+        indices: np.ndarray = ((year * 12 + month_zhi) * 60 + day) * 12 + hour_zhi
+        return indices
+
+    @staticmethod
+    def codes_from_index(indices: np.ndarray) -> np.ndarray:
+        """由记录序号还原干支编码
+
+        Args:
+            indices: 序号数组
+
+        Returns:
+            形状为 (N, 8) 的干支编码数组
+        """
+        indices = np.asarray(indices, dtype=np.intp).ravel()
+        rest, hour_zhi = np.divmod(indices, 12)
+        rest, day = np.divmod(rest, 60)
+        year, month_zhi = np.divmod(rest, 12)
+        year_gan, day_gan = year % 10, day % 10
+        return np.column_stack([
+            year_gan, year % 12, _WUHU_DUN_BY_ZHI[year_gan, month_zhi], month_zhi,
+            day_gan, day % 12, _WUSHU_DUN_CODES[day_gan, hour_zhi], hour_zhi,
+        ])
+
+    @staticmethod
+    def build() -> "AnalysisTable":
+        """枚举全部可达八字并构建全表
+
+        Returns:
+            AnalysisTable 对象
+        """
+        codes = AnalysisTable.codes_from_index(np.arange(SIZE))
+        wuxing = BatchWuxingAnalyzer.analyze(codes)
+        records = np.zeros(SIZE, dtype=RECORD)
+        records["wuxing_count"] = wuxing.wuxing_count
+        records["scores"] = wuxing.scores * 2
+        records["strength"] = wuxing.strength
+        records["yong_shen"] = wuxing.yong_shen
+        records["xi_shen"] = wuxing.xi_shen
+        records["ji_shen"] = wuxing.ji_shen
+        records["pattern"] = MingGeAnalyzer.determine_pattern_many(codes, wuxing)
+        return AnalysisTable(records)
+
+    def save(self, path: str) -> int:
+        """写入全表文件
+
+        Args:
+            path: 输出文件路径
+
+        Returns:
+            写入的字节数
+        """
+        with open(path, "wb") as f:
+            written = f.write(AnalysisTable.HEADER.pack(
+                AnalysisTable.MAGIC, AnalysisTable.VERSION, RECORD.itemsize, len(self.records)
+            ))
+            written += f.write(np.ascontiguousarray(self.records).tobytes())
+        return written
+
+    @staticmethod
+    def load(path: str) -> "AnalysisTable":
+        """以内存映射方式打开全表文件
+
+        Args:
+            path: 全表文件路径
+
+        Returns:
+            AnalysisTable 对象
+
+        Raises:
+            ValueError: 文件格式无效
+        """
+        f = open(path, "rb")
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            f.close()
+            raise ValueError(f"无效的八字分析全表文件: {path}")
+
+        header_size = AnalysisTable.HEADER.size
+        if len(mapped) >= header_size:
+            magic, version, record_size, count = AnalysisTable.HEADER.unpack_from(mapped, 0)
+        else:
+            magic, version, record_size, count = b"", 0, 0, 0
+        if magic != AnalysisTable.MAGIC or version != AnalysisTable.VERSION \
+                or record_size != RECORD.itemsize or count != SIZE \
+                or len(mapped) != header_size + count * record_size:
+            mapped.close()
+            f.close()
+            raise ValueError(f"无效的八字分析全表文件: {path}")
+
+        table = AnalysisTable(np.frombuffer(mapped, dtype=RECORD, count=count, offset=header_size))
+        table._map = mapped
+        table._file = f
+        return table
+
+    def close(self) -> None:
+        """关闭全表文件（仅对 load 打开的全表有效）"""
+        if self._map is not None:
+            self.records = np.empty(0, dtype=RECORD)
+            self._map.close()
+            self._map = None
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __enter__(self) -> "AnalysisTable":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def lookup_record(self, codes: Sequence[int]) -> Tuple:
+        """查找八字的分析记录
+
+        Args:
+            codes: (年干, 年支, 月干, 月支, 日干, 日支, 时干, 时支) 编码
+
+        Returns:
+            (五行数量, 强弱评分, 强弱索引, 用神, 喜神, 忌神, 格局编号) 元组，
+            五行数量与评分为元组，其余为整数
+        """
+        record = self.records[AnalysisTable.index(codes)]
+        return (
+            tuple(record["wuxing_count"].tolist()),
+            tuple((record["scores"] / 2).tolist()),
+            int(record["strength"]), int(record["yong_shen"]), int(record["xi_shen"]),
+            int(record["ji_shen"]), int(record["pattern"]),
+        )
+
+    def lookup_many(self, codes: np.ndarray) -> Tuple[WuxingColumns, np.ndarray]:
+        """批量查找
+
+        Args:
+            codes: 形状为 (N, 8) 的干支编码数组
+
+        Returns:
+            (WuxingColumns 对象, 格局编号数组) 元组
+        """
+        codes = np.asarray(codes, dtype=np.intp).reshape(-1, 8)
+        records = self.records[AnalysisTable.index_many(codes)]
+        wuxing = WuxingColumns(
+            codes[:, 4].astype(np.int8),
+            records["wuxing_count"].astype(np.int8),
+            records["scores"] / 2,
+            records["strength"].astype(np.int8),
+            records["yong_shen"].astype(np.int8),
+            records["xi_shen"].astype(np.int8),
+            records["ji_shen"].astype(np.int8),
+        )
+        return wuxing, records["pattern"]
+
+    def lookup(self, codes: Sequence[int]) -> Dict:
+        """查找八字的五行综合分析与格局
+
+        Args:
+            codes: (年干, 年支, 月干, 月支, 日干, 日支, 时干, 时支) 编码
+
+        Returns:
+            字典：wuxing 同 WuxingAnalyzer.analyze_comprehensive，
+            pattern 同 MingGeAnalyzer.determine_pattern
+        """
+        wuxing, patterns = self.lookup_many(np.array([codes[:8]]))
+        analysis = wuxing.to_dict(0)
+        return {
+            "wuxing": analysis,
+            "pattern": MingGeAnalyzer.describe_pattern(int(patterns[0]), codes, analysis["strength"]),
+        }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """命令行入口：生成八字分析全表文件"""
+    parser = argparse.ArgumentParser(description="生成八字分析全表文件")
+    parser.add_argument("--output", required=True, help="输出文件路径")
+    parser.add_argument("--benchmark", action="store_true", help="测试查询吞吐量")
+    parser.add_argument("--count", type=int, default=100000, help="测试查询的随机八字数量")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    table = AnalysisTable.build()
+    size = table.save(args.output)
+    elapsed = time.perf_counter() - started
+    print(f"已生成八字分析全表：{args.output}（{len(table)} 条记录，{size} 字节，耗时 {elapsed:.2f} 秒）")
+
+    if args.benchmark:
+        rng = np.random.default_rng(0)
+        codes = AnalysisTable.codes_from_index(rng.integers(0, SIZE, args.count))
+        chart_codes = [tuple(row) for row in codes.tolist()]
+
+        started = time.perf_counter()
+        with AnalysisTable.load(args.output) as loaded:
+            load_time = time.perf_counter() - started
+
+            started = time.perf_counter()
+            for item in chart_codes:
+                loaded.lookup_record(item)
+            single = time.perf_counter() - started
+
+            started = time.perf_counter()
+            loaded.lookup_many(codes)
+            batch = time.perf_counter() - started
+
+        print(f"加载耗时 {load_time * 1000:.3f} 毫秒，逐盘查询 {args.count / single:,.0f} 盘/秒，"
+              f"批量查询 {args.count / batch:,.0f} 盘/秒")
+
+
+if __name__ == "__main__":
+    main()
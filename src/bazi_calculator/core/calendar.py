@@ -4,9 +4,24 @@
 """
 
 from datetime import datetime, timedelta
-from typing import Tuple
+from typing import TYPE_CHECKING, List, Optional, Tuple
 from bazi_calculator.core.ganzhi import GanzhiCalculator
+from bazi_calculator.core.shensha import ShenshaCalculator
 from bazi_calculator.core.jieqi import JieqiCalculator
+from bazi_calculator.core.solar_time import Location, TrueSolarTime
+
+if TYPE_CHECKING:
+    from bazi_calculator.core.calendar_batch import BaziColumns, DatetimeArray
+
+
+def _generate_wuhu_dun_codes() -> list:
+    """生成五虎遁月干编码表：[年干][月序（寅月为0）] -> 月干索引"""
+    return [[((year_gan % 5) * 2 + 2 + order) % 10 for order in range(12)] for year_gan in range(10)]
+
+
+def _generate_wushu_dun_codes() -> list:
+    """生成五鼠遁时干编码表：[日干][时支] -> 时干索引"""
+    return [[((day_gan % 5) * 2 + hour_zhi) % 10 for hour_zhi in range(12)] for day_gan in range(10)]
 
 
 class BaziCalendar:
@@ -51,6 +66,266 @@ class BaziCalendar:
         ["壬", "癸", "甲", "乙", "丙", "丁", "戊", "己", "庚", "辛", "壬", "癸"],  # 癸日
     ]
     
+    # 整数编码内核使用的查找表
+    # 五虎遁月干编码表，按月序（寅月为0）覆盖全部十二个月
+    WUHU_DUN_CODES = _generate_wuhu_dun_codes()
+    
+    # 五鼠遁时干编码表，按时支索引排列
+    WUSHU_DUN_CODES = _generate_wushu_dun_codes()
+    
+    # 节气索引到月支索引：立春、雨水为寅月，依此类推
+    JIEQI_MONTH_ZHI = [(idx // 2 + 2) % 12 for idx in range(24)]
+    
+    # 钟点（0-23时）到时支索引：23时起为子时
+    HOUR_ZHI = [((hour + 1) // 2) % 12 for hour in range(24)]
+    
+    # 基准日期的序数（datetime.toordinal）
+    BASE_ORDINAL = BASE_DATE.toordinal()
+    
+    # 各时支在当日的起始钟点：子时取当日0时，其余为 2 × 时支 - 1
+    HOUR_ZHI_START = [0] + [2 * zhi - 1 for zhi in range(1, 12)]
+    
+    @staticmethod
+    def get_year_codes(year: int) -> Tuple[int, int]:
+        """根据节气年份计算年柱干支编码
+        
+        Args:
+            year: 以立春为界的年份
+            
+        Returns:
+            (年干索引, 年支索引) 元组
+        """
+        # 从公元4年甲子年起算
+        return (year - 4) % 10, (year - 4) % 12
+    
+    @staticmethod
+    def get_month_codes(year_gan: int, jieqi_index: int) -> Tuple[int, int]:
+        """根据年干编码与节气索引计算月柱干支编码（五虎遁）
+        
+        Args:
+            year_gan: 年干索引（0-9）
+            jieqi_index: 节气索引（0-23）
+            
+        Returns:
+            (月干索引, 月支索引) 元组
+        """
+        return (
+            BaziCalendar.WUHU_DUN_CODES[year_gan][jieqi_index // 2],
+            BaziCalendar.JIEQI_MONTH_ZHI[jieqi_index],
+        )
+    
+    @staticmethod
+    def get_day_codes(ordinal: int) -> Tuple[int, int]:
+        """根据日期序数计算日柱干支编码
+        
+        Args:
+            ordinal: 日期序数（date.toordinal()）
+            
+        Returns:
+            (日干索引, 日支索引) 元组
+        """
+        days_diff = ordinal - BaziCalendar.BASE_ORDINAL
+        return days_diff % 10, days_diff % 12
+    
+    @staticmethod
+    def get_hour_codes(day_gan: int, hour: int) -> Tuple[int, int]:
+        """根据日干编码与钟点计算时柱干支编码（五鼠遁）
+        
+        Args:
+            day_gan: 日干索引（0-9）
+            hour: 钟点（0-23）
+            
+        Returns:
+            (时干索引, 时支索引) 元组
+        """
+        hour_zhi = BaziCalendar.HOUR_ZHI[hour]
+        return BaziCalendar.WUSHU_DUN_CODES[day_gan][hour_zhi], hour_zhi
+    
+    @staticmethod
+    def get_chart_codes(birth_date: datetime) -> Tuple[int, int, int, int, int, int, int, int, int]:
+        """计算八字四柱的整数编码
+        
+        只做一次节气定位，其余全部为整数查表，供服务与批量任务使用。
+        
+        Args:
+            birth_date: 出生日期时间
+            
+        Returns:
+            (年干, 年支, 月干, 月支, 日干, 日支, 时干, 时支, 节气索引) 元组
+        """
+        jieqi_year, jieqi_index = JieqiCalculator.locate_jieqi(birth_date)
+        return BaziCalendar._chart_codes(birth_date, jieqi_year, jieqi_index)
+    
+    @staticmethod
+    def get_chart_codes_adaptive(
+        birth_date: datetime,
+        window_hours: float = JieqiCalculator.PRECISION_WINDOW_HOURS,
+    ) -> Tuple[Tuple[int, int, int, int, int, int, int, int, int], str]:
+        """以两级精度计算八字四柱的整数编码
+        
+        预计算节气表范围外、且出生时间距节气交接超过 window_hours 时由太阳黄经估计节气，
+        否则精确定位（见 JieqiCalculator.locate_jieqi_adaptive）。
+        
+        Args:
+            birth_date: 出生日期时间
+            window_hours: 精确定位窗口（小时）
+            
+        Returns:
+            (get_chart_codes 相同的编码元组, 所用级别) 元组
+        """
+        jieqi_year, jieqi_index, tier = JieqiCalculator.locate_jieqi_adaptive(birth_date, window_hours)
+        return BaziCalendar._chart_codes(birth_date, jieqi_year, jieqi_index), tier
+    
+    @staticmethod
+    def get_hour_variant_codes(birth_date: datetime) -> list:
+        """时辰未知时计算当日十二个时辰的八字编码
+        
+        年、月、日柱只计算一次，时柱按五鼠遁展开为十二个时辰。
+        当日若有节气交接，交接之后的时辰改用下一节气的年柱、月柱；
+        每个时辰以其起始钟点（子时为当日0时）为准。
+        
+        Args:
+            birth_date: 出生日期（时间部分忽略）
+            
+        Returns:
+            按时支（子至亥）排列的12个编码元组，格式与 get_chart_codes 相同
+        """
+        day_start = datetime(birth_date.year, birth_date.month, birth_date.day)
+        jieqi_year, jieqi_index, _, next_term = JieqiCalculator.locate_jieqi_interval(day_start)
+        day_gan, day_zhi = BaziCalendar.get_day_codes(day_start.toordinal())
+        
+        # 当日至多一次节气交接，预先算好交接前后的年柱、月柱
+        next_year, next_index = (jieqi_year + 1, 0) if jieqi_index == 23 else (jieqi_year, jieqi_index + 1)
+        terms = []
+        for year, index in ((jieqi_year, jieqi_index), (next_year, next_index)):
+            year_gan, year_zhi = BaziCalendar.get_year_codes(year)
+            terms.append((year_gan, year_zhi) + BaziCalendar.get_month_codes(year_gan, index) + (index,))
+        
+        variants = []
+        for hour_zhi, hour in enumerate(BaziCalendar.HOUR_ZHI_START):
+            slot = day_start + timedelta(hours=hour)
+            year_gan, year_zhi, month_gan, month_zhi, index = terms[slot >= next_term]
+            variants.append((
+                year_gan, year_zhi, month_gan, month_zhi, day_gan, day_zhi,
+                BaziCalendar.WUSHU_DUN_CODES[day_gan][hour_zhi], hour_zhi, index,
+            ))
+        return variants
+    
+    @staticmethod
+    def get_hour_variants(birth_date: datetime) -> list:
+        """时辰未知时计算当日十二个时辰的完整八字
+        
+        Args:
+            birth_date: 出生日期（时间部分忽略）
+            
+        Returns:
+            按时支（子至亥）排列的12个 get_all_pillars 字典，
+            birth_info 中的时间为各时辰的起始钟点
+        """
+        day_start = datetime(birth_date.year, birth_date.month, birth_date.day)
+        return [
+            BaziCalendar.codes_to_pillars(
+                codes[:8], codes[8], day_start + timedelta(hours=BaziCalendar.HOUR_ZHI_START[hour_zhi])
+            )
+            for hour_zhi, codes in enumerate(BaziCalendar.get_hour_variant_codes(birth_date))
+        ]
+    
+    @staticmethod
+    def get_chart_codes_in_range(start: datetime, end: datetime) -> list:
+        """计算时间范围内各段不同的八字编码
+        
+        只在可能改变八字的时刻分段：时辰交界（奇数整点）、日期变更（0时）
+        和节气交接（含立春），节气只在范围起点定位一次，之后逐个推进，
+        代价与段数成正比而与范围长短无关。
+        
+        Args:
+            start: 范围起点
+            end: 范围终点（不含）
+            
+        Returns:
+            按时间排列的 (段起点, 段终点, 编码元组) 列表，段左闭右开，
+            编码元组格式与 get_chart_codes 相同
+        """
+        segments: List[Tuple[datetime, datetime, Tuple[int, ...]]] = []
+        if start >= end:
+            return segments
+        
+        jieqi_year, jieqi_index, _, next_term = JieqiCalculator.locate_jieqi_interval(start)
+        
+        segment_start = start
+        while segment_start < end:
+            # 下一个时辰交界：偶数钟点的下一整点为奇数，奇数钟点跳过一小时，23时到次日0时
+            hour = segment_start.hour
+            step = 1 if hour % 2 == 0 or hour == 23 else 2
+            next_hour = datetime(segment_start.year, segment_start.month, segment_start.day, hour) \
+                + timedelta(hours=step)
+            
+            segment_end = min(next_hour, next_term, end)
+            segments.append((
+                segment_start,
+                segment_end,
+                BaziCalendar._chart_codes(segment_start, jieqi_year, jieqi_index),
+            ))
+            
+            # 越过节气交接时推进到下一个节气
+            if segment_end == next_term:
+                if jieqi_index == 23:
+                    jieqi_year, jieqi_index = jieqi_year + 1, 0
+                else:
+                    jieqi_index += 1
+                following_year, following_index = (
+                    (jieqi_year + 1, 0) if jieqi_index == 23 else (jieqi_year, jieqi_index + 1)
+                )
+                next_term = JieqiCalculator.calculate_jieqi_datetime(following_year, following_index)
+            
+            segment_start = segment_end
+        
+        return segments
+    
+    @staticmethod
+    def get_charts_in_range(start: datetime, end: datetime) -> list:
+        """计算时间范围内各段不同的完整八字
+        
+        用于出生时间只知道大致范围的情况（如"夜里十点到两点之间"）。
+        
+        Args:
+            start: 范围起点
+            end: 范围终点（不含）
+            
+        Returns:
+            按时间排列的 ((段起点, 段终点), get_all_pillars 字典) 列表，
+            字典的 birth_info 为段起点
+        """
+        return [
+            ((segment_start, segment_end), BaziCalendar.codes_to_pillars(codes[:8], codes[8], segment_start))
+            for segment_start, segment_end, codes in BaziCalendar.get_chart_codes_in_range(start, end)
+        ]
+    
+    @staticmethod
+    def _chart_codes(
+        birth_date: datetime,
+        jieqi_year: int,
+        jieqi_index: int,
+    ) -> Tuple[int, int, int, int, int, int, int, int, int]:
+        """由节气定位结果计算四柱编码"""
+        year_gan, year_zhi = BaziCalendar.get_year_codes(jieqi_year)
+        month_gan, month_zhi = BaziCalendar.get_month_codes(year_gan, jieqi_index)
+        day_gan, day_zhi = BaziCalendar.get_day_codes(birth_date.toordinal())
+        hour_gan, hour_zhi = BaziCalendar.get_hour_codes(day_gan, birth_date.hour)
+        return year_gan, year_zhi, month_gan, month_zhi, day_gan, day_zhi, hour_gan, hour_zhi, jieqi_index
+    
+    @staticmethod
+    def _pillar_strings(gan: int, zhi: int) -> Tuple[str, str, str, str]:
+        """将干支编码转换为 (天干, 地支, 天干五行, 地支五行) 元组"""
+        gan_str = GanzhiCalculator.TIANGAN[gan]
+        zhi_str = GanzhiCalculator.DIZHI[zhi]
+        return (
+            gan_str,
+            zhi_str,
+            GanzhiCalculator.TIANGAN_WUXING[gan_str],
+            GanzhiCalculator.DIZHI_WUXING[zhi_str],
+        )
+    
     @staticmethod
     def get_year_pillar(birth_date: datetime) -> Tuple[str, str, str, str]:
         """计算年柱（年干和年支）
@@ -63,25 +338,8 @@ class BaziCalendar:
         Returns:
             (年干, 年支, 年干五行, 年支五行) 元组
         """
-        # 判断是否在立春之前
-        if JieqiCalculator.is_before_lichun(birth_date):
-            year = birth_date.year - 1
-        else:
-            year = birth_date.year
-        
-        # 计算年干（从公元4年甲子年起算）
-        year_gan_index = (year - 4) % 10
-        year_gan = GanzhiCalculator.get_tiangan_by_index(year_gan_index)
-        
-        # 计算年支（从公元4年甲子年起算）
-        year_zhi_index = (year - 4) % 12
-        year_zhi = GanzhiCalculator.get_dizhi_by_index(year_zhi_index)
-        
-        # 获取五行
-        year_gan_wuxing = GanzhiCalculator.get_tiangan_wuxing(year_gan)
-        year_zhi_wuxing = GanzhiCalculator.get_dizhi_wuxing(year_zhi)
-        
-        return year_gan, year_zhi, year_gan_wuxing, year_zhi_wuxing
+        jieqi_year, _ = JieqiCalculator.locate_jieqi(birth_date)
+        return BaziCalendar._pillar_strings(*BaziCalendar.get_year_codes(jieqi_year))
     
     @staticmethod
     def get_month_pillar(birth_date: datetime, year_gan: str) -> Tuple[str, str, str, str, str]:
@@ -96,59 +354,10 @@ class BaziCalendar:
         Returns:
             (月干, 月支, 月干五行, 月支五行, 节气名称) 元组
         """
-        year = birth_date.year
-        
-        # 找到当前节气
-        current_jieqi, jieqi_time, _ = JieqiCalculator.get_current_jieqi(birth_date)
-        
-        # 节气名称到月份的映射（从寅月开始）
-        jieqi_to_month = {
-            "立春": ("寅", "一月"),
-            "雨水": ("寅", "一月"),
-            "惊蛰": ("卯", "二月"),
-            "春分": ("卯", "二月"),
-            "清明": ("辰", "三月"),
-            "谷雨": ("辰", "三月"),
-            "立夏": ("巳", "四月"),
-            "小满": ("巳", "四月"),
-            "芒种": ("午", "五月"),
-            "夏至": ("午", "五月"),
-            "小暑": ("未", "六月"),
-            "大暑": ("未", "六月"),
-            "立秋": ("申", "七月"),
-            "处暑": ("申", "七月"),
-            "白露": ("酉", "八月"),
-            "秋分": ("酉", "八月"),
-            "寒露": ("戌", "九月"),
-            "霜降": ("戌", "九月"),
-            "立冬": ("亥", "十月"),
-            "小雪": ("亥", "十月"),
-            "大雪": ("子", "十一月"),
-            "冬至": ("子", "十一月"),
-            "小寒": ("丑", "十二月"),
-            "大寒": ("丑", "十二月"),
-        }
-        
-        month_zhi, month_name = jieqi_to_month.get(current_jieqi, ("寅", "正月"))
-        
-        # 使用五虎遁法计算月干
-        year_gan_index = GanzhiCalculator.TIANGAN.index(year_gan)
-        month_index = GanzhiCalculator.DIZHI.index(month_zhi)
-        
-        # 五虎遁法月份顺序（从寅月开始）：寅、卯、辰、巳、午、未、申、酉、戌、亥、子、丑
-        month_order = ["寅", "卯", "辰", "巳", "午", "未", "申", "酉", "戌", "亥", "子", "丑"]
-        month_index_in_order = month_order.index(month_zhi)
-        
-        # 五虎遁表：年干对应行，月份对应列（从寅月开始）
-        # 寅月是第0列
-        month_gan_index_in_year = month_index_in_order % 10
-        month_gan = BaziCalendar.WUHU_DUN_TABLE[year_gan_index][month_gan_index_in_year]
-        
-        # 获取五行
-        month_gan_wuxing = GanzhiCalculator.get_tiangan_wuxing(month_gan)
-        month_zhi_wuxing = GanzhiCalculator.get_dizhi_wuxing(month_zhi)
-        
-        return month_gan, month_zhi, month_gan_wuxing, month_zhi_wuxing, current_jieqi
+        _, jieqi_index = JieqiCalculator.locate_jieqi(birth_date)
+        year_gan_index = GanzhiCalculator.get_tiangan_index(year_gan)
+        month_codes = BaziCalendar.get_month_codes(year_gan_index, jieqi_index)
+        return BaziCalendar._pillar_strings(*month_codes) + (JieqiCalculator.JIEQI_NAMES[jieqi_index],)
     
     @staticmethod
     def get_day_pillar(birth_date: datetime) -> Tuple[str, str, str, str]:
@@ -162,23 +371,7 @@ class BaziCalendar:
         Returns:
             (日干, 日支, 日干五行, 日支五行) 元组
         """
-        # 计算与基准日期的天数差
-        delta = birth_date.date() - BaziCalendar.BASE_DATE.date()
-        days_diff = delta.days
-        
-        # 计算日干索引
-        day_gan_index = days_diff % 10
-        day_gan = GanzhiCalculator.get_tiangan_by_index(day_gan_index)
-        
-        # 计算日支索引
-        day_zhi_index = days_diff % 12
-        day_zhi = GanzhiCalculator.get_dizhi_by_index(day_zhi_index)
-        
-        # 获取五行
-        day_gan_wuxing = GanzhiCalculator.get_tiangan_wuxing(day_gan)
-        day_zhi_wuxing = GanzhiCalculator.get_dizhi_wuxing(day_zhi)
-        
-        return day_gan, day_zhi, day_gan_wuxing, day_zhi_wuxing
+        return BaziCalendar._pillar_strings(*BaziCalendar.get_day_codes(birth_date.toordinal()))
     
     @staticmethod
     def get_hour_pillar(birth_time: datetime, day_gan: str) -> Tuple[str, str, str, str]:
@@ -193,81 +386,85 @@ class BaziCalendar:
         Returns:
             (时干, 时支, 时干五行, 时支五行) 元组
         """
-        # 根据出生时间确定时支
-        hour = birth_time.hour
-        
-        # 时辰划分（按照八字标准）
-        # 亥时：21:00-23:00
-        # 子时：23:00-01:00（跨日）
-        if hour >= 21 and hour < 23:
-            hour_zhi = "亥"
-        elif hour >= 23 or hour < 1:
-            hour_zhi = "子"
-        elif hour >= 1 and hour < 3:
-            hour_zhi = "丑"
-        elif hour >= 3 and hour < 5:
-            hour_zhi = "寅"
-        elif hour >= 5 and hour < 7:
-            hour_zhi = "卯"
-        elif hour >= 7 and hour < 9:
-            hour_zhi = "辰"
-        elif hour >= 9 and hour < 11:
-            hour_zhi = "巳"
-        elif hour >= 11 and hour < 13:
-            hour_zhi = "午"
-        elif hour >= 13 and hour < 15:
-            hour_zhi = "未"
-        elif hour >= 15 and hour < 17:
-            hour_zhi = "申"
-        elif hour >= 17 and hour < 19:
-            hour_zhi = "酉"
-        elif hour >= 19 and hour < 21:
-            hour_zhi = "戌"
-        else:
-            hour_zhi = "亥"
-        
-        # 使用五鼠遁法计算时干
-        day_gan_index = GanzhiCalculator.TIANGAN.index(day_gan)
-        hour_zhi_index = GanzhiCalculator.DIZHI.index(hour_zhi)
-        
-        # 五鼠遁表：日干对应行，时支对应列
-        hour_gan = BaziCalendar.WUSHU_DUN_TABLE[day_gan_index][hour_zhi_index]
-        
-        # 获取五行
-        hour_gan_wuxing = GanzhiCalculator.get_tiangan_wuxing(hour_gan)
-        hour_zhi_wuxing = GanzhiCalculator.get_dizhi_wuxing(hour_zhi)
-        
-        return hour_gan, hour_zhi, hour_gan_wuxing, hour_zhi_wuxing
+        # 时辰划分：每两小时一个时辰，子时为23:00-01:00（跨日）
+        day_gan_index = GanzhiCalculator.get_tiangan_index(day_gan)
+        return BaziCalendar._pillar_strings(*BaziCalendar.get_hour_codes(day_gan_index, birth_time.hour))
     
     @staticmethod
-    def get_all_pillars(birth_date: datetime) -> dict:
+    def get_all_pillars(
+        birth_date: datetime,
+        location: Optional[Location] = None,
+        window_hours: Optional[float] = None,
+        include_shishen: bool = False,
+        include_shensha: bool = False,
+    ) -> dict:
         """计算完整的八字四柱
         
         Args:
             birth_date: 出生日期时间
+            location: 出生地经度或城市名称，提供时先换算为真太阳时再排盘
+            window_hours: 提供时按两级精度定位节气（见 get_chart_codes_adaptive）
+            include_shishen: 是否附带十神与藏干（见 codes_to_pillars）
+            include_shensha: 是否附带神煞（见 codes_to_pillars）
             
         Returns:
-            包含四柱完整信息的字典
+            包含四柱完整信息的字典（换算真太阳时的，birth_info 中另附 true_solar_time；
+            两级精度的另附 precision）
         """
-        # 计算年柱
-        year_gan, year_zhi, year_gan_wuxing, year_zhi_wuxing = BaziCalendar.get_year_pillar(birth_date)
-        
-        # 计算月柱
-        month_gan, month_zhi, month_gan_wuxing, month_zhi_wuxing, jieqi = BaziCalendar.get_month_pillar(birth_date, year_gan)
+        chart_date = birth_date
+        if location is not None:
+            chart_date = TrueSolarTime.correct(birth_date, location)
         
-        # 计算日柱
-        day_gan, day_zhi, day_gan_wuxing, day_zhi_wuxing = BaziCalendar.get_day_pillar(birth_date)
+        if window_hours is None:
+            codes = BaziCalendar.get_chart_codes(chart_date)
+        else:
+            codes, tier = BaziCalendar.get_chart_codes_adaptive(chart_date, window_hours)
+        
+        result = BaziCalendar.codes_to_pillars(
+            codes[:8], codes[8], birth_date, include_shishen, include_shensha
+        )
+        if location is not None:
+            result["birth_info"]["true_solar_time"] = chart_date
+        if window_hours is not None:
+            result["precision"] = {"tier": tier, "window_hours": window_hours}
+        return result
+    
+    @staticmethod
+    def codes_to_pillars(
+        codes: Tuple[int, ...],
+        jieqi_index: int,
+        birth_date: datetime,
+        include_shishen: bool = False,
+        include_shensha: bool = False,
+    ) -> dict:
+        """将四柱整数编码转换为 get_all_pillars 的字典结构
         
-        # 计算时柱
-        hour_gan, hour_zhi, hour_gan_wuxing, hour_zhi_wuxing = BaziCalendar.get_hour_pillar(birth_date, day_gan)
+        Args:
+            codes: (年干, 年支, 月干, 月支, 日干, 日支, 时干, 时支) 编码
+            jieqi_index: 月柱所在节气索引
+            birth_date: 出生日期时间
+            include_shishen: 是否附带十神与藏干，默认不计算以保持排盘开销
+            include_shensha: 是否附带神煞，默认不计算
+            
+        Returns:
+            包含四柱完整信息（含纳音）的字典；include_shishen 为True时另附 shishen
+            （见 GanzhiCalculator.get_chart_shishen），include_shensha 为True时另附 shensha
+            （见 ShenshaCalculator.detect）
+        """
+        year_gan, year_zhi, year_gan_wuxing, year_zhi_wuxing = BaziCalendar._pillar_strings(codes[0], codes[1])
+        month_gan, month_zhi, month_gan_wuxing, month_zhi_wuxing = BaziCalendar._pillar_strings(codes[2], codes[3])
+        day_gan, day_zhi, day_gan_wuxing, day_zhi_wuxing = BaziCalendar._pillar_strings(codes[4], codes[5])
+        hour_gan, hour_zhi, hour_gan_wuxing, hour_zhi_wuxing = BaziCalendar._pillar_strings(codes[6], codes[7])
+        jieqi = JieqiCalculator.JIEQI_NAMES[jieqi_index]
         
-        return {
+        result = {
             "year": {
                 "gan": year_gan,
                 "zhi": year_zhi,
                 "gan_wuxing": year_gan_wuxing,
                 "zhi_wuxing": year_zhi_wuxing,
-                "full": year_gan + year_zhi
+                "full": year_gan + year_zhi,
+                "nayin": GanzhiCalculator.get_nayin(GanzhiCalculator.get_jiazi_index(codes[0], codes[1]))
             },
             "month": {
                 "gan": month_gan,
@@ -275,6 +472,7 @@ class BaziCalendar:
                 "gan_wuxing": month_gan_wuxing,
                 "zhi_wuxing": month_zhi_wuxing,
                 "full": month_gan + month_zhi,
+                "nayin": GanzhiCalculator.get_nayin(GanzhiCalculator.get_jiazi_index(codes[2], codes[3])),
                 "jieqi": jieqi
             },
             "day": {
@@ -283,6 +481,7 @@ class BaziCalendar:
                 "gan_wuxing": day_gan_wuxing,
                 "zhi_wuxing": day_zhi_wuxing,
                 "full": day_gan + day_zhi,
+                "nayin": GanzhiCalculator.get_nayin(GanzhiCalculator.get_jiazi_index(codes[4], codes[5])),
                 "day_master": day_gan  # 日主
             },
             "hour": {
@@ -290,15 +489,42 @@ class BaziCalendar:
                 "zhi": hour_zhi,
                 "gan_wuxing": hour_gan_wuxing,
                 "zhi_wuxing": hour_zhi_wuxing,
-                "full": hour_gan + hour_zhi
+                "full": hour_gan + hour_zhi,
+                "nayin": GanzhiCalculator.get_nayin(GanzhiCalculator.get_jiazi_index(codes[6], codes[7]))
             },
-            "birth_info": {
-                "date": birth_date,
-                "year": birth_date.year,
-                "month": birth_date.month,
-                "day": birth_date.day,
-                "hour": birth_date.hour,
-                "minute": birth_date.minute,
-                "second": birth_date.second
-            }
+            "birth_info": BaziCalendar.get_birth_info(birth_date)
+        }
+        if include_shishen:
+            result["shishen"] = GanzhiCalculator.get_chart_shishen(codes)
+        if include_shensha:
+            result["shensha"] = ShenshaCalculator.detect(codes)
+        return result
+    
+    @staticmethod
+    def get_birth_info(birth_date: datetime) -> dict:
+        """生成 get_all_pillars 结果中的 birth_info 字典"""
+        return {
+            "date": birth_date,
+            "year": birth_date.year,
+            "month": birth_date.month,
+            "day": birth_date.day,
+            "hour": birth_date.hour,
+            "minute": birth_date.minute,
+            "second": birth_date.second
         }
+    
+    @staticmethod
+    def get_all_pillars_many(birth_dates: "DatetimeArray") -> "BaziColumns":
+        """批量计算八字四柱
+        
+        按列计算年、月、日、时四柱，同一年份的节气只取一次。
+        
+        Args:
+            birth_dates: datetime 序列或 numpy datetime64 数组
+            
+        Returns:
+            BaziColumns 对象，保存整数干支编码，可通过 to_dict/to_dicts
+            转换为 get_all_pillars 的字典结构
+        """
+        from bazi_calculator.core.calendar_batch import BaziColumns
+        return BaziColumns.from_datetimes(birth_dates)
@@ -0,0 +1,303 @@
+"""批量八字排盘模块
+
+此模块按列批量计算四柱，结果以整数干支编码保存，需要时再转换为
+字符串或 BaziCalendar.get_all_pillars 的字典结构。
+"""
+
+from datetime import datetime
+from typing import Dict, List, Sequence, Union
+
+import numpy as np
+
+from bazi_calculator.core.calendar import BaziCalendar
+from bazi_calculator.core.ganzhi import GanzhiCalculator
+from bazi_calculator.core.jieqi import JieqiCalculator
+from bazi_calculator.core.shensha import ShenshaCalculator
+
+
+# 1970-01-01T00:00:00 对应的儒略日
+_UNIX_EPOCH_JD = 2440587.5
+
+# 日柱基准：1949年10月1日为甲子日
+_BASE_DAY = np.datetime64(BaziCalendar.BASE_DATE.date(), "D")
+
+# BaziCalendar 整数编码内核查找表的数组形式
+_WUHU_DUN_CODES = np.array(BaziCalendar.WUHU_DUN_CODES, dtype=np.int8)
+_WUSHU_DUN_CODES = np.array(BaziCalendar.WUSHU_DUN_CODES, dtype=np.int8)
+_JIEQI_MONTH_ZHI = np.array(BaziCalendar.JIEQI_MONTH_ZHI, dtype=np.int8)
+_HOUR_ZHI = np.array(BaziCalendar.HOUR_ZHI, dtype=np.int8)
+
+# 十神矩阵（日干 × 天干）
+_SHISHEN_MATRIX = np.array(GanzhiCalculator.SHISHEN_MATRIX, dtype=np.int8)
+
+
+def _generate_zhi_shishen_weights() -> np.ndarray:
+    """生成地支十神权重表：[日干, 地支, 十神] 为该地支藏干中该十神的权重合计"""
+    weights = np.zeros((10, 12, 10))
+    for day_gan in range(10):
+        for zhi in range(12):
+            for _, shishen, weight in GanzhiCalculator.ZHI_SHISHEN[day_gan][zhi]:
+                weights[day_gan, zhi, shishen] += weight
+    return weights
+
+
+_ZHI_SHISHEN_WEIGHTS = _generate_zhi_shishen_weights()
+
+DatetimeArray = Union[Sequence[datetime], np.ndarray]
+
+
+class BaziColumns:
+    """按列存储的批量八字结果
+
+    每个柱的天干、地支均为整数编码（天干0-9对应甲-癸，地支0-11对应子-亥），
+    月柱另附节气索引（0-23）。
+    """
+
+    PILLARS = ("year", "month", "day", "hour")
+
+    # 干支与节气名称数组，用于批量生成字符串视图
+    _TIANGAN = np.array(GanzhiCalculator.TIANGAN)
+    _DIZHI = np.array(GanzhiCalculator.DIZHI)
+    _JIAZI = np.array(GanzhiCalculator.JIAZI)
+    _NAYIN = np.array(GanzhiCalculator.NAYIN)
+    _JIEQI_NAMES = np.array(JieqiCalculator.JIEQI_NAMES)
+
+    def __init__(
+        self,
+        dates: np.ndarray,
+        year_gan: np.ndarray,
+        year_zhi: np.ndarray,
+        month_gan: np.ndarray,
+        month_zhi: np.ndarray,
+        jieqi: np.ndarray,
+        day_gan: np.ndarray,
+        day_zhi: np.ndarray,
+        hour_gan: np.ndarray,
+        hour_zhi: np.ndarray,
+    ):
+        """初始化批量结果
+
+        Args:
+            dates: 出生时间数组（datetime64）
+            year_gan, year_zhi: 年柱干支编码
+            month_gan, month_zhi: 月柱干支编码
+            jieqi: 月柱所在节气索引
+            day_gan, day_zhi: 日柱干支编码
+            hour_gan, hour_zhi: 时柱干支编码
+        """
+        self.dates = dates
+        self.year_gan = year_gan
+        self.year_zhi = year_zhi
+        self.month_gan = month_gan
+        self.month_zhi = month_zhi
+        self.jieqi = jieqi
+        self.day_gan = day_gan
+        self.day_zhi = day_zhi
+        self.hour_gan = hour_gan
+        self.hour_zhi = hour_zhi
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    @staticmethod
+    def from_datetimes(birth_dates: DatetimeArray) -> "BaziColumns":
+        """批量计算四柱
+
+        同一批记录涉及的每个年份只取一次节气，之后用一次有序查找
+        为所有记录定位所在节气。
+
+        Args:
+            birth_dates: datetime 序列或 datetime64 数组
+
+        Returns:
+            BaziColumns 对象
+        """
+        dates = np.asarray(birth_dates, dtype="datetime64[us]").ravel()
+        seconds = dates.astype("datetime64[s]").astype(np.int64)
+
+        if len(dates) == 0:
+            empty = np.empty(0, dtype=np.int8)
+            return BaziColumns(dates, *([empty] * 9))
+
+        # 该批日期所涉年份的全部节气（前一年的小寒、大寒落在当年一月）
+        calendar_years = dates.astype("datetime64[Y]").astype(np.int64) + 1970
+        first_year = int(calendar_years.min()) - 1
+        last_year = int(calendar_years.max())
+        jieqi_seconds = BaziColumns._jieqi_seconds(first_year, last_year)
+
+        # 定位每条记录所在的节气
+        position = np.searchsorted(jieqi_seconds, seconds, side="right") - 1
+        jieqi = (position % 24).astype(np.int8)
+
+        # 年柱：立春所在的节气年
+        year = first_year + position // 24
+        year_gan = ((year - 4) % 10).astype(np.int8)
+        year_zhi = ((year - 4) % 12).astype(np.int8)
+
+        # 月柱：节气定月支，五虎遁定月干
+        month_zhi = _JIEQI_MONTH_ZHI[jieqi]
+        month_gan = _WUHU_DUN_CODES[year_gan, jieqi // 2]
+
+        # 日柱：与基准甲子日的天数差
+        days = (dates.astype("datetime64[D]") - _BASE_DAY).astype(np.int64)
+        day_gan = (days % 10).astype(np.int8)
+        day_zhi = (days % 12).astype(np.int8)
+
+        # 时柱：钟点定时支，五鼠遁定时干
+        hours = (seconds // 3600) % 24
+        hour_zhi = _HOUR_ZHI[hours]
+        hour_gan = _WUSHU_DUN_CODES[day_gan, hour_zhi]
+
+        return BaziColumns(
+            dates, year_gan, year_zhi, month_gan, month_zhi, jieqi,
+            day_gan, day_zhi, hour_gan, hour_zhi,
+        )
+
+    @staticmethod
+    def _jieqi_seconds(first_year: int, last_year: int) -> np.ndarray:
+        """获取连续年份全部节气的 Unix 秒数
+
+        Args:
+            first_year: 起始年份
+            last_year: 结束年份（含）
+
+        Returns:
+            按时间排序的 int64 数组，第 (year - first_year) * 24 + idx 项为 year 年第 idx 个节气
+        """
+        jds: List[float] = []
+        for year in range(first_year, last_year + 1):
+            jds.extend(JieqiCalculator._get_year_jieqi_jds(year))
+        return np.round((np.array(jds) - _UNIX_EPOCH_JD) * 86400).astype(np.int64)
+
+    def codes_columns(self) -> List[np.ndarray]:
+        """按年干、年支、月干、月支、日干、日支、时干、时支顺序返回各列"""
+        return [
+            self.year_gan, self.year_zhi, self.month_gan, self.month_zhi,
+            self.day_gan, self.day_zhi, self.hour_gan, self.hour_zhi,
+        ]
+
+    @property
+    def codes(self) -> np.ndarray:
+        """干支编码矩阵
+
+        Returns:
+            形状为 (N, 8) 的数组，列依次为年干、年支、月干、月支、日干、日支、时干、时支
+        """
+        return np.column_stack(self.codes_columns())
+
+    def gan_strings(self, pillar: str) -> np.ndarray:
+        """获取指定柱的天干字符串数组
+
+        Args:
+            pillar: 柱名（year/month/day/hour）
+
+        Returns:
+            天干字符串数组
+        """
+        strings: np.ndarray = BaziColumns._TIANGAN[getattr(self, f"{pillar}_gan")]
+        return strings
+
+    def zhi_strings(self, pillar: str) -> np.ndarray:
+        """获取指定柱的地支字符串数组
+
+        Args:
+            pillar: 柱名（year/month/day/hour）
+
+        Returns:
+            地支字符串数组
+        """
+        strings: np.ndarray = BaziColumns._DIZHI[getattr(self, f"{pillar}_zhi")]
+        return strings
+
+    def jiazi_index(self, pillar: str) -> np.ndarray:
+        """获取指定柱在六十甲子中的索引
+
+        Args:
+            pillar: 柱名（year/month/day/hour）
+
+        Returns:
+            六十甲子索引数组（0-59）
+        """
+        gan = getattr(self, f"{pillar}_gan").astype(np.int64)
+        zhi = getattr(self, f"{pillar}_zhi").astype(np.int64)
+        jiazi: np.ndarray = (6 * gan - 5 * zhi) % 60
+        return jiazi
+
+    def full_strings(self, pillar: str) -> np.ndarray:
+        """获取指定柱的干支字符串数组（如"甲子"）
+
+        Args:
+            pillar: 柱名（year/month/day/hour）
+
+        Returns:
+            干支字符串数组
+        """
+        strings: np.ndarray = BaziColumns._JIAZI[self.jiazi_index(pillar)]
+        return strings
+
+    def nayin_strings(self, pillar: str) -> np.ndarray:
+        """获取指定柱的纳音字符串数组
+
+        Args:
+            pillar: 柱名（year/month/day/hour）
+
+        Returns:
+            纳音字符串数组
+        """
+        strings: np.ndarray = BaziColumns._NAYIN[self.jiazi_index(pillar) // 2]
+        return strings
+
+    def shensha_flags(self) -> np.ndarray:
+        """批量计算神煞位掩码（见 ShenshaCalculator.get_flags_many）"""
+        flags: np.ndarray = ShenshaCalculator.get_flags_many(self.codes)
+        return flags
+
+    def gan_shishen(self) -> np.ndarray:
+        """获取各柱天干相对日干的十神索引
+
+        Returns:
+            形状为 (N, 4) 的数组，列依次为年、月、日、时，值为 GanzhiCalculator.SHISHEN
+            的索引；日柱为日主自身，恒为0
+        """
+        gans = np.column_stack([self.year_gan, self.month_gan, self.day_gan, self.hour_gan])
+        shishen: np.ndarray = _SHISHEN_MATRIX[self.day_gan[:, np.newaxis], gans]
+        return shishen
+
+    def shishen_weights(self) -> np.ndarray:
+        """批量计算十神权重，与 GanzhiCalculator.get_chart_shishen 的 weights 一致
+
+        Returns:
+            形状为 (N, 10) 的数组，列按 GanzhiCalculator.SHISHEN 排列；
+            除日主外的天干每个计1，地支藏干按权重计
+        """
+        day_gan = self.day_gan.astype(np.intp)
+        weights = np.zeros((len(self), 10))
+        rows = np.arange(len(self))
+        for gan in (self.year_gan, self.month_gan, self.hour_gan):
+            np.add.at(weights, (rows, _SHISHEN_MATRIX[day_gan, gan]), 1.0)
+        for zhi in (self.year_zhi, self.month_zhi, self.day_zhi, self.hour_zhi):
+            weights += _ZHI_SHISHEN_WEIGHTS[day_gan, zhi]
+        return weights
+
+    def jieqi_names(self) -> np.ndarray:
+        """获取月柱所在节气名称数组"""
+        names: np.ndarray = BaziColumns._JIEQI_NAMES[self.jieqi]
+        return names
+
+    def to_dict(self, i: int) -> Dict:
+        """将第i条记录转换为 BaziCalendar.get_all_pillars 的字典结构
+
+        Args:
+            i: 记录索引
+
+        Returns:
+            包含四柱完整信息的字典
+        """
+        codes = tuple(int(column[i]) for column in self.codes_columns())
+        birth_date = self.dates[i].astype(datetime)
+        pillars: Dict = BaziCalendar.codes_to_pillars(codes, int(self.jieqi[i]), birth_date)
+        return pillars
+
+    def to_dicts(self) -> List[Dict]:
+        """将全部记录转换为字典列表"""
+        return [self.to_dict(i) for i in range(len(self))]
@@ -0,0 +1,350 @@
+"""八字区间索引模块
+
+此模块把一段年份内的全部四柱预先排成区间索引：每个时辰边界、午夜和
+节气交接时刻各开启一个区间，区间内四柱不变。排盘时只需一次二分查找。
+
+每个区间压缩为一个 uint64：
+    高35位：区间起点距起始年份1月1日0时的秒数
+    低29位：节气索引（5位）、年柱、月柱、日柱、时柱的六十甲子索引（各6位）
+
+文件格式（小端序）：
+    文件头（32字节）：魔数 b"BZCHART\\0"、格式版本（uint16）、保留（uint16）、
+        起始年份（int32）、结束年份（int32）、区间数（uint32），其余填充
+    区间数组：区间数个 uint64
+
+读取时以内存映射方式打开文件，不做任何解码。
+
+命令行生成索引并测试加载与查询耗时：
+    python -m bazi_calculator.core.chart_index --start 1900 --end 2100 --output chart.idx --benchmark
+"""
+
+import argparse
+import mmap
+import struct
+import time
+from bisect import bisect_right
+from datetime import datetime
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from bazi_calculator.core.calendar import BaziCalendar
+from bazi_calculator.core.calendar_batch import BaziColumns, DatetimeArray
+
+
+# 区间编码的位宽
+_CODE_BITS = 29
+_CODE_MASK = (1 << _CODE_BITS) - 1
+_JIAZI_BITS = 6
+_JIAZI_MASK = (1 << _JIAZI_BITS) - 1
+
+# 六十甲子索引到 (天干, 地支) 编码
+_JIAZI_CODES = [(jiazi % 10, jiazi % 12) for jiazi in range(60)]
+
+# 每日开启新区间的钟点：午夜换日柱，奇数钟点换时支
+_BOUNDARY_HOURS = np.array([0] + list(range(1, 24, 2)), dtype=np.int64)
+
+
+class ChartIndex:
+    """八字区间索引
+
+    覆盖 [start_year年1月1日, end_year+1年1月1日) 内的全部时刻。
+    """
+
+    # 文件魔数与格式版本
+    MAGIC = b"BZCHART\0"
+    VERSION = 1
+
+    # 文件头结构
+    HEADER = struct.Struct("<8sHHiiI8x")
+
+    # 单个索引可覆盖的最大年数（受区间起点的35位秒数限制）
+    MAX_YEARS = 1000
+
+    def __init__(self, entries: np.ndarray, start_year: int, end_year: int):
+        """初始化索引
+
+        Args:
+            entries: 压缩后的区间数组（uint64，按起点升序）
+            start_year: 起始年份
+            end_year: 结束年份（含）
+        """
+        self.entries = entries
+        # 供 bisect 直接读取的整数视图，避免逐个创建 NumPy 标量
+        self._keys = entries.data.cast("B").cast("Q")
+        self.start_year = start_year
+        self.end_year = end_year
+        self.origin = datetime(start_year, 1, 1)
+        self._span = (datetime(end_year + 1, 1, 1) - self.origin).days * 86400
+        self._origin64 = np.datetime64(self.origin, "s")
+        self._map: Optional[mmap.mmap] = None
+        self._file: Optional[BinaryIO] = None
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @staticmethod
+    def build(start_year: int, end_year: int) -> "ChartIndex":
+        """构建区间索引
+
+        Args:
+            start_year: 起始年份
+            end_year: 结束年份（含）
+
+        Returns:
+            ChartIndex 对象
+
+        Raises:
+            ValueError: 年份范围无效
+        """
+        if not 2 <= start_year <= end_year or end_year - start_year + 1 > ChartIndex.MAX_YEARS:
+            raise ValueError(f"年份范围无效: {start_year}-{end_year}")
+
+        origin = np.datetime64(f"{start_year:04d}-01-01", "s")
+        span = int((np.datetime64(f"{end_year + 1:04d}-01-01", "s") - origin).astype(np.int64))
+
+        # 时辰与午夜边界
+        days = np.arange(0, span, 86400, dtype=np.int64)
+        hour_starts = (days[:, np.newaxis] + _BOUNDARY_HOURS * 3600).ravel()
+
+        # 节气交接边界（前一年的小寒、大寒落在起始年份一月）
+        origin_unix = int(origin.astype(np.int64))
+        jieqi_starts = BaziColumns._jieqi_seconds(start_year - 1, end_year) - origin_unix
+        jieqi_starts = jieqi_starts[(jieqi_starts > 0) & (jieqi_starts < span)]
+
+        starts = np.union1d(hour_starts, jieqi_starts)
+        columns = BaziColumns.from_datetimes(origin + starts)
+
+        packed = columns.jieqi.astype(np.uint64)
+        for pillar in BaziColumns.PILLARS:
+            packed = (packed << np.uint64(_JIAZI_BITS)) | columns.jiazi_index(pillar).astype(np.uint64)
+        entries = (starts.astype(np.uint64) << np.uint64(_CODE_BITS)) | packed
+        return ChartIndex(entries, start_year, end_year)
+
+    def save(self, path: str) -> int:
+        """写入索引文件
+
+        Args:
+            path: 输出文件路径
+
+        Returns:
+            写入的字节数
+        """
+        with open(path, "wb") as f:
+            written = f.write(ChartIndex.HEADER.pack(
+                ChartIndex.MAGIC, ChartIndex.VERSION, 0, self.start_year, self.end_year, len(self.entries)
+            ))
+            written += f.write(np.ascontiguousarray(self.entries, dtype="<u8").tobytes())
+        return written
+
+    @staticmethod
+    def load(path: str) -> "ChartIndex":
+        """以内存映射方式打开索引文件
+
+        Args:
+            path: 索引文件路径
+
+        Returns:
+            ChartIndex 对象
+
+        Raises:
+            ValueError: 文件格式无效
+        """
+        f = open(path, "rb")
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            f.close()
+            raise ValueError(f"无效的八字索引文件: {path}")
+
+        header_size = ChartIndex.HEADER.size
+        if len(mapped) >= header_size:
+            magic, version, _, start_year, end_year, count = ChartIndex.HEADER.unpack_from(mapped, 0)
+        else:
+            magic, version, start_year, end_year, count = b"", 0, 0, 0, 0
+        if magic != ChartIndex.MAGIC or version != ChartIndex.VERSION \
+                or len(mapped) != header_size + count * 8:
+            mapped.close()
+            f.close()
+            raise ValueError(f"无效的八字索引文件: {path}")
+
+        entries = np.frombuffer(mapped, dtype="<u8", count=count, offset=header_size)
+        index = ChartIndex(entries, start_year, end_year)
+        index._map = mapped
+        index._file = f
+        return index
+
+    def close(self) -> None:
+        """关闭索引文件（仅对 load 打开的索引有效）"""
+        if self._map is not None:
+            self._keys.release()
+            self.entries = np.empty(0, dtype=np.uint64)
+            self._keys = self.entries.data.cast("B").cast("Q")
+            self._map.close()
+            self._map = None
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __enter__(self) -> "ChartIndex":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _offset(self, date: datetime) -> int:
+        """计算时刻距索引起点的整秒数（秒以下截断）"""
+        delta = date - self.origin
+        return delta.days * 86400 + delta.seconds
+
+    def covers(self, date: datetime) -> bool:
+        """判断索引是否包含指定时刻
+
+        Args:
+            date: 日期时间
+
+        Returns:
+            是否包含
+        """
+        return self.start_year <= date.year <= self.end_year
+
+    def _position(self, date: datetime) -> int:
+        """二分查找时刻所在区间的位置
+
+        Raises:
+            KeyError: 索引不包含该时刻
+        """
+        if not self.covers(date):
+            raise KeyError(f"八字索引不包含时刻: {date}")
+        key = (self._offset(date) << _CODE_BITS) | _CODE_MASK
+        return bisect_right(self._keys, key) - 1
+
+    @staticmethod
+    def _unpack_codes(packed: int) -> Tuple[int, int, int, int, int, int, int, int, int]:
+        """将区间编码解压为 BaziCalendar.get_chart_codes 的元组形式"""
+        return (
+            _JIAZI_CODES[(packed >> 18) & _JIAZI_MASK]
+            + _JIAZI_CODES[(packed >> 12) & _JIAZI_MASK]
+            + _JIAZI_CODES[(packed >> 6) & _JIAZI_MASK]
+            + _JIAZI_CODES[packed & _JIAZI_MASK]
+            + ((packed >> 24) & 0x1F,)
+        )
+
+    def lookup_codes(self, date: datetime) -> Tuple[int, int, int, int, int, int, int, int, int]:
+        """查找四柱整数编码
+
+        Args:
+            date: 出生日期时间
+
+        Returns:
+            与 BaziCalendar.get_chart_codes 相同的
+            (年干, 年支, 月干, 月支, 日干, 日支, 时干, 时支, 节气索引) 元组
+
+        Raises:
+            KeyError: 索引不包含该时刻
+        """
+        return ChartIndex._unpack_codes(self._keys[self._position(date)] & _CODE_MASK)
+
+    def lookup(self, date: datetime) -> Dict[str, Any]:
+        """查找完整的八字四柱
+
+        Args:
+            date: 出生日期时间
+
+        Returns:
+            与 BaziCalendar.get_all_pillars 相同结构的字典
+        """
+        codes = self.lookup_codes(date)
+        pillars: Dict[str, Any] = BaziCalendar.codes_to_pillars(codes[:8], codes[8], date)
+        return pillars
+
+    def get_interval(self, date: datetime) -> Tuple[datetime, datetime]:
+        """获取时刻所在区间（区间内四柱相同）
+
+        Args:
+            date: 日期时间
+
+        Returns:
+            (区间起点, 下一区间起点) 元组
+        """
+        position = self._position(date)
+        start = self._keys[position] >> _CODE_BITS
+        if position + 1 < len(self._keys):
+            end = self._keys[position + 1] >> _CODE_BITS
+        else:
+            end = self._span
+        return (
+            (self._origin64 + np.timedelta64(start, "s")).astype(datetime),
+            (self._origin64 + np.timedelta64(end, "s")).astype(datetime),
+        )
+
+    def lookup_many(self, birth_dates: DatetimeArray) -> BaziColumns:
+        """批量查找四柱
+
+        Args:
+            birth_dates: datetime 序列或 datetime64 数组
+
+        Returns:
+            BaziColumns 对象
+
+        Raises:
+            KeyError: 存在索引不包含的时刻
+        """
+        dates = np.asarray(birth_dates, dtype="datetime64[us]").ravel()
+        offsets = (dates.astype("datetime64[s]") - self._origin64).astype(np.int64)
+        if len(dates) and (offsets.min() < 0 or offsets.max() >= self._span):
+            raise KeyError("八字索引不包含部分时刻")
+
+        keys = (offsets.astype(np.uint64) << np.uint64(_CODE_BITS)) | np.uint64(_CODE_MASK)
+        packed = self.entries[np.searchsorted(self.entries, keys, side="right") - 1]
+
+        jiazi = [
+            ((packed >> np.uint64(shift)) & np.uint64(_JIAZI_MASK)).astype(np.int8)
+            for shift in (18, 12, 6, 0)
+        ]
+        jieqi = ((packed >> np.uint64(24)) & np.uint64(0x1F)).astype(np.int8)
+        year, month, day, hour = jiazi
+        return BaziColumns(
+            dates, year % 10, year % 12, month % 10, month % 12, jieqi,
+            day % 10, day % 12, hour % 10, hour % 12,
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """命令行入口：生成八字区间索引文件"""
+    parser = argparse.ArgumentParser(description="生成八字区间索引文件")
+    parser.add_argument("--start", type=int, default=1900, help="起始年份")
+    parser.add_argument("--end", type=int, default=2100, help="结束年份（含）")
+    parser.add_argument("--output", required=True, help="输出文件路径")
+    parser.add_argument("--benchmark", action="store_true", help="测试加载与查询耗时")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    index = ChartIndex.build(args.start, args.end)
+    size = index.save(args.output)
+    elapsed = time.perf_counter() - started
+    print(f"已生成 {args.start}-{args.end} 年八字索引：{args.output}（{len(index)} 个区间，{size} 字节，耗时 {elapsed:.2f} 秒）")
+
+    if args.benchmark:
+        started = time.perf_counter()
+        loaded = ChartIndex.load(args.output)
+        load_time = time.perf_counter() - started
+
+        rng = np.random.default_rng(0)
+        offsets = rng.integers(0, loaded._span, 10000)
+        dates = [(loaded._origin64 + np.timedelta64(int(s), "s")).astype(datetime) for s in offsets]
+        # 首轮查询包含内存映射缺页开销，次轮为页面已驻留时的耗时
+        lookup_times = []
+        for _ in range(2):
+            started = time.perf_counter()
+            for date in dates:
+                loaded.lookup_codes(date)
+            lookup_times.append((time.perf_counter() - started) / len(dates))
+        loaded.close()
+
+        print(f"加载耗时 {load_time * 1000:.3f} 毫秒，单次查询平均 "
+              f"{lookup_times[0] * 1e6:.2f} 微秒（首轮）/ {lookup_times[1] * 1e6:.2f} 微秒（次轮）")
+
+
+if __name__ == "__main__":
+    main()
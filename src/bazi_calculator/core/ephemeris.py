@@ -0,0 +1,209 @@
+"""节气历表文件模块
+
+此模块定义一种紧凑的二进制节气历表格式，并提供生成与读取功能，
+用于预计算节气表（1900-2100年）之外的历史与远期年份。
+
+文件格式（小端序）：
+    文件头（32字节）：魔数 b"BZJIEQI\\0"、格式版本（uint16）、
+        每条记录的节气数（uint16）、起始年份（int32）、结束年份（int32），其余填充
+    记录（每年96字节）：24个 uint32，依次为该年第0-23个节气距当年
+        1月1日0时的秒数（小寒、大寒落在次年一月，秒数超过一年）
+
+读取时以内存映射方式打开文件，只解码实际访问到的年份。
+
+命令行生成历表：
+    python -m bazi_calculator.core.ephemeris --start 1 --end 9998 --output jieqi.eph
+"""
+
+import argparse
+import mmap
+import struct
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from bazi_calculator.core.jieqi import JieqiCalculator
+
+
+class JieqiEphemeris:
+    """节气历表读取器
+
+    以内存映射方式打开历表文件，按需解码单个年份的节气时刻。
+    """
+
+    # 文件魔数与格式版本
+    MAGIC = b"BZJIEQI\0"
+    VERSION = 1
+
+    # 文件头与记录结构
+    HEADER = struct.Struct("<8sHHii12x")
+    RECORD = struct.Struct("<24I")
+
+    # 可生成的年份范围（受 datetime 年份范围限制，结束年份的小寒、大寒在次年）
+    MIN_YEAR = 1
+    MAX_YEAR = 9998
+
+    def __init__(self, path: str):
+        """打开历表文件
+
+        Args:
+            path: 历表文件路径
+
+        Raises:
+            ValueError: 文件格式无效
+        """
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"无效的节气历表文件: {path}")
+
+        if len(self._map) < JieqiEphemeris.HEADER.size:
+            self.close()
+            raise ValueError(f"无效的节气历表文件: {path}")
+
+        magic, version, terms, start_year, end_year = JieqiEphemeris.HEADER.unpack_from(self._map, 0)
+        if magic != JieqiEphemeris.MAGIC or version != JieqiEphemeris.VERSION or terms != 24:
+            self.close()
+            raise ValueError(f"无效的节气历表文件: {path}")
+
+        expected_size = JieqiEphemeris.HEADER.size + (end_year - start_year + 1) * JieqiEphemeris.RECORD.size
+        if len(self._map) != expected_size:
+            self.close()
+            raise ValueError(f"节气历表文件长度不符: {path}")
+
+        self.start_year = int(start_year)
+        self.end_year = int(end_year)
+
+        # 已解码年份的缓存（节气时间与对应儒略日）
+        self._cache: Dict[int, List[datetime]] = {}
+        self._jd_cache: Dict[int, List[float]] = {}
+
+    def covers(self, year: int) -> bool:
+        """判断历表是否包含指定年份
+
+        Args:
+            year: 年份
+
+        Returns:
+            是否包含
+        """
+        return self.start_year <= year <= self.end_year
+
+    def get_year_jieqi(self, year: int) -> List[datetime]:
+        """获取指定年份的全部24个节气时刻
+
+        Args:
+            year: 年份
+
+        Returns:
+            按节气索引排列的节气时间列表
+
+        Raises:
+            KeyError: 历表不包含该年份
+        """
+        cached = self._cache.get(year)
+        if cached is not None:
+            return cached
+
+        if not self.covers(year):
+            raise KeyError(f"节气历表不包含年份: {year}")
+
+        offset = JieqiEphemeris.HEADER.size + (year - self.start_year) * JieqiEphemeris.RECORD.size
+        seconds = JieqiEphemeris.RECORD.unpack_from(self._map, offset)
+        year_start = datetime(year, 1, 1)
+        terms = [year_start + timedelta(seconds=s) for s in seconds]
+
+        self._cache[year] = terms
+        return terms
+
+    def get_year_julian_days(self, year: int) -> List[float]:
+        """获取指定年份全部24个节气的儒略日
+
+        Args:
+            year: 年份
+
+        Returns:
+            按节气索引排列的儒略日列表
+        """
+        cached = self._jd_cache.get(year)
+        if cached is None:
+            cached = [JieqiCalculator._get_julian_day(t) for t in self.get_year_jieqi(year)]
+            self._jd_cache[year] = cached
+        return cached
+
+    def get_jieqi(self, year: int, jieqi_index: int) -> datetime:
+        """获取指定年份指定节气的时刻
+
+        Args:
+            year: 年份
+            jieqi_index: 节气索引（0-23）
+
+        Returns:
+            节气时间
+        """
+        return self.get_year_jieqi(year)[jieqi_index]
+
+    def close(self) -> None:
+        """关闭历表文件"""
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> "JieqiEphemeris":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @staticmethod
+    def build(path: str, start_year: int, end_year: int) -> int:
+        """用迭代求解生成历表文件
+
+        节气时刻与 JieqiCalculator.calculate_jieqi_datetime 的求解结果一致
+        （截断到整秒）。
+
+        Args:
+            path: 输出文件路径
+            start_year: 起始年份
+            end_year: 结束年份（含）
+
+        Returns:
+            写入的字节数
+
+        Raises:
+            ValueError: 年份范围无效
+        """
+        if not JieqiEphemeris.MIN_YEAR <= start_year <= end_year <= JieqiEphemeris.MAX_YEAR:
+            raise ValueError(f"年份范围无效: {start_year}-{end_year}")
+
+        written = 0
+        with open(path, "wb") as f:
+            written += f.write(JieqiEphemeris.HEADER.pack(
+                JieqiEphemeris.MAGIC, JieqiEphemeris.VERSION, 24, start_year, end_year
+            ))
+            for year in range(start_year, end_year + 1):
+                year_start = datetime(year, 1, 1)
+                seconds = [
+                    int((JieqiCalculator._find_jieqi_time(year, longitude) - year_start).total_seconds())
+                    for longitude in JieqiCalculator.JIEQI_LONGITUDE
+                ]
+                written += f.write(JieqiEphemeris.RECORD.pack(*seconds))
+
+        return written
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """命令行入口：生成节气历表文件"""
+    parser = argparse.ArgumentParser(description="生成节气历表文件")
+    parser.add_argument("--start", type=int, required=True, help="起始年份")
+    parser.add_argument("--end", type=int, required=True, help="结束年份（含）")
+    parser.add_argument("--output", required=True, help="输出文件路径")
+    args = parser.parse_args(argv)
+
+    size = JieqiEphemeris.build(args.output, args.start, args.end)
+    print(f"已生成 {args.start}-{args.end} 年节气历表：{args.output}（{size} 字节）")
+
+
+if __name__ == "__main__":
+    main()
@@ -24,6 +24,42 @@ def _generate_jiazi_list() -> List[str]:
 _JIAZI_FULL = _generate_jiazi_list()
 
 
+def _generate_shishen_matrix() -> List[List[int]]:
+    """生成十神矩阵：第 i 行第 j 列为天干 j 相对日干 i 的十神索引
+
+    天干索引整除2即五行（木火土金水，按相生顺序排列），
+    五行差 (j//2 - i//2) % 5 依次为同我、我生、我克、克我、生我，
+    阴阳相同取偏（比肩、食神、偏财、七杀、偏印），不同取正。
+    """
+    return [
+        [((j // 2 - i // 2) % 5) * 2 + (i % 2 != j % 2) for j in range(10)]
+        for i in range(10)
+    ]
+
+
+def _generate_canggan_codes(
+    canggan: Dict[str, List[Tuple[str, float]]],
+    tiangan_index: Dict[str, int],
+    dizhi: List[str],
+) -> List[Tuple[Tuple[int, float], ...]]:
+    """将地支藏干表转换为按地支索引排列的 (天干索引, 权重) 元组"""
+    return [tuple((tiangan_index[gan], weight) for gan, weight in canggan[zhi]) for zhi in dizhi]
+
+
+def _generate_zhi_shishen(
+    canggan_codes: List[Tuple[Tuple[int, float], ...]],
+    shishen_matrix: List[List[int]],
+) -> List[List[Tuple[Tuple[int, int, float], ...]]]:
+    """生成地支十神表：第 i 行第 z 列为地支 z 各藏干 (天干索引, 十神索引, 权重)"""
+    return [
+        [
+            tuple((gan, shishen_matrix[day_gan][gan], weight) for gan, weight in canggan)
+            for canggan in canggan_codes
+        ]
+        for day_gan in range(10)
+    ]
+
+
 class GanzhiCalculator:
     """干支计算器
     
@@ -77,6 +113,49 @@ class GanzhiCalculator:
     # 以甲子年开始的60年干支表
     JIAZI = _JIAZI_FULL
     
+    # 天干、地支到索引的映射
+    TIANGAN_INDEX = {gan: idx for idx, gan in enumerate(TIANGAN)}
+    DIZHI_INDEX = {zhi: idx for idx, zhi in enumerate(DIZHI)}
+    
+    # 纳音五行，每两个相邻的六十甲子共用一个，NAYIN[甲子索引 // 2]
+    NAYIN = [
+        "海中金", "炉中火", "大林木", "路旁土", "剑锋金", "山头火",
+        "涧下水", "城头土", "白蜡金", "杨柳木", "泉中水", "屋上土",
+        "霹雳火", "松柏木", "长流水", "砂石金", "山下火", "平地木",
+        "壁上土", "金箔金", "覆灯火", "天河水", "大驿土", "钗钏金",
+        "桑柘木", "大溪水", "沙中土", "天上火", "石榴木", "大海水"
+    ]
+    
+    # 十神（按同我、我生、我克、克我、生我排列，每类先偏后正）
+    SHISHEN = [
+        "比肩", "劫财", "食神", "伤官", "偏财", "正财", "七杀", "正官", "偏印", "正印"
+    ]
+    
+    # 十神矩阵：SHISHEN_MATRIX[日干索引][天干索引] 为十神索引
+    SHISHEN_MATRIX = _generate_shishen_matrix()
+    
+    # 地支藏干及权重（本气、中气、余气）
+    CANGGAN = {
+        "子": [("癸", 1.0)],
+        "丑": [("己", 0.6), ("癸", 0.3), ("辛", 0.1)],
+        "寅": [("甲", 0.6), ("丙", 0.3), ("戊", 0.1)],
+        "卯": [("乙", 1.0)],
+        "辰": [("戊", 0.6), ("乙", 0.3), ("癸", 0.1)],
+        "巳": [("丙", 0.6), ("庚", 0.3), ("戊", 0.1)],
+        "午": [("丁", 0.7), ("己", 0.3)],
+        "未": [("己", 0.6), ("丁", 0.3), ("乙", 0.1)],
+        "申": [("庚", 0.6), ("壬", 0.3), ("戊", 0.1)],
+        "酉": [("辛", 1.0)],
+        "戌": [("戊", 0.6), ("辛", 0.3), ("丁", 0.1)],
+        "亥": [("壬", 0.7), ("甲", 0.3)]
+    }
+    
+    # 藏干的整数编码形式：CANGGAN_CODES[地支索引] 为 ((天干索引, 权重), ...)
+    CANGGAN_CODES = _generate_canggan_codes(CANGGAN, TIANGAN_INDEX, DIZHI)
+    
+    # 地支十神表：ZHI_SHISHEN[日干索引][地支索引] 为 ((天干索引, 十神索引, 权重), ...)
+    ZHI_SHISHEN = _generate_zhi_shishen(CANGGAN_CODES, SHISHEN_MATRIX)
+    
     @staticmethod
     def get_tiangan_by_index(idx: int) -> str:
         """根据索引获取天干
@@ -111,6 +190,58 @@ class GanzhiCalculator:
             raise IndexError(f"地支索引超出范围: {idx}")
         return GanzhiCalculator.DIZHI[idx]
     
+    @staticmethod
+    def get_tiangan_index(tiangan: str) -> int:
+        """获取天干的索引
+        
+        Args:
+            tiangan: 天干字符
+            
+        Returns:
+            索引（0-9）
+            
+        Raises:
+            ValueError: 无效的天干
+        """
+        if tiangan not in GanzhiCalculator.TIANGAN_INDEX:
+            raise ValueError(f"无效的天干: {tiangan}")
+        return GanzhiCalculator.TIANGAN_INDEX[tiangan]
+    
+    @staticmethod
+    def get_dizhi_index(dizhi: str) -> int:
+        """获取地支的索引
+        
+        Args:
+            dizhi: 地支字符
+            
+        Returns:
+            索引（0-11）
+            
+        Raises:
+            ValueError: 无效的地支
+        """
+        if dizhi not in GanzhiCalculator.DIZHI_INDEX:
+            raise ValueError(f"无效的地支: {dizhi}")
+        return GanzhiCalculator.DIZHI_INDEX[dizhi]
+    
+    @staticmethod
+    def get_jiazi_index(tiangan_idx: int, dizhi_idx: int) -> int:
+        """根据干支索引获取六十甲子索引
+        
+        Args:
+            tiangan_idx: 天干索引（0-9）
+            dizhi_idx: 地支索引（0-11）
+            
+        Returns:
+            六十甲子索引（0-59）
+            
+        Raises:
+            ValueError: 干支阴阳不同，不构成甲子
+        """
+        if (tiangan_idx - dizhi_idx) % 2:
+            raise ValueError(f"无效的干支组合: {tiangan_idx}, {dizhi_idx}")
+        return (6 * tiangan_idx - 5 * dizhi_idx) % 60
+    
     @staticmethod
     def get_ganzhi_pair(tiangan_idx: int, dizhi_idx: int) -> Tuple[str, str]:
         """获取干支对
@@ -206,6 +337,100 @@ class GanzhiCalculator:
             raise IndexError(f"六十甲子索引超出范围: {idx}")
         return GanzhiCalculator.JIAZI[idx]
     
+    @staticmethod
+    def get_nayin(jiazi_idx: int) -> str:
+        """根据六十甲子索引获取纳音
+        
+        Args:
+            jiazi_idx: 六十甲子索引（0-59）
+            
+        Returns:
+            纳音名称（如"海中金"）
+            
+        Raises:
+            IndexError: 索引超出范围
+        """
+        if not 0 <= jiazi_idx < len(GanzhiCalculator.JIAZI):
+            raise IndexError(f"六十甲子索引超出范围: {jiazi_idx}")
+        return GanzhiCalculator.NAYIN[jiazi_idx // 2]
+    
+    @staticmethod
+    def get_shishen(day_gan: str, tiangan: str) -> str:
+        """获取天干相对日干的十神
+        
+        Args:
+            day_gan: 日干
+            tiangan: 天干
+            
+        Returns:
+            十神名称（如"正官"）
+            
+        Raises:
+            ValueError: 无效的天干
+        """
+        day_idx = GanzhiCalculator.get_tiangan_index(day_gan)
+        gan_idx = GanzhiCalculator.get_tiangan_index(tiangan)
+        return GanzhiCalculator.SHISHEN[GanzhiCalculator.SHISHEN_MATRIX[day_idx][gan_idx]]
+    
+    @staticmethod
+    def get_canggan(dizhi: str) -> List[Tuple[str, float]]:
+        """获取地支藏干
+        
+        Args:
+            dizhi: 地支字符
+            
+        Returns:
+            [(藏干, 权重), ...]，本气在前
+            
+        Raises:
+            ValueError: 无效的地支
+        """
+        if dizhi not in GanzhiCalculator.CANGGAN:
+            raise ValueError(f"无效的地支: {dizhi}")
+        return list(GanzhiCalculator.CANGGAN[dizhi])
+    
+    @staticmethod
+    def get_chart_shishen(codes: Tuple[int, ...]) -> Dict:
+        """一次遍历计算整盘的十神与藏干
+        
+        Args:
+            codes: (年干, 年支, 月干, 月支, 日干, 日支, 时干, 时支) 编码
+            
+        Returns:
+            字典：gan 为各柱天干的十神（日柱为"日主"）；canggan 为各柱地支藏干列表，
+            每项含 gan、shishen、weight；weights 为除日主外各十神的权重合计
+            （天干每个计1，藏干按权重计）
+        """
+        tiangan = GanzhiCalculator.TIANGAN
+        shishen = GanzhiCalculator.SHISHEN
+        day_gan = codes[4]
+        shishen_row = GanzhiCalculator.SHISHEN_MATRIX[day_gan]
+        zhi_row = GanzhiCalculator.ZHI_SHISHEN[day_gan]
+        
+        weights = [0.0] * 10
+        gan_shishen = {}
+        canggan = {}
+        for position, pillar in enumerate(("year", "month", "day", "hour")):
+            gan, zhi = codes[2 * position], codes[2 * position + 1]
+            if pillar == "day":
+                gan_shishen[pillar] = "日主"
+            else:
+                shishen_idx = shishen_row[gan]
+                gan_shishen[pillar] = shishen[shishen_idx]
+                weights[shishen_idx] += 1.0
+            
+            hidden = []
+            for hidden_gan, shishen_idx, weight in zhi_row[zhi]:
+                hidden.append({"gan": tiangan[hidden_gan], "shishen": shishen[shishen_idx], "weight": weight})
+                weights[shishen_idx] += weight
+            canggan[pillar] = hidden
+        
+        return {
+            "gan": gan_shishen,
+            "canggan": canggan,
+            "weights": {name: round(weight, 6) for name, weight in zip(shishen, weights)},
+        }
+    
     @staticmethod
     def is_sheng_relation(wuxing1: str, wuxing2: str) -> bool:
         """判断两个五行是否为相生关系
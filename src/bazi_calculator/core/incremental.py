@@ -0,0 +1,163 @@
+"""增量排盘模块
+
+出生时间被修改时，此模块只重算可能变化的柱：
+    时柱：时支变化或日干变化
+    日柱：日期变化
+    年柱、月柱：新时间越出原节气区间
+
+下游分析（五行、命格以及外部注册的分析如取名）按各自依赖的干支信息
+生成缓存键，键不变的结果直接沿用，只有受影响的分析才重新计算。
+"""
+
+import copy
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from bazi_calculator.core.calendar import BaziCalendar
+from bazi_calculator.core.jieqi import JieqiCalculator
+from bazi_calculator.core.mingge import MingGeAnalyzer
+from bazi_calculator.core.wuxing import AnalysisContext, WuxingAnalyzer
+
+
+# 分析定义：(缓存键函数, 计算函数)，两者都以 IncrementalChart 为参数
+Analysis = Tuple[Callable[["IncrementalChart"], Any], Callable[["IncrementalChart"], Dict]]
+
+PILLARS = ("year", "month", "day", "hour")
+
+
+def wuxing_key(chart: "IncrementalChart") -> Tuple:
+    """五行分析只依赖日干与八个干支的五行"""
+    bazi = chart.bazi
+    return (bazi["day"]["gan"],) + tuple(
+        (bazi[pillar]["gan_wuxing"], bazi[pillar]["zhi_wuxing"]) for pillar in PILLARS
+    )
+
+
+def mingge_key(chart: "IncrementalChart") -> Tuple:
+    """命格分析另依赖四柱干支（格局、化气与合冲刑害破）"""
+    bazi = chart.bazi
+    return wuxing_key(chart) + tuple(bazi[pillar]["full"] for pillar in PILLARS)
+
+
+class IncrementalChart:
+    """增量排盘器
+
+    保存一次排盘的四柱编码、所在节气区间与下游分析缓存，
+    修改出生时间时只重算受影响的部分。
+    """
+
+    # 当前的四柱字典与 (八个干支编码, 节气索引)
+    bazi: Dict
+    codes: Tuple[int, ...]
+
+    # 默认的下游分析
+    DEFAULT_ANALYSES: Dict[str, Analysis] = {
+        "wuxing": (wuxing_key, lambda chart: WuxingAnalyzer.analyze_comprehensive(chart.bazi, chart.context)),
+        "mingge": (
+            mingge_key,
+            lambda chart: MingGeAnalyzer.analyze_comprehensive(
+                chart.bazi, chart.get_analysis("wuxing"), chart.context
+            ),
+        ),
+    }
+
+    def __init__(self, birth_date: datetime, analyses: Optional[Dict[str, Analysis]] = None):
+        """排盘并初始化分析缓存
+
+        Args:
+            birth_date: 出生日期时间
+            analyses: 额外的下游分析，名称到 (缓存键函数, 计算函数) 的映射
+        """
+        self.analyses = dict(IncrementalChart.DEFAULT_ANALYSES)
+        if analyses:
+            self.analyses.update(analyses)
+        self._cache: Dict[str, Tuple[Any, Dict]] = {}
+        self._context: Optional[AnalysisContext] = None
+
+        self.birth_date = birth_date
+        self._locate_jieqi(birth_date)
+        self.codes = BaziCalendar._chart_codes(birth_date, self._jieqi_year, self._jieqi_index)
+        self.bazi = BaziCalendar.codes_to_pillars(self.codes[:8], self.codes[8], birth_date)
+
+    @property
+    def context(self) -> AnalysisContext:
+        """当前八字的分析上下文，供各下游分析共用，四柱变化后重新创建"""
+        if self._context is None:
+            self._context = WuxingAnalyzer.build_context(self.bazi)
+        return self._context
+
+    def _locate_jieqi(self, date: datetime) -> None:
+        """定位节气并记录节气区间"""
+        year, index, self._jieqi_start, self._jieqi_end = JieqiCalculator.locate_jieqi_interval(date)
+        self._jieqi_year, self._jieqi_index = year, index
+
+    def update(self, birth_date: datetime) -> List[str]:
+        """修改出生时间，只重算可能变化的柱
+
+        Args:
+            birth_date: 新的出生日期时间
+
+        Returns:
+            干支或节气发生变化的柱名称列表（按年、月、日、时排列）
+        """
+        previous = self.codes
+        year_gan, year_zhi, month_gan, month_zhi, day_gan, day_zhi, hour_gan, hour_zhi, jieqi_index = previous
+
+        # 越出原节气区间才重新定位节气
+        if not self._jieqi_start <= birth_date < self._jieqi_end:
+            self._locate_jieqi(birth_date)
+            year_gan, year_zhi = BaziCalendar.get_year_codes(self._jieqi_year)
+            month_gan, month_zhi = BaziCalendar.get_month_codes(year_gan, self._jieqi_index)
+            jieqi_index = self._jieqi_index
+
+        if birth_date.date() != self.birth_date.date():
+            day_gan, day_zhi = BaziCalendar.get_day_codes(birth_date.toordinal())
+
+        if day_gan != previous[4] or BaziCalendar.HOUR_ZHI[birth_date.hour] != hour_zhi:
+            hour_gan, hour_zhi = BaziCalendar.get_hour_codes(day_gan, birth_date.hour)
+
+        self.codes = (
+            year_gan, year_zhi, month_gan, month_zhi, day_gan, day_zhi, hour_gan, hour_zhi, jieqi_index
+        )
+        self.birth_date = birth_date
+
+        changed = []
+        rebuilt = None
+        for position, pillar in enumerate(PILLARS):
+            if self.codes[2 * position:2 * position + 2] != previous[2 * position:2 * position + 2] \
+                    or (pillar == "month" and jieqi_index != previous[8]):
+                changed.append(pillar)
+                if rebuilt is None:
+                    rebuilt = BaziCalendar.codes_to_pillars(self.codes[:8], jieqi_index, birth_date)
+                self.bazi[pillar] = rebuilt[pillar]
+        if rebuilt is not None:
+            self._context = None
+        self.bazi["birth_info"] = BaziCalendar.get_birth_info(birth_date)
+        return changed
+
+    def get_analysis(self, name: str) -> Dict:
+        """获取下游分析结果，依赖的干支信息未变时沿用缓存
+
+        Args:
+            name: 分析名称
+
+        Returns:
+            分析结果的副本，调用方修改返回值不会影响缓存
+
+        Raises:
+            KeyError: 未注册的分析
+        """
+        key_func, compute = self.analyses[name]
+        key = key_func(self)
+        cached = self._cache.get(name)
+        if cached is None or cached[0] != key:
+            cached = (key, compute(self))
+            self._cache[name] = cached
+        return copy.deepcopy(cached[1])
+
+    def get_stale_analyses(self) -> List[str]:
+        """获取已缓存但因出生时间修改而失效的分析名称"""
+        return [
+            name for name, (key, _) in self._cache.items()
+            if self.analyses[name][0](self) != key
+        ]
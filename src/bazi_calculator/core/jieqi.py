@@ -4,10 +4,15 @@
 基于Jean Meeus《Astronomical Algorithms》中的算法。
 """
 
+from array import array
+from bisect import bisect_right
 from datetime import datetime, timedelta
-from typing import Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 from math import radians, sin, cos, tan, atan, asin, acos, degrees, floor, pi
 
+if TYPE_CHECKING:
+    from bazi_calculator.core.ephemeris import JieqiEphemeris
+
 
 class JieqiCalculator:
     """节气计算器
@@ -34,6 +39,55 @@ class JieqiCalculator:
     # 节气名称到索引的映射
     JIEQI_INDEX = {name: idx for idx, name in enumerate(JIEQI_NAMES)}
     
+    # 七十二候名称，自立春初候起每候对应太阳黄经5度（第i候始于 (315 + 5i) % 360 度）
+    HOU_NAMES = [
+        "东风解冻", "蛰虫始振", "鱼陟负冰", "獭祭鱼", "候雁北", "草木萌动",
+        "桃始华", "仓庚鸣", "鹰化为鸠", "玄鸟至", "雷乃发声", "始电",
+        "桐始华", "田鼠化为鴽", "虹始见", "萍始生", "鸣鸠拂其羽", "戴胜降于桑",
+        "蝼蝈鸣", "蚯蚓出", "王瓜生", "苦菜秀", "靡草死", "麦秋至",
+        "螳螂生", "鵙始鸣", "反舌无声", "鹿角解", "蜩始鸣", "半夏生",
+        "温风至", "蟋蟀居壁", "鹰始挚", "腐草为萤", "土润溽暑", "大雨时行",
+        "凉风至", "白露降", "寒蝉鸣", "鹰乃祭鸟", "天地始肃", "禾乃登",
+        "鸿雁来", "玄鸟归", "群鸟养羞", "雷始收声", "蛰虫坯户", "水始涸",
+        "鸿雁来宾", "雀入大水为蛤", "菊有黄华", "豺乃祭兽", "草木黄落", "蛰虫咸俯",
+        "水始冰", "地始冻", "雉入大水为蜃", "虹藏不见", "天气上升地气下降", "闭塞而成冬",
+        "鹖鴠不鸣", "虎始交", "荔挺出", "蚯蚓结", "麋角解", "水泉动",
+        "雁北乡", "鹊始巢", "雉始雊", "鸡乳", "征鸟厉疾", "水泽腹坚"
+    ]
+    
+    # 预计算节气表覆盖的年份范围（含首尾）
+    TABLE_START_YEAR = 1900
+    TABLE_END_YEAR = 2100
+    
+    # 预计算节气表：按时间顺序排列的扁平儒略日数组，首次使用时构建
+    # 第 (year - TABLE_START_YEAR) * 24 + idx 项为 year 年第 idx 个节气
+    # （小寒、大寒落在次年一月，因此整个数组天然有序）
+    _jieqi_table: Optional[array] = None
+    
+    # 节气求解模式
+    SOLVER_MODES = ("analytic", "fixed_rate")
+    
+    # 固定变化率迭代的次数上限与黄经精度（度）
+    FIXED_RATE_MAX_ITERATIONS = 10
+    FIXED_RATE_TOLERANCE = 0.0001
+    
+    # 解析导数迭代的次数上限与黄经精度（度），1e-7度约合0.01秒
+    ANALYTIC_MAX_ITERATIONS = 10
+    ANALYTIC_TOLERANCE = 1e-7
+    
+    # 平太阳黄经变化率（度/日）
+    MEAN_SOLAR_RATE = 36000.76983 / 36525.0
+    
+    # 自适应精度：距节气交接多少小时以内才精确定位，以及太阳黄经日变化上限（度/日）
+    PRECISION_WINDOW_HOURS = 36.0
+    MAX_SOLAR_RATE = 1.02
+    
+    # 可选的节气历表（JieqiEphemeris），用于预计算表之外的年份
+    _ephemeris: Optional["JieqiEphemeris"] = None
+    
+    # 儒略日转换为时间时的取整补偿（约0.09秒），保证整秒时刻往返一致
+    _JD_EPSILON = 1e-6
+    
     @staticmethod
     def _get_julian_day(date: datetime) -> float:
         """获取儒略日
@@ -105,27 +159,63 @@ class JieqiCalculator:
         return L_true % 360
     
     @staticmethod
-    def _find_jieqi_time(year: int, longitude: float) -> datetime:
-        """查找指定年份太阳到达指定黄经的时间
+    def _get_solar_longitude_rate(jd: float) -> float:
+        """计算太阳黄经变化率（_get_solar_longitude 的解析导数）
+        
+        Args:
+            jd: 儒略日
+            
+        Returns:
+            太阳黄经变化率（度/日）
+        """
+        T = (jd - 2451545.0) / 36525.0
+        
+        # 平黄经、平近点角对儒略世纪的导数（度/世纪）
+        dL0 = 36000.76983 + 2 * 0.0003032 * T
+        dM = radians(35999.05029 - 2 * 0.0001537 * T)
+        
+        M = radians((357.52911 + 35999.05029 * T - 0.0001537 * T * T) % 360)
+        
+        # 中心差各项系数及其导数
+        a = 1.914602 - 0.004817 * T - 0.000014 * T * T
+        da = -0.004817 - 2 * 0.000014 * T
+        b = 0.019993 - 0.000101 * T
+        db = -0.000101
+        
+        dC = da * sin(M) + a * cos(M) * dM \
+            + db * sin(2 * M) + b * cos(2 * M) * 2 * dM \
+            + 0.000289 * cos(3 * M) * 3 * dM
+        
+        # 章动项导数
+        omega = radians(125.04 - 1934.136 * T)
+        dnutation = -0.00478 * cos(omega) * radians(-1934.136)
+        
+        return (dL0 + dC + dnutation) / 36525.0
+    
+    @staticmethod
+    def _solve_fixed_rate(year: int, longitude: float) -> Tuple[float, int, float, bool]:
+        """以固定黄经变化率迭代求解节气时刻
         
         Args:
             year: 年份
-            longitude: 目标黄经（度）
+            longitude: 目标黄经（度），可为任意角度
             
         Returns:
-            节气时间
+            (儒略日, 迭代次数, 黄经残差, 是否收敛) 元组
         """
         # 初始估计：从年初开始，每隔15天左右有一个节气
         jd_start = JieqiCalculator._get_julian_day(datetime(year, 1, 1))
         
         # 简化的节气时间估计
-        # 根据黄经确定大致的月份
-        idx = JieqiCalculator.JIEQI_LONGITUDE.index(int(longitude))
+        # 根据黄经确定自立春起的节气序数（二十四节气恰为整数）
+        idx = ((longitude - 315) % 360) / 15
         days_per_jieqi = 365.25 / 24.0
         estimated_jd = jd_start + idx * days_per_jieqi - 10
         
         # 使用牛顿迭代法精确定位
-        for _ in range(10):
+        iterations = 0
+        converged = False
+        for _ in range(JieqiCalculator.FIXED_RATE_MAX_ITERATIONS):
             current_longitude = JieqiCalculator._get_solar_longitude(estimated_jd)
             
             # 处理黄经过0度的情况
@@ -137,25 +227,152 @@ class JieqiCalculator:
             
             diff = current_longitude - longitude
             
-            if abs(diff) < 0.0001:  # 精度足够
+            if abs(diff) < JieqiCalculator.FIXED_RATE_TOLERANCE:  # 精度足够
+                converged = True
                 break
             
             # 太阳黄经变化率（简化为每天约1度）
             jd_correction = diff / 0.9856
             estimated_jd -= jd_correction
+            iterations += 1
+        
+        if not converged:
+            diff = JieqiCalculator._longitude_diff(
+                JieqiCalculator._get_solar_longitude(estimated_jd), longitude
+            )
+        
+        return estimated_jd, iterations, diff, converged
+    
+    @staticmethod
+    def _solve_analytic(year: int, longitude: float) -> Tuple[float, int, float, bool]:
+        """以解析导数的牛顿法求解太阳到达指定黄经的时刻
+        
+        初值取平太阳（只含平黄经）到达目标黄经的时刻，之后每步用
+        _get_solar_longitude_rate 给出的真实变化率修正，通常2-3次迭代
+        即可达到亚秒精度。年份归属与 _find_jieqi_time 相同：从当年立春
+        （黄经315度）起算，小寒、大寒落在次年一月。
+        
+        Args:
+            year: 年份
+            longitude: 目标黄经（度），可为任意角度
+            
+        Returns:
+            (儒略日, 迭代次数, 黄经残差, 是否收敛) 元组
+        """
+        # 平太阳自立春起需走过的黄经
+        arc = (longitude - 315) % 360
+        
+        # 平太阳约在2月4日到达立春，据此锚定当年的周期
+        jd_anchor = JieqiCalculator._get_julian_day(datetime(year, 2, 4)) \
+            + arc / JieqiCalculator.MEAN_SOLAR_RATE
+        T = (jd_anchor - 2451545.0) / 36525.0
+        mean_longitude = (280.46646 + 36000.76983 * T + 0.0003032 * T * T) % 360
+        estimated_jd = jd_anchor \
+            + JieqiCalculator._longitude_diff(longitude, mean_longitude) / JieqiCalculator.MEAN_SOLAR_RATE
+        
+        iterations = 0
+        converged = False
+        diff = 0.0
+        for _ in range(JieqiCalculator.ANALYTIC_MAX_ITERATIONS):
+            diff = JieqiCalculator._longitude_diff(
+                JieqiCalculator._get_solar_longitude(estimated_jd), longitude
+            )
+            if abs(diff) < JieqiCalculator.ANALYTIC_TOLERANCE:
+                converged = True
+                break
+            
+            estimated_jd -= diff / JieqiCalculator._get_solar_longitude_rate(estimated_jd)
+            iterations += 1
+        
+        if not converged:
+            diff = JieqiCalculator._longitude_diff(
+                JieqiCalculator._get_solar_longitude(estimated_jd), longitude
+            )
+            converged = abs(diff) < JieqiCalculator.ANALYTIC_TOLERANCE
         
-        # 将儒略日转换回datetime
-        jd = estimated_jd
+        return estimated_jd, iterations, diff, converged
+    
+    @staticmethod
+    def _longitude_diff(longitude: float, target: float) -> float:
+        """计算两个黄经之差，归一到 [-180, 180) 区间"""
+        return (longitude - target + 180) % 360 - 180
+    
+    @staticmethod
+    def _find_jieqi_time(year: int, longitude: float) -> datetime:
+        """查找指定年份太阳到达指定黄经的时间
+        
+        Args:
+            year: 年份
+            longitude: 目标黄经（度）
+            
+        Returns:
+            节气时间
+        """
+        estimated_jd, _, _, _ = JieqiCalculator._solve_fixed_rate(year, longitude)
+        return JieqiCalculator._julian_day_to_datetime(estimated_jd)
+    
+    @staticmethod
+    def solve_jieqi(year: int, jieqi_index: int, mode: str = "analytic") -> Dict[str, Any]:
+        """求解节气时刻并返回收敛信息
+        
+        不经过预计算节气表，每次都实际求解，便于监控求解代价与精度。
+        
+        Args:
+            year: 年份
+            jieqi_index: 节气索引（0-23）
+            mode: 求解模式，"analytic"（解析导数）或 "fixed_rate"（固定变化率，
+                即 calculate_jieqi_datetime 使用的方式）
+            
+        Returns:
+            求解结果字典，包含儒略日、时间、迭代次数、黄经残差（度）、
+            对应的时间残差（秒）以及是否收敛
+            
+        Raises:
+            IndexError: 节气索引超出范围
+            ValueError: 无效的求解模式
+        """
+        if not 0 <= jieqi_index < 24:
+            raise IndexError(f"节气索引超出范围: {jieqi_index}")
+        if mode not in JieqiCalculator.SOLVER_MODES:
+            raise ValueError(f"无效的求解模式: {mode}")
+        
+        longitude = JieqiCalculator.JIEQI_LONGITUDE[jieqi_index]
+        if mode == "analytic":
+            jd, iterations, residual, converged = JieqiCalculator._solve_analytic(year, longitude)
+        else:
+            jd, iterations, residual, converged = JieqiCalculator._solve_fixed_rate(year, longitude)
+        
+        rate = JieqiCalculator._get_solar_longitude_rate(jd)
+        
+        return {
+            "jieqi": JieqiCalculator.JIEQI_NAMES[jieqi_index],
+            "mode": mode,
+            "julian_day": jd,
+            "datetime": JieqiCalculator._julian_day_to_datetime(jd),
+            "iterations": iterations,
+            "residual": residual,
+            "residual_seconds": abs(residual) / rate * 86400,
+            "converged": converged,
+        }
+    
+    @staticmethod
+    def _julian_day_to_datetime(jd: float) -> datetime:
+        """将儒略日转换回datetime（秒以下截断）
+        
+        Args:
+            jd: 儒略日
+            
+        Returns:
+            对应的日期时间
+        """
         jd = jd + 0.5
         
         Z = int(jd)
         F = jd - Z
         
-        if Z < 2299161:
-            A = Z
-        else:
-            alpha = int((Z - 1867216.25) / 36524.25)
-            A = Z + 1 + alpha - int(alpha / 4)
+        # 始终按格里高利历（外推）换算，与 _get_julian_day 及 datetime 一致
+        alpha = int((Z - 1867216.25) / 36524.25)
+        A = Z + 1 + alpha - int(alpha / 4)
         
         B = A + 1524
         C = int((B - 122.1) / 365.25)
@@ -172,6 +389,89 @@ class JieqiCalculator:
         
         return datetime(year_calc, month, day, hour, minute, second)
     
+    @staticmethod
+    def _solve_year_jieqi(year: int) -> List[float]:
+        """用迭代法求解某年全部24个节气的儒略日
+        
+        节气时刻先截断到整秒再转换为儒略日，与 calculate_jieqi_datetime
+        返回的时间保持一致。
+        
+        Args:
+            year: 年份
+            
+        Returns:
+            按节气索引排列的24个儒略日
+        """
+        return [
+            JieqiCalculator._get_julian_day(
+                JieqiCalculator._find_jieqi_time(year, longitude)
+            )
+            for longitude in JieqiCalculator.JIEQI_LONGITUDE
+        ]
+    
+    @staticmethod
+    def _get_year_jieqi_jds(year: int) -> List[float]:
+        """获取某年全部节气的儒略日
+        
+        依次使用预计算节气表、节气历表（若已配置且包含该年份），
+        都不包含时迭代求解。
+        
+        Args:
+            year: 年份
+            
+        Returns:
+            按节气索引排列的24个儒略日
+        """
+        if JieqiCalculator.TABLE_START_YEAR <= year <= JieqiCalculator.TABLE_END_YEAR:
+            position = (year - JieqiCalculator.TABLE_START_YEAR) * 24
+            return JieqiCalculator._get_jieqi_table()[position:position + 24].tolist()
+        
+        ephemeris = JieqiCalculator._ephemeris
+        if ephemeris is not None and ephemeris.covers(year):
+            julian_days: List[float] = ephemeris.get_year_julian_days(year)
+            return julian_days
+        return JieqiCalculator._solve_year_jieqi(year)
+    
+    @staticmethod
+    def configure_ephemeris(path: Optional[str]) -> None:
+        """配置节气历表文件
+        
+        配置后，预计算节气表（TABLE_START_YEAR-TABLE_END_YEAR）之外的年份
+        优先从历表读取，历表也不包含时才迭代求解。
+        
+        Args:
+            path: 历表文件路径（由 bazi_calculator.core.ephemeris 生成），
+                为None时取消配置
+            
+        Raises:
+            ValueError: 文件格式无效
+        """
+        from bazi_calculator.core.ephemeris import JieqiEphemeris
+        
+        ephemeris = JieqiEphemeris(path) if path is not None else None
+        if JieqiCalculator._ephemeris is not None:
+            JieqiCalculator._ephemeris.close()
+        JieqiCalculator._ephemeris = ephemeris
+    
+    @staticmethod
+    def _get_jieqi_table() -> array:
+        """获取预计算节气表，首次调用时构建
+        
+        Returns:
+            覆盖 TABLE_START_YEAR 至 TABLE_END_YEAR 的扁平儒略日数组
+        """
+        if JieqiCalculator._jieqi_table is None:
+            table = array("d")
+            for year in range(JieqiCalculator.TABLE_START_YEAR, JieqiCalculator.TABLE_END_YEAR + 1):
+                table.extend(JieqiCalculator._solve_year_jieqi(year))
+            JieqiCalculator._jieqi_table = table
+        return JieqiCalculator._jieqi_table
+    
+    @staticmethod
+    def _table_jd_to_datetime(jd: float) -> datetime:
+        """将节气表中的整秒儒略日还原为datetime"""
+        return JieqiCalculator._julian_day_to_datetime(jd + JieqiCalculator._JD_EPSILON)
+    
     @staticmethod
     def calculate_jieqi_datetime(year: int, jieqi_index: int) -> datetime:
         """计算指定年份指定节气的精确时间
@@ -189,66 +489,151 @@ class JieqiCalculator:
         if not 0 <= jieqi_index < 24:
             raise IndexError(f"节气索引超出范围: {jieqi_index}")
         
+        if JieqiCalculator.TABLE_START_YEAR <= year <= JieqiCalculator.TABLE_END_YEAR:
+            table = JieqiCalculator._get_jieqi_table()
+            position = (year - JieqiCalculator.TABLE_START_YEAR) * 24 + jieqi_index
+            return JieqiCalculator._table_jd_to_datetime(table[position])
+        
+        ephemeris = JieqiCalculator._ephemeris
+        if ephemeris is not None and ephemeris.covers(year):
+            jieqi_time: datetime = ephemeris.get_jieqi(year, jieqi_index)
+            return jieqi_time
+        
         longitude = JieqiCalculator.JIEQI_LONGITUDE[jieqi_index]
         return JieqiCalculator._find_jieqi_time(year, longitude)
     
     @staticmethod
-    def get_current_jieqi(date: datetime) -> Tuple[str, datetime, datetime]:
-        """获取指定日期当前所在的节气
+    def _locate_jieqi(date: datetime) -> Tuple[int, int, float, float]:
+        """定位日期所在的节气
+        
+        在预计算节气表范围内只需一次二分查找；超出范围时从节气历表
+        读取（若已配置）或临时求解前后两年的节气，再做同样的查找。
         
         Args:
             date: 日期
             
         Returns:
-            (节气名称, 节气开始时间, 下一个节气开始时间) 元组
+            (节气所属年份, 节气索引, 节气开始儒略日, 下一个节气开始儒略日) 元组
         """
-        year = date.year
         jd_date = JieqiCalculator._get_julian_day(date)
+        table = JieqiCalculator._get_jieqi_table()
+        
+        # 表内查找：需同时有当前节气和下一个节气
+        position = bisect_right(table, jd_date) - 1
+        if 0 <= position < len(table) - 1:
+            year = JieqiCalculator.TABLE_START_YEAR + position // 24
+            return year, position % 24, table[position], table[position + 1]
+        
+        # 超出预计算范围，取前一年与当年的节气（前一年的小寒、大寒落在当年一月）
+        year = date.year - 1
+        terms = JieqiCalculator._get_year_jieqi_jds(year) + JieqiCalculator._get_year_jieqi_jds(year + 1)
+        position = bisect_right(terms, jd_date) - 1
+        return year + position // 24, position % 24, terms[position], terms[position + 1]
+    
+    @staticmethod
+    def locate_jieqi(date: datetime) -> Tuple[int, int]:
+        """获取日期所在节气的年份与索引
+        
+        节气年份以立春为界，即八字年柱所用的年份。
         
-        # 计算该年所有节气
-        jieqi_times = []
-        for i in range(24):
-            jieqi_time = JieqiCalculator.calculate_jieqi_datetime(year, i)
-            jieqi_times.append((i, jieqi_time))
-        
-        # 检查是否在年份的前几个节气（可能是前一年的大寒和小寒）
-        if date < jieqi_times[0][1]:
-            # 在第一个节气之前，需要查看前一年的后几个节气
-            prev_year_jieqi_times = []
-            for i in range(22, 24):  # 小寒和大寒
-                jieqi_time = JieqiCalculator.calculate_jieqi_datetime(year - 1, i)
-                prev_year_jieqi_times.append((i, jieqi_time))
+        Args:
+            date: 日期
             
-            # 找到当前节气
-            for i in range(len(prev_year_jieqi_times)):
-                idx, jieqi_time = prev_year_jieqi_times[i]
-                if jd_date >= JieqiCalculator._get_julian_day(jieqi_time):
-                    current_jieqi_index = idx
-                    current_jieqi_time = jieqi_time
-                    next_jieqi_time = jieqi_times[0][1]
-                    current_jieqi_name = JieqiCalculator.JIEQI_NAMES[current_jieqi_index]
-                    return current_jieqi_name, current_jieqi_time, next_jieqi_time
-        
-        # 找到当前日期所在的节气
-        current_jieqi_index = 0
-        current_jieqi_time = jieqi_times[0][1]
-        next_jieqi_time = jieqi_times[1][1]
-        
-        for i in range(len(jieqi_times)):
-            idx = int(i)
-            _, jieqi_time = jieqi_times[idx]
-            if jd_date >= JieqiCalculator._get_julian_day(jieqi_time):
-                current_jieqi_index = idx
-                current_jieqi_time = jieqi_time
-                if idx < 23:
-                    next_jieqi_time = jieqi_times[idx + 1][1]
-                else:
-                    # 最后一个节气，下一个是下一年的小寒
-                    next_jieqi_time = JieqiCalculator.calculate_jieqi_datetime(year + 1, 22)
-            else:
-                break
+        Returns:
+            (节气所属年份, 节气索引) 元组
+        """
+        year, jieqi_index, _, _ = JieqiCalculator._locate_jieqi(date)
+        return year, jieqi_index
+    
+    @staticmethod
+    def locate_jieqi_interval(date: datetime) -> Tuple[int, int, datetime, datetime]:
+        """获取日期所在节气的年份、索引与起止时间
+        
+        起止时间之间的任意时刻都属于同一节气，可据此判断后续时刻是否越出该节气。
+        
+        Args:
+            date: 日期
+            
+        Returns:
+            (节气所属年份, 节气索引, 节气开始时间, 下一个节气开始时间) 元组
+        """
+        year, jieqi_index, start_jd, end_jd = JieqiCalculator._locate_jieqi(date)
+        return (
+            year,
+            jieqi_index,
+            JieqiCalculator._table_jd_to_datetime(start_jd),
+            JieqiCalculator._table_jd_to_datetime(end_jd),
+        )
+    
+    @staticmethod
+    def estimate_jieqi(date: datetime) -> Tuple[int, int, float]:
+        """用一次太阳黄经计算估计日期所在的节气
+        
+        节气交接按太阳黄经定义，直接由该时刻的黄经得到所在节气，
+        只在交接时刻前后数秒（求解精度与整秒截断）内可能与精确定位不同。
+        
+        Args:
+            date: 日期
+            
+        Returns:
+            (节气所属年份, 节气索引, 距最近节气交接的小时数下限) 元组
+        """
+        longitude = JieqiCalculator._get_solar_longitude(JieqiCalculator._get_julian_day(date))
+        arc = (longitude - 315) % 360
+        jieqi_index = int(arc // 15) % 24
+        offset = arc - jieqi_index * 15
+        margin_hours = min(offset, 15 - offset) / JieqiCalculator.MAX_SOLAR_RATE * 24
+        
+        # 一月全部属于上一节气年；二月立春前为上一年的大寒
+        if date.month == 1 or jieqi_index >= 22:
+            year = date.year - 1
+        else:
+            year = date.year
+        return year, jieqi_index, margin_hours
+    
+    @staticmethod
+    def locate_jieqi_adaptive(
+        date: datetime,
+        window_hours: float = PRECISION_WINDOW_HOURS,
+    ) -> Tuple[int, int, str]:
+        """两级精度定位日期所在的节气
+        
+        预计算节气表范围内的二分查找已比估计更快，直接精确定位；表外先用
+        estimate_jieqi 估计，距节气交接不足 window_hours 时改用 locate_jieqi 精确定位。
+        所用级别随结果返回，由调用方自行统计。
+        
+        Args:
+            date: 日期
+            window_hours: 精确定位窗口（小时）
+            
+        Returns:
+            (节气所属年份, 节气索引, 所用级别) 元组，级别为 "estimate" 或 "precise"
+        """
+        table = JieqiCalculator._get_jieqi_table()
+        jd_date = JieqiCalculator._get_julian_day(date)
+        if not table[0] <= jd_date < table[-1]:
+            year, jieqi_index, margin_hours = JieqiCalculator.estimate_jieqi(date)
+            if margin_hours > window_hours:
+                return year, jieqi_index, "estimate"
+        
+        year, jieqi_index = JieqiCalculator.locate_jieqi(date)
+        return year, jieqi_index, "precise"
+    
+    @staticmethod
+    def get_current_jieqi(date: datetime) -> Tuple[str, datetime, datetime]:
+        """获取指定日期当前所在的节气
+        
+        Args:
+            date: 日期
+            
+        Returns:
+            (节气名称, 节气开始时间, 下一个节气开始时间) 元组
+        """
+        _, jieqi_index, current_jd, next_jd = JieqiCalculator._locate_jieqi(date)
         
-        current_jieqi_name = JieqiCalculator.JIEQI_NAMES[current_jieqi_index]
+        current_jieqi_name = JieqiCalculator.JIEQI_NAMES[jieqi_index]
+        current_jieqi_time = JieqiCalculator._table_jd_to_datetime(current_jd)
+        next_jieqi_time = JieqiCalculator._table_jd_to_datetime(next_jd)
         
         return current_jieqi_name, current_jieqi_time, next_jieqi_time
     
@@ -0,0 +1,325 @@
+"""批量节气计算模块
+
+此模块提供 JieqiCalculator 中儒略日、太阳黄经和节气求解的向量化版本，
+一次处理整批时刻，适用于大批量排盘任务。
+算法与 JieqiCalculator 完全相同，日期统一按格里高利历（外推）处理。
+另提供任意黄经（如七十二候）交点的区间搜索。
+"""
+
+from datetime import datetime
+from typing import Iterator, Sequence, Tuple, Union
+
+import numpy as np
+
+from bazi_calculator.core.jieqi import JieqiCalculator
+
+
+# 1970-01-01T00:00:00 对应的儒略日
+_UNIX_EPOCH_JD = 2440587.5
+
+# 每日秒数
+_SECONDS_PER_DAY = 86400.0
+
+ArrayLike = Union[np.ndarray, list, tuple]
+
+
+class BatchJieqiCalculator:
+    """批量节气计算器
+
+    所有方法均为数组输入、数组输出，与 JieqiCalculator 的标量方法一一对应。
+    """
+
+    # 节气对应的太阳黄经（数组形式）
+    JIEQI_LONGITUDE = np.array(JieqiCalculator.JIEQI_LONGITUDE, dtype=np.float64)
+
+    # 迭代求解的最大次数与精度（与 JieqiCalculator._find_jieqi_time 一致）
+    MAX_ITERATIONS = 10
+    TOLERANCE = 0.0001
+
+    # 黄经交点搜索：采样步长（日）、每批处理的天数，以及牛顿修正的次数上限与精度（度）
+    CROSSING_STEP_DAYS = 1.0
+    CROSSING_CHUNK_DAYS = 366.0
+    CROSSING_MAX_ITERATIONS = 10
+    CROSSING_TOLERANCE = 1e-7
+
+    @staticmethod
+    def to_datetime64(dates: ArrayLike) -> np.ndarray:
+        """将日期序列转换为秒精度的 datetime64 数组
+
+        Args:
+            dates: datetime 序列或 datetime64 数组
+
+        Returns:
+            datetime64[s] 数组
+        """
+        return np.asarray(dates, dtype="datetime64[s]")
+
+    @staticmethod
+    def get_julian_days(dates: ArrayLike) -> np.ndarray:
+        """批量获取儒略日
+
+        Args:
+            dates: datetime 序列或 datetime64 数组
+
+        Returns:
+            儒略日数组
+        """
+        seconds = BatchJieqiCalculator.to_datetime64(dates).astype(np.int64)
+        return seconds / _SECONDS_PER_DAY + _UNIX_EPOCH_JD
+
+    @staticmethod
+    def julian_days_to_datetime64(jd: ArrayLike) -> np.ndarray:
+        """将儒略日数组转换回 datetime64（秒以下截断）
+
+        Args:
+            jd: 儒略日数组
+
+        Returns:
+            datetime64[s] 数组
+        """
+        jd = np.asarray(jd, dtype=np.float64)
+        seconds = np.floor((jd - _UNIX_EPOCH_JD) * _SECONDS_PER_DAY)
+        return seconds.astype(np.int64).astype("datetime64[s]")
+
+    @staticmethod
+    def get_solar_longitudes(jd: ArrayLike) -> np.ndarray:
+        """批量计算太阳黄经
+
+        Args:
+            jd: 儒略日数组
+
+        Returns:
+            太阳黄经数组（角度）
+        """
+        jd = np.asarray(jd, dtype=np.float64)
+
+        # 从2000年1月1日12时UT起算的儒略世纪数
+        T = (jd - 2451545.0) / 36525.0
+
+        # 太阳平黄经
+        L0 = np.mod(280.46646 + 36000.76983 * T + 0.0003032 * T * T, 360)
+
+        # 太阳平近点角
+        M = np.radians(np.mod(357.52911 + 35999.05029 * T - 0.0001537 * T * T, 360))
+
+        # 太阳中心差
+        C = (1.914602 - 0.004817 * T - 0.000014 * T * T) * np.sin(M) \
+            + (0.019993 - 0.000101 * T) * np.sin(2 * M) \
+            + 0.000289 * np.sin(3 * M)
+
+        # 章动修正（简化版）
+        omega = np.radians(125.04 - 1934.136 * T)
+        nutation = -0.00478 * np.sin(omega)
+
+        longitudes: np.ndarray = np.mod(L0 + C + nutation, 360)
+        return longitudes
+
+    @staticmethod
+    def get_solar_longitude_rates(jd: ArrayLike) -> np.ndarray:
+        """批量计算太阳黄经变化率（与 JieqiCalculator._get_solar_longitude_rate 一致）
+
+        Args:
+            jd: 儒略日数组
+
+        Returns:
+            太阳黄经变化率数组（度/日）
+        """
+        jd = np.asarray(jd, dtype=np.float64)
+        T = (jd - 2451545.0) / 36525.0
+
+        # 平黄经、平近点角对儒略世纪的导数（度/世纪）
+        dL0 = 36000.76983 + 2 * 0.0003032 * T
+        dM = np.radians(35999.05029 - 2 * 0.0001537 * T)
+
+        M = np.radians(np.mod(357.52911 + 35999.05029 * T - 0.0001537 * T * T, 360))
+
+        # 中心差各项系数及其导数
+        a = 1.914602 - 0.004817 * T - 0.000014 * T * T
+        da = -0.004817 - 2 * 0.000014 * T
+        b = 0.019993 - 0.000101 * T
+        db = -0.000101
+
+        dC = da * np.sin(M) + a * np.cos(M) * dM \
+            + db * np.sin(2 * M) + b * np.cos(2 * M) * 2 * dM \
+            + 0.000289 * np.cos(3 * M) * 3 * dM
+
+        # 章动项导数
+        omega = np.radians(125.04 - 1934.136 * T)
+        dnutation = -0.00478 * np.cos(omega) * np.radians(-1934.136)
+
+        rates: np.ndarray = (dL0 + dC + dnutation) / 36525.0
+        return rates
+
+    @staticmethod
+    def find_jieqi_julian_days(years: ArrayLike, jieqi_indices: ArrayLike) -> np.ndarray:
+        """批量求解 (年份, 节气索引) 对应的节气儒略日
+
+        初始估计与迭代方式与 JieqiCalculator._find_jieqi_time 相同，
+        已收敛的元素不再参与后续迭代。years 与 jieqi_indices 按 NumPy 规则广播。
+
+        Args:
+            years: 年份数组
+            jieqi_indices: 节气索引数组（0-23）
+
+        Returns:
+            节气儒略日数组
+
+        Raises:
+            IndexError: 节气索引超出范围
+        """
+        years, jieqi_indices = np.broadcast_arrays(
+            np.asarray(years, dtype=np.int64),
+            np.asarray(jieqi_indices, dtype=np.int64),
+        )
+        if np.any((jieqi_indices < 0) | (jieqi_indices >= 24)):
+            raise IndexError("节气索引超出范围")
+
+        targets = BatchJieqiCalculator.JIEQI_LONGITUDE[jieqi_indices]
+
+        # 初始估计：从年初开始，每个节气约间隔 365.25/24 天
+        jan_first = (years - 1970).astype("datetime64[Y]").astype("datetime64[s]")
+        jd_start = BatchJieqiCalculator.get_julian_days(jan_first)
+        estimated_jd = jd_start + jieqi_indices * (365.25 / 24.0) - 10
+
+        active = np.ones(estimated_jd.shape, dtype=bool)
+        for _ in range(BatchJieqiCalculator.MAX_ITERATIONS):
+            current_longitude = BatchJieqiCalculator.get_solar_longitudes(estimated_jd)
+
+            # 黄经差归一到 [-180, 180)，处理过0度的情况
+            diff = np.mod(current_longitude - targets + 180, 360) - 180
+
+            active &= np.abs(diff) >= BatchJieqiCalculator.TOLERANCE
+            if not active.any():
+                break
+
+            estimated_jd = np.where(active, estimated_jd - diff / 0.9856, estimated_jd)
+
+        return estimated_jd
+
+    @staticmethod
+    def find_jieqi_datetimes(years: ArrayLike, jieqi_indices: ArrayLike) -> np.ndarray:
+        """批量求解节气时刻
+
+        Args:
+            years: 年份数组
+            jieqi_indices: 节气索引数组（0-23）
+
+        Returns:
+            datetime64[s] 数组（秒以下截断）
+        """
+        jd = BatchJieqiCalculator.find_jieqi_julian_days(years, jieqi_indices)
+        return BatchJieqiCalculator.julian_days_to_datetime64(jd)
+
+    @staticmethod
+    def get_year_jieqi_table(start_year: int, end_year: int) -> np.ndarray:
+        """一次求解连续年份的全部节气
+
+        Args:
+            start_year: 起始年份
+            end_year: 结束年份（含）
+
+        Returns:
+            形状为 (年数, 24) 的儒略日数组，行按年份、列按节气索引排列
+        """
+        years = np.arange(start_year, end_year + 1)[:, np.newaxis]
+        return BatchJieqiCalculator.find_jieqi_julian_days(years, np.arange(24)[np.newaxis, :])
+
+    @staticmethod
+    def _refine_crossings(jd_low: np.ndarray, jd_high: np.ndarray, targets: np.ndarray,
+                          jd: np.ndarray) -> np.ndarray:
+        """在区间内以牛顿法批量修正黄经交点
+
+        Args:
+            jd_low: 区间起点儒略日数组
+            jd_high: 区间终点儒略日数组
+            targets: 目标黄经数组（度）
+            jd: 初始估计儒略日数组
+
+        Returns:
+            修正后的儒略日数组
+        """
+        active = np.ones(jd.shape, dtype=bool)
+        for _ in range(BatchJieqiCalculator.CROSSING_MAX_ITERATIONS):
+            diff = np.mod(BatchJieqiCalculator.get_solar_longitudes(jd) - targets + 180, 360) - 180
+            active &= np.abs(diff) >= BatchJieqiCalculator.CROSSING_TOLERANCE
+            if not active.any():
+                break
+
+            step = diff / BatchJieqiCalculator.get_solar_longitude_rates(jd)
+            jd = np.where(active, np.clip(jd - step, jd_low, jd_high), jd)
+        return jd
+
+    @staticmethod
+    def find_longitude_crossings(
+        longitudes: Union[float, Sequence[float]],
+        start: datetime,
+        end: datetime,
+    ) -> Iterator[Tuple[float, datetime]]:
+        """按时间顺序逐个生成太阳到达指定黄经的时刻
+
+        每批对 CROSSING_CHUNK_DAYS 天按 CROSSING_STEP_DAYS 采样太阳黄经并展开为
+        单调序列，由此找出包含各目标黄经的采样区间，再对全部区间一起做牛顿修正。
+        太阳黄经的计算与 JieqiCalculator 相同，但修正到 CROSSING_TOLERANCE，
+        比 calculate_jieqi_datetime 所用的固定变化率迭代更精确，两者在节气时刻上
+        可相差数秒。
+
+        Args:
+            longitudes: 目标黄经（度）或黄经序列，可为任意角度
+            start: 搜索范围起点
+            end: 搜索范围终点（不含）
+
+        Yields:
+            (目标黄经, 到达时刻) 元组，时刻秒以下截断；目标黄经为传入时的原值
+        """
+        values = np.atleast_1d(np.asarray(longitudes, dtype=np.float64))
+        targets = np.mod(values, 360)
+
+        step = BatchJieqiCalculator.CROSSING_STEP_DAYS
+        samples = int(round(BatchJieqiCalculator.CROSSING_CHUNK_DAYS / step))
+        jd_start = JieqiCalculator._get_julian_day(start)
+        jd_end = JieqiCalculator._get_julian_day(end)
+
+        # 从起点前一个步长开始采样，使恰在起点的交点落在首个区间内
+        chunk_start = jd_start - step
+        while chunk_start < jd_end and len(targets):
+            grid = chunk_start + step * np.arange(samples + 1)
+            longitude = BatchJieqiCalculator.get_solar_longitudes(grid)
+
+            # 太阳黄经单调增加，逐步增量取模后累加即为展开后的黄经
+            unwrapped = longitude[0] + np.concatenate(([0.0], np.cumsum(np.mod(np.diff(longitude), 360))))
+
+            # 每个目标黄经在第 i 个区间 (grid[i], grid[i+1]] 内被越过时，圈数加一
+            turns = np.floor((unwrapped[:, np.newaxis] - targets[np.newaxis, :]) / 360)
+            interval, target = np.nonzero(np.diff(turns, axis=0))
+
+            if len(interval):
+                goal = targets[target] + 360 * turns[interval + 1, target]
+                low, high = unwrapped[interval], unwrapped[interval + 1]
+                jd_low, jd_high = grid[interval], grid[interval + 1]
+                guess = jd_low + (goal - low) / (high - low) * step
+                jd = BatchJieqiCalculator._refine_crossings(jd_low, jd_high, targets[target], guess)
+
+                for position in np.argsort(jd, kind="stable"):
+                    if jd_start <= jd[position] < jd_end:
+                        yield (
+                            float(values[target[position]]),
+                            JieqiCalculator._julian_day_to_datetime(float(jd[position])),
+                        )
+
+            chunk_start = grid[-1]
+
+    @staticmethod
+    def find_hou(start: datetime, end: datetime) -> Iterator[Tuple[int, str, datetime]]:
+        """按时间顺序逐个生成七十二候的起始时刻
+
+        Args:
+            start: 搜索范围起点
+            end: 搜索范围终点（不含）
+
+        Yields:
+            (候索引, 候名称, 起始时刻) 元组，候索引自立春初候起为0-71
+        """
+        longitudes = [(315 + 5 * index) % 360 for index in range(72)]
+        for longitude, moment in BatchJieqiCalculator.find_longitude_crossings(longitudes, start, end):
+            index = int((longitude - 315) % 360) // 5
+            yield index, JieqiCalculator.HOU_NAMES[index], moment
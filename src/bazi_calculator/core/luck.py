@@ -0,0 +1,301 @@
+"""大运流年模块
+
+此模块按时间顺序逐项生成大运、流年、流月：
+    大运：由月柱顺排或逆排，每步十年；阳年男、阴年女顺行，阴年男、阳年女逆行
+    起运：顺行取出生到下一个节的时长，逆行取上一个节到出生的时长，三天折一年
+    流年：以立春为界的年柱
+    流月：以各节为界的月柱（五虎遁）
+
+全部接口为生成器，可随时停止或用 itertools.islice 分页，不必一次构建百年时间线。
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from bazi_calculator.core.calendar import BaziCalendar
+from bazi_calculator.core.ganzhi import GanzhiCalculator
+from bazi_calculator.core.jieqi import JieqiCalculator
+
+
+class LuckTimeline:
+    """大运流年计算器
+
+    提供起运时间、大运、流年、流月以及合并时间线的生成功能。
+    """
+
+    # 每步大运的年数
+    DAYUN_YEARS = 10
+
+    # 由岁数换算日期时每岁的天数（回归年）
+    YEAR_DAYS = 365.2425
+
+    # 性别取值
+    GENDERS = ("男", "女")
+
+    @staticmethod
+    def get_relation(day_master_wuxing: str, wuxing: str) -> str:
+        """获取五行相对日主的关系
+
+        Args:
+            day_master_wuxing: 日主五行
+            wuxing: 五行
+
+        Returns:
+            "比劫"、"印星"、"食伤"、"财星" 或 "官杀"
+        """
+        if wuxing == day_master_wuxing:
+            return "比劫"
+        if GanzhiCalculator.WUXING_SHENG[wuxing] == day_master_wuxing:
+            return "印星"
+        if GanzhiCalculator.WUXING_SHENG[day_master_wuxing] == wuxing:
+            return "食伤"
+        if GanzhiCalculator.WUXING_KE[day_master_wuxing] == wuxing:
+            return "财星"
+        return "官杀"
+
+    @staticmethod
+    def _pillar(jiazi_index: int, day_master_wuxing: str) -> Dict[str, str]:
+        """由六十甲子索引生成柱信息及其与日主的五行关系"""
+        gan = GanzhiCalculator.TIANGAN[jiazi_index % 10]
+        zhi = GanzhiCalculator.DIZHI[jiazi_index % 12]
+        gan_wuxing = GanzhiCalculator.TIANGAN_WUXING[gan]
+        zhi_wuxing = GanzhiCalculator.DIZHI_WUXING[zhi]
+        return {
+            "gan": gan,
+            "zhi": zhi,
+            "full": gan + zhi,
+            "gan_wuxing": gan_wuxing,
+            "zhi_wuxing": zhi_wuxing,
+            "gan_relation": LuckTimeline.get_relation(day_master_wuxing, gan_wuxing),
+            "zhi_relation": LuckTimeline.get_relation(day_master_wuxing, zhi_wuxing),
+        }
+
+    @staticmethod
+    def _add_years(date: datetime, years: int) -> datetime:
+        """日期加整年（2月29日在平年取2月28日）"""
+        try:
+            return date.replace(year=date.year + years)
+        except ValueError:
+            return date.replace(year=date.year + years, day=28)
+
+    @staticmethod
+    def _age_date(birth_date: datetime, age: float) -> datetime:
+        """由岁数（浮点）换算日期"""
+        return birth_date + timedelta(days=age * LuckTimeline.YEAR_DAYS)
+
+    @staticmethod
+    def _next_jie(year: int, jieqi_index: int) -> Tuple[int, int]:
+        """获取下一个节（偶数节气索引）"""
+        return (year + 1, 0) if jieqi_index >= 22 else (year, jieqi_index + 2)
+
+    @staticmethod
+    def get_direction(year_gan: int, gender: str) -> int:
+        """获取大运排列方向
+
+        Args:
+            year_gan: 年干索引（0-9，偶数为阳干）
+            gender: 性别（男/女）
+
+        Returns:
+            1 为顺行，-1 为逆行
+
+        Raises:
+            ValueError: 无效的性别
+        """
+        if gender not in LuckTimeline.GENDERS:
+            raise ValueError(f"无效的性别: {gender}")
+        return 1 if (year_gan % 2 == 0) == (gender == "男") else -1
+
+    @staticmethod
+    def get_start(birth_date: datetime, gender: str) -> Dict[str, Any]:
+        """计算起运时间
+
+        Args:
+            birth_date: 出生日期时间
+            gender: 性别（男/女）
+
+        Returns:
+            包含 direction（1顺行/-1逆行）、jieqi（所取的节）、jieqi_time、
+            start_age（起运岁数，浮点）与 start_date（起运日期，由 start_age 换算）的字典
+
+        Raises:
+            ValueError: 无效的性别
+        """
+        jieqi_year, jieqi_index = JieqiCalculator.locate_jieqi(birth_date)
+        direction = LuckTimeline.get_direction(BaziCalendar.get_year_codes(jieqi_year)[0], gender)
+
+        # 当前月份的节（月首）以及下一个节
+        jie_year, jie_index = jieqi_year, jieqi_index - jieqi_index % 2
+        if direction > 0:
+            jie_year, jie_index = LuckTimeline._next_jie(jie_year, jie_index)
+        jieqi_time = JieqiCalculator.calculate_jieqi_datetime(jie_year, jie_index)
+
+        start_age = abs(jieqi_time - birth_date) / timedelta(days=3)
+        return {
+            "direction": direction,
+            "jieqi": JieqiCalculator.JIEQI_NAMES[jie_index],
+            "jieqi_time": jieqi_time,
+            "start_age": start_age,
+            "start_date": LuckTimeline._age_date(birth_date, start_age),
+        }
+
+    @staticmethod
+    def iter_dayun(
+        birth_date: datetime,
+        gender: str,
+        count: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """逐步生成大运
+
+        Args:
+            birth_date: 出生日期时间
+            gender: 性别（男/女）
+            count: 生成的步数，为None时无限生成
+
+        Yields:
+            大运字典：index（第几步，从0起）、pillar（柱信息及与日主的关系）、
+            start_age、start_date、end_date
+
+        Raises:
+            ValueError: 无效的性别
+        """
+        codes = BaziCalendar.get_chart_codes(birth_date)
+        day_master_wuxing = GanzhiCalculator.TIANGAN_WUXING[GanzhiCalculator.TIANGAN[codes[4]]]
+        month_jiazi = GanzhiCalculator.get_jiazi_index(codes[2], codes[3])
+        start = LuckTimeline.get_start(birth_date, gender)
+
+        index = 0
+        while count is None or index < count:
+            start_age = start["start_age"] + index * LuckTimeline.DAYUN_YEARS
+            yield {
+                "index": index,
+                "pillar": LuckTimeline._pillar(
+                    (month_jiazi + start["direction"] * (index + 1)) % 60, day_master_wuxing
+                ),
+                "start_age": start_age,
+                "start_date": LuckTimeline._age_date(birth_date, start_age),
+                "end_date": LuckTimeline._age_date(birth_date, start_age + LuckTimeline.DAYUN_YEARS),
+            }
+            index += 1
+
+    @staticmethod
+    def iter_liunian(
+        day_master: str,
+        start_year: int,
+        end_year: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """逐年生成流年
+
+        Args:
+            day_master: 日主天干
+            start_year: 起始年份（以立春为界）
+            end_year: 结束年份（含），为None时无限生成
+
+        Yields:
+            流年字典：year、pillar、start（当年立春时刻）
+        """
+        day_master_wuxing = GanzhiCalculator.get_tiangan_wuxing(day_master)
+        year = start_year
+        while end_year is None or year <= end_year:
+            yield {
+                "year": year,
+                "pillar": LuckTimeline._pillar((year - 4) % 60, day_master_wuxing),
+                "start": JieqiCalculator.calculate_jieqi_datetime(year, 0),
+            }
+            year += 1
+
+    @staticmethod
+    def iter_liuyue(day_master: str, year: int) -> Iterator[Dict[str, Any]]:
+        """生成某年（以立春为界）的十二个流月
+
+        Args:
+            day_master: 日主天干
+            year: 年份
+
+        Yields:
+            流月字典：year、month（1为寅月）、jieqi（起始的节）、pillar、start
+        """
+        day_master_wuxing = GanzhiCalculator.get_tiangan_wuxing(day_master)
+        for order in range(12):
+            yield LuckTimeline._liuyue(
+                year, order * 2, JieqiCalculator.calculate_jieqi_datetime(year, order * 2), day_master_wuxing
+            )
+
+    @staticmethod
+    def _liuyue(year: int, jieqi_index: int, start: datetime, day_master_wuxing: str) -> Dict[str, Any]:
+        """生成以某个节起始的流月字典"""
+        month_gan, month_zhi = BaziCalendar.get_month_codes(BaziCalendar.get_year_codes(year)[0], jieqi_index)
+        return {
+            "year": year,
+            "month": jieqi_index // 2 + 1,
+            "jieqi": JieqiCalculator.JIEQI_NAMES[jieqi_index],
+            "pillar": LuckTimeline._pillar(
+                GanzhiCalculator.get_jiazi_index(month_gan, month_zhi), day_master_wuxing
+            ),
+            "start": start,
+        }
+
+    @staticmethod
+    def iter_timeline(
+        birth_date: datetime,
+        gender: str,
+        years: int = 100,
+        include_months: bool = True,
+    ) -> Iterator[Dict[str, Any]]:
+        """按时间顺序生成大运、流年、流月合并的时间线
+
+        从出生所在的年、月开始，每遇立春生成流年，每遇节生成流月，
+        大运在起运日期及此后每十年生成；各项只在需要时计算。
+
+        Args:
+            birth_date: 出生日期时间
+            gender: 性别（男/女）
+            years: 时间线覆盖的年数（自出生起）
+            include_months: 是否生成流月
+
+        Yields:
+            记录字典，level 为 "dayun"、"year" 或 "month"，time 为该项的起始时刻，
+            其余字段同 iter_dayun、iter_liunian、iter_liuyue；流年另含 nominal_age（虚岁）
+
+        Raises:
+            ValueError: 无效的性别
+        """
+        end = LuckTimeline._add_years(birth_date, years)
+        codes = BaziCalendar.get_chart_codes(birth_date)
+        day_master = GanzhiCalculator.TIANGAN[codes[4]]
+        day_master_wuxing = GanzhiCalculator.get_tiangan_wuxing(day_master)
+        birth_year, birth_index = JieqiCalculator.locate_jieqi(birth_date)
+
+        dayun = LuckTimeline.iter_dayun(birth_date, gender)
+        next_dayun = next(dayun)
+
+        liunian = LuckTimeline.iter_liunian(day_master, birth_year)
+        jie_year, jie_index = birth_year, birth_index - birth_index % 2
+        jie_time = JieqiCalculator.calculate_jieqi_datetime(jie_year, jie_index)
+        first = True
+
+        while jie_time < end:
+            while next_dayun["start_date"] <= jie_time:
+                yield dict(next_dayun, level="dayun", time=next_dayun["start_date"])
+                next_dayun = next(dayun)
+
+            if jie_index == 0 or first:
+                record = next(liunian)
+                yield dict(
+                    record,
+                    level="year",
+                    time=record["start"],
+                    nominal_age=record["year"] - birth_year + 1,
+                )
+
+            if include_months:
+                record = LuckTimeline._liuyue(jie_year, jie_index, jie_time, day_master_wuxing)
+                yield dict(record, level="month", time=jie_time)
+
+            first = False
+            jie_year, jie_index = LuckTimeline._next_jie(jie_year, jie_index)
+            jie_time = JieqiCalculator.calculate_jieqi_datetime(jie_year, jie_index)
+
+        while next_dayun["start_date"] < end:
+            yield dict(next_dayun, level="dayun", time=next_dayun["start_date"])
+            next_dayun = next(dayun)
@@ -0,0 +1,279 @@
+"""农历计算模块
+
+此模块提供农历与公历的相互转换，基于按年位压缩的农历数据表（1900-2100年）。
+
+数据表每年一个整数（自低位起）：
+    第0-3位：闰月月份（0表示无闰月）
+    第4-15位：正月至腊月的大小（第15位为正月，置位为大月30天，否则小月29天）
+    第16位：闰月大小（置位为30天）
+    第17-22位：正月初一距公历当年1月1日的天数
+"""
+
+from array import array
+from bisect import bisect_right
+from datetime import date, datetime, timedelta
+from typing import List, Tuple, Union
+
+
+def _generate_month_offsets(lunar_info: array) -> List[Tuple[int, ...]]:
+    """生成每个农历年各月初一距正月初一的天数（按月份顺序，闰月紧随本月），末项为全年天数"""
+    table = []
+    for info in lunar_info:
+        leap_month = info & 0xF
+        offsets = [0]
+        for month in range(1, 13):
+            offsets.append(offsets[-1] + (30 if info & (0x8000 >> (month - 1)) else 29))
+            if month == leap_month:
+                offsets.append(offsets[-1] + (30 if info & 0x10000 else 29))
+        table.append(tuple(offsets))
+    return table
+
+
+def _generate_new_year_ordinals(start_year: int, lunar_info: array) -> List[int]:
+    """生成各农历年正月初一的公历序数，末项为表尾年份下一年的正月初一"""
+    ordinals = [date(start_year + i, 1, 1).toordinal() + (info >> 17) for i, info in enumerate(lunar_info)]
+    last_year_days = _generate_month_offsets(lunar_info[-1:])[0][-1]
+    ordinals.append(ordinals[-1] + last_year_days)
+    return ordinals
+
+
+class LunarCalendar:
+    """农历计算器
+
+    提供农历与公历相互转换的功能，单次转换为常数时间。
+    """
+
+    # 数据表覆盖的农历年份范围
+    START_YEAR = 1900
+    END_YEAR = 2100
+
+    # 农历数据表（与香港天文台历表一致）
+    LUNAR_INFO = array("I", [
+        0x3c4bd8, 0x624ae0, 0x4ca570, 0x3854d5, 0x5cd260, 0x44d950, 0x316554, 0x5656a0, 0x409ad0, 0x2a55d2,  # 1900-1909
+        0x504ae0, 0x3aa5b6, 0x60a4d0, 0x48d250, 0x33d255, 0x58b540, 0x42d6a0, 0x2cada2, 0x5295b0, 0x3f4977,  # 1910-1919
+        0x644970, 0x4ca4b0, 0x36b4b5, 0x5c6a50, 0x466d40, 0x2fab54, 0x562b60, 0x409570, 0x2c52f2, 0x504970,  # 1920-1929
+        0x3a6566, 0x5ed4a0, 0x48ea50, 0x336a95, 0x585ad0, 0x442b60, 0x2f86e3, 0x5292e0, 0x3dc8d7, 0x62c950,  # 1930-1939
+        0x4cd4a0, 0x35d8a6, 0x5ab550, 0x4656a0, 0x31a5b4, 0x5625d0, 0x4092d0, 0x2ad2b2, 0x50a950, 0x38b557,  # 1940-1949
+        0x5e6ca0, 0x48b550, 0x355355, 0x584da0, 0x42a5b0, 0x2f4573, 0x5452b0, 0x3ca9a8, 0x60e950, 0x4c6aa0,  # 1950-1959
+        0x36aea6, 0x5aab50, 0x464b60, 0x30aae4, 0x56a570, 0x405260, 0x28f263, 0x4ed950, 0x3a5b57, 0x5e56a0,  # 1960-1969
+        0x4896d0, 0x344dd5, 0x5a4ad0, 0x42a4d0, 0x2cd4d4, 0x52d250, 0x3cd558, 0x60b540, 0x4ab6a0, 0x3795a6,  # 1970-1979
+        0x5c95b0, 0x4649b0, 0x30a974, 0x56a4b0, 0x40b27a, 0x646a50, 0x4e6d40, 0x38af46, 0x5eab60, 0x489570,  # 1980-1989
+        0x344af5, 0x5a4970, 0x4464b0, 0x2c74a3, 0x50ea50, 0x3c6b58, 0x625ac0, 0x4aab60, 0x3696d5, 0x5c92e0,  # 1990-1999
+        0x46c960, 0x2ed954, 0x54d4a0, 0x3eda50, 0x2a7552, 0x4e56a0, 0x38abb7, 0x6025d0, 0x4a92d0, 0x32cab5,  # 2000-2009
+        0x58a950, 0x42b4a0, 0x2cbaa4, 0x50ad50, 0x3c55d9, 0x624ba0, 0x4ca5b0, 0x375176, 0x5c52b0, 0x46a930,  # 2010-2019
+        0x307954, 0x546aa0, 0x3ead50, 0x2a5b52, 0x504b60, 0x38a6e6, 0x5ea4e0, 0x48d260, 0x32ea65, 0x56d530,  # 2020-2029
+        0x425aa0, 0x2c76a3, 0x5296d0, 0x3c4afb, 0x624ad0, 0x4ca4d0, 0x37d0b6, 0x5ad250, 0x44d520, 0x2edd45,  # 2030-2039
+        0x54b5a0, 0x3e56d0, 0x2a55b2, 0x5049b0, 0x3aa577, 0x5ea4b0, 0x48aa50, 0x33b255, 0x586d20, 0x40ada0,  # 2040-2049
+        0x2d4b63, 0x529370, 0x3e49f8, 0x624970, 0x4c64b0, 0x3768a6, 0x5aea50, 0x446b20, 0x2fa6c4, 0x54aae0,  # 2050-2059
+        0x4092e0, 0x28d2e3, 0x4ec960, 0x38d557, 0x5ed4a0, 0x46da50, 0x325d55, 0x5856a0, 0x42a6d0, 0x2c55d4,  # 2060-2069
+        0x5252d0, 0x3ca9b8, 0x62a950, 0x4ab4a0, 0x34b6a6, 0x5aad50, 0x4655a0, 0x2eaba4, 0x54a5b0, 0x4052b0,  # 2070-2079
+        0x2ab273, 0x4e6930, 0x387337, 0x5e6aa0, 0x48ad50, 0x334b55, 0x584b60, 0x42a570, 0x2e54e4, 0x50d160,  # 2080-2089
+        0x3ae968, 0x60d520, 0x4adaa0, 0x356aa6, 0x5a56d0, 0x464ae0, 0x30a9d4, 0x54a2d0, 0x3ed150, 0x28f252,  # 2090-2099
+        0x4ed520,  # 2100
+    ])
+
+    # 各年各月初一距正月初一的天数，以及各年正月初一的公历序数
+    _YEAR_MONTH_OFFSETS = _generate_month_offsets(LUNAR_INFO)
+    _NEW_YEAR_ORDINALS = _generate_new_year_ordinals(START_YEAR, LUNAR_INFO)
+
+    # 农历月份名称
+    MONTH_NAMES = ["正月", "二月", "三月", "四月", "五月", "六月",
+                   "七月", "八月", "九月", "十月", "冬月", "腊月"]
+
+    @staticmethod
+    def _get_info(year: int) -> int:
+        """获取指定农历年的数据
+
+        Raises:
+            ValueError: 年份超出数据表范围
+        """
+        if not LunarCalendar.START_YEAR <= year <= LunarCalendar.END_YEAR:
+            raise ValueError(f"农历年份超出范围（{LunarCalendar.START_YEAR}-{LunarCalendar.END_YEAR}）: {year}")
+        return LunarCalendar.LUNAR_INFO[year - LunarCalendar.START_YEAR]
+
+    @staticmethod
+    def get_leap_month(year: int) -> int:
+        """获取闰月月份
+
+        Args:
+            year: 农历年份
+
+        Returns:
+            闰月月份（1-12），无闰月返回0
+        """
+        return LunarCalendar._get_info(year) & 0xF
+
+    @staticmethod
+    def get_month_days(year: int, month: int, is_leap: bool = False) -> int:
+        """获取农历月的天数
+
+        Args:
+            year: 农历年份
+            month: 农历月份（1-12）
+            is_leap: 是否闰月
+
+        Returns:
+            天数（29或30）
+
+        Raises:
+            ValueError: 月份无效或该年没有此闰月
+        """
+        info = LunarCalendar._get_info(year)
+        if not 1 <= month <= 12:
+            raise ValueError(f"农历月份无效: {month}")
+        if is_leap:
+            if info & 0xF != month:
+                raise ValueError(f"农历{year}年没有闰{month}月")
+            return 30 if info & 0x10000 else 29
+        return 30 if info & (0x8000 >> (month - 1)) else 29
+
+    @staticmethod
+    def get_year_months(year: int) -> List[Tuple[int, bool, int]]:
+        """获取农历年的全部月份
+
+        Args:
+            year: 农历年份
+
+        Returns:
+            按顺序排列的 (月份, 是否闰月, 天数) 列表
+        """
+        leap_month = LunarCalendar.get_leap_month(year)
+        months = []
+        for month in range(1, 13):
+            months.append((month, False, LunarCalendar.get_month_days(year, month)))
+            if month == leap_month:
+                months.append((month, True, LunarCalendar.get_month_days(year, month, True)))
+        return months
+
+    @staticmethod
+    def get_year_days(year: int) -> int:
+        """获取农历年的总天数
+
+        Args:
+            year: 农历年份
+
+        Returns:
+            天数
+        """
+        LunarCalendar._get_info(year)
+        return LunarCalendar._YEAR_MONTH_OFFSETS[year - LunarCalendar.START_YEAR][-1]
+
+    @staticmethod
+    def get_new_year(year: int) -> date:
+        """获取正月初一对应的公历日期
+
+        Args:
+            year: 农历年份
+
+        Returns:
+            公历日期
+        """
+        return date(year, 1, 1) + timedelta(days=LunarCalendar._get_info(year) >> 17)
+
+    @staticmethod
+    def lunar_to_solar(year: int, month: int, day: int, is_leap: bool = False) -> date:
+        """农历转公历
+
+        Args:
+            year: 农历年份
+            month: 农历月份（1-12）
+            day: 农历日（1-30）
+            is_leap: 是否闰月
+
+        Returns:
+            公历日期
+
+        Raises:
+            ValueError: 农历日期无效
+        """
+        if not 1 <= day <= LunarCalendar.get_month_days(year, month, is_leap):
+            raise ValueError(f"农历日期无效: {year}年{'闰' if is_leap else ''}{month}月{day}日")
+
+        leap_month = LunarCalendar.LUNAR_INFO[year - LunarCalendar.START_YEAR] & 0xF
+        position = month - 1 + (1 if leap_month and (month > leap_month or is_leap) else 0)
+        offset = LunarCalendar._YEAR_MONTH_OFFSETS[year - LunarCalendar.START_YEAR][position]
+        ordinal = LunarCalendar._NEW_YEAR_ORDINALS[year - LunarCalendar.START_YEAR] + offset + day - 1
+        return date.fromordinal(ordinal)
+
+    @staticmethod
+    def solar_to_lunar(solar_date: Union[date, datetime]) -> Tuple[int, int, int, bool]:
+        """公历转农历
+
+        Args:
+            solar_date: 公历日期（datetime 只取日期部分）
+
+        Returns:
+            (农历年, 农历月, 农历日, 是否闰月) 元组
+
+        Raises:
+            ValueError: 日期超出数据表范围
+        """
+        ordinal = solar_date.toordinal()
+        new_years = LunarCalendar._NEW_YEAR_ORDINALS
+        index = solar_date.year - LunarCalendar.START_YEAR
+        if 0 <= index < len(new_years) and ordinal < new_years[index]:
+            index -= 1
+        if not 0 <= index < len(new_years) - 1 or ordinal >= new_years[index + 1]:
+            raise ValueError(f"日期超出农历数据表范围: {solar_date}")
+
+        offsets = LunarCalendar._YEAR_MONTH_OFFSETS[index]
+        day_offset = ordinal - new_years[index]
+        position = bisect_right(offsets, day_offset) - 1
+        leap_month = LunarCalendar.LUNAR_INFO[index] & 0xF
+        if leap_month and position >= leap_month:
+            month, is_leap = position, position == leap_month
+        else:
+            month, is_leap = position + 1, False
+        return index + LunarCalendar.START_YEAR, month, day_offset - offsets[position] + 1, is_leap
+
+    @staticmethod
+    def to_solar_datetime(
+        year: int,
+        month: int,
+        day: int,
+        hour: int = 0,
+        minute: int = 0,
+        second: int = 0,
+        is_leap: bool = False,
+    ) -> datetime:
+        """将农历出生时间转换为公历 datetime
+
+        Args:
+            year: 农历年份
+            month: 农历月份
+            day: 农历日
+            hour: 时
+            minute: 分
+            second: 秒
+            is_leap: 是否闰月
+
+        Returns:
+            公历日期时间
+        """
+        solar_date = LunarCalendar.lunar_to_solar(year, month, day, is_leap)
+        return datetime(solar_date.year, solar_date.month, solar_date.day, hour, minute, second)
+
+    @staticmethod
+    def format_lunar_date(year: int, month: int, day: int, is_leap: bool = False) -> str:
+        """格式化农历日期（如"2024年闰二月初五"）
+
+        Args:
+            year: 农历年份
+            month: 农历月份
+            day: 农历日
+            is_leap: 是否闰月
+
+        Returns:
+            农历日期字符串
+        """
+        if day == 10:
+            day_name = "初十"
+        elif day == 20:
+            day_name = "二十"
+        elif day == 30:
+            day_name = "三十"
+        else:
+            digits = "一二三四五六七八九"
+            day_name = ("初", "十", "廿")[day // 10] + digits[day % 10 - 1]
+        return f"{year}年{'闰' if is_leap else ''}{LunarCalendar.MONTH_NAMES[month - 1]}{day_name}"
+
@@ -0,0 +1,134 @@
+"""批量农历转换模块
+
+此模块提供 LunarCalendar 农历、公历互转的向量化版本：把数据表展开为
+逐月的起始日期数组，公历转农历为一次有序查找，农历转公历为一次索引。
+"""
+
+from typing import List, Tuple, Union
+
+import numpy as np
+
+from bazi_calculator.core.lunar import LunarCalendar
+
+
+ArrayLike = Union[np.ndarray, list, tuple]
+
+
+def _generate_month_arrays() -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """将农历数据表展开为逐月数组
+
+    Returns:
+        (各月初一的公历序数（末项为表尾的下一个正月初一）, 所属农历年, 月份, 是否闰月,
+        各年正月在逐月数组中的位置) 元组
+    """
+    starts: List[int] = []
+    years: List[int] = []
+    months: List[int] = []
+    leaps: List[bool] = []
+    year_first: List[int] = []
+    for index, offsets in enumerate(LunarCalendar._YEAR_MONTH_OFFSETS):
+        year = LunarCalendar.START_YEAR + index
+        year_first.append(len(starts))
+        new_year = LunarCalendar._NEW_YEAR_ORDINALS[index]
+        for position, (month, is_leap, _) in enumerate(LunarCalendar.get_year_months(year)):
+            starts.append(new_year + offsets[position])
+            years.append(year)
+            months.append(month)
+            leaps.append(is_leap)
+    starts.append(LunarCalendar._NEW_YEAR_ORDINALS[-1])
+    return (
+        np.array(starts, dtype=np.int64),
+        np.array(years, dtype=np.int64),
+        np.array(months, dtype=np.int64),
+        np.array(leaps, dtype=bool),
+        np.array(year_first, dtype=np.int64),
+    )
+
+
+# 逐月查找表
+_MONTH_STARTS, _MONTH_YEARS, _MONTH_NUMBERS, _MONTH_LEAPS, _YEAR_FIRST_MONTH = _generate_month_arrays()
+
+# 各年闰月月份（0表示无闰月）
+_LEAP_MONTHS = np.array(LunarCalendar.LUNAR_INFO, dtype=np.int64) & 0xF
+
+# datetime64[D] 的0日（1970-01-01）对应的公历序数
+_EPOCH_ORDINAL = 719163
+
+
+class BatchLunarCalendar:
+    """批量农历转换器
+
+    所有方法均为数组输入、数组输出，与 LunarCalendar 的标量方法一一对应。
+    """
+
+    @staticmethod
+    def solar_to_lunar(dates: ArrayLike) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """批量公历转农历
+
+        Args:
+            dates: date/datetime 序列或 datetime64 数组（只取日期部分）
+
+        Returns:
+            (农历年, 农历月, 农历日, 是否闰月) 数组元组
+
+        Raises:
+            ValueError: 存在超出数据表范围的日期
+        """
+        ordinals = np.asarray(dates, dtype="datetime64[D]").astype(np.int64).ravel() + _EPOCH_ORDINAL
+        if len(ordinals) and (ordinals.min() < _MONTH_STARTS[0] or ordinals.max() >= _MONTH_STARTS[-1]):
+            raise ValueError("存在超出农历数据表范围的日期")
+
+        month_index = np.searchsorted(_MONTH_STARTS, ordinals, side="right") - 1
+        return (
+            _MONTH_YEARS[month_index],
+            _MONTH_NUMBERS[month_index],
+            ordinals - _MONTH_STARTS[month_index] + 1,
+            _MONTH_LEAPS[month_index],
+        )
+
+    @staticmethod
+    def lunar_to_solar(
+        years: ArrayLike,
+        months: ArrayLike,
+        days: ArrayLike,
+        is_leap: Union[bool, ArrayLike] = False,
+    ) -> np.ndarray:
+        """批量农历转公历
+
+        参数按 NumPy 规则广播。
+
+        Args:
+            years: 农历年份数组
+            months: 农历月份数组（1-12）
+            days: 农历日数组（1-30）
+            is_leap: 是否闰月数组
+
+        Returns:
+            datetime64[D] 数组
+
+        Raises:
+            ValueError: 存在无效的农历日期
+        """
+        years, months, days, is_leap = np.broadcast_arrays(
+            np.asarray(years, dtype=np.int64),
+            np.asarray(months, dtype=np.int64),
+            np.asarray(days, dtype=np.int64),
+            np.asarray(is_leap, dtype=bool),
+        )
+        year_index = years - LunarCalendar.START_YEAR
+        if np.any((year_index < 0) | (year_index >= len(_LEAP_MONTHS)) | (months < 1) | (months > 12)):
+            raise ValueError("存在无效的农历日期")
+
+        leap_month = _LEAP_MONTHS[year_index]
+        if np.any(is_leap & (leap_month != months)):
+            raise ValueError("存在无效的农历日期")
+
+        shift = (leap_month > 0) & ((months > leap_month) | is_leap)
+        month_index = _YEAR_FIRST_MONTH[year_index] + months - 1 + shift
+        month_days = _MONTH_STARTS[month_index + 1] - _MONTH_STARTS[month_index]
+        if np.any((days < 1) | (days > month_days)):
+            raise ValueError("存在无效的农历日期")
+
+        ordinals = _MONTH_STARTS[month_index] + days - 1
+        dates: np.ndarray = (ordinals - _EPOCH_ORDINAL).astype("datetime64[D]")
+        return dates
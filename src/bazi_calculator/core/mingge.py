@@ -1,10 +1,182 @@
 """命格分析模块
 
 此模块提供八字命格分析功能，包括格局判断、性格分析、运势分析等。
+
+格局、性格、事业财运与健康规则均以声明式表格给出，导入时编译为查找结构：
+格局规则按优先顺序排列，编译为以化气、强弱、日主五行、月令、从格、克泄耗最旺者
+与所引用五行数量为下标的决策表，每盘只需一次特征提取与一次查表；批量模式
+（determine_pattern_many）对整数干支编码数组做同样的查表。新增格局只需在
+PATTERN_RULES 中加入一条规则及其描述模板。
+
+完整报告（五行分析与命格分析）共用一个 AnalysisContext 时，各项只计算一次。
+比较共用与不共用上下文的耗时：
+    python -m bazi_calculator.core.mingge --benchmark --count 20000
 """
 
-from typing import Dict, List, Tuple
+import argparse
+import time
+from datetime import datetime
+from itertools import product
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
 from bazi_calculator.core.ganzhi import GanzhiCalculator
+from bazi_calculator.core.relations import GanzhiRelations
+from bazi_calculator.core.wuxing import AnalysisContext, WuxingAnalyzer
+from bazi_calculator.core.wuxing_batch import (
+    BatchWuxingAnalyzer, GAN_WUXING, STRENGTHS, WUXING, ZHI_WUXING, WuxingColumns,
+)
+
+
+# 克泄耗中最旺者（并列时依次取财星、官杀、食伤）
+DOMINANTS = ("cai", "guansha", "shishang")
+
+# 化气格的相合天干所在柱及其标签
+HUAQI_PILLARS = (("month", "月干"), ("hour", "时干"))
+
+# 格局决策表的特征维度：(名称, 取值数)；之后为规则引用的各五行数量所在的区段
+PATTERN_FEATURES = (
+    ("huaqi", 2),
+    ("strength", len(STRENGTHS)),
+    ("day_master_wuxing", len(WUXING)),
+    ("month_same", 2),
+    ("cong", 2),
+    ("dominant", len(DOMINANTS)),
+)
+
+# 天干五合化神的五行编号（按阳干索引0-4）
+_GAN_HE_WUXING = np.array([WUXING.index(wuxing) for wuxing in GanzhiRelations.GAN_HE_WUXING], dtype=np.intp)
+
+# 名称到编号
+_STRENGTH_CODES = {strength: code for code, strength in enumerate(STRENGTHS)}
+_WUXING_CODES = {wuxing: code for code, wuxing in enumerate(WUXING)}
+
+
+def _pattern_count_wuxing(rules: Sequence[Dict]) -> Tuple[str, ...]:
+    """获取格局规则引用了数量条件的五行（按 WUXING 排列）"""
+    referenced = {wuxing for rule in rules for wuxing in rule.get("counts", {})}
+    return tuple(wuxing for wuxing in WUXING if wuxing in referenced)
+
+
+def _pattern_count_buckets(rules: Sequence[Dict]) -> np.ndarray:
+    """生成五行数量到区段的映射
+
+    各五行按规则中数量区间的端点（low 与 high + 1）把0-8分段，同一区段内的数量
+    满足的规则完全相同，决策表只需每段一个位置。
+
+    Returns:
+        形状为 (所引用五行数, 9) 的数组：[i, 数量] 为第 i 个所引用五行的数量所在区段
+    """
+    counts = np.arange(9)
+    buckets = []
+    for wuxing in _pattern_count_wuxing(rules):
+        cuts = sorted({
+            bound
+            for rule in rules if wuxing in rule.get("counts", {})
+            for bound in (rule["counts"][wuxing][0], rule["counts"][wuxing][1] + 1)
+            if 0 < bound <= 8
+        })
+        buckets.append(np.searchsorted(cuts, counts, side="right"))
+    return np.array(buckets, dtype=np.intp).reshape(-1, len(counts))
+
+
+def _compile_pattern_rules(rules: Sequence[Dict]) -> np.ndarray:
+    """将格局规则编译为决策表
+
+    决策表的每个下标组合对应一组特征取值，值为按优先顺序第一条满足的规则序号。
+    五行数量按 _pattern_count_buckets 分段，表的大小随规则引用的区段数而非数量取值增长。
+
+    Args:
+        rules: 按优先顺序排列的格局规则，最后一条为无条件的默认格局
+
+    Returns:
+        uint8 决策表，维度依次为 PATTERN_FEATURES 与所引用五行的数量区段
+    """
+    count_wuxing = _pattern_count_wuxing(rules)
+    count_buckets = _pattern_count_buckets(rules)
+    sizes = [size for _, size in PATTERN_FEATURES] + [int(row.max()) + 1 for row in count_buckets]
+    shape = tuple(sizes)
+    # 各维度的下标按广播排列，不展开完整网格
+    axes = np.ogrid[tuple(slice(0, size) for size in sizes)]
+    grid = dict(zip([name for name, _ in PATTERN_FEATURES], axes))
+    for i, wuxing in enumerate(count_wuxing):
+        # 每个区段以其最小数量作为代表值（区段内各数量满足的条件相同）
+        axis = axes[len(PATTERN_FEATURES) + i]
+        grid[wuxing] = np.searchsorted(count_buckets[i], axis)
+
+    table = np.zeros(shape, dtype=np.uint8)
+    # 从低优先级到高优先级依次覆盖
+    for index in reversed(range(len(rules))):
+        rule = rules[index]
+        mask = np.ones(shape, dtype=bool)
+        for name in ("huaqi", "month_same", "cong"):
+            if name in rule:
+                mask &= grid[name] == int(rule[name])
+        if "strength" in rule:
+            mask &= np.isin(grid["strength"], [_STRENGTH_CODES[value] for value in rule["strength"]])
+        if "day_master_wuxing" in rule:
+            mask &= np.isin(grid["day_master_wuxing"], [_WUXING_CODES[value] for value in rule["day_master_wuxing"]])
+        if "dominant" in rule:
+            mask &= grid["dominant"] == DOMINANTS.index(rule["dominant"])
+        for wuxing, (low, high) in rule.get("counts", {}).items():
+            mask &= (grid[wuxing] >= low) & (grid[wuxing] <= high)
+        table[mask] = index
+    return table
+
+
+def _generate_patterns(rules: Sequence[Dict]) -> List[Tuple[str, str, str]]:
+    """生成格局编号表：(格局类型, 格局名称, 化气格的相合天干所在柱)
+
+    默认格局编号为0，其余规则按优先顺序编号，化气格按五合与所在柱展开。
+    """
+    patterns = [(rules[-1]["type"], rules[-1]["name"], "")]
+    patterns += [(rule["type"], rule["name"], "") for rule in rules[:-1] if not rule.get("huaqi")]
+    for yang in range(5):
+        _, name = GanzhiRelations.get_gan_he(yang, yang + 5)
+        for pillar, _ in HUAQI_PILLARS:
+            patterns.append(("化气格", name, pillar))
+    return patterns
+
+
+def _career_list(careers: Dict[str, List[str]], yong_shen: str, xi_shen: str) -> List[str]:
+    """由用神、喜神对应的行业生成适合的事业列表（去重）"""
+    career_suggestions = []
+    career_suggestions.extend(careers.get(yong_shen, []))
+    career_suggestions.extend(careers.get(xi_shen, []))
+    return list(set(career_suggestions))
+
+
+def _compile_careers(careers: Dict[str, List[str]]) -> Dict[Tuple[str, str], List[str]]:
+    """编译事业表：(用神, 喜神) 到适合的事业列表"""
+    keys = list(careers) + [""]
+    return {(yong, xi): _career_list(careers, yong, xi) for yong, xi in product(keys, keys)}
+
+
+def _compile_health_messages(organs: Dict[str, List[str]]) -> Dict[str, Dict[str, Tuple[str, ...]]]:
+    """编译健康提示表：五行到缺失、过多时的 (问题, 建议) 与作为日主时的建议"""
+    messages = {}
+    for wuxing, items in organs.items():
+        names = ','.join(items)
+        messages[wuxing] = {
+            "missing": (f"缺{wuxing}，注意{names}健康", f"多接触{wuxing}属性事物（如{wuxing}色、{wuxing}味等）"),
+            "excessive": (f"{wuxing}过多，{names}可能过旺", f"平衡{wuxing}，避免过度消耗相关器官"),
+            "main": (f"日主为{wuxing}，要特别注意{names}的保养",),
+        }
+    return messages
+
+
+def _level_message(levels: Sequence[Tuple[Optional[float], str]], score: float) -> str:
+    """按分值取第一条高于阈值的提示（阈值为None时无条件）"""
+    for threshold, message in levels:
+        if threshold is None or score > threshold:
+            return message
+    return ""
+
+
+def _copy_record(record: Dict) -> Dict:
+    """复制规则表中的记录，列表值另行复制，避免调用方修改共享的表格"""
+    return {key: list(value) if isinstance(value, list) else value for key, value in record.items()}
 
 
 class MingGeAnalyzer:
@@ -13,101 +185,326 @@ class MingGeAnalyzer:
     提供格局判断、性格分析、运势分析等功能。
     """
 
+    # 格局描述模板，按格局名称（化气格统一为"化气格"）索引
+    PATTERN_DESCRIPTIONS = {
+        "建禄格": "日主在月支得地（禄），日主{day_master}生于{month_zhi}月，得令得势，命主自立自强，个性坚毅。",
+        "财格": "财星（金）多且旺，日主{day_master}命财格，主财运旺盛，善于理财。",
+        "官格": "官星（木）多且旺，日主{day_master}命官格，主事业有成，适合从政。",
+        "从财格": "日主{day_master}太弱，财星过旺，从财格，宜从商理财，以财为用。",
+        "从官格": "日主{day_master}太弱，官星过旺，从官格，宜从政管理，以官为用。",
+        "从儿格": "日主{day_master}太弱，食伤过旺，从儿格，宜技艺求财，以食伤为用。",
+        "化气格": "日主{day_master}与{label}{gan}相合化为{wuxing}，{name}，格局清贵，利学业功名。",
+        "普通格局": "日主{day_master}命局平衡，无明显特殊格局，宜根据用神喜神调节运势。",
+    }
+
+    # 格局规则，按优先顺序排列，第一条满足的规则即为格局。条件均可省略：
+    #     huaqi：日干与月干或时干相合且化神在地支出现
+    #     strength、day_master_wuxing：日主强弱、日主五行的允许取值
+    #     month_same：月支五行是否与日主相同
+    #     cong：克泄耗是否超过生扶的两倍（生扶 / 克泄耗 < 0.5）
+    #     dominant：克泄耗中最旺者（见 DOMINANTS）
+    #     counts：五行数量的闭区间
+    PATTERN_RULES: List[Dict[str, Any]] = [
+        {"type": "化气格", "name": "化气格", "huaqi": True},
+        {"type": "正格", "name": "建禄格", "strength": ("强", "中和"), "month_same": True},
+        {"type": "正格", "name": "财格", "strength": ("强", "中和"), "month_same": False,
+         "counts": {"金": (3, 8)}, "day_master_wuxing": ("火",)},
+        {"type": "正格", "name": "官格", "strength": ("强", "中和"), "month_same": False,
+         "counts": {"金": (0, 2), "木": (3, 8)}, "day_master_wuxing": ("土",)},
+        {"type": "从格", "name": "从财格", "strength": ("弱",), "cong": True, "dominant": "cai"},
+        {"type": "从格", "name": "从官格", "strength": ("弱",), "cong": True, "dominant": "guansha"},
+        {"type": "从格", "name": "从儿格", "strength": ("弱",), "cong": True, "dominant": "shishang"},
+        {"type": "正格", "name": "普通格局"},
+    ]
+
+    # 规则引用了数量条件的五行，依次为决策表的最后几个维度
+    PATTERN_COUNT_WUXING = _pattern_count_wuxing(PATTERN_RULES)
+
+    # 所引用五行的数量到决策表区段的映射
+    PATTERN_COUNT_BUCKETS = _pattern_count_buckets(PATTERN_RULES)
+
+    # 格局决策表
+    PATTERN_TABLE = _compile_pattern_rules(PATTERN_RULES)
+
+    # 格局编号表（determine_pattern_many 的结果为其索引）
+    PATTERNS = _generate_patterns(PATTERN_RULES)
+
+    # 日主性格特征
+    PERSONALITY_TRAITS: Dict[str, Dict[str, Any]] = {
+        "甲": {
+            "traits": ["刚强", "正直", "有领导力", "独立自主"],
+            "strengths": ["有主见", "有责任感", "有担当"],
+            "weaknesses": ["固执", "不够灵活", "容易冲动"],
+            "description": "甲木日主，如大树参天，为人正直刚毅，有领导才能，但有时过于固执。"
+        },
+        "乙": {
+            "traits": ["温柔", "善良", "灵活", "善解人意"],
+            "strengths": ["善于沟通", "适应力强", "有同情心"],
+            "weaknesses": ["优柔寡断", "容易受影响", "缺乏主见"],
+            "description": "乙木日主，如花草柔美，为人温柔善良，善于社交，但有时缺乏决断力。"
+        },
+        "丙": {
+            "traits": ["热情", "开朗", "阳光", "有感染力"],
+            "strengths": ["乐观向上", "有号召力", "富有激情"],
+            "weaknesses": ["急躁", "容易冲动", "不够细心"],
+            "description": "丙火日主，如太阳普照，为人热情开朗，有感染力，但有时过于急躁。"
+        },
+        "丁": {
+            "traits": ["细腻", "敏感", "有洞察力", "温和"],
+            "strengths": ["善解人意", "观察力强", "有创造力"],
+            "weaknesses": ["多愁善感", "容易受伤害", "不够果断"],
+            "description": "丁火日主，如烛光温暖，为人细腻敏感，善解人意，但有时多愁善感。"
+        },
+        "戊": {
+            "traits": ["稳重", "可靠", "有担当", "踏实"],
+            "strengths": ["责任心强", "值得信赖", "稳重可靠"],
+            "weaknesses": ["保守", "不够灵活", "反应较慢"],
+            "description": "戊土日主，如高山厚重，为人稳重可靠，有担当，但有时过于保守。"
+        },
+        "己": {
+            "traits": ["温和", "包容", "善解人意", "有耐心"],
+            "strengths": ["包容性强", "善于合作", "有亲和力"],
+            "weaknesses": ["缺乏主见", "容易妥协", "不够自信"],
+            "description": "己土日主，如田园滋润，为人温和包容，善于合作，但有时缺乏主见。"
+        },
+        "庚": {
+            "traits": ["刚毅", "果断", "有魄力", "正直"],
+            "strengths": ["决策能力强", "有魄力", "坚持不懈"],
+            "weaknesses": ["过于强硬", "缺乏柔性", "容易树敌"],
+            "description": "庚金日主，如钢铁坚硬，为人刚毅果断，有魄力，但有时过于强硬。"
+        },
+        "辛": {
+            "traits": ["精致", "优雅", "有品味", "细腻"],
+            "strengths": ["审美能力强", "注重细节", "有艺术天赋"],
+            "weaknesses": ["追求完美", "过于挑剔", "容易纠结"],
+            "description": "辛金日主，如珠宝精致，为人优雅有品味，注重细节，但有时过于挑剔。"
+        },
+        "壬": {
+            "traits": ["聪明", "灵活", "适应力强", "善变"],
+            "strengths": ["反应快", "学习能力强", "善于应变"],
+            "weaknesses": ["不够专注", "容易分心", "缺乏耐心"],
+            "description": "壬水日主，如江河奔流，为人聪明灵活，适应力强，但有时不够专注。"
+        },
+        "癸": {
+            "traits": ["温柔", "智慧", "深沉", "敏感"],
+            "strengths": ["有智慧", "善思考", "有直觉"],
+            "weaknesses": ["过于敏感", "容易多想", "缺乏行动力"],
+            "description": "癸水日主，如雨露滋润，为人温柔智慧，善于思考，但有时过于敏感。"
+        }
+    }
+
+    # 未知日主的默认性格
+    DEFAULT_PERSONALITY: Dict[str, Any] = {
+        "traits": ["平和", "中正"],
+        "strengths": ["适应力强", "能屈能伸"],
+        "weaknesses": ["缺乏特色", "过于中庸"],
+        "description": "{day_master}日主，性格平和，能屈能伸，易于相处。"
+    }
+
+    # 五行对应事业
+    WUXING_CAREERS = {
+        "金": ["金融", "银行", "珠宝", "汽车", "机械", "IT技术", "法律"],
+        "木": ["教育", "文化", "艺术", "出版", "林业", "家具", "服装"],
+        "水": ["贸易", "物流", "旅游", "水产", "航运", "饮料", "清洁"],
+        "火": ["电子", "IT互联网", "能源", "餐饮", "娱乐", "广告", "媒体"],
+        "土": ["房地产", "建筑", "农业", "矿产", "陶瓷", "古玩", "仓储"]
+    }
+
+    # (用神, 喜神) 到适合的事业列表
+    CAREER_TABLE = _compile_careers(WUXING_CAREERS)
+
+    # 财运、事业成就提示：(阈值, 提示)，取第一条评分高于阈值的提示
+    WEALTH_LEVELS = [
+        (5, "财星较旺，财运较佳，善于理财"),
+        (2, "财运中等，需要努力积累"),
+        (None, "财星较弱，宜稳健理财，不宜投机"),
+    ]
+    CAREER_LEVELS = [
+        (5, "官星较旺，适合从政或管理岗位"),
+        (2, "事业运中等，需要脚踏实地"),
+        (None, "官星较弱，不宜追求权力，适合技术或专业领域"),
+    ]
+
+    # 忌神对应的投资提示
+    JI_SHEN_WEALTH_WARNINGS = [
+        ("金", "金为忌神，不宜投资黄金、珠宝等"),
+        ("水", "水为忌神，不宜投资航运、水产等"),
+    ]
+
+    # 五行与健康
+    WUXING_HEALTH = {
+        "金": ["肺", "呼吸系统", "皮肤", "大肠"],
+        "木": ["肝", "胆", "眼睛", "筋骨"],
+        "水": ["肾", "膀胱", "耳朵", "生殖系统"],
+        "火": ["心", "小肠", "舌头", "血液"],
+        "土": ["脾", "胃", "肌肉", "消化系统"]
+    }
+
+    # 五行缺失、过多及作为日主时的健康提示
+    HEALTH_MESSAGES = _compile_health_messages(WUXING_HEALTH)
+
+    @staticmethod
+    def _pattern_key(
+        huaqi: bool,
+        strength: str,
+        day_master_wuxing: str,
+        month_zhi_wuxing: str,
+        scores: Dict[str, float],
+        wuxing_count: Dict[str, int],
+    ) -> Tuple[int, ...]:
+        """提取格局决策表的下标"""
+        input_energy = scores.get('day_master', 0) + scores.get('yin', 0) + scores.get('bijie', 0)
+        output_energy = scores.get('shishang', 0) + scores.get('cai', 0) + scores.get('guansha', 0)
+        cong = output_energy > 0 and input_energy / output_energy < 0.5
+
+        cai_score = scores.get('cai', 0)
+        guansha_score = scores.get('guansha', 0)
+        shishang_score = scores.get('shishang', 0)
+        if cai_score >= guansha_score and cai_score >= shishang_score:
+            dominant = 0
+        elif guansha_score >= cai_score and guansha_score >= shishang_score:
+            dominant = 1
+        else:
+            dominant = 2
+
+        return (
+            int(huaqi),
+            _STRENGTH_CODES[strength],
+            _WUXING_CODES[day_master_wuxing],
+            int(month_zhi_wuxing == day_master_wuxing),
+            int(cong),
+            dominant,
+        ) + tuple(
+            int(MingGeAnalyzer.PATTERN_COUNT_BUCKETS[i, wuxing_count[wuxing]])
+            for i, wuxing in enumerate(MingGeAnalyzer.PATTERN_COUNT_WUXING)
+        )
+
     @staticmethod
-    def determine_pattern(bazi: Dict) -> Dict:
+    def determine_pattern(bazi: Dict, context: Optional[AnalysisContext] = None) -> Dict:
         """判断八字格局
         
         判断命局属于哪种格局（正格、从格、化气格等）
         
         Args:
             bazi: 八字信息字典
+            context: 已创建的分析上下文，为None时新建
             
         Returns:
             包含格局信息的字典
         """
-        day_master = bazi["day"]["gan"]
-        day_master_wuxing = bazi["day"]["gan_wuxing"]
-        month_zhi = bazi["month"]["zhi"]
-        month_zhi_wuxing = bazi["month"]["zhi_wuxing"]
-        
-        # 获取日主强弱
-        from bazi_calculator.core.wuxing import WuxingAnalyzer
-        strength, scores = WuxingAnalyzer.analyze_day_master_strength(bazi)
+        context = context or AnalysisContext(bazi)
+        day_master = context.day_master
+        day_master_wuxing = context.day_master_wuxing
+        strength = context.strength
+        
+        huaqi_info = MingGeAnalyzer._check_huaqi(bazi)
+        key = MingGeAnalyzer._pattern_key(
+            huaqi_info["is_huaqi"], strength, day_master_wuxing,
+            bazi["month"]["zhi_wuxing"], context.scores, context.wuxing_count,
+        )
+        rule = MingGeAnalyzer.PATTERN_RULES[MingGeAnalyzer.PATTERN_TABLE[key]]
+        
+        if rule.get("huaqi"):
+            pattern_name = huaqi_info["pattern_name"]
+            pattern_description = huaqi_info["description"]
+        else:
+            pattern_name = rule["name"]
+            pattern_description = MingGeAnalyzer.PATTERN_DESCRIPTIONS[pattern_name].format(
+                day_master=day_master, month_zhi=bazi["month"]["zhi"]
+            )
         
-        # 判断格局
-        pattern_type = ""
-        pattern_name = ""
-        pattern_description = ""
+        return {
+            "pattern_type": rule["type"],
+            "pattern_name": pattern_name,
+            "pattern_description": pattern_description,
+            "day_master": day_master,
+            "day_master_wuxing": day_master_wuxing,
+            "strength": strength
+        }
+    
+    @staticmethod
+    def determine_pattern_many(codes: np.ndarray, wuxing: Optional[WuxingColumns] = None) -> np.ndarray:
+        """批量判断格局，与逐盘调用 determine_pattern 一致
         
-        # 1. 正格判断
-        if strength in ["强", "中和"]:
-            if month_zhi_wuxing == day_master_wuxing:
-                pattern_type = "正格"
-                pattern_name = "建禄格"
-                pattern_description = f"日主在月支得地（禄），日主{day_master}生于{month_zhi}月，得令得势，命主自立自强，个性坚毅。"
-            
-            # 检查是否有财格
-            elif WuxingAnalyzer.count_wuxing_in_pillar(bazi["year"])["金"] + \
-                 WuxingAnalyzer.count_wuxing_in_pillar(bazi["month"])["金"] + \
-                 WuxingAnalyzer.count_wuxing_in_pillar(bazi["day"])["金"] + \
-                 WuxingAnalyzer.count_wuxing_in_pillar(bazi["hour"])["金"] >= 3:
-                if day_master_wuxing == "火":
-                    pattern_type = "正格"
-                    pattern_name = "财格"
-                    pattern_description = f"财星（金）多且旺，日主{day_master}命财格，主财运旺盛，善于理财。"
+        Args:
+            codes: 形状为 (N, 8) 的干支编码数组（如 BaziColumns.codes）
+            wuxing: 同一批八字的批量五行分析结果，为None时计算
             
-            # 检查是否有官格
-            elif WuxingAnalyzer.count_wuxing_in_pillar(bazi["year"])["木"] + \
-                 WuxingAnalyzer.count_wuxing_in_pillar(bazi["month"])["木"] + \
-                 WuxingAnalyzer.count_wuxing_in_pillar(bazi["day"])["木"] + \
-                 WuxingAnalyzer.count_wuxing_in_pillar(bazi["hour"])["木"] >= 3:
-                if day_master_wuxing == "土":
-                    pattern_type = "正格"
-                    pattern_name = "官格"
-                    pattern_description = f"官星（木）多且旺，日主{day_master}命官格，主事业有成，适合从政。"
+        Returns:
+            格局编号数组（PATTERNS 的索引）
+        """
+        codes = np.asarray(codes, dtype=np.intp).reshape(-1, 8)
+        if wuxing is None:
+            wuxing = BatchWuxingAnalyzer.analyze(codes)
+        day_gan = codes[:, 4]
+        day_master_wuxing = GAN_WUXING[day_gan]
+        scores = wuxing.scores
+        
+        # 化气：日干与月干（优先）或时干相合，且化神在地支出现；huaqi 为展开后的化气格序号
+        zhi_wuxing = np.zeros(len(codes), dtype=np.intp)
+        for position in (1, 3, 5, 7):
+            zhi_wuxing |= 1 << ZHI_WUXING[codes[:, position]]
+        huaqi = np.full(len(codes), -1, dtype=np.intp)
+        for offset, position in enumerate((2, 6)):
+            gan = codes[:, position]
+            yang = np.minimum(day_gan, gan) % 5
+            matched = (huaqi < 0) & (np.abs(day_gan - gan) == 5) & ((zhi_wuxing >> _GAN_HE_WUXING[yang]) & 1 == 1)
+            huaqi[matched] = (2 * yang + offset)[matched]
+        
+        input_energy = scores[:, 0] + scores[:, 1] + scores[:, 2]
+        output_energy = scores[:, 3] + scores[:, 4] + scores[:, 5]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cong = (output_energy > 0) & (input_energy / output_energy < 0.5)
+        shishang, cai, guansha = scores[:, 3], scores[:, 4], scores[:, 5]
+        dominant = np.select(
+            [(cai >= guansha) & (cai >= shishang), (guansha >= cai) & (guansha >= shishang)], [0, 1], 2
+        )
+        
+        key = (
+            (huaqi >= 0).astype(np.intp),
+            wuxing.strength.astype(np.intp),
+            day_master_wuxing,
+            (ZHI_WUXING[codes[:, 3]] == day_master_wuxing).astype(np.intp),
+            cong.astype(np.intp),
+            dominant,
+        ) + tuple(
+            MingGeAnalyzer.PATTERN_COUNT_BUCKETS[i, wuxing.wuxing_count[:, WUXING.index(name)]]
+            for i, name in enumerate(MingGeAnalyzer.PATTERN_COUNT_WUXING)
+        )
+        patterns = _RULE_PATTERNS[MingGeAnalyzer.PATTERN_TABLE[key]]
+        return np.where(huaqi >= 0, _HUAQI_BASE + huaqi, patterns).astype(np.uint8)
+    
+    @staticmethod
+    def describe_pattern(pattern: int, codes: Sequence[int], strength: str) -> Dict:
+        """由格局编号生成 determine_pattern 的字典结构
         
-        # 2. 从格判断
-        if strength == "弱":
-            input_energy = scores.get('day_master', 0) + scores.get('yin', 0) + scores.get('bijie', 0)
-            output_energy = scores.get('shishang', 0) + scores.get('cai', 0) + scores.get('guansha', 0)
+        Args:
+            pattern: 格局编号（PATTERNS 的索引）
+            codes: 干支编码
+            strength: 强弱描述
             
-            if output_energy > 0 and input_energy / output_energy < 0.5:
-                pattern_type = "从格"
-                
-                # 判断从财
-                cai_score = scores.get('cai', 0)
-                guansha_score = scores.get('guansha', 0)
-                shishang_score = scores.get('shishang', 0)
-                
-                if cai_score >= guansha_score and cai_score >= shishang_score:
-                    pattern_name = "从财格"
-                    pattern_description = f"日主{day_master}太弱，财星过旺，从财格，宜从商理财，以财为用。"
-                elif guansha_score >= cai_score and guansha_score >= shishang_score:
-                    pattern_name = "从官格"
-                    pattern_description = f"日主{day_master}太弱，官星过旺，从官格，宜从政管理，以官为用。"
-                else:
-                    pattern_name = "从儿格"
-                    pattern_description = f"日主{day_master}太弱，食伤过旺，从儿格，宜技艺求财，以食伤为用。"
-        
-        # 3. 化气格判断
-        pattern_info = MingGeAnalyzer._check_huaqi(bazi)
-        if pattern_info["is_huaqi"]:
-            pattern_type = "化气格"
-            pattern_name = pattern_info["pattern_name"]
-            pattern_description = pattern_info["description"]
-        
-        # 默认格局
-        if not pattern_type:
-            pattern_type = "正格"
-            pattern_name = "普通格局"
-            pattern_description = f"日主{day_master}命局平衡，无明显特殊格局，宜根据用神喜神调节运势。"
-        
+        Returns:
+            格局信息字典
+        """
+        pattern_type, pattern_name, pillar = MingGeAnalyzer.PATTERNS[pattern]
+        day_master = GanzhiCalculator.TIANGAN[codes[4]]
+        if pillar:
+            gan = codes[2] if pillar == "month" else codes[6]
+            wuxing, _ = GanzhiRelations.get_gan_he(codes[4], gan)
+            description = MingGeAnalyzer.PATTERN_DESCRIPTIONS["化气格"].format(
+                day_master=day_master, label=dict(HUAQI_PILLARS)[pillar],
+                gan=GanzhiCalculator.TIANGAN[gan], wuxing=wuxing, name=pattern_name,
+            )
+        else:
+            description = MingGeAnalyzer.PATTERN_DESCRIPTIONS[pattern_name].format(
+                day_master=day_master, month_zhi=GanzhiCalculator.DIZHI[codes[3]]
+            )
         return {
             "pattern_type": pattern_type,
             "pattern_name": pattern_name,
-            "pattern_description": pattern_description,
+            "pattern_description": description,
             "day_master": day_master,
-            "day_master_wuxing": day_master_wuxing,
+            "day_master_wuxing": GanzhiCalculator.TIANGAN_WUXING[day_master],
             "strength": strength
         }
     
@@ -121,60 +518,21 @@ class MingGeAnalyzer:
         Returns:
             化气格信息字典
         """
-        # 化气条件：日干与月干或时干相合，且化神得地
-        
-        # 检查日主与月干是否化气
+        # 化气条件：日干与月干或时干相合，且化神得地（在地支有根）
         day_gan = bazi["day"]["gan"]
-        month_gan = bazi["month"]["gan"]
-        hour_gan = bazi["hour"]["gan"]
-        
-        # 天干合化条件
-        huaqi_pairs = {
-            ("甲", "己"): ("土", "甲己化土"),
-            ("乙", "庚"): ("金", "乙庚化金"),
-            ("丙", "辛"): ("水", "丙辛化水"),
-            ("丁", "壬"): ("木", "丁壬化木"),
-            ("戊", "癸"): ("火", "戊癸化火"),
-            ("己", "甲"): ("土", "甲己化土"),
-            ("庚", "乙"): ("金", "乙庚化金"),
-            ("辛", "丙"): ("水", "丙辛化水"),
-            ("壬", "丁"): ("木", "丁壬化木"),
-            ("癸", "戊"): ("火", "戊癸化火"),
-        }
+        day_idx = GanzhiCalculator.TIANGAN_INDEX[day_gan]
+        zhi_wuxing = {bazi[pillar_name]["zhi_wuxing"] for pillar_name in ["year", "month", "day", "hour"]}
         
-        # 检查日主与月干
-        if (day_gan, month_gan) in huaqi_pairs:
-            huaqi_wuxing, huaqi_name = huaqi_pairs[(day_gan, month_gan)]
-            
-            # 检查化神是否得地（在地支有根）
-            has_root = False
-            for pillar_name in ["year", "month", "day", "hour"]:
-                if bazi[pillar_name]["zhi_wuxing"] == huaqi_wuxing:
-                    has_root = True
-                    break
-            
-            if has_root:
-                return {
-                    "is_huaqi": True,
-                    "pattern_name": huaqi_name,
-                    "description": f"日主{day_gan}与月干{month_gan}相合化为{huaqi_wuxing}，{huaqi_name}，格局清贵，利学业功名。"
-                }
-        
-        # 检查日主与时干
-        if (day_gan, hour_gan) in huaqi_pairs:
-            huaqi_wuxing, huaqi_name = huaqi_pairs[(day_gan, hour_gan)]
-            
-            has_root = False
-            for pillar_name in ["year", "month", "day", "hour"]:
-                if bazi[pillar_name]["zhi_wuxing"] == huaqi_wuxing:
-                    has_root = True
-                    break
-            
-            if has_root:
+        for pillar_name, label in HUAQI_PILLARS:
+            gan = bazi[pillar_name]["gan"]
+            huaqi_wuxing, huaqi_name = GanzhiRelations.get_gan_he(day_idx, GanzhiCalculator.TIANGAN_INDEX[gan])
+            if huaqi_wuxing and huaqi_wuxing in zhi_wuxing:
                 return {
                     "is_huaqi": True,
                     "pattern_name": huaqi_name,
-                    "description": f"日主{day_gan}与时干{hour_gan}相合化为{huaqi_wuxing}，{huaqi_name}，格局清贵，利学业功名。"
+                    "description": MingGeAnalyzer.PATTERN_DESCRIPTIONS["化气格"].format(
+                        day_master=day_gan, label=label, gan=gan, wuxing=huaqi_wuxing, name=huaqi_name
+                    )
                 }
         
         return {
@@ -194,83 +552,11 @@ class MingGeAnalyzer:
             性格分析字典
         """
         day_master = bazi["day"]["gan"]
-        day_master_wuxing = bazi["day"]["gan_wuxing"]
-        
-        # 日主性格特征
-        personality_traits = {
-            "甲": {
-                "traits": ["刚强", "正直", "有领导力", "独立自主"],
-                "strengths": ["有主见", "有责任感", "有担当"],
-                "weaknesses": ["固执", "不够灵活", "容易冲动"],
-                "description": "甲木日主，如大树参天，为人正直刚毅，有领导才能，但有时过于固执。"
-            },
-            "乙": {
-                "traits": ["温柔", "善良", "灵活", "善解人意"],
-                "strengths": ["善于沟通", "适应力强", "有同情心"],
-                "weaknesses": ["优柔寡断", "容易受影响", "缺乏主见"],
-                "description": "乙木日主，如花草柔美，为人温柔善良，善于社交，但有时缺乏决断力。"
-            },
-            "丙": {
-                "traits": ["热情", "开朗", "阳光", "有感染力"],
-                "strengths": ["乐观向上", "有号召力", "富有激情"],
-                "weaknesses": ["急躁", "容易冲动", "不够细心"],
-                "description": "丙火日主，如太阳普照，为人热情开朗，有感染力，但有时过于急躁。"
-            },
-            "丁": {
-                "traits": ["细腻", "敏感", "有洞察力", "温和"],
-                "strengths": ["善解人意", "观察力强", "有创造力"],
-                "weaknesses": ["多愁善感", "容易受伤害", "不够果断"],
-                "description": "丁火日主，如烛光温暖，为人细腻敏感，善解人意，但有时多愁善感。"
-            },
-            "戊": {
-                "traits": ["稳重", "可靠", "有担当", "踏实"],
-                "strengths": ["责任心强", "值得信赖", "稳重可靠"],
-                "weaknesses": ["保守", "不够灵活", "反应较慢"],
-                "description": "戊土日主，如高山厚重，为人稳重可靠，有担当，但有时过于保守。"
-            },
-            "己": {
-                "traits": ["温和", "包容", "善解人意", "有耐心"],
-                "strengths": ["包容性强", "善于合作", "有亲和力"],
-                "weaknesses": ["缺乏主见", "容易妥协", "不够自信"],
-                "description": "己土日主，如田园滋润，为人温和包容，善于合作，但有时缺乏主见。"
-            },
-            "庚": {
-                "traits": ["刚毅", "果断", "有魄力", "正直"],
-                "strengths": ["决策能力强", "有魄力", "坚持不懈"],
-                "weaknesses": ["过于强硬", "缺乏柔性", "容易树敌"],
-                "description": "庚金日主，如钢铁坚硬，为人刚毅果断，有魄力，但有时过于强硬。"
-            },
-            "辛": {
-                "traits": ["精致", "优雅", "有品味", "细腻"],
-                "strengths": ["审美能力强", "注重细节", "有艺术天赋"],
-                "weaknesses": ["追求完美", "过于挑剔", "容易纠结"],
-                "description": "辛金日主，如珠宝精致，为人优雅有品味，注重细节，但有时过于挑剔。"
-            },
-            "壬": {
-                "traits": ["聪明", "灵活", "适应力强", "善变"],
-                "strengths": ["反应快", "学习能力强", "善于应变"],
-                "weaknesses": ["不够专注", "容易分心", "缺乏耐心"],
-                "description": "壬水日主，如江河奔流，为人聪明灵活，适应力强，但有时不够专注。"
-            },
-            "癸": {
-                "traits": ["温柔", "智慧", "深沉", "敏感"],
-                "strengths": ["有智慧", "善思考", "有直觉"],
-                "weaknesses": ["过于敏感", "容易多想", "缺乏行动力"],
-                "description": "癸水日主，如雨露滋润，为人温柔智慧，善于思考，但有时过于敏感。"
-            }
-        }
-        
-        personality = personality_traits.get(day_master, {})
-        
-        if not personality:
-            personality = {
-                "traits": ["平和", "中正"],
-                "strengths": ["适应力强", "能屈能伸"],
-                "weaknesses": ["缺乏特色", "过于中庸"],
-                "description": f"{day_master}日主，性格平和，能屈能伸，易于相处。"
-            }
-        
-        return personality
+        personality = MingGeAnalyzer.PERSONALITY_TRAITS.get(day_master)
+        if personality is None:
+            personality = dict(MingGeAnalyzer.DEFAULT_PERSONALITY)
+            personality["description"] = personality["description"].format(day_master=day_master)
+        return _copy_record(personality)
     
     @staticmethod
     def analyze_career_wealth(bazi: Dict, wuxing_analysis: Dict) -> Dict:
@@ -283,61 +569,27 @@ class MingGeAnalyzer:
         Returns:
             事业财运分析字典
         """
-        day_master = bazi["day"]["gan"]
         yong_shen = wuxing_analysis["yong_shen_info"]["yong_shen"]
         xi_shen = wuxing_analysis["yong_shen_info"]["xi_shen"]
         ji_shen = wuxing_analysis["yong_shen_info"]["ji_shen"]
-        strength = wuxing_analysis["strength"]
+        scores = wuxing_analysis["scores"]
         
         # 根据用神和喜神分析适合的事业
-        career_suggestions = []
-        
-        # 五行对应事业
-        wuxing_to_career = {
-            "金": ["金融", "银行", "珠宝", "汽车", "机械", "IT技术", "法律"],
-            "木": ["教育", "文化", "艺术", "出版", "林业", "家具", "服装"],
-            "水": ["贸易", "物流", "旅游", "水产", "航运", "饮料", "清洁"],
-            "火": ["电子", "IT互联网", "能源", "餐饮", "娱乐", "广告", "媒体"],
-            "土": ["房地产", "建筑", "农业", "矿产", "陶瓷", "古玩", "仓储"]
-        }
-        
-        # 用神对应的事业
-        if yong_shen in wuxing_to_career:
-            career_suggestions.extend(wuxing_to_career[yong_shen])
-        
-        # 喜神对应的事业
-        if xi_shen in wuxing_to_career:
-            career_suggestions.extend(wuxing_to_career[xi_shen])
+        careers = MingGeAnalyzer.CAREER_TABLE.get((yong_shen, xi_shen))
+        if careers is None:
+            careers = _career_list(MingGeAnalyzer.WUXING_CAREERS, yong_shen, xi_shen)
         
         # 财运分析
-        cai_score = wuxing_analysis["scores"].get("cai", 0)
-        wealth_analysis = []
-        
-        if cai_score > 5:
-            wealth_analysis.append("财星较旺，财运较佳，善于理财")
-        elif cai_score > 2:
-            wealth_analysis.append("财运中等，需要努力积累")
-        else:
-            wealth_analysis.append("财星较弱，宜稳健理财，不宜投机")
-        
-        if "金" in ji_shen:
-            wealth_analysis.append("金为忌神，不宜投资黄金、珠宝等")
-        if "水" in ji_shen:
-            wealth_analysis.append("水为忌神，不宜投资航运、水产等")
+        wealth_analysis = [_level_message(MingGeAnalyzer.WEALTH_LEVELS, scores.get("cai", 0))]
+        wealth_analysis += [
+            message for wuxing, message in MingGeAnalyzer.JI_SHEN_WEALTH_WARNINGS if wuxing in ji_shen
+        ]
         
         # 事业成就分析
-        guansha_score = wuxing_analysis["scores"].get("guansha", 0)
-        career_achievement = []
-        
-        if guansha_score > 5:
-            career_achievement.append("官星较旺，适合从政或管理岗位")
-        elif guansha_score > 2:
-            career_achievement.append("事业运中等，需要脚踏实地")
-        else:
-            career_achievement.append("官星较弱，不宜追求权力，适合技术或专业领域")
+        career_achievement = [_level_message(MingGeAnalyzer.CAREER_LEVELS, scores.get("guansha", 0))]
         
         return {
-            "suitable_careers": list(set(career_suggestions)),
+            "suitable_careers": list(careers),
             "wealth_analysis": wealth_analysis,
             "career_achievement": career_achievement,
             "yong_shen": yong_shen,
@@ -345,68 +597,61 @@ class MingGeAnalyzer:
         }
     
     @staticmethod
-    def analyze_health(bazi: Dict) -> Dict:
+    def analyze_health(bazi: Dict, context: Optional[AnalysisContext] = None) -> Dict:
         """分析健康运势
         
         Args:
             bazi: 八字信息字典
+            context: 已创建的分析上下文，为None时新建
             
         Returns:
             健康分析字典
         """
-        # 五行与健康
-        wuxing_to_health = {
-            "金": ["肺", "呼吸系统", "皮肤", "大肠"],
-            "木": ["肝", "胆", "眼睛", "筋骨"],
-            "水": ["肾", "膀胱", "耳朵", "生殖系统"],
-            "火": ["心", "小肠", "舌头", "血液"],
-            "土": ["脾", "胃", "肌肉", "消化系统"]
-        }
-        
-        from bazi_calculator.core.wuxing import WuxingAnalyzer
-        wuxing_count = WuxingAnalyzer.count_wuxing_in_bazi(bazi)
+        context = context or AnalysisContext(bazi)
+        messages = MingGeAnalyzer.HEALTH_MESSAGES
         
         health_issues = []
         health_suggestions = []
         
-        # 检查五行缺失
-        for wuxing, count in wuxing_count.items():
-            if count == 0:
-                organs = wuxing_to_health.get(wuxing, [])
-                if organs:
-                    health_issues.append(f"缺{wuxing}，注意{','.join(organs)}健康")
-                    health_suggestions.append(f"多接触{wuxing}属性事物（如{wuxing}色、{wuxing}味等）")
-            elif count >= 5:
-                organs = wuxing_to_health.get(wuxing, [])
-                if organs:
-                    health_issues.append(f"{wuxing}过多，{','.join(organs)}可能过旺")
-                    health_suggestions.append(f"平衡{wuxing}，避免过度消耗相关器官")
+        # 检查五行缺失与过多
+        for wuxing, count in context.wuxing_count.items():
+            if wuxing not in messages or 0 < count < 5:
+                continue
+            issue, suggestion = messages[wuxing]["missing" if count == 0 else "excessive"]
+            health_issues.append(issue)
+            health_suggestions.append(suggestion)
         
         # 检查日主健康
-        day_master_wuxing = bazi["day"]["gan_wuxing"]
-        main_organs = wuxing_to_health.get(day_master_wuxing, [])
-        if main_organs:
-            health_suggestions.append(f"日主为{day_master_wuxing}，要特别注意{','.join(main_organs)}的保养")
+        day_master_wuxing = context.day_master_wuxing
+        if day_master_wuxing in messages:
+            health_suggestions.extend(messages[day_master_wuxing]["main"])
         
         return {
             "health_issues": health_issues,
             "health_suggestions": health_suggestions,
-            "main_organs": main_organs
+            "main_organs": list(MingGeAnalyzer.WUXING_HEALTH.get(day_master_wuxing, []))
         }
     
     @staticmethod
-    def analyze_comprehensive(bazi: Dict, wuxing_analysis: Dict) -> Dict:
+    def analyze_comprehensive(
+        bazi: Dict,
+        wuxing_analysis: Dict,
+        context: Optional[AnalysisContext] = None,
+    ) -> Dict:
         """综合命格分析
         
         Args:
             bazi: 八字信息字典
             wuxing_analysis: 五行分析结果
+            context: 已创建的分析上下文（可与五行分析共用），为None时新建
             
         Returns:
             综合命格分析字典
         """
+        context = context or AnalysisContext(bazi)
+        
         # 格局分析
-        pattern_analysis = MingGeAnalyzer.determine_pattern(bazi)
+        pattern_analysis = MingGeAnalyzer.determine_pattern(bazi, context)
         
         # 性格分析
         personality_analysis = MingGeAnalyzer.analyze_personality(bazi)
@@ -415,11 +660,69 @@ class MingGeAnalyzer:
         career_wealth_analysis = MingGeAnalyzer.analyze_career_wealth(bazi, wuxing_analysis)
         
         # 健康分析
-        health_analysis = MingGeAnalyzer.analyze_health(bazi)
+        health_analysis = MingGeAnalyzer.analyze_health(bazi, context)
+        
+        # 干支合冲刑害破（复制上下文缓存的结果）
+        relations = context.relations
+        relation_analysis = {
+            "gan": [dict(item) for item in relations["gan"]],
+            "zhi": [dict(item) for item in relations["zhi"]],
+            "triples": [dict(item) for item in relations["triples"]],
+            "flags": relations["flags"],
+            "names": list(relations["names"]),
+        }
         
         return {
             "pattern_analysis": pattern_analysis,
             "personality_analysis": personality_analysis,
             "career_wealth_analysis": career_wealth_analysis,
-            "health_analysis": health_analysis
+            "health_analysis": health_analysis,
+            "relation_analysis": relation_analysis
         }
+
+
+# 决策表规则序号到格局编号（化气格规则另按五合与所在柱展开）
+_RULE_PATTERNS = np.array([
+    MingGeAnalyzer.PATTERNS.index((rule["type"], rule["name"], "")) if not rule.get("huaqi") else 0
+    for rule in MingGeAnalyzer.PATTERN_RULES
+], dtype=np.uint8)
+
+# 展开后的第一个化气格编号
+_HUAQI_BASE = next(index for index, (_, _, pillar) in enumerate(MingGeAnalyzer.PATTERNS) if pillar)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """命令行入口：比较完整报告共用与不共用分析上下文的耗时"""
+    parser = argparse.ArgumentParser(description="命格分析基准测试")
+    parser.add_argument("--benchmark", action="store_true", help="运行基准测试")
+    parser.add_argument("--count", type=int, default=20000, help="随机八字数量")
+    parser.add_argument("--seed", type=int, default=0, help="随机种子")
+    args = parser.parse_args(argv)
+    if not args.benchmark:
+        parser.print_help()
+        return
+
+    from bazi_calculator.core.calendar import BaziCalendar
+
+    rng = np.random.default_rng(args.seed)
+    start = np.datetime64(datetime(1901, 1, 1), "s")
+    offsets = rng.integers(0, 199 * 365 * 86400, args.count)
+    bazis = BaziCalendar.get_all_pillars_many(start + offsets.astype("timedelta64[s]")).to_dicts()
+
+    started = time.perf_counter()
+    for bazi in bazis:
+        MingGeAnalyzer.analyze_comprehensive(bazi, WuxingAnalyzer.analyze_comprehensive(bazi))
+    separate = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for bazi in bazis:
+        context = WuxingAnalyzer.build_context(bazi)
+        MingGeAnalyzer.analyze_comprehensive(bazi, WuxingAnalyzer.analyze_comprehensive(bazi, context), context)
+    shared = time.perf_counter() - started
+
+    print(f"{args.count} 个八字完整报告：各自新建上下文 {separate:.3f} 秒，"
+          f"共用上下文 {shared:.3f} 秒，加速 {separate / shared:.2f} 倍")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,315 @@
+"""干支关系模块
+
+此模块检测八字中天干、地支之间的合、冲、刑、害、破等关系：
+    天干：五合、相冲（10×10 关系位掩码）
+    地支两两：六合、半合、六冲、相刑、自刑、六害、六破（12×12 关系位掩码）
+    地支三者：三合局、三会局、三刑（地支出现集合的12位掩码）
+
+两两关系查表后用位运算判断，三者关系只需一次掩码比较；
+批量模式对 N×8 的干支编码数组按列查表，得到每盘的关系位掩码。
+"""
+
+from itertools import combinations
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from bazi_calculator.core.ganzhi import GanzhiCalculator
+
+
+PILLARS = ("year", "month", "day", "hour")
+
+# 地支两两配对的 (柱序号, 柱序号)
+PILLAR_PAIRS = list(combinations(range(4), 2))
+
+
+def _symmetric_matrix(size: int, pairs: Dict[int, Sequence[Tuple[int, int]]]) -> List[List[int]]:
+    """由 {关系位: [(a, b), ...]} 生成对称的关系位掩码矩阵"""
+    matrix = [[0] * size for _ in range(size)]
+    for flag, items in pairs.items():
+        for a, b in items:
+            matrix[a][b] |= flag
+            matrix[b][a] |= flag
+    return matrix
+
+
+class GanzhiRelations:
+    """干支关系检测器
+
+    提供天干五合、相冲与地支合、冲、刑、害、破及三合、三会、三刑的检测功能。
+    """
+
+    # 关系位
+    GAN_HE = 1 << 0
+    GAN_CHONG = 1 << 1
+    LIUHE = 1 << 2
+    BANHE = 1 << 3
+    CHONG = 1 << 4
+    XING = 1 << 5
+    ZIXING = 1 << 6
+    HAI = 1 << 7
+    PO = 1 << 8
+    SANHE = 1 << 9
+    SANHUI = 1 << 10
+    SANXING = 1 << 11
+
+    # 关系位对应的名称
+    NAMES = {
+        GAN_HE: "天干五合",
+        GAN_CHONG: "天干相冲",
+        LIUHE: "六合",
+        BANHE: "半合",
+        CHONG: "六冲",
+        XING: "相刑",
+        ZIXING: "自刑",
+        HAI: "六害",
+        PO: "六破",
+        SANHE: "三合",
+        SANHUI: "三会",
+        SANXING: "三刑",
+    }
+
+    # 天干关系矩阵：甲己、乙庚、丙辛、丁壬、戊癸相合；甲庚、乙辛、丙壬、丁癸相冲
+    GAN_MATRIX = _symmetric_matrix(10, {
+        GAN_HE: [(i, i + 5) for i in range(5)],
+        GAN_CHONG: [(i, i + 6) for i in range(4)],
+    })
+
+    # 天干五合的化神，按阳干索引（甲乙丙丁戊）排列
+    GAN_HE_WUXING = ["土", "金", "水", "木", "火"]
+
+    # 地支关系矩阵
+    ZHI_MATRIX = _symmetric_matrix(12, {
+        # 子丑、寅亥、卯戌、辰酉、巳申、午未
+        LIUHE: [(0, 1), (2, 11), (3, 10), (4, 9), (5, 8), (6, 7)],
+        # 三合局中含帝旺（子午卯酉）的两支
+        BANHE: [(8, 0), (0, 4), (11, 3), (3, 7), (2, 6), (6, 10), (5, 9), (9, 1)],
+        CHONG: [(i, i + 6) for i in range(6)],
+        # 子卯无礼之刑，寅巳申恃势之刑，丑戌未无恩之刑
+        XING: [(0, 3), (2, 5), (5, 8), (2, 8), (1, 10), (10, 7), (1, 7)],
+        # 辰午酉亥自刑
+        ZIXING: [(4, 4), (6, 6), (9, 9), (11, 11)],
+        # 子未、丑午、寅巳、卯辰、申亥、酉戌
+        HAI: [(0, 7), (1, 6), (2, 5), (3, 4), (8, 11), (9, 10)],
+        # 子酉、卯午、辰丑、未戌、寅亥、巳申
+        PO: [(0, 9), (3, 6), (4, 1), (7, 10), (2, 11), (5, 8)],
+    })
+
+    # 地支两两关系在名称中的后缀（如"子午冲"）
+    ZHI_SUFFIXES = (
+        (LIUHE, "合"), (BANHE, "半合"), (CHONG, "冲"), (XING, "刑"),
+        (ZIXING, "自刑"), (HAI, "害"), (PO, "破"),
+    )
+
+    # 六合的合化五行，按地支索引排列
+    LIUHE_WUXING = ["土", "土", "木", "火", "金", "水", "土", "土", "水", "金", "火", "木"]
+
+    # 三者关系：(关系位, 地支索引, 五行)，五行为空表示不成局
+    TRIPLES = [
+        (SANHE, (8, 0, 4), "水"),
+        (SANHE, (11, 3, 7), "木"),
+        (SANHE, (2, 6, 10), "火"),
+        (SANHE, (5, 9, 1), "金"),
+        (SANHUI, (2, 3, 4), "木"),
+        (SANHUI, (5, 6, 7), "火"),
+        (SANHUI, (8, 9, 10), "金"),
+        (SANHUI, (11, 0, 1), "水"),
+        (SANXING, (2, 5, 8), ""),
+        (SANXING, (1, 10, 7), ""),
+    ]
+
+    # 三者关系的地支掩码
+    TRIPLE_MASKS = [sum(1 << zhi for zhi in branches) for _, branches, _ in TRIPLES]
+
+    @staticmethod
+    def get_gan_relation(gan1: int, gan2: int) -> int:
+        """获取两个天干的关系位掩码
+
+        Args:
+            gan1: 天干索引（0-9）
+            gan2: 天干索引（0-9）
+
+        Returns:
+            GAN_HE、GAN_CHONG 的组合
+        """
+        return GanzhiRelations.GAN_MATRIX[gan1][gan2]
+
+    @staticmethod
+    def get_zhi_relation(zhi1: int, zhi2: int) -> int:
+        """获取两个地支的关系位掩码
+
+        Args:
+            zhi1: 地支索引（0-11）
+            zhi2: 地支索引（0-11）
+
+        Returns:
+            LIUHE、BANHE、CHONG、XING、ZIXING、HAI、PO 的组合
+        """
+        return GanzhiRelations.ZHI_MATRIX[zhi1][zhi2]
+
+    @staticmethod
+    def get_gan_he(gan1: int, gan2: int) -> Tuple[str, str]:
+        """获取两个天干的五合
+
+        Args:
+            gan1: 天干索引（0-9）
+            gan2: 天干索引（0-9）
+
+        Returns:
+            (化神五行, 名称如"甲己化土")；不相合时为 ("", "")
+        """
+        if not GanzhiRelations.GAN_MATRIX[gan1][gan2] & GanzhiRelations.GAN_HE:
+            return "", ""
+        yang = gan1 % 5
+        wuxing = GanzhiRelations.GAN_HE_WUXING[yang]
+        tiangan = GanzhiCalculator.TIANGAN
+        return wuxing, f"{tiangan[yang]}{tiangan[yang + 5]}化{wuxing}"
+
+    @staticmethod
+    def get_flags(codes: Sequence[int]) -> int:
+        """获取一盘八字出现的全部关系位
+
+        Args:
+            codes: (年干, 年支, 月干, 月支, 日干, 日支, 时干, 时支) 编码
+
+        Returns:
+            关系位掩码
+        """
+        gan_matrix = GanzhiRelations.GAN_MATRIX
+        zhi_matrix = GanzhiRelations.ZHI_MATRIX
+        flags = 0
+        present = 0
+        for i, j in PILLAR_PAIRS:
+            flags |= gan_matrix[codes[2 * i]][codes[2 * j]]
+            flags |= zhi_matrix[codes[2 * i + 1]][codes[2 * j + 1]]
+        for i in range(4):
+            present |= 1 << codes[2 * i + 1]
+        for (flag, _, _), mask in zip(GanzhiRelations.TRIPLES, GanzhiRelations.TRIPLE_MASKS):
+            if present & mask == mask:
+                flags |= flag
+        return flags
+
+    @staticmethod
+    def flag_names(flags: int) -> List[str]:
+        """将关系位掩码转换为关系名称列表"""
+        return [name for flag, name in GanzhiRelations.NAMES.items() if flags & flag]
+
+    @staticmethod
+    def detect(codes: Sequence[int]) -> Dict:
+        """检测一盘八字的全部干支关系
+
+        Args:
+            codes: (年干, 年支, 月干, 月支, 日干, 日支, 时干, 时支) 编码
+
+        Returns:
+            字典：gan、zhi 为两两关系列表，每项含 pillars（两柱名称）、relation（关系名称）、
+            name（如"子午冲"）与 wuxing（合化五行，其余为空字符串）；
+            triples 为三者关系列表，每项含 pillars、relation、name 与 wuxing；
+            flags 为关系位掩码，names 为出现的关系名称
+        """
+        tiangan = GanzhiCalculator.TIANGAN
+        dizhi = GanzhiCalculator.DIZHI
+        names = GanzhiRelations.NAMES
+
+        gan_relations = []
+        zhi_relations = []
+        flags = 0
+        for i, j in PILLAR_PAIRS:
+            pillars = (PILLARS[i], PILLARS[j])
+            gan1, gan2 = codes[2 * i], codes[2 * j]
+            relation = GanzhiRelations.GAN_MATRIX[gan1][gan2]
+            flags |= relation
+            if relation & GanzhiRelations.GAN_HE:
+                wuxing, _ = GanzhiRelations.get_gan_he(gan1, gan2)
+                gan_relations.append({
+                    "pillars": pillars, "relation": names[GanzhiRelations.GAN_HE],
+                    "name": f"{tiangan[gan1]}{tiangan[gan2]}合", "wuxing": wuxing,
+                })
+            if relation & GanzhiRelations.GAN_CHONG:
+                gan_relations.append({
+                    "pillars": pillars, "relation": names[GanzhiRelations.GAN_CHONG],
+                    "name": f"{tiangan[gan1]}{tiangan[gan2]}冲", "wuxing": "",
+                })
+
+            zhi1, zhi2 = codes[2 * i + 1], codes[2 * j + 1]
+            relation = GanzhiRelations.ZHI_MATRIX[zhi1][zhi2]
+            flags |= relation
+            if not relation:
+                continue
+            for flag, suffix in GanzhiRelations.ZHI_SUFFIXES:
+                if relation & flag:
+                    zhi_relations.append({
+                        "pillars": pillars, "relation": names[flag],
+                        "name": f"{dizhi[zhi1]}{dizhi[zhi2]}{suffix}",
+                        "wuxing": GanzhiRelations.LIUHE_WUXING[zhi1] if flag == GanzhiRelations.LIUHE else "",
+                    })
+
+        zhis = [codes[2 * i + 1] for i in range(4)]
+        present = 0
+        for zhi in zhis:
+            present |= 1 << zhi
+        triples = []
+        for (flag, branches, wuxing), mask in zip(GanzhiRelations.TRIPLES, GanzhiRelations.TRIPLE_MASKS):
+            if present & mask != mask:
+                continue
+            flags |= flag
+            if flag == GanzhiRelations.SANXING:
+                name = "".join(dizhi[zhi] for zhi in branches) + "三刑"
+            else:
+                name = "".join(dizhi[zhi] for zhi in branches) + names[flag] + wuxing + "局"
+            triples.append({
+                "pillars": tuple(PILLARS[i] for i in range(4) if zhis[i] in branches),
+                "relation": names[flag],
+                "name": name,
+                "wuxing": wuxing,
+            })
+
+        return {
+            "gan": gan_relations,
+            "zhi": zhi_relations,
+            "triples": triples,
+            "flags": flags,
+            "names": GanzhiRelations.flag_names(flags),
+        }
+
+    @staticmethod
+    def detect_bazi(bazi: Dict) -> Dict:
+        """检测八字信息字典的全部干支关系，结果同 detect"""
+        return GanzhiRelations.detect(GanzhiRelations._bazi_codes(bazi))
+
+    @staticmethod
+    def _bazi_codes(bazi: Dict) -> Tuple[int, ...]:
+        """由八字信息字典获取八个干支编码"""
+        codes = []
+        for pillar in PILLARS:
+            codes.append(GanzhiCalculator.TIANGAN_INDEX[bazi[pillar]["gan"]])
+            codes.append(GanzhiCalculator.DIZHI_INDEX[bazi[pillar]["zhi"]])
+        return tuple(codes)
+
+    @staticmethod
+    def get_flags_many(codes: np.ndarray) -> np.ndarray:
+        """批量获取关系位掩码，与逐盘调用 get_flags 一致
+
+        Args:
+            codes: 形状为 (N, 8) 的干支编码数组（如 BaziColumns.codes）
+
+        Returns:
+            长度为 N 的 uint16 数组
+        """
+        codes = np.asarray(codes, dtype=np.intp).reshape(-1, 8)
+        flags = np.zeros(len(codes), dtype=np.uint16)
+        for i, j in PILLAR_PAIRS:
+            flags |= _GAN_MATRIX[codes[:, 2 * i], codes[:, 2 * j]]
+            flags |= _ZHI_MATRIX[codes[:, 2 * i + 1], codes[:, 2 * j + 1]]
+
+        present = np.zeros(len(codes), dtype=np.uint16)
+        for i in range(4):
+            present |= np.left_shift(1, codes[:, 2 * i + 1]).astype(np.uint16)
+        for (flag, _, _), mask in zip(GanzhiRelations.TRIPLES, GanzhiRelations.TRIPLE_MASKS):
+            flags[(present & mask) == mask] |= flag
+        return flags
+
+
+# 关系矩阵的数组形式，供批量查表
+_GAN_MATRIX = np.array(GanzhiRelations.GAN_MATRIX, dtype=np.uint16)
+_ZHI_MATRIX = np.array(GanzhiRelations.ZHI_MATRIX, dtype=np.uint16)
@@ -0,0 +1,121 @@
+"""八字反查模块
+
+此模块根据给定的四柱反查公历出生时间区间：年柱按六十年一周期跳跃，
+月柱按节气定位月份，日柱按六十日一周期定位日期，时柱按时辰定位钟点，
+无需逐分钟排盘。
+"""
+
+import re
+from datetime import datetime, timedelta
+from typing import List, Sequence, Tuple, Union
+
+from bazi_calculator.core.calendar import BaziCalendar
+from bazi_calculator.core.ganzhi import GanzhiCalculator
+from bazi_calculator.core.jieqi import JieqiCalculator
+
+
+PillarsInput = Union[str, Sequence[str]]
+
+
+class BaziReverseSearch:
+    """八字反查器
+
+    提供由四柱反查出生时间区间的功能。
+    """
+
+    @staticmethod
+    def parse_pillars(pillars: PillarsInput) -> Tuple[int, int, int, int]:
+        """解析四柱为六十甲子索引
+
+        Args:
+            pillars: 八字字符串（如"甲辰 丁卯 庚午 辛巳"，空格可省略）或四个干支字符串
+
+        Returns:
+            (年柱, 月柱, 日柱, 时柱) 的六十甲子索引元组
+
+        Raises:
+            ValueError: 四柱格式无效
+        """
+        if isinstance(pillars, str):
+            text = re.sub(r"\s+", "", pillars)
+            pillars = [text[i:i + 2] for i in range(0, len(text), 2)]
+
+        if len(pillars) != 4 or any(len(pillar) != 2 for pillar in pillars):
+            raise ValueError(f"无效的四柱: {pillars}")
+
+        year, month, day, hour = (
+            GanzhiCalculator.get_jiazi_index(
+                GanzhiCalculator.get_tiangan_index(pillar[0]),
+                GanzhiCalculator.get_dizhi_index(pillar[1]),
+            )
+            for pillar in pillars
+        )
+        return year, month, day, hour
+
+    @staticmethod
+    def find_intervals(
+        pillars: PillarsInput,
+        start: datetime,
+        end: datetime,
+    ) -> List[Tuple[datetime, datetime]]:
+        """查找四柱相同的全部出生时间区间
+
+        Args:
+            pillars: 八字字符串或四个干支字符串
+            start: 查找范围起点
+            end: 查找范围终点（不含）
+
+        Returns:
+            按时间排序的 (区间起点, 区间终点) 列表，区间左闭右开
+
+        Raises:
+            ValueError: 四柱格式无效
+        """
+        year, month, day, hour = BaziReverseSearch.parse_pillars(pillars)
+        year_gan, month_gan, month_zhi = year % 10, month % 10, month % 12
+        day_gan, hour_gan, hour_zhi = day % 10, hour % 10, hour % 12
+
+        # 五虎遁、五鼠遁不符的组合不存在
+        month_order = (month_zhi - 2) % 12
+        if BaziCalendar.WUHU_DUN_CODES[year_gan][month_order] != month_gan:
+            return []
+        if BaziCalendar.WUSHU_DUN_CODES[day_gan][hour_zhi] != hour_gan:
+            return []
+
+        # 时支对应的钟点区间（子时包括当日0时和23时两段）
+        if hour_zhi == 0:
+            hour_slots = [(0, 1), (23, 24)]
+        else:
+            hour_slots = [(2 * hour_zhi - 1, 2 * hour_zhi + 1)]
+
+        intervals = []
+        # 年柱：六十年一周期；节气年可能比公历年早一年（小寒、大寒在次年一月）
+        first_year = start.year - 1
+        jieqi_year = first_year + (year - (first_year - 4)) % 60
+        while jieqi_year <= end.year:
+            # 月柱：该节气年中对应月份的节与下一个节之间
+            jieqi_index = month_order * 2
+            month_start = JieqiCalculator.calculate_jieqi_datetime(jieqi_year, jieqi_index)
+            if jieqi_index + 2 < 24:
+                month_end = JieqiCalculator.calculate_jieqi_datetime(jieqi_year, jieqi_index + 2)
+            else:
+                month_end = JieqiCalculator.calculate_jieqi_datetime(jieqi_year + 1, 0)
+
+            window_start = max(month_start, start)
+            window_end = min(month_end, end)
+            if window_start < window_end:
+                # 日柱：六十日一周期，一个月内至多一天
+                offset = (day - (window_start.toordinal() - BaziCalendar.BASE_ORDINAL)) % 60
+                ordinal = window_start.toordinal() + offset
+                while ordinal <= window_end.toordinal():
+                    midnight = datetime.fromordinal(ordinal)
+                    for first_hour, last_hour in hour_slots:
+                        slot_start = max(midnight + timedelta(hours=first_hour), window_start)
+                        slot_end = min(midnight + timedelta(hours=last_hour), window_end)
+                        if slot_start < slot_end:
+                            intervals.append((slot_start, slot_end))
+                    ordinal += 60
+
+            jieqi_year += 60
+
+        return intervals
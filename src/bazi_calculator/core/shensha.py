@@ -0,0 +1,232 @@
+"""神煞模块
+
+此模块按查表方式计算常用神煞。每种神煞由一个或多个基准（日干、年干、年支、日支、
+月支或日柱六十甲子索引）查得目标地支（或天干）的位掩码，再与命盘各柱比对：
+    天乙贵人、文昌：日干、年干查地支
+    禄神、羊刃：日干查地支
+    桃花、驿马、华盖、将星：年支、日支按三合局查地支
+    孤辰、寡宿：年支按方位查地支
+    月德：月支按三合局查天干
+    魁罡：日柱本身
+    空亡：日柱所在旬查地支
+
+基准与目标同为地支时不与基准所在柱自身比对。每盘的神煞结果为一个位掩码，
+第 i 位对应 ShenshaCalculator.NAMES[i]。
+"""
+
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from bazi_calculator.core.ganzhi import GanzhiCalculator
+
+
+PILLARS = ("year", "month", "day", "hour")
+
+# 基准：(柱序号, 类型)，类型为 gan、zhi 或 jiazi
+KEYS = {
+    "year_gan": (0, "gan"),
+    "year_zhi": (0, "zhi"),
+    "month_zhi": (1, "zhi"),
+    "day_gan": (2, "gan"),
+    "day_zhi": (2, "zhi"),
+    "day_jiazi": (2, "jiazi"),
+}
+
+
+def _masks(targets: Sequence[Sequence[int]]) -> List[int]:
+    """将每个基准对应的目标索引列表转换为位掩码列表"""
+    return [sum(1 << target for target in items) for items in targets]
+
+
+def _sanhe_masks(targets: Sequence[int]) -> List[int]:
+    """由三合局（按地支索引除以4的余数分组：水、金、火、木）的目标生成地支位掩码"""
+    return _masks([[targets[zhi % 4]] for zhi in range(12)])
+
+
+def _kongwang_masks() -> List[int]:
+    """生成六十甲子各柱所在旬的空亡地支位掩码"""
+    masks = []
+    for index in range(60):
+        first_zhi = (index // 10 * 10) % 12
+        masks.append((1 << (first_zhi + 10) % 12) | (1 << (first_zhi + 11) % 12))
+    return masks
+
+
+# 天乙贵人：甲戊庚牛羊，乙己鼠猴乡，丙丁猪鸡位，壬癸兔蛇藏，六辛逢马虎
+_TIANYI = _masks([[1, 7], [0, 8], [11, 9], [11, 9], [1, 7], [0, 8], [1, 7], [6, 2], [5, 3], [5, 3]])
+
+# 文昌：甲巳、乙午、丙戊申、丁己酉、庚亥、辛子、壬寅、癸卯
+_WENCHANG = _masks([[5], [6], [8], [9], [8], [9], [11], [0], [2], [3]])
+
+# 禄神：甲寅、乙卯、丙戊巳、丁己午、庚申、辛酉、壬亥、癸子
+_LU = _masks([[2], [3], [5], [6], [5], [6], [8], [9], [11], [0]])
+
+# 羊刃（阳干）：甲卯、丙戊午、庚酉、壬子
+_YANGREN = _masks([[3], [], [6], [], [6], [], [9], [], [0], []])
+
+# 孤辰、寡宿：按年支所在方位（亥子丑、寅卯辰、巳午未、申酉戌）
+_GUCHEN = _masks([[(zhi + 1) % 12 // 3 * 3 + 2] for zhi in range(12)])
+_GUASU = _masks([[((zhi + 1) % 12 // 3 * 3 + 10) % 12] for zhi in range(12)])
+
+# 魁罡：庚辰、庚戌、壬辰、戊戌
+_KUIGANG = [
+    int(index in (16, 46, 28, 34)) for index in range(60)
+]
+
+
+class ShenshaCalculator:
+    """神煞计算器
+
+    提供单盘与批量的神煞位掩码计算功能。
+    """
+
+    # 神煞定义：(名称, ((基准, 位掩码表), ...), 目标)，目标为 zhi、gan 或 self（日柱本身）
+    SHENSHA: List[Tuple[str, Tuple[Tuple[str, List[int]], ...], str]] = [
+        ("天乙贵人", (("day_gan", _TIANYI), ("year_gan", _TIANYI)), "zhi"),
+        ("文昌", (("day_gan", _WENCHANG), ("year_gan", _WENCHANG)), "zhi"),
+        ("禄神", (("day_gan", _LU),), "zhi"),
+        ("羊刃", (("day_gan", _YANGREN),), "zhi"),
+        ("桃花", (("year_zhi", _sanhe_masks([9, 6, 3, 0])), ("day_zhi", _sanhe_masks([9, 6, 3, 0]))), "zhi"),
+        ("驿马", (("year_zhi", _sanhe_masks([2, 11, 8, 5])), ("day_zhi", _sanhe_masks([2, 11, 8, 5]))), "zhi"),
+        ("华盖", (("year_zhi", _sanhe_masks([4, 1, 10, 7])), ("day_zhi", _sanhe_masks([4, 1, 10, 7]))), "zhi"),
+        ("将星", (("year_zhi", _sanhe_masks([0, 9, 6, 3])), ("day_zhi", _sanhe_masks([0, 9, 6, 3]))), "zhi"),
+        ("孤辰", (("year_zhi", _GUCHEN),), "zhi"),
+        ("寡宿", (("year_zhi", _GUASU),), "zhi"),
+        ("月德", (("month_zhi", _sanhe_masks([8, 6, 2, 0])),), "gan"),
+        ("魁罡", (("day_jiazi", _KUIGANG),), "self"),
+        ("空亡", (("day_jiazi", _kongwang_masks()),), "zhi"),
+    ]
+
+    # 神煞名称，第 i 项对应位掩码的第 i 位
+    NAMES = [name for name, _, _ in SHENSHA]
+
+    @staticmethod
+    def _key_code(codes: Sequence[int], key: str) -> int:
+        """获取基准的编码"""
+        pillar, kind = KEYS[key]
+        if kind == "jiazi":
+            return int(GanzhiCalculator.get_jiazi_index(codes[2 * pillar], codes[2 * pillar + 1]))
+        return int(codes[2 * pillar + (kind == "zhi")])
+
+    @staticmethod
+    def get_pillars(codes: Sequence[int]) -> Dict[str, List[str]]:
+        """一次遍历计算命盘的神煞及其所在柱
+
+        Args:
+            codes: (年干, 年支, 月干, 月支, 日干, 日支, 时干, 时支) 编码
+
+        Returns:
+            出现的神煞名称到所在柱名称列表（按年、月、日、时排列）的映射
+        """
+        result = {}
+        for name, keys, target in ShenshaCalculator.SHENSHA:
+            hits = 0
+            for key, masks in keys:
+                mask = masks[ShenshaCalculator._key_code(codes, key)]
+                key_pillar, key_kind = KEYS[key]
+                if target == "self":
+                    hits |= mask << key_pillar
+                    continue
+                for pillar in range(4):
+                    if target == "zhi" and key_kind != "gan" and pillar == key_pillar:
+                        continue
+                    if mask >> codes[2 * pillar + (target == "zhi")] & 1:
+                        hits |= 1 << pillar
+            if hits:
+                result[name] = [PILLARS[pillar] for pillar in range(4) if hits >> pillar & 1]
+        return result
+
+    @staticmethod
+    def get_flags(codes: Sequence[int]) -> int:
+        """获取命盘的神煞位掩码
+
+        Args:
+            codes: (年干, 年支, 月干, 月支, 日干, 日支, 时干, 时支) 编码
+
+        Returns:
+            位掩码，第 i 位对应 NAMES[i]
+        """
+        # 各柱天干、地支的位集合；基准为地支时比对的是除基准柱外的地支集合
+        gan_set = (1 << codes[0]) | (1 << codes[2]) | (1 << codes[4]) | (1 << codes[6])
+        zhi_bits = [1 << codes[2 * pillar + 1] for pillar in range(4)]
+        zhi_set = zhi_bits[0] | zhi_bits[1] | zhi_bits[2] | zhi_bits[3]
+        zhi_others = [
+            zhi_bits[(pillar + 1) % 4] | zhi_bits[(pillar + 2) % 4] | zhi_bits[(pillar + 3) % 4]
+            for pillar in range(4)
+        ]
+        key_codes = {key: ShenshaCalculator._key_code(codes, key) for key in KEYS}
+
+        flags = 0
+        for bit, (_, keys, target) in enumerate(ShenshaCalculator.SHENSHA):
+            for key, masks in keys:
+                key_pillar, key_kind = KEYS[key]
+                if target == "self":
+                    present = 1
+                elif target == "gan":
+                    present = gan_set
+                elif key_kind == "gan":
+                    present = zhi_set
+                else:
+                    present = zhi_others[key_pillar]
+                if masks[key_codes[key]] & present:
+                    flags |= 1 << bit
+                    break
+        return flags
+
+    @staticmethod
+    def flag_names(flags: int) -> List[str]:
+        """将神煞位掩码转换为名称列表"""
+        return [name for i, name in enumerate(ShenshaCalculator.NAMES) if flags >> i & 1]
+
+    @staticmethod
+    def detect(codes: Sequence[int]) -> Dict:
+        """计算命盘的神煞
+
+        Args:
+            codes: (年干, 年支, 月干, 月支, 日干, 日支, 时干, 时支) 编码
+
+        Returns:
+            字典：flags 为位掩码，names 为出现的神煞名称，pillars 为各神煞所在柱
+        """
+        pillars = ShenshaCalculator.get_pillars(codes)
+        flags = 0
+        for i, name in enumerate(ShenshaCalculator.NAMES):
+            if name in pillars:
+                flags |= 1 << i
+        return {
+            "flags": flags,
+            "names": list(pillars),
+            "pillars": pillars,
+        }
+
+    @staticmethod
+    def get_flags_many(codes: np.ndarray) -> np.ndarray:
+        """批量获取神煞位掩码，与逐盘调用 get_flags 一致
+
+        Args:
+            codes: 形状为 (N, 8) 的干支编码数组（如 BaziColumns.codes）
+
+        Returns:
+            长度为 N 的 uint16 数组
+        """
+        codes = np.asarray(codes, dtype=np.intp).reshape(-1, 8)
+        flags = np.zeros(len(codes), dtype=np.uint16)
+        for bit, (_, keys, target) in enumerate(ShenshaCalculator.SHENSHA):
+            hits = np.zeros(len(codes), dtype=bool)
+            for key, masks in keys:
+                key_pillar, key_kind = KEYS[key]
+                if key_kind == "jiazi":
+                    key_codes = (6 * codes[:, 2 * key_pillar] - 5 * codes[:, 2 * key_pillar + 1]) % 60
+                else:
+                    key_codes = codes[:, 2 * key_pillar + (key_kind == "zhi")]
+                mask = np.array(masks, dtype=np.int64)[key_codes]
+                if target == "self":
+                    hits |= mask.astype(bool)
+                    continue
+                for pillar in range(4):
+                    if target == "zhi" and key_kind != "gan" and pillar == key_pillar:
+                        continue
+                    hits |= (mask >> codes[:, 2 * pillar + (target == "zhi")]) & 1 == 1
+            flags[hits] |= 1 << bit
+        return flags
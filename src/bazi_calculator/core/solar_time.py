@@ -0,0 +1,127 @@
+"""真太阳时模块
+
+此模块把出生地的钟表时间换算为真太阳时：
+    真太阳时 = 钟表时间 + (出生地经度 - 时区标准经度) × 4分钟 + 均时差
+
+均时差按年内日序预先制表，城市经度查询离线数据并缓存，
+每次换算只需查表与一次加法。
+"""
+
+import math
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import List, Union
+
+from bazi_calculator.data.city_gazetteer import CityGazetteer
+
+
+def _generate_equation_of_time_table() -> List[int]:
+    """生成按日序（1月1日为0）排列的均时差表（秒，正午值，366项）
+
+    采用 Spencer 傅里叶级数，精度约半分钟。
+    """
+    table = []
+    for day in range(366):
+        gamma = 2 * math.pi * day / 365
+        minutes = 229.18 * (
+            0.000075
+            + 0.001868 * math.cos(gamma)
+            - 0.032077 * math.sin(gamma)
+            - 0.014615 * math.cos(2 * gamma)
+            - 0.040849 * math.sin(2 * gamma)
+        )
+        table.append(round(minutes * 60))
+    return table
+
+
+Location = Union[str, float, int]
+
+
+class TrueSolarTime:
+    """真太阳时计算器
+
+    提供经度时差、均时差和真太阳时换算功能。
+    """
+
+    # 北京时间的标准经度
+    STANDARD_MERIDIAN = 120.0
+
+    # 每度经度对应的时差（秒）
+    SECONDS_PER_DEGREE = 240
+
+    # 均时差表（秒），按日序索引
+    EQUATION_OF_TIME = _generate_equation_of_time_table()
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def get_longitude(location: Location) -> float:
+        """解析出生地经度
+
+        Args:
+            location: 经度（东经为正）或城市名称
+
+        Returns:
+            经度
+
+        Raises:
+            ValueError: 城市未收录或经度超出范围
+        """
+        if isinstance(location, str):
+            longitude = CityGazetteer.get_longitude(location)
+            if longitude is None:
+                raise ValueError(f"未收录的城市: {location}")
+            return float(longitude)
+
+        if not -180 <= location <= 180:
+            raise ValueError(f"经度超出范围: {location}")
+        return float(location)
+
+    @staticmethod
+    def get_equation_of_time(date: datetime) -> int:
+        """获取均时差
+
+        Args:
+            date: 日期
+
+        Returns:
+            均时差（秒），真太阳时减平太阳时
+        """
+        return TrueSolarTime.EQUATION_OF_TIME[date.timetuple().tm_yday - 1]
+
+    @staticmethod
+    def get_correction(
+        date: datetime,
+        location: Location,
+        standard_meridian: float = STANDARD_MERIDIAN,
+    ) -> int:
+        """计算钟表时间到真太阳时的修正量
+
+        Args:
+            date: 钟表时间
+            location: 经度或城市名称
+            standard_meridian: 时区标准经度（默认东八区120°）
+
+        Returns:
+            修正量（秒）
+        """
+        longitude = TrueSolarTime.get_longitude(location)
+        longitude_offset = round((longitude - standard_meridian) * TrueSolarTime.SECONDS_PER_DEGREE)
+        return longitude_offset + TrueSolarTime.get_equation_of_time(date)
+
+    @staticmethod
+    def correct(
+        date: datetime,
+        location: Location,
+        standard_meridian: float = STANDARD_MERIDIAN,
+    ) -> datetime:
+        """将钟表时间换算为真太阳时
+
+        Args:
+            date: 钟表时间
+            location: 经度或城市名称
+            standard_meridian: 时区标准经度（默认东八区120°）
+
+        Returns:
+            真太阳时
+        """
+        return date + timedelta(seconds=TrueSolarTime.get_correction(date, location, standard_meridian))
@@ -0,0 +1,319 @@
+"""日主强弱评分模型模块
+
+此模块把日主强弱评分的各项参数做成可配置的模型：
+    gan_points、zhi_points：天干、地支按相对日主的关系（same、yin、guansha、shishang、cai）计入的分值
+    seasonal：按月令旺相休囚死对各五行分值的乘数
+    hidden_stems：地支是否按藏干及其权重计分（否则按地支本气五行计分）
+    thresholds：判断强（strong）与中和（neutral）时生扶能量相对克泄耗能量的倍数
+
+模型创建时编译为 [日主五行, 五行, 月支] 的 5×5×12 分值张量，再展开为按天干、地支编码
+直接读取评分向量的内核，每盘评分为八次查表与累加，与模型参数无关。多个模型可在同一批
+八字上并列评分。
+
+默认模型的参数与 WuxingAnalyzer 相同，评分结果逐位一致。配置为 JSON 对象，省略的项取默认值：
+    {"seasonal": {"旺": 1.5, "相": 1.2, "休": 1.0, "囚": 0.8, "死": 0.6}, "hidden_stems": true}
+"""
+
+import json
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from bazi_calculator.core.ganzhi import GanzhiCalculator
+from bazi_calculator.core.wuxing import WuxingAnalyzer
+from bazi_calculator.core.wuxing_batch import GAN_WUXING, SCORE_NAMES, STRENGTHS, WUXING, ZHI_WUXING
+
+
+# 旺相休囚死
+SEASONAL_STATES = ("旺", "相", "休", "囚", "死")
+
+# 默认配置（与 WuxingAnalyzer 的评分一致）
+DEFAULT_CONFIG: Dict[str, Any] = {
+    "name": "default",
+    "gan_points": {relation: score for relation, (_, score) in WuxingAnalyzer.GAN_SCORES.items()},
+    "zhi_points": {relation: score for relation, (_, score) in WuxingAnalyzer.ZHI_SCORES.items()},
+    "seasonal": {state: 1.0 for state in SEASONAL_STATES},
+    "hidden_stems": False,
+    "thresholds": {"strong": 1.3, "neutral": 0.8},
+}
+
+
+def _generate_relation_codes() -> np.ndarray:
+    """生成关系表：[日主五行, 五行] 为 WuxingAnalyzer.RELATIONS 的索引"""
+    codes = np.zeros((len(WUXING), len(WUXING)), dtype=np.intp)
+    for day_master, day_master_wuxing in enumerate(WUXING):
+        relations = WuxingAnalyzer.WUXING_RELATIONS[day_master_wuxing]
+        for element, wuxing in enumerate(WUXING):
+            codes[day_master, element] = WuxingAnalyzer.RELATIONS.index(relations[wuxing])
+    return codes
+
+
+def _generate_seasonal_states() -> np.ndarray:
+    """生成旺相休囚死表：[五行, 月支] 为 SEASONAL_STATES 的索引
+
+    当令（与月支五行相同）为旺，令生者为相，生令者为休，克令者为囚，令克者为死。
+    """
+    sheng = GanzhiCalculator.WUXING_SHENG
+    ke = GanzhiCalculator.WUXING_KE
+    states = np.zeros((len(WUXING), 12), dtype=np.intp)
+    for element, wuxing in enumerate(WUXING):
+        for month_zhi, zhi in enumerate(GanzhiCalculator.DIZHI):
+            season = GanzhiCalculator.DIZHI_WUXING[zhi]
+            if wuxing == season:
+                state = "旺"
+            elif sheng[season] == wuxing:
+                state = "相"
+            elif sheng[wuxing] == season:
+                state = "休"
+            elif ke[wuxing] == season:
+                state = "囚"
+            else:
+                state = "死"
+            states[element, month_zhi] = SEASONAL_STATES.index(state)
+    return states
+
+
+def _generate_score_columns(scores: Dict[str, Tuple[str, float]]) -> np.ndarray:
+    """生成评分列表：[日主五行, 五行] 为计入的评分项（SCORE_NAMES 的索引）"""
+    columns = [SCORE_NAMES.index(scores[relation][0]) for relation in WuxingAnalyzer.RELATIONS]
+    table: np.ndarray = np.array(columns, dtype=np.intp)[_RELATION_CODES]
+    return table
+
+
+# 五行相对日主的关系与旺相休囚死
+_RELATION_CODES = _generate_relation_codes()
+_SEASONAL_STATES = _generate_seasonal_states()
+
+# 天干、地支按关系计入的评分项
+_GAN_COLUMNS = _generate_score_columns(WuxingAnalyzer.GAN_SCORES)
+_ZHI_COLUMNS = _generate_score_columns(WuxingAnalyzer.ZHI_SCORES)
+
+# 地支藏干的五行与权重：(地支, 五行, 权重)
+_CANGGAN_ITEMS = [
+    (zhi, GAN_WUXING[gan], weight)
+    for zhi, items in enumerate(GanzhiCalculator.CANGGAN_CODES)
+    for gan, weight in items
+]
+
+
+class StrengthModel:
+    """日主强弱评分模型
+
+    tensor 为 [天干/地支, 日主五行, 五行, 月支] 的分值张量（两个 5×5×12），
+    gan_kernel、zhi_kernel 为按 [日主五行, 天干/地支编码, 月支] 读取的评分向量（列按 SCORE_NAMES）。
+    """
+
+    # 内置的示例模型
+    PRESETS: Dict[str, Dict[str, Any]] = {
+        "default": {},
+        "seasonal": {
+            "name": "seasonal",
+            "seasonal": {"旺": 1.5, "相": 1.2, "休": 1.0, "囚": 0.8, "死": 0.6},
+        },
+        "hidden_stems": {"name": "hidden_stems", "hidden_stems": True},
+    }
+
+    def __init__(self, config: Optional[Dict] = None):
+        """由配置创建并编译模型
+
+        Args:
+            config: 模型配置，省略的项取 DEFAULT_CONFIG 的值
+
+        Raises:
+            ValueError: 配置包含未知的项、关系或旺相休囚死名称
+        """
+        config = dict(config or {})
+        unknown = set(config) - set(DEFAULT_CONFIG)
+        if unknown:
+            raise ValueError(f"未知的配置项: {sorted(unknown)}")
+
+        self.name = config.get("name", DEFAULT_CONFIG["name"])
+        self.gan_points = StrengthModel._merge(config, "gan_points", WuxingAnalyzer.RELATIONS)
+        self.zhi_points = StrengthModel._merge(config, "zhi_points", WuxingAnalyzer.RELATIONS)
+        self.seasonal = StrengthModel._merge(config, "seasonal", SEASONAL_STATES)
+        self.thresholds = StrengthModel._merge(config, "thresholds", ("strong", "neutral"))
+        self.hidden_stems = bool(config.get("hidden_stems", DEFAULT_CONFIG["hidden_stems"]))
+        self._compile()
+
+    @staticmethod
+    def _merge(config: Dict, key: str, names: Sequence[str]) -> Dict[str, float]:
+        """合并一项配置与默认值"""
+        values = dict(DEFAULT_CONFIG[key])
+        overrides = config.get(key, {})
+        unknown = set(overrides) - set(names)
+        if unknown:
+            raise ValueError(f"配置项 {key} 包含未知的名称: {sorted(unknown)}")
+        values.update({name: float(value) for name, value in overrides.items()})
+        return values
+
+    def _compile(self) -> None:
+        """编译分值张量与评分内核"""
+        relations = WuxingAnalyzer.RELATIONS
+        gan_points = np.array([self.gan_points[relation] for relation in relations])
+        zhi_points = np.array([self.zhi_points[relation] for relation in relations])
+        multipliers = np.array([self.seasonal[state] for state in SEASONAL_STATES])[_SEASONAL_STATES]
+
+        # [日主五行, 五行, 月支]
+        gan_tensor = gan_points[_RELATION_CODES][:, :, np.newaxis] * multipliers[np.newaxis]
+        zhi_tensor = zhi_points[_RELATION_CODES][:, :, np.newaxis] * multipliers[np.newaxis]
+        self.tensor = np.stack([gan_tensor, zhi_tensor])
+
+        day_masters = np.arange(len(WUXING))[:, np.newaxis]
+        months = np.arange(12)
+
+        self.gan_kernel = np.zeros((len(WUXING), 10, 12, len(SCORE_NAMES)))
+        for gan in range(10):
+            element = GAN_WUXING[gan]
+            self.gan_kernel[day_masters, gan, months, _GAN_COLUMNS[:, element][:, np.newaxis]] = \
+                gan_tensor[:, element, :]
+
+        self.zhi_kernel = np.zeros((len(WUXING), 12, 12, len(SCORE_NAMES)))
+        if self.hidden_stems:
+            for zhi, element, weight in _CANGGAN_ITEMS:
+                self.zhi_kernel[day_masters, zhi, months, _ZHI_COLUMNS[:, element][:, np.newaxis]] += \
+                    zhi_tensor[:, element, :] * weight
+        else:
+            for zhi in range(12):
+                element = ZHI_WUXING[zhi]
+                self.zhi_kernel[day_masters, zhi, months, _ZHI_COLUMNS[:, element][:, np.newaxis]] = \
+                    zhi_tensor[:, element, :]
+
+        # 逐盘评分使用的嵌套列表
+        self._gan_rows = self.gan_kernel.tolist()
+        self._zhi_rows = self.zhi_kernel.tolist()
+
+    @staticmethod
+    def from_preset(name: str) -> "StrengthModel":
+        """创建内置模型
+
+        Args:
+            name: PRESETS 中的模型名称
+
+        Returns:
+            StrengthModel 对象
+
+        Raises:
+            ValueError: 未知的模型名称
+        """
+        if name not in StrengthModel.PRESETS:
+            raise ValueError(f"未知的评分模型: {name}")
+        return StrengthModel(StrengthModel.PRESETS[name])
+
+    @staticmethod
+    def load(path: str) -> "StrengthModel":
+        """从 JSON 配置文件创建模型
+
+        Args:
+            path: 配置文件路径
+
+        Returns:
+            StrengthModel 对象
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            return StrengthModel(json.load(f))
+
+    def to_config(self) -> Dict:
+        """导出完整配置（可写入 JSON）"""
+        return {
+            "name": self.name,
+            "gan_points": dict(self.gan_points),
+            "zhi_points": dict(self.zhi_points),
+            "seasonal": dict(self.seasonal),
+            "hidden_stems": self.hidden_stems,
+            "thresholds": dict(self.thresholds),
+        }
+
+    def judge(self, scores: Sequence[float]) -> str:
+        """由评分向量判断日主强弱
+
+        Args:
+            scores: 按 SCORE_NAMES 排列的评分
+
+        Returns:
+            "强"、"中和" 或 "弱"
+        """
+        total_energy = scores[0] + scores[1] + scores[2]
+        output_energy = scores[3] + scores[4] + scores[5]
+        if total_energy > output_energy * self.thresholds["strong"]:
+            return "强"
+        if total_energy > output_energy * self.thresholds["neutral"]:
+            return "中和"
+        return "弱"
+
+    def score(self, codes: Sequence[int]) -> Tuple[Dict[str, float], str]:
+        """计算一盘八字的强弱评分
+
+        Args:
+            codes: (年干, 年支, 月干, 月支, 日干, 日支, 时干, 时支) 编码
+
+        Returns:
+            (评分字典, 强弱描述) 元组，评分字典与 WuxingAnalyzer.analyze_day_master_strength 相同
+        """
+        day_master = GAN_WUXING[codes[4]]
+        month_zhi = codes[3]
+        gan_rows = self._gan_rows[day_master]
+        zhi_rows = self._zhi_rows[day_master]
+        scores = [0.0] * len(SCORE_NAMES)
+        for position in range(0, 8, 2):
+            for row in (gan_rows[codes[position]][month_zhi], zhi_rows[codes[position + 1]][month_zhi]):
+                for column in range(len(SCORE_NAMES)):
+                    scores[column] += row[column]
+        return dict(zip(SCORE_NAMES, scores)), self.judge(scores)
+
+    def score_bazi(self, bazi: Dict) -> Tuple[Dict[str, float], str]:
+        """计算八字信息字典的强弱评分（供 AnalysisContext 使用）
+
+        Args:
+            bazi: 八字信息字典
+
+        Returns:
+            (评分字典, 强弱描述) 元组
+        """
+        codes = []
+        for pillar in ("year", "month", "day", "hour"):
+            codes.append(GanzhiCalculator.TIANGAN_INDEX[bazi[pillar]["gan"]])
+            codes.append(GanzhiCalculator.DIZHI_INDEX[bazi[pillar]["zhi"]])
+        return self.score(codes)
+
+    def score_many(self, codes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """批量计算强弱评分，与逐盘调用 score 一致
+
+        Args:
+            codes: 形状为 (N, 8) 的干支编码数组（如 BaziColumns.codes）
+
+        Returns:
+            (形状为 (N, 6) 的评分数组, 强弱索引数组（STRENGTHS 的索引）) 元组
+        """
+        scores, strength = StrengthModel.score_models_many([self], codes)
+        return scores[0], strength[0]
+
+    @staticmethod
+    def score_models_many(models: List["StrengthModel"], codes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """用多个模型并列批量评分
+
+        Args:
+            models: 模型列表
+            codes: 形状为 (N, 8) 的干支编码数组
+
+        Returns:
+            (形状为 (M, N, 6) 的评分数组, 形状为 (M, N) 的强弱索引数组) 元组，M 为模型数
+        """
+        codes = np.asarray(codes, dtype=np.intp).reshape(-1, 8)
+        gan_kernels = np.stack([model.gan_kernel for model in models])
+        zhi_kernels = np.stack([model.zhi_kernel for model in models])
+        day_master = GAN_WUXING[codes[:, 4]]
+        month_zhi = codes[:, 3]
+
+        scores = np.zeros((len(models), len(codes), len(SCORE_NAMES)))
+        for position in range(0, 8, 2):
+            scores += gan_kernels[:, day_master, codes[:, position], month_zhi]
+            scores += zhi_kernels[:, day_master, codes[:, position + 1], month_zhi]
+
+        total_energy = scores[:, :, 0] + scores[:, :, 1] + scores[:, :, 2]
+        output_energy = scores[:, :, 3] + scores[:, :, 4] + scores[:, :, 5]
+        strong = np.array([model.thresholds["strong"] for model in models])[:, np.newaxis]
+        neutral = np.array([model.thresholds["neutral"] for model in models])[:, np.newaxis]
+        strength = np.full(scores.shape[:2], STRENGTHS.index("弱"), dtype=np.int8)
+        strength[total_energy > output_energy * neutral] = STRENGTHS.index("中和")
+        strength[total_energy > output_energy * strong] = STRENGTHS.index("强")
+        return scores, strength
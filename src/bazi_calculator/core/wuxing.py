@@ -1,11 +1,114 @@
 """五行分析模块
 
 此模块提供五行分析功能，包括日主强弱分析和用神推算。
+
+同一八字的五行统计、日主强弱评分、用神与干支关系保存在 AnalysisContext 中，
+五行分析与命格分析共用同一上下文时，每项只计算一次。各分析返回的是上下文结果的副本，
+调用方修改返回值不会影响共用同一上下文的后续分析。
 """
 
-from typing import Dict, List, Tuple
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 from collections import Counter
 from bazi_calculator.core.ganzhi import GanzhiCalculator
+from bazi_calculator.core.relations import GanzhiRelations
+
+if TYPE_CHECKING:
+    from bazi_calculator.core.strength import StrengthModel
+
+
+PILLARS = ["year", "month", "day", "hour"]
+
+
+def _generate_wuxing_relations() -> Dict[str, Dict[str, str]]:
+    """生成五行关系表：[日主五行][五行] 为同我、生我、克我、我生或我克"""
+    sheng_relation = GanzhiCalculator.WUXING_SHENG
+    ke_relation = GanzhiCalculator.WUXING_KE
+    table = {}
+    for day_master_wuxing in sheng_relation:
+        relations = {}
+        for wuxing in sheng_relation:
+            if wuxing == day_master_wuxing:
+                relations[wuxing] = "same"
+            elif sheng_relation[wuxing] == day_master_wuxing:
+                relations[wuxing] = "yin"
+            elif ke_relation[wuxing] == day_master_wuxing:
+                relations[wuxing] = "guansha"
+            elif sheng_relation[day_master_wuxing] == wuxing:
+                relations[wuxing] = "shishang"
+            else:
+                relations[wuxing] = "cai"
+        table[day_master_wuxing] = relations
+    return table
+
+
+class AnalysisContext:
+    """单个八字的分析上下文
+    
+    创建时一次遍历四柱，统计五行并按各五行相对日主的关系评出日主强弱
+    （指定评分模型时由模型评分）；用神与干支关系在首次使用时计算，之后直接复用。
+    """
+    
+    def __init__(self, bazi: Dict, model: Optional["StrengthModel"] = None):
+        """由八字信息字典创建分析上下文
+        
+        Args:
+            bazi: 八字信息字典
+            model: 强弱评分模型（见 StrengthModel），为None时使用默认评分
+        """
+        self.bazi = bazi
+        self.day_master = bazi["day"]["gan"]
+        self.day_master_wuxing = bazi["day"]["gan_wuxing"]
+        
+        # 各五行相对日主的关系
+        self.wuxing_relation = WuxingAnalyzer.WUXING_RELATIONS[self.day_master_wuxing]
+        
+        # 指定评分模型时只统计五行，强弱评分由模型给出
+        if model is not None:
+            self.wuxing_count = WuxingAnalyzer.count_wuxing_in_bazi(bazi)
+            self.scores, self.strength = model.score_bazi(bazi)
+            return
+        
+        self.wuxing_count = {"金": 0, "木": 0, "水": 0, "火": 0, "土": 0}
+        self.scores = {
+            "day_master": 0.0,
+            "yin": 0.0,  # 印星（生日主）
+            "bijie": 0.0,  # 比劫（同五行）
+            "shishang": 0.0,  # 食伤（日主生）
+            "cai": 0.0,  # 财星（日主克）
+            "guansha": 0.0  # 官杀（克日主）
+        }
+        
+        # 遍历四柱，天干、地支计入五行数量并按与日主的关系计分
+        for pillar_name in PILLARS:
+            if pillar_name not in bazi:
+                continue
+            
+            pillar = bazi[pillar_name]
+            if "gan" in pillar and "gan_wuxing" in pillar:
+                wuxing = pillar["gan_wuxing"]
+                self.wuxing_count[wuxing] += 1
+                name, score = WuxingAnalyzer.GAN_SCORES[self.wuxing_relation[wuxing]]
+                self.scores[name] += score
+            if "zhi" in pillar and "zhi_wuxing" in pillar:
+                wuxing = pillar["zhi_wuxing"]
+                self.wuxing_count[wuxing] += 1
+                name, score = WuxingAnalyzer.ZHI_SCORES[self.wuxing_relation[wuxing]]
+                self.scores[name] += score
+        
+        # 日主强弱
+        self.strength = WuxingAnalyzer._judge_strength(self.scores)
+    
+    @cached_property
+    def yong_shen_info(self) -> Dict:
+        """用神、喜神、忌神（见 WuxingAnalyzer.determine_yong_shen）"""
+        return WuxingAnalyzer._determine_yong_shen(self)
+    
+    @cached_property
+    def relations(self) -> Dict:
+        """干支合冲刑害破（见 GanzhiRelations.detect）"""
+        relations: Dict = GanzhiRelations.detect_bazi(self.bazi)
+        return relations
 
 
 class WuxingAnalyzer:
@@ -58,81 +161,74 @@ class WuxingAnalyzer:
         
         return wuxing_count
     
+    # 五行相对日主的关系：same 同我、yin 生我、guansha 克我、shishang 我生、cai 我克
+    RELATIONS = ("same", "yin", "guansha", "shishang", "cai")
+    
+    # 五行关系表：WUXING_RELATIONS[日主五行][五行] 为 RELATIONS 之一
+    WUXING_RELATIONS = _generate_wuxing_relations()
+    
+    # 天干、地支按关系计入的评分项与分值
+    GAN_SCORES = {
+        "same": ("day_master", 10.0),
+        "yin": ("yin", 8.0),
+        "guansha": ("guansha", 6.0),
+        "shishang": ("shishang", 4.0),
+        "cai": ("cai", 5.0),
+    }
+    ZHI_SCORES = {
+        "same": ("bijie", 6.0),
+        "yin": ("yin", 4.0),
+        "guansha": ("guansha", 3.0),
+        "shishang": ("shishang", 2.0),
+        "cai": ("cai", 2.5),
+    }
+    
     @staticmethod
-    def analyze_day_master_strength(bazi: Dict) -> Tuple[str, Dict[str, float]]:
-        """分析日主强弱
+    def build_context(bazi: Dict, model: Optional["StrengthModel"] = None) -> AnalysisContext:
+        """创建分析上下文，供同一八字的多个分析共用
         
         Args:
             bazi: 八字信息字典
+            model: 强弱评分模型（见 StrengthModel），为None时使用默认评分
             
         Returns:
-            (强弱描述, 强弱评分) 元组
-            强弱评分：日主能量、印星能量、比劫能量、食伤能量、财星能量、官杀能量
+            AnalysisContext 对象
         """
-        day_master = bazi["day"]["gan"]
-        day_master_wuxing = bazi["day"]["gan_wuxing"]
-        
-        # 统计各类干支
-        scores = {
-            "day_master": 0.0,
-            "yin": 0.0,  # 印星（生日主）
-            "bijie": 0.0,  # 比劫（同五行）
-            "shishang": 0.0,  # 食伤（克日主）
-            "cai": 0.0,  # 财星（日主克）
-            "guansha": 0.0  # 官杀（克日主）
-        }
-        
-        # 五行生克关系
-        sheng_relation = GanzhiCalculator.WUXING_SHENG
-        ke_relation = GanzhiCalculator.WUXING_KE
+        return AnalysisContext(bazi, model)
+    
+    @staticmethod
+    def get_wuxing_relations(day_master_wuxing: str) -> Dict[str, str]:
+        """获取五行相对日主的关系
         
-        # 遍历四柱分析
-        for pillar_name in ["year", "month", "day", "hour"]:
-            if pillar_name not in bazi:
-                continue
-                
-            pillar = bazi[pillar_name]
-            
-            # 分析天干
-            if "gan" in pillar and "gan_wuxing" in pillar:
-                gan_wuxing = pillar["gan_wuxing"]
-                
-                if gan_wuxing == day_master_wuxing:
-                    # 日主本身
-                    scores["day_master"] += 10.0
-                elif sheng_relation.get(gan_wuxing) == day_master_wuxing:
-                    # 印星（生日主）
-                    scores["yin"] += 8.0
-                elif ke_relation.get(gan_wuxing) == day_master_wuxing:
-                    # 官杀（克日主）
-                    scores["guansha"] += 6.0
-                elif sheng_relation.get(day_master_wuxing) == gan_wuxing:
-                    # 食伤（日主生）
-                    scores["shishang"] += 4.0
-                elif ke_relation.get(day_master_wuxing) == gan_wuxing:
-                    # 财星（日主克）
-                    scores["cai"] += 5.0
+        Args:
+            day_master_wuxing: 日主五行
             
-            # 分析地支
-            if "zhi" in pillar and "zhi_wuxing" in pillar:
-                zhi_wuxing = pillar["zhi_wuxing"]
-                
-                if zhi_wuxing == day_master_wuxing:
-                    # 比劫（同五行地支）
-                    scores["bijie"] += 6.0
-                elif sheng_relation.get(zhi_wuxing) == day_master_wuxing:
-                    # 印星地支
-                    scores["yin"] += 4.0
-                elif ke_relation.get(zhi_wuxing) == day_master_wuxing:
-                    # 官杀地支
-                    scores["guansha"] += 3.0
-                elif sheng_relation.get(day_master_wuxing) == zhi_wuxing:
-                    # 食伤地支
-                    scores["shishang"] += 2.0
-                elif ke_relation.get(day_master_wuxing) == zhi_wuxing:
-                    # 财星地支
-                    scores["cai"] += 2.5
+        Returns:
+            五行到关系（见 RELATIONS）的映射
+        """
+        return dict(WuxingAnalyzer.WUXING_RELATIONS[day_master_wuxing])
+    
+    @staticmethod
+    def analyze_day_master_strength(
+        bazi: Dict,
+        context: Optional[AnalysisContext] = None,
+    ) -> Tuple[str, Dict[str, float]]:
+        """分析日主强弱
         
+        Args:
+            bazi: 八字信息字典
+            context: 已创建的分析上下文，为None时新建
+            
+        Returns:
+            (强弱描述, 强弱评分) 元组
+            强弱评分：日主能量、印星能量、比劫能量、食伤能量、财星能量、官杀能量
+        """
+        context = context or AnalysisContext(bazi)
+        return context.strength, dict(context.scores)
+    
+    @staticmethod
+    def _judge_strength(scores: Dict[str, float]) -> str:
+        """由强弱评分判断日主强弱"""
         # 计算日主总能量
         total_energy = (
             scores["day_master"] + scores["yin"] + scores["bijie"]
@@ -151,23 +247,37 @@ class WuxingAnalyzer:
         else:
             strength = "弱"
         
-        return strength, scores
+        return strength
     
     @staticmethod
-    def determine_yong_shen(bazi: Dict) -> Dict:
+    def determine_yong_shen(bazi: Dict, context: Optional[AnalysisContext] = None) -> Dict:
         """推算用神、喜神、忌神
         
         Args:
             bazi: 八字信息字典
+            context: 已创建的分析上下文，为None时新建
             
         Returns:
             用神信息字典
         """
-        day_master = bazi["day"]["gan"]
-        day_master_wuxing = bazi["day"]["gan_wuxing"]
-        
-        # 分析日主强弱
-        strength, scores = WuxingAnalyzer.analyze_day_master_strength(bazi)
+        context = context or AnalysisContext(bazi)
+        return WuxingAnalyzer._copy_yong_shen_info(context.yong_shen_info)
+    
+    @staticmethod
+    def _copy_yong_shen_info(yong_shen_info: Dict) -> Dict:
+        """复制上下文缓存的用神信息（含忌神列表与评分）"""
+        copied = dict(yong_shen_info)
+        copied["ji_shen"] = list(yong_shen_info["ji_shen"])
+        copied["scores"] = dict(yong_shen_info["scores"])
+        return copied
+    
+    @staticmethod
+    def _determine_yong_shen(context: AnalysisContext) -> Dict:
+        """由分析上下文中的日主强弱推算用神、喜神、忌神"""
+        bazi = context.bazi
+        day_master = context.day_master
+        day_master_wuxing = context.day_master_wuxing
+        strength, scores = context.strength, context.scores
         
         # 五行生克关系
         sheng_relation = GanzhiCalculator.WUXING_SHENG
@@ -267,23 +377,20 @@ class WuxingAnalyzer:
         }
     
     @staticmethod
-    def analyze_comprehensive(bazi: Dict) -> Dict:
+    def analyze_comprehensive(bazi: Dict, context: Optional[AnalysisContext] = None) -> Dict:
         """综合分析八字五行
         
         Args:
             bazi: 八字信息字典
+            context: 已创建的分析上下文，为None时新建
             
         Returns:
             综合分析结果字典
         """
-        # 统计五行
-        wuxing_count = WuxingAnalyzer.count_wuxing_in_bazi(bazi)
-        
-        # 分析日主强弱
-        strength, scores = WuxingAnalyzer.analyze_day_master_strength(bazi)
-        
-        # 推算用神
-        yong_shen_info = WuxingAnalyzer.determine_yong_shen(bazi)
+        context = context or AnalysisContext(bazi)
+        wuxing_count = dict(context.wuxing_count)
+        strength, scores = context.strength, dict(context.scores)
+        yong_shen_info = WuxingAnalyzer._copy_yong_shen_info(context.yong_shen_info)
         
         # 五行缺失
         missing_wuxing = [wuxing for wuxing, count in wuxing_count.items() if count == 0]
@@ -307,3 +414,63 @@ class WuxingAnalyzer:
                 "strength_description": strength
             }
         }
+    
+    @staticmethod
+    def analyze_many(bazis: List[Dict]) -> List[Dict]:
+        """批量综合分析多个八字
+        
+        各八字转换为干支编码后一次交给 BatchWuxingAnalyzer 向量化分析，
+        结果与逐个调用 analyze_comprehensive 一致。
+        
+        Args:
+            bazis: 八字信息字典列表（须含完整四柱）
+            
+        Returns:
+            与输入顺序一致的综合分析结果列表
+        """
+        from bazi_calculator.core.wuxing_batch import BatchWuxingAnalyzer
+        codes = [
+            [
+                index
+                for pillar in PILLARS
+                for index in (
+                    GanzhiCalculator.TIANGAN_INDEX[bazi[pillar]["gan"]],
+                    GanzhiCalculator.DIZHI_INDEX[bazi[pillar]["zhi"]],
+                )
+            ]
+            for bazi in bazis
+        ]
+        analyses: List[Dict] = BatchWuxingAnalyzer.analyze(codes).to_dicts()
+        return analyses
+    
+    @staticmethod
+    def summarize_stability(analyses: List[Dict]) -> Dict:
+        """汇总多个综合分析结果中结论的一致性
+        
+        用于时辰未知时比较十二个时辰的分析结果。
+        
+        Args:
+            analyses: analyze_comprehensive 的结果列表
+            
+        Returns:
+            汇总字典：yong_shen、xi_shen、strength 各含 stable（是否全部相同）、
+            value（全部相同时的取值，否则为None）与 distribution（各取值出现次数）；
+            stable_conclusions 列出全部相同的结论名称
+        """
+        values = {
+            "yong_shen": [analysis["yong_shen_info"]["yong_shen"] for analysis in analyses],
+            "xi_shen": [analysis["yong_shen_info"]["xi_shen"] for analysis in analyses],
+            "strength": [analysis["strength"] for analysis in analyses],
+        }
+        
+        summary: Dict[str, Any] = {}
+        for name, items in values.items():
+            distribution = dict(Counter(items).most_common())
+            stable = len(distribution) == 1
+            summary[name] = {
+                "stable": stable,
+                "value": items[0] if stable else None,
+                "distribution": distribution,
+            }
+        summary["stable_conclusions"] = [name for name in values if summary[name]["stable"]]
+        return summary
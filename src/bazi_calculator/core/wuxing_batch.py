@@ -0,0 +1,270 @@
+"""批量五行分析模块
+
+此模块提供 WuxingAnalyzer 综合分析的向量化版本：输入 N×8 的整数干支编码
+（如 BaziColumns.codes），五行数量与强弱评分由 [日干, 干支] 查找表逐柱累加，
+强弱判断与用神、喜神、忌神按数组条件选取，结果与逐盘分析一致。
+
+五行按 WUXING（金、木、水、火、土，即 analyze_comprehensive 中 wuxing_count 的顺序）编号。
+"""
+
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from bazi_calculator.core.ganzhi import GanzhiCalculator
+from bazi_calculator.core.jieqi_batch import ArrayLike
+from bazi_calculator.core.wuxing import WuxingAnalyzer
+
+if TYPE_CHECKING:
+    from bazi_calculator.core.strength import StrengthModel
+
+
+# 五行编号顺序
+WUXING = ("金", "木", "水", "火", "土")
+
+# 评分项，scores 数组的列顺序
+SCORE_NAMES = ("day_master", "yin", "bijie", "shishang", "cai", "guansha")
+
+# 强弱，strength 数组的取值为其索引
+STRENGTHS = ("强", "中和", "弱")
+
+
+def _wuxing_codes(names: List[str], wuxing_map: Dict[str, str]) -> np.ndarray:
+    """生成干支编码到五行编号的数组"""
+    return np.array([WUXING.index(wuxing_map[name]) for name in names], dtype=np.intp)
+
+
+def _generate_score_table(names: List[str], wuxing_map: Dict[str, str], points: Dict) -> np.ndarray:
+    """生成评分表：[日干, 干支编码] 为该干支计入各评分项的分值（列按 SCORE_NAMES）"""
+    table = np.zeros((10, len(names), len(SCORE_NAMES)))
+    for day_gan, day_name in enumerate(GanzhiCalculator.TIANGAN):
+        relations = WuxingAnalyzer.WUXING_RELATIONS[GanzhiCalculator.TIANGAN_WUXING[day_name]]
+        for code, name in enumerate(names):
+            score_name, score = points[relations[wuxing_map[name]]]
+            table[day_gan, code, SCORE_NAMES.index(score_name)] = score
+    return table
+
+
+def _generate_inverse(table: np.ndarray) -> np.ndarray:
+    """由五行生（克）表生成反查表：[五行] 为生（克）该五行的五行"""
+    inverse = np.empty_like(table)
+    inverse[table] = np.arange(len(table))
+    return inverse
+
+
+# 干支编码到五行编号
+GAN_WUXING = _wuxing_codes(GanzhiCalculator.TIANGAN, GanzhiCalculator.TIANGAN_WUXING)
+ZHI_WUXING = _wuxing_codes(GanzhiCalculator.DIZHI, GanzhiCalculator.DIZHI_WUXING)
+
+# 干支编码到五行数量的单位向量
+_GAN_COUNTS = np.eye(len(WUXING), dtype=np.int8)[GAN_WUXING]
+_ZHI_COUNTS = np.eye(len(WUXING), dtype=np.int8)[ZHI_WUXING]
+
+# 评分表（日干 × 干支 × 评分项）
+_GAN_SCORES = _generate_score_table(GanzhiCalculator.TIANGAN, GanzhiCalculator.TIANGAN_WUXING, WuxingAnalyzer.GAN_SCORES)
+_ZHI_SCORES = _generate_score_table(GanzhiCalculator.DIZHI, GanzhiCalculator.DIZHI_WUXING, WuxingAnalyzer.ZHI_SCORES)
+
+# 五行生克：_SHENG[x] 为 x 所生，_KE[x] 为 x 所克；_SHENG_BY、_KE_BY 为生、克 x 者
+_SHENG = _wuxing_codes(list(WUXING), GanzhiCalculator.WUXING_SHENG)
+_KE = _wuxing_codes(list(WUXING), GanzhiCalculator.WUXING_KE)
+_SHENG_BY = _generate_inverse(_SHENG)
+_KE_BY = _generate_inverse(_KE)
+
+
+class WuxingColumns:
+    """按列存储的批量五行分析结果
+
+    五行、用神、喜神、忌神均为 WUXING 的编号，强弱为 STRENGTHS 的索引。
+    """
+
+    def __init__(
+        self,
+        day_gan: np.ndarray,
+        wuxing_count: np.ndarray,
+        scores: np.ndarray,
+        strength: np.ndarray,
+        yong_shen: np.ndarray,
+        xi_shen: np.ndarray,
+        ji_shen: np.ndarray,
+    ):
+        """初始化批量结果
+
+        Args:
+            day_gan: 日干编码
+            wuxing_count: 形状为 (N, 5) 的五行数量，列按 WUXING
+            scores: 形状为 (N, 6) 的强弱评分，列按 SCORE_NAMES
+            strength: 强弱索引
+            yong_shen, xi_shen, ji_shen: 用神、喜神、忌神五行编号
+        """
+        self.day_gan = day_gan
+        self.wuxing_count = wuxing_count
+        self.scores = scores
+        self.strength = strength
+        self.yong_shen = yong_shen
+        self.xi_shen = xi_shen
+        self.ji_shen = ji_shen
+
+    def __len__(self) -> int:
+        return len(self.day_gan)
+
+    def strength_names(self) -> np.ndarray:
+        """获取强弱描述数组"""
+        names: np.ndarray = np.array(STRENGTHS)[self.strength]
+        return names
+
+    def to_dict(self, i: int) -> Dict:
+        """将第i条记录转换为 WuxingAnalyzer.analyze_comprehensive 的字典结构
+
+        Args:
+            i: 记录索引
+
+        Returns:
+            综合分析结果字典
+        """
+        day_master = GanzhiCalculator.TIANGAN[self.day_gan[i]]
+        day_master_wuxing = GanzhiCalculator.TIANGAN_WUXING[day_master]
+        wuxing_count = {wuxing: int(count) for wuxing, count in zip(WUXING, self.wuxing_count[i])}
+        scores = {name: float(score) for name, score in zip(SCORE_NAMES, self.scores[i])}
+        strength = STRENGTHS[self.strength[i]]
+        yong_shen = WUXING[self.yong_shen[i]]
+        xi_shen = WUXING[self.xi_shen[i]]
+        ji_shen = [WUXING[self.ji_shen[i]]]
+
+        return {
+            "wuxing_count": wuxing_count,
+            "strength": strength,
+            "scores": scores,
+            "yong_shen_info": {
+                "yong_shen": yong_shen,
+                "xi_shen": xi_shen,
+                "ji_shen": ji_shen,
+                "strength": strength,
+                "day_master": day_master,
+                "day_master_wuxing": day_master_wuxing,
+                "scores": scores,
+            },
+            "missing_wuxing": [wuxing for wuxing, count in wuxing_count.items() if count == 0],
+            "excessive_wuxing": [wuxing for wuxing, count in wuxing_count.items() if count >= 5],
+            "summary": {
+                "day_master": day_master,
+                "day_master_wuxing": day_master_wuxing,
+                "yong_shen": yong_shen,
+                "xi_shen": xi_shen,
+                "ji_shen": ji_shen,
+                "strength_description": strength,
+            },
+        }
+
+    def to_dicts(self) -> List[Dict]:
+        """将全部记录转换为字典列表"""
+        return [self.to_dict(i) for i in range(len(self))]
+
+
+class BatchWuxingAnalyzer:
+    """批量五行分析器
+
+    与 WuxingAnalyzer 的综合分析一一对应，输入为整数干支编码数组。
+    """
+
+    @staticmethod
+    def count_wuxing(codes: np.ndarray) -> np.ndarray:
+        """批量统计五行数量
+
+        Args:
+            codes: 形状为 (N, 8) 的干支编码数组
+
+        Returns:
+            形状为 (N, 5) 的 int8 数组，列按 WUXING
+        """
+        codes = np.asarray(codes, dtype=np.intp).reshape(-1, 8)
+        counts: np.ndarray = _GAN_COUNTS[codes[:, 0::2]].sum(axis=1, dtype=np.int8) \
+            + _ZHI_COUNTS[codes[:, 1::2]].sum(axis=1, dtype=np.int8)
+        return counts
+
+    @staticmethod
+    def score_strength(
+        codes: np.ndarray, model: Optional["StrengthModel"] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """批量计算强弱评分并判断日主强弱
+
+        评分按年、月、日、时和先干后支的顺序逐项累加，与 AnalysisContext 的累加顺序相同，
+        因此浮点结果逐位一致。
+
+        Args:
+            codes: 形状为 (N, 8) 的干支编码数组
+            model: 强弱评分模型（见 StrengthModel），为None时使用默认评分
+
+        Returns:
+            (形状为 (N, 6) 的评分数组（列按 SCORE_NAMES）, 强弱索引数组) 元组
+        """
+        if model is not None:
+            result: Tuple[np.ndarray, np.ndarray] = model.score_many(codes)
+            return result
+        codes = np.asarray(codes, dtype=np.intp).reshape(-1, 8)
+        day_gan = codes[:, 4]
+        scores = np.zeros((len(codes), len(SCORE_NAMES)))
+        for position in range(8):
+            table = _ZHI_SCORES if position % 2 else _GAN_SCORES
+            scores += table[day_gan, codes[:, position]]
+
+        # 与 WuxingAnalyzer._judge_strength 相同的求和顺序与阈值
+        total_energy = scores[:, 0] + scores[:, 1] + scores[:, 2]
+        output_energy = scores[:, 3] + scores[:, 4] + scores[:, 5]
+        strength = np.full(len(codes), STRENGTHS.index("弱"), dtype=np.int8)
+        strength[total_energy > output_energy * 0.8] = STRENGTHS.index("中和")
+        strength[total_energy > output_energy * 1.3] = STRENGTHS.index("强")
+        return scores, strength
+
+    @staticmethod
+    def analyze(codes: ArrayLike, model: Optional["StrengthModel"] = None) -> WuxingColumns:
+        """批量综合分析，与逐盘调用 WuxingAnalyzer.analyze_comprehensive 一致
+
+        Args:
+            codes: 形状为 (N, 8) 的干支编码数组（如 BaziColumns.codes）或编码行的列表
+            model: 强弱评分模型（见 StrengthModel），为None时使用默认评分
+
+        Returns:
+            WuxingColumns 对象
+        """
+        codes = np.asarray(codes, dtype=np.intp).reshape(-1, 8)
+        wuxing_count = BatchWuxingAnalyzer.count_wuxing(codes)
+        scores, strength = BatchWuxingAnalyzer.score_strength(codes, model)
+        day_master_wuxing = GAN_WUXING[codes[:, 4]]
+        _, yin, bijie, shishang, cai, guansha = scores.T
+
+        # 弱：印星多于比劫取生日主者，否则取日主五行
+        weak_yong = np.where(yin > bijie, _SHENG_BY[day_master_wuxing], day_master_wuxing)
+
+        # 强：官杀、食伤、财星依次比较，取严格最大者（均为0时取财星）
+        strong_yong = _KE[day_master_wuxing]
+        strong_yong = np.where(
+            (guansha > 0) & (shishang <= guansha) & (cai <= guansha),
+            _KE_BY[day_master_wuxing], strong_yong,
+        )
+        strong_yong = np.where(
+            (shishang > np.maximum(guansha, 0)) & (cai <= shishang),
+            _SHENG[day_master_wuxing], strong_yong,
+        )
+
+        # 中和：取月支五行
+        neutral_yong = ZHI_WUXING[codes[:, 3]]
+
+        is_strong = strength == STRENGTHS.index("强")
+        yong_shen = np.select(
+            [is_strong, strength == STRENGTHS.index("中和")],
+            [strong_yong, neutral_yong],
+            weak_yong,
+        )
+        # 喜神为用神所生；忌神在身强时为生用神者，否则为克用神者
+        xi_shen = _SHENG[yong_shen]
+        ji_shen = np.where(is_strong, _SHENG_BY[yong_shen], _KE_BY[yong_shen])
+
+        return WuxingColumns(
+            codes[:, 4].astype(np.int8),
+            wuxing_count,
+            scores,
+            strength,
+            yong_shen.astype(np.int8),
+            xi_shen.astype(np.int8),
+            ji_shen.astype(np.int8),
+        )
@@ -4,10 +4,12 @@ from bazi_calculator.data.kangxi_strokes import KangxiStrokes
 from bazi_calculator.data.zodiac_rules import ZodiacRules
 from bazi_calculator.data.pingze_patterns import PingzePatterns
 from bazi_calculator.data.char_database import CharacterDatabase
+from bazi_calculator.data.city_gazetteer import CityGazetteer
 
 __all__ = [
     "KangxiStrokes",
     "ZodiacRules",
     "PingzePatterns",
     "CharacterDatabase",
+    "CityGazetteer",
 ]
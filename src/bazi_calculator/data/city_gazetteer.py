@@ -0,0 +1,204 @@
+"""城市经纬度数据模块
+
+提供常用城市的经度、纬度，用于离线计算真太阳时
+"""
+
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+
+class CityGazetteer:
+    """城市经纬度查询器"""
+
+    # 城市经纬度（东经为正，北纬为正），按省级行政区排列
+    CITIES: Dict[str, Tuple[float, float]] = {
+        # 直辖市
+        "北京": (116.41, 39.90),
+        "天津": (117.20, 39.08),
+        "上海": (121.47, 31.23),
+        "重庆": (106.55, 29.56),
+        # 河北
+        "石家庄": (114.51, 38.04),
+        "唐山": (118.18, 39.63),
+        "秦皇岛": (119.60, 39.94),
+        "邯郸": (114.54, 36.63),
+        "保定": (115.46, 38.87),
+        "张家口": (114.89, 40.82),
+        "承德": (117.96, 40.95),
+        # 山西
+        "太原": (112.55, 37.87),
+        "大同": (113.30, 40.08),
+        # 内蒙古
+        "呼和浩特": (111.75, 40.84),
+        "包头": (109.84, 40.66),
+        "赤峰": (118.89, 42.26),
+        "鄂尔多斯": (109.78, 39.61),
+        "海拉尔": (119.77, 49.21),
+        # 辽宁
+        "沈阳": (123.43, 41.80),
+        "大连": (121.61, 38.91),
+        "鞍山": (122.99, 41.11),
+        "丹东": (124.35, 40.00),
+        "锦州": (121.13, 41.10),
+        # 吉林
+        "长春": (125.32, 43.82),
+        "吉林": (126.55, 43.84),
+        # 黑龙江
+        "哈尔滨": (126.53, 45.80),
+        "齐齐哈尔": (123.92, 47.35),
+        "大庆": (125.10, 46.59),
+        "牡丹江": (129.63, 44.55),
+        "佳木斯": (130.32, 46.80),
+        "漠河": (122.54, 52.97),
+        # 江苏
+        "南京": (118.80, 32.06),
+        "苏州": (120.59, 31.30),
+        "无锡": (120.31, 31.49),
+        "常州": (119.97, 31.81),
+        "南通": (120.89, 31.98),
+        "扬州": (119.41, 32.39),
+        "徐州": (117.28, 34.20),
+        # 浙江
+        "杭州": (120.16, 30.27),
+        "宁波": (121.55, 29.87),
+        "温州": (120.70, 28.00),
+        "绍兴": (120.58, 30.03),
+        "嘉兴": (120.76, 30.75),
+        "湖州": (120.09, 30.89),
+        "金华": (119.65, 29.08),
+        "台州": (121.42, 28.66),
+        # 安徽
+        "合肥": (117.23, 31.82),
+        "芜湖": (118.43, 31.35),
+        # 福建
+        "福州": (119.30, 26.08),
+        "厦门": (118.09, 24.48),
+        "泉州": (118.68, 24.87),
+        # 江西
+        "南昌": (115.86, 28.68),
+        "九江": (116.00, 29.71),
+        "赣州": (114.93, 25.83),
+        # 山东
+        "济南": (117.00, 36.67),
+        "青岛": (120.38, 36.07),
+        "烟台": (121.45, 37.46),
+        "潍坊": (119.16, 36.71),
+        "淄博": (118.05, 36.81),
+        "临沂": (118.36, 35.10),
+        "济宁": (116.59, 35.41),
+        # 河南
+        "郑州": (113.63, 34.75),
+        "洛阳": (112.45, 34.62),
+        "开封": (114.31, 34.80),
+        # 湖北
+        "武汉": (114.31, 30.59),
+        "宜昌": (111.29, 30.69),
+        "襄阳": (112.14, 32.04),
+        # 湖南
+        "长沙": (112.94, 28.23),
+        "株洲": (113.13, 27.83),
+        "湘潭": (112.94, 27.83),
+        "岳阳": (113.13, 29.36),
+        # 广东
+        "广州": (113.26, 23.13),
+        "深圳": (114.06, 22.54),
+        "珠海": (113.58, 22.27),
+        "佛山": (113.12, 23.02),
+        "东莞": (113.75, 23.02),
+        "汕头": (116.68, 23.35),
+        # 广西
+        "南宁": (108.37, 22.82),
+        "桂林": (110.29, 25.27),
+        "柳州": (109.41, 24.33),
+        "北海": (109.12, 21.48),
+        # 海南
+        "海口": (110.35, 20.02),
+        "三亚": (109.51, 18.25),
+        # 四川
+        "成都": (104.07, 30.57),
+        "绵阳": (104.68, 31.47),
+        # 贵州
+        "贵阳": (106.63, 26.65),
+        "遵义": (106.93, 27.73),
+        # 云南
+        "昆明": (102.83, 24.88),
+        "大理": (100.27, 25.61),
+        "丽江": (100.23, 26.86),
+        # 西藏
+        "拉萨": (91.13, 29.65),
+        "日喀则": (88.88, 29.27),
+        "林芝": (94.36, 29.65),
+        # 陕西
+        "西安": (108.94, 34.34),
+        "宝鸡": (107.24, 34.36),
+        "延安": (109.49, 36.59),
+        # 甘肃
+        "兰州": (103.83, 36.06),
+        "天水": (105.72, 34.58),
+        "酒泉": (98.49, 39.73),
+        "敦煌": (94.66, 40.14),
+        # 青海
+        "西宁": (101.78, 36.62),
+        # 宁夏
+        "银川": (106.23, 38.49),
+        # 新疆
+        "乌鲁木齐": (87.62, 43.83),
+        "克拉玛依": (84.89, 45.58),
+        "伊宁": (81.32, 43.92),
+        "喀什": (75.99, 39.47),
+        # 港澳台
+        "香港": (114.17, 22.32),
+        "澳门": (113.54, 22.20),
+        "台北": (121.56, 25.04),
+        "高雄": (120.31, 22.63),
+    }
+
+    # 可省略的行政区划后缀
+    SUFFIXES = ("特别行政区", "市", "县", "区")
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def normalize(name: str) -> str:
+        """规范化城市名称（去除空白与行政区划后缀）
+
+        Args:
+            name: 城市名称
+
+        Returns:
+            规范化后的名称
+        """
+        name = name.strip()
+        for suffix in CityGazetteer.SUFFIXES:
+            if name.endswith(suffix) and name[:-len(suffix)] in CityGazetteer.CITIES:
+                return name[:-len(suffix)]
+        return name
+
+    @staticmethod
+    def get_location(name: str) -> Optional[Tuple[float, float]]:
+        """获取城市经纬度
+
+        Args:
+            name: 城市名称（可带"市"等后缀）
+
+        Returns:
+            (经度, 纬度) 元组，未收录返回None
+        """
+        return CityGazetteer.CITIES.get(CityGazetteer.normalize(name))
+
+    @staticmethod
+    def get_longitude(name: str) -> Optional[float]:
+        """获取城市经度
+
+        Args:
+            name: 城市名称
+
+        Returns:
+            经度，未收录返回None
+        """
+        location = CityGazetteer.get_location(name)
+        return location[0] if location else None
+
+    @staticmethod
+    def get_all_cities() -> List[str]:
+        """获取所有收录的城市名称"""
+        return list(CityGazetteer.CITIES.keys())
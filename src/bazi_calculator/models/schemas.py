@@ -8,15 +8,16 @@ from pydantic import BaseModel, Field
 class BirthInfo(BaseModel):
     """出生信息"""
 
-    date: datetime = Field(description="出生日期时间")
-    year: int = Field(description="公历年份")
-    month: int = Field(description="公历月份")
-    day: int = Field(description="公历日")
+    date: datetime = Field(description="出生日期时间（公历）")
+    year: int = Field(description="出生年份（按历法类型）")
+    month: int = Field(description="出生月份（按历法类型）")
+    day: int = Field(description="出生日（按历法类型）")
     hour: int = Field(description="出生时")
     minute: int = Field(description="出生分")
     second: int = Field(description="出生秒")
     gender: str = Field(description="性别，男/女")
     calendar_type: str = Field(default="公历", description="历法类型，公历/农历")
+    is_leap_month: bool = Field(default=False, description="是否农历闰月")
 
 
 class Pillar(BaseModel):
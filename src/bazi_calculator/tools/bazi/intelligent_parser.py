@@ -10,7 +10,8 @@ from datetime import datetime
 from langchain_core.tools import tool
 
 from bazi_calculator.tools.bazi.llm_time_parser import LLMTimeParser, ParsedBirthInfo
-from bazi_calculator.core.calendar import BaziCalendar
+from bazi_calculator.tools.naming.bazi_for_naming import NAMING_ANALYSIS
+from bazi_calculator.core.incremental import IncrementalChart
 
 
 class IntelligentBaziCalculator:
@@ -28,6 +29,8 @@ class IntelligentBaziCalculator:
         """
         self.llm = llm
         self.parser = LLMTimeParser(llm)
+        # 最近一次排盘，修改出生时间时增量重算
+        self.chart: Optional[IncrementalChart] = None
 
     def calculate_from_natural_language(self, user_input: str) -> Dict[str, Any]:
         """
@@ -42,11 +45,12 @@ class IntelligentBaziCalculator:
         # 1. 使用LLM解析用户输入
         parsed_info = self.parser.parse_with_fallback(user_input)
 
-        # 2. 转换为BirthInfo
+        # 2. 转换为BirthInfo（农历日期在此换算为公历）
         birth_info = parsed_info.to_birth_info()
 
         # 3. 计算八字
-        bazi_result = BaziCalendar.get_all_pillars(birth_info.date)
+        self.chart = IncrementalChart(birth_info.date, analyses={"naming": NAMING_ANALYSIS})
+        bazi_result = self.chart.bazi
 
         # 4. 组装返回结果
         result = {
@@ -59,8 +63,20 @@ class IntelligentBaziCalculator:
                 "minute": parsed_info.minute,
                 "gender": parsed_info.gender,
                 "calendar_type": parsed_info.calendar_type,
+                "is_leap_month": parsed_info.is_leap_month,
+                "solar_date": birth_info.date,
                 "formatted_time": f"{parsed_info.year}年{parsed_info.month}月{parsed_info.day}日 {parsed_info.hour:02d}时{parsed_info.minute:02d}分"
             },
+            **self._bazi_sections(bazi_result),
+            "success": True
+        }
+
+        return result
+
+    @staticmethod
+    def _bazi_sections(bazi_result: Dict[str, Any]) -> Dict[str, Any]:
+        """由四柱结果生成返回结果中的 bazi 与 bazi_result 部分"""
+        return {
             "bazi": {
                 "year": {
                     "gan": bazi_result["year"]["gan"],
@@ -116,11 +132,61 @@ class IntelligentBaziCalculator:
                     "gan_wuxing": bazi_result["hour"]["gan_wuxing"],
                     "zhi_wuxing": bazi_result["hour"]["zhi_wuxing"]
                 }
-            },
-            "success": True
+            }
         }
 
-        return result
+    def update_birth_time(self, result: Dict[str, Any], birth_date: datetime) -> Dict[str, Any]:
+        """修改出生时间并增量重算
+
+        只重算可能变化的柱（时柱、日柱，或跨越节气时的年柱、月柱），
+        并列出因此失效的下游分析（wuxing、mingge、naming），
+        未失效的分析通过 get_analysis 取得时直接沿用缓存。
+        result 不是最近一次排盘的结果时，先按其中的出生时间重新排盘。
+
+        Args:
+            result: calculate_from_natural_language 或 update_birth_time 的返回结果
+            birth_date: 修改后的出生时间（公历）
+
+        Returns:
+            更新后的结果字典，另含 changed_pillars 与 invalidated_analyses
+        """
+        solar_date = result["parsed_info"]["solar_date"]
+        if self.chart is None or self.chart.birth_date != solar_date:
+            self.chart = IncrementalChart(solar_date, analyses={"naming": NAMING_ANALYSIS})
+
+        changed_pillars = self.chart.update(birth_date)
+
+        parsed_info = dict(result["parsed_info"])
+        parsed_info.update({
+            "year": birth_date.year,
+            "month": birth_date.month,
+            "day": birth_date.day,
+            "hour": birth_date.hour,
+            "minute": birth_date.minute,
+            "calendar_type": "公历",
+            "is_leap_month": False,
+            "solar_date": birth_date,
+            "formatted_time": f"{birth_date.year}年{birth_date.month}月{birth_date.day}日 {birth_date.hour:02d}时{birth_date.minute:02d}分"
+        })
+
+        return {
+            **result,
+            "parsed_info": parsed_info,
+            **self._bazi_sections(self.chart.bazi),
+            "changed_pillars": changed_pillars,
+            "invalidated_analyses": self.chart.get_stale_analyses(),
+        }
+
+    def get_analysis(self, name: str) -> Dict[str, Any]:
+        """获取最近一次排盘的下游分析（wuxing、mingge 或 naming），未失效时沿用缓存
+
+        Raises:
+            ValueError: 尚未排盘
+        """
+        if self.chart is None:
+            raise ValueError("尚未排盘，请先调用 calculate_from_natural_language")
+        analysis: Dict[str, Any] = self.chart.get_analysis(name)
+        return analysis
 
     def format_result(self, result: Dict[str, Any]) -> str:
         """
@@ -8,6 +8,7 @@ from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import PydanticOutputParser
 from pydantic import BaseModel, Field
 
+from bazi_calculator.core.lunar import LunarCalendar
 from bazi_calculator.models.schemas import BirthInfo
 
 
@@ -20,13 +21,20 @@ class ParsedBirthInfo(BaseModel):
     minute: int = Field(default=0, description="分钟，0-59")
     gender: str = Field(description="性别，'男'或'女'")
     calendar_type: str = Field(default="公历", description="历法类型，'公历'或'农历'")
+    is_leap_month: bool = Field(default=False, description="是否农历闰月，仅农历有效")
     original_input: str = Field(description="用户的原始输入")
 
     def to_birth_info(self):
-        """转换为BirthInfo对象"""
+        """转换为BirthInfo对象（农历日期换算为公历时间）"""
         from datetime import datetime
+        if self.calendar_type == "农历":
+            birth_date = LunarCalendar.to_solar_datetime(
+                self.year, self.month, self.day, self.hour, self.minute, is_leap=self.is_leap_month
+            )
+        else:
+            birth_date = datetime(self.year, self.month, self.day, self.hour, self.minute)
         return BirthInfo(
-            date=datetime(self.year, self.month, self.day, self.hour, self.minute),
+            date=birth_date,
             year=self.year,
             month=self.month,
             day=self.day,
@@ -34,7 +42,8 @@ class ParsedBirthInfo(BaseModel):
             minute=self.minute,
             second=0,
             gender=self.gender,
-            calendar_type=self.calendar_type
+            calendar_type=self.calendar_type,
+            is_leap_month=self.is_leap_month
         )
 
 
@@ -72,7 +81,8 @@ class LLMTimeParser:
 
 3. 历法类型：
    - 默认为'公历'
-   - 如果明确提到农历、阴历、旧历等，设为'农历'
+   - 如果明确提到农历、阴历、旧历等，设为'农历'，年月日保持农历数值
+   - 农历闰月（如"闰二月"）将is_leap_month设为true
 
 4. 输出要求：
    - 年份必须为4位数字
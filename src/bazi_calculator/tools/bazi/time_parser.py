@@ -9,6 +9,7 @@ from typing import Dict, Any, Optional
 
 from langchain_core.tools import tool
 
+from bazi_calculator.core.lunar import LunarCalendar
 from bazi_calculator.models.schemas import BirthInfo, TimeParseResult
 
 
@@ -21,6 +22,8 @@ def parse_birth_time(time_description: str, gender: str, calendar_type: str = "
     - 简写格式：2024.3.15 10:30
     - 纯数字格式：202403151030
     - 汉字格式：甲辰年二月十五日
+    - 农历闰月：2023年闰2月15日 10点30分（calendar_type 为农历）
+    - 只有日期：2024年3月15日（时辰未知，时间按0时处理）
 
     Args:
         time_description: 时间描述
@@ -43,19 +46,21 @@ def _parse_time_description(time_description: str, gender: str, calendar_type: s
         calendar_type: 历法类型
 
     Returns:
-        BirthInfo对象
+        BirthInfo对象（农历输入的 date 为换算后的公历时间）
     """
     time_description = time_description.strip()
+    is_leap_month = False
 
-    # 尝试匹配标准格式：2024年3月15日 10点30分
-    pattern1 = r'(\d{4})年(\d{1,2})月(\d{1,2})日\s*(\d{1,2})点?(\d{0,2})分?'
+    # 尝试匹配标准格式：2024年3月15日 10点30分（农历可带"闰"，时辰未知时可省略时间）
+    pattern1 = r'(\d{4})年(闰?)(\d{1,2})月(\d{1,2})日\s*(?:(\d{1,2})点?(\d{0,2})分?)?'
     match = re.search(pattern1, time_description)
 
     if match:
-        year, month, day, hour, minute = match.groups()
+        year, leap, month, day, hour, minute = match.groups()
         hour = int(hour) if hour else 0
         minute = int(minute) if minute else 0
-        birth_date = datetime(int(year), int(month), int(day), hour, minute)
+        is_leap_month = bool(leap)
+        birth_date = _to_datetime(int(year), int(month), int(day), hour, minute, calendar_type, is_leap_month)
     else:
         # 尝试匹配简写格式：2024.3.15 10:30
         pattern2 = r'(\d{4})\.(\d{1,2})\.(\d{1,2})\s*(\d{1,2}):?(\d{0,2})?'
@@ -65,7 +70,7 @@ def _parse_time_description(time_description: str, gender: str, calendar_type: s
             year, month, day, hour, minute = match.groups()
             hour = int(hour) if hour else 0
             minute = int(minute) if minute else 0
-            birth_date = datetime(int(year), int(month), int(day), hour, minute)
+            birth_date = _to_datetime(int(year), int(month), int(day), hour, minute, calendar_type)
         else:
             # 尝试匹配纯数字格式：202403151030
             pattern3 = r'(\d{4})(\d{2})(\d{2})(\d{2})(\d{2})'
@@ -73,23 +78,50 @@ def _parse_time_description(time_description: str, gender: str, calendar_type: s
 
             if match:
                 year, month, day, hour, minute = match.groups()
-                birth_date = datetime(int(year), int(month), int(day), int(hour), int(minute))
+                birth_date = _to_datetime(int(year), int(month), int(day), int(hour), int(minute), calendar_type)
             else:
                 raise ValueError(f"无法解析时间描述：{time_description}")
 
     return BirthInfo(
         date=birth_date,
-        year=birth_date.year,
-        month=birth_date.month,
-        day=birth_date.day,
+        year=int(year),
+        month=int(month),
+        day=int(day),
         hour=birth_date.hour,
         minute=birth_date.minute,
         second=birth_date.second,
         gender=gender,
-        calendar_type=calendar_type
+        calendar_type=calendar_type,
+        is_leap_month=is_leap_month
     )
 
 
+def _to_datetime(
+    year: int,
+    month: int,
+    day: int,
+    hour: int,
+    minute: int,
+    calendar_type: str,
+    is_leap_month: bool = False
+) -> datetime:
+    """将解析出的年月日时分转换为公历时间
+
+    Args:
+        year, month, day: 年月日（按 calendar_type 历法）
+        hour, minute: 时分
+        calendar_type: 历法类型
+        is_leap_month: 是否农历闰月
+
+    Returns:
+        公历日期时间
+    """
+    if calendar_type == "农历":
+        solar_date: datetime = LunarCalendar.to_solar_datetime(year, month, day, hour, minute, is_leap=is_leap_month)
+        return solar_date
+    return datetime(year, month, day, hour, minute)
+
+
 @tool
 def validate_time(birth_date: datetime) -> Dict[str, Any]:
     """验证出生时间的有效性
@@ -3,9 +3,10 @@
 分析八字为取名提供指导，包括用神确定、生肖分析等
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 from langchain_core.tools import tool
 
+from bazi_calculator.core.incremental import IncrementalChart, wuxing_key
 from bazi_calculator.core.wuxing import WuxingAnalyzer
 from bazi_calculator.data.zodiac_rules import ZodiacRules
 
@@ -23,6 +24,19 @@ def analyze_bazi_for_naming(bazi: Dict[str, Any]) -> Dict[str, Any]:
     Args:
         bazi: 八字信息字典，包含四柱信息
 
+    Returns:
+        八字取名分析结果
+    """
+    return _analyze_for_naming(bazi, WuxingAnalyzer.analyze_comprehensive(bazi))
+
+
+def _analyze_for_naming(bazi: Dict[str, Any], wuxing_analysis: Dict[str, Any]) -> Dict[str, Any]:
+    """由八字与五行分析结果生成取名分析
+
+    Args:
+        bazi: 八字信息字典
+        wuxing_analysis: WuxingAnalyzer.analyze_comprehensive 的结果
+
     Returns:
         八字取名分析结果
     """
@@ -32,9 +46,6 @@ def analyze_bazi_for_naming(bazi: Dict[str, Any]) -> Dict[str, Any]:
     # 获取生肖
     zodiac = ZodiacRules.get_zodiac_by_year(year)
 
-    # 五行分析
-    wuxing_analysis = WuxingAnalyzer.analyze_comprehensive(bazi)
-
     # 获取用神信息
     yong_shen_info = wuxing_analysis["yong_shen_info"]
 
@@ -70,6 +81,19 @@ def analyze_bazi_for_naming(bazi: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+def naming_key(chart: IncrementalChart) -> Tuple:
+    """取名分析依赖出生年份（生肖）与五行分析"""
+    key: Tuple = (chart.bazi["birth_info"]["year"],) + wuxing_key(chart)
+    return key
+
+
+# 供 IncrementalChart 注册的取名分析：出生时间修改后生肖与五行分析不变时沿用结果
+NAMING_ANALYSIS = (
+    naming_key,
+    lambda chart: _analyze_for_naming(chart.bazi, chart.get_analysis("wuxing")),
+)
+
+
 @tool
 def get_naming_priorities(
     bazi_analysis: Dict[str, Any]
@@ -0,0 +1,23 @@
+"""核心模块测试共用的辅助函数"""
+
+import numpy as np
+from bazi_calculator.core.ganzhi import GanzhiCalculator
+
+
+def pillar_codes(*pillars):
+    """由干支字符串生成八个编码"""
+    codes = []
+    for pillar in pillars:
+        codes.append(GanzhiCalculator.get_tiangan_index(pillar[0]))
+        codes.append(GanzhiCalculator.get_dizhi_index(pillar[1]))
+    return tuple(codes)
+
+
+def random_codes(count, seed):
+    """生成随机的干支编码（四柱干支阴阳相符）"""
+    rng = np.random.default_rng(seed)
+    gans = rng.integers(0, 10, (count, 4))
+    codes = np.empty((count, 8), dtype=np.int8)
+    codes[:, 0::2] = gans
+    codes[:, 1::2] = rng.integers(0, 6, (count, 4)) * 2 + gans % 2
+    return codes
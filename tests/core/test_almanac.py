@@ -0,0 +1,81 @@
+"""黄历生成模块测试"""
+
+import csv
+import io
+import json
+import pytest
+from datetime import date, datetime, timedelta
+from bazi_calculator.core.almanac import Almanac, main
+from bazi_calculator.core.calendar import BaziCalendar
+from bazi_calculator.core.jieqi import JieqiCalculator
+
+
+class TestAlmanac:
+    """测试黄历生成"""
+
+    def test_matches_pillars(self):
+        """测试各日记录与逐日排盘一致"""
+        for record in Almanac.iter_days(date(2023, 12, 20), date(2024, 3, 10)):
+            day = datetime.strptime(record["date"], "%Y-%m-%d")
+            bazi = BaziCalendar.get_all_pillars(day)
+            assert record["year_pillar"] == bazi["year"]["full"]
+            assert record["month_pillar"] == bazi["month"]["full"]
+            assert record["day_pillar"] == bazi["day"]["full"]
+            assert record["jieqi"] == bazi["month"]["jieqi"]
+
+    def test_crossing(self):
+        """测试交节当日给出节气与时刻，次日起改用新节气"""
+        lichun = JieqiCalculator.calculate_jieqi_datetime(2024, 0)
+        records = list(Almanac.iter_days(lichun.date(), lichun.date() + timedelta(days=2)))
+        assert records[0]["crossing_jieqi"] == "立春"
+        assert records[0]["crossing_time"] == lichun.strftime("%Y-%m-%d %H:%M:%S")
+        assert records[0]["year_pillar"] == "癸卯"
+        assert records[1]["crossing_jieqi"] == ""
+        assert (records[1]["year_pillar"], records[1]["month_pillar"], records[1]["jieqi"]) == ("甲辰", "丙寅", "立春")
+
+    def test_full_year(self):
+        """测试整年记录数与交节次数"""
+        records = list(Almanac.iter_years(2024, 2024))
+        assert len(records) == 366
+        assert sum(1 for r in records if r["crossing_jieqi"]) == 24
+
+    def test_out_of_table_range(self):
+        """测试预计算节气表之外的年份"""
+        records = list(Almanac.iter_days(date(2250, 1, 1), date(2250, 3, 1)))
+        for record in records[::7]:
+            day = datetime.strptime(record["date"], "%Y-%m-%d")
+            assert record["month_pillar"] == BaziCalendar.get_all_pillars(day)["month"]["full"]
+
+    def test_empty_range(self):
+        """测试空范围"""
+        assert list(Almanac.iter_days(date(2024, 1, 2), date(2024, 1, 1))) == []
+
+    def test_write_jsonl_csv(self):
+        """测试写入 JSONL 与 CSV"""
+        records = list(Almanac.iter_days(date(2024, 1, 1), date(2024, 1, 11)))
+
+        output = io.StringIO()
+        assert Almanac.write(iter(records), output, "jsonl") == 10
+        lines = output.getvalue().splitlines()
+        assert json.loads(lines[0]) == records[0]
+
+        output = io.StringIO()
+        assert Almanac.write(iter(records), output, "csv") == 10
+        rows = list(csv.DictReader(io.StringIO(output.getvalue())))
+        assert rows == records
+
+        with pytest.raises(ValueError):
+            Almanac.write(records, io.StringIO(), "xml")
+
+    def test_main(self, tmp_path):
+        """测试命令行生成"""
+        path = tmp_path / "almanac.csv"
+        main(["--start", "2024", "--end", "2025", "--output", str(path)])
+        with open(path, encoding="utf-8", newline="") as file:
+            rows = list(csv.DictReader(file))
+        assert len(rows) == 366 + 365
+        assert rows[0]["date"] == "2024-01-01"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
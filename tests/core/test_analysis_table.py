@@ -0,0 +1,92 @@
+"""八字分析全表模块测试"""
+
+import random
+import pytest
+import numpy as np
+from datetime import datetime, timedelta
+from bazi_calculator.core.analysis_table import AnalysisTable, PATTERNS, RECORD, SIZE, main
+from bazi_calculator.core.calendar import BaziCalendar
+from bazi_calculator.core.mingge import MingGeAnalyzer
+from bazi_calculator.core.wuxing import WuxingAnalyzer
+
+
+@pytest.fixture(scope="module")
+def table():
+    """构建全表"""
+    return AnalysisTable.build()
+
+
+class TestAnalysisTable:
+    """测试八字分析全表"""
+
+    def test_index_roundtrip(self):
+        """测试序号与干支编码互相转换"""
+        indices = np.arange(SIZE)
+        codes = AnalysisTable.codes_from_index(indices)
+        assert (AnalysisTable.index_many(codes) == indices).all()
+        assert len({tuple(row) for row in codes[::97].tolist()}) == len(codes[::97])
+        for i in (0, 12345, SIZE - 1):
+            assert AnalysisTable.index(tuple(codes[i])) == i
+            assert type(AnalysisTable.index(tuple(codes[i]))) is int
+
+    def test_unreachable_codes(self):
+        """测试不可达的八字"""
+        codes = list(BaziCalendar.get_chart_codes(datetime(2024, 3, 15, 10, 30))[:8])
+        codes[6] = (codes[6] + 2) % 10
+        with pytest.raises(ValueError):
+            AnalysisTable.index(codes)
+        with pytest.raises(ValueError):
+            AnalysisTable.index_many(np.array([codes]))
+
+    def test_matches_scalar(self, table):
+        """测试随机八字与每种格局的记录与逐盘分析一致"""
+        rng = np.random.default_rng(2)
+        indices = np.concatenate([rng.integers(0, SIZE, 300)] + [
+            np.flatnonzero(table.records["pattern"] == pattern)[:5] for pattern in range(len(PATTERNS))
+        ])
+        codes = AnalysisTable.codes_from_index(indices)
+        for row in codes.tolist():
+            bazi = BaziCalendar.codes_to_pillars(tuple(row), 0, datetime(2000, 1, 1))
+            context = WuxingAnalyzer.build_context(bazi)
+            result = table.lookup(row)
+            assert result["wuxing"] == WuxingAnalyzer.analyze_comprehensive(bazi, context)
+            assert result["pattern"] == MingGeAnalyzer.determine_pattern(bazi, context)
+
+    def test_lookup_many(self, table):
+        """测试批量查找与排盘结果衔接"""
+        rng = random.Random(4)
+        dates = [datetime(1901, 1, 1) + timedelta(seconds=rng.randrange(199 * 365 * 86400)) for _ in range(200)]
+        columns = BaziCalendar.get_all_pillars_many(dates)
+        wuxing, patterns = table.lookup_many(columns.codes)
+        for i, bazi in enumerate(columns.to_dicts()):
+            assert wuxing.to_dict(i) == WuxingAnalyzer.analyze_comprehensive(bazi)
+            assert PATTERNS[patterns[i]][1] == MingGeAnalyzer.determine_pattern(bazi)["pattern_name"]
+
+    def test_save_and_load(self, table, tmp_path):
+        """测试写入后内存映射读取"""
+        path = str(tmp_path / "analysis.tbl")
+        assert table.save(path) == AnalysisTable.HEADER.size + SIZE * RECORD.itemsize
+        codes = BaziCalendar.get_chart_codes(datetime(1990, 3, 15, 10, 30))[:8]
+        with AnalysisTable.load(path) as loaded:
+            assert len(loaded) == SIZE
+            assert loaded.lookup_record(codes) == table.lookup_record(codes)
+        assert len(loaded) == 0
+
+    def test_invalid_file(self, tmp_path):
+        """测试无效文件"""
+        path = tmp_path / "bad.tbl"
+        path.write_bytes(b"not an analysis table")
+        with pytest.raises(ValueError):
+            AnalysisTable.load(str(path))
+
+    def test_command_line(self, tmp_path, capsys):
+        """测试命令行生成与基准测试"""
+        path = str(tmp_path / "analysis.tbl")
+        main(["--output", path, "--benchmark", "--count", "1000"])
+        output = capsys.readouterr().out
+        assert "518400 条记录" in output
+        assert "批量查询" in output
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -1,8 +1,10 @@
 """八字日历计算模块测试"""
 
 import pytest
-from datetime import datetime
+from datetime import datetime, timedelta
 from bazi_calculator.core.calendar import BaziCalendar
+from bazi_calculator.core.ganzhi import GanzhiCalculator
+from bazi_calculator.core.jieqi import JieqiCalculator
 
 
 class TestBaziCalendar:
@@ -187,5 +189,135 @@ class TestBaziCalendar:
         assert jieqi2 in ["立春", "雨水", "惊蛰", "春分", "清明", "谷雨", "立夏", "小满", "芒种", "夏至", "小暑", "大暑", "立秋", "处暑", "白露", "秋分", "寒露", "霜降", "立冬", "小雪", "大雪", "冬至", "小寒", "大寒"]
 
 
+
+class TestBaziCalendarCodes:
+    """测试整数编码内核"""
+
+    def test_wuhu_dun_codes_match_table(self):
+        """测试五虎遁编码表与字符表一致"""
+        for year_gan in range(10):
+            for order in range(12):
+                expected = BaziCalendar.WUHU_DUN_TABLE[year_gan][order % 10]
+                assert GanzhiCalculator.TIANGAN[BaziCalendar.WUHU_DUN_CODES[year_gan][order]] == expected
+
+    def test_wushu_dun_codes_match_table(self):
+        """测试五鼠遁编码表与字符表一致"""
+        for day_gan in range(10):
+            for hour_zhi in range(12):
+                expected = BaziCalendar.WUSHU_DUN_TABLE[day_gan][hour_zhi]
+                assert GanzhiCalculator.TIANGAN[BaziCalendar.WUSHU_DUN_CODES[day_gan][hour_zhi]] == expected
+
+    def test_hour_zhi_table(self):
+        """测试钟点到时支"""
+        assert BaziCalendar.HOUR_ZHI[23] == 0
+        assert BaziCalendar.HOUR_ZHI[0] == 0
+        assert BaziCalendar.HOUR_ZHI[1] == 1
+        assert BaziCalendar.HOUR_ZHI[12] == 6
+        assert BaziCalendar.HOUR_ZHI[22] == 11
+
+    def test_jieqi_month_zhi_table(self):
+        """测试节气到月支"""
+        assert BaziCalendar.JIEQI_MONTH_ZHI[0] == 2   # 立春 -> 寅
+        assert BaziCalendar.JIEQI_MONTH_ZHI[1] == 2   # 雨水 -> 寅
+        assert BaziCalendar.JIEQI_MONTH_ZHI[20] == 0  # 大雪 -> 子
+        assert BaziCalendar.JIEQI_MONTH_ZHI[23] == 1  # 大寒 -> 丑
+
+    def test_day_codes(self):
+        """测试日柱编码"""
+        assert BaziCalendar.get_day_codes(BaziCalendar.BASE_ORDINAL) == (0, 0)
+        assert BaziCalendar.get_day_codes(BaziCalendar.BASE_ORDINAL - 1) == (9, 11)
+
+    def test_chart_codes_match_pillars(self):
+        """测试编码结果与字典结果一致"""
+        date = datetime(1990, 8, 8, 14, 0)
+        codes = BaziCalendar.get_chart_codes(date)
+        bazi = BaziCalendar.get_all_pillars(date)
+        for i, pillar in enumerate(["year", "month", "day", "hour"]):
+            assert GanzhiCalculator.TIANGAN[codes[2 * i]] == bazi[pillar]["gan"]
+            assert GanzhiCalculator.DIZHI[codes[2 * i + 1]] == bazi[pillar]["zhi"]
+        assert bazi["year"]["full"] == "庚午"
+        assert BaziCalendar.codes_to_pillars(codes[:8], codes[8], date) == bazi
+
+    def test_shishen_opt_in(self):
+        """测试十神默认不计算，按需附带"""
+        date = datetime(1990, 8, 8, 14, 0)
+        assert "shishen" not in BaziCalendar.get_all_pillars(date)
+        bazi = BaziCalendar.get_all_pillars(date, include_shishen=True)
+        codes = BaziCalendar.get_chart_codes(date)
+        assert bazi["shishen"] == GanzhiCalculator.get_chart_shishen(codes[:8])
+
+    def test_early_january_month(self):
+        """测试小寒之前仍为子月"""
+        month_gan, month_zhi, _, _, jieqi = BaziCalendar.get_month_pillar(datetime(2024, 1, 2), "癸")
+        assert month_zhi == "子"
+        assert jieqi == "冬至"
+        assert month_gan + month_zhi == "甲子"
+
+    def test_invalid_gan(self):
+        """测试无效的天干参数"""
+        with pytest.raises(ValueError):
+            BaziCalendar.get_month_pillar(datetime(2024, 3, 1), "子")
+        with pytest.raises(ValueError):
+            BaziCalendar.get_hour_pillar(datetime(2024, 3, 1), "子")
+
+    def test_adaptive_precision(self):
+        """测试两级精度排盘结果一致并报告所用级别"""
+        near_lichun = datetime(2024, 2, 4, 12, 0)
+        result = BaziCalendar.get_all_pillars(near_lichun, window_hours=36)
+        assert result["precision"] == {"tier": "precise", "window_hours": 36}
+        del result["precision"]
+        assert result == BaziCalendar.get_all_pillars(near_lichun)
+
+        codes, tier = BaziCalendar.get_chart_codes_adaptive(datetime(2150, 3, 1))
+        assert tier == "estimate"
+        assert codes == BaziCalendar.get_chart_codes(datetime(2150, 3, 1))
+
+    def test_hour_variants(self):
+        """测试时辰未知时的十二时辰八字"""
+        variants = BaziCalendar.get_hour_variants(datetime(1990, 3, 15, 17, 45))
+        assert [v["hour"]["full"] for v in variants] == [
+            "甲子", "乙丑", "丙寅", "丁卯", "戊辰", "己巳", "庚午", "辛未", "壬申", "癸酉", "甲戌", "乙亥"
+        ]
+        assert all(v["day"]["full"] == variants[0]["day"]["full"] for v in variants)
+        assert variants[5] == BaziCalendar.get_all_pillars(datetime(1990, 3, 15, 9))
+
+    def test_hour_variants_jieqi_day(self):
+        """测试节气交接当日，交接后的时辰改用下一节气的年柱、月柱"""
+        lichun = JieqiCalculator.calculate_jieqi_datetime(2024, 0)
+        day_start = datetime(lichun.year, lichun.month, lichun.day)
+        codes = BaziCalendar.get_hour_variant_codes(lichun)
+        for hour_zhi, variant in enumerate(codes):
+            slot = day_start + timedelta(hours=BaziCalendar.HOUR_ZHI_START[hour_zhi])
+            assert variant == BaziCalendar.get_chart_codes(slot)
+        assert codes[0][:4] != codes[-1][:4]
+
+    def test_charts_in_range(self):
+        """测试时间范围内按时辰与日期交界分段"""
+        segments = BaziCalendar.get_charts_in_range(datetime(2024, 3, 1, 22, 0), datetime(2024, 3, 2, 2, 0))
+        assert [interval for interval, _ in segments] == [
+            (datetime(2024, 3, 1, 22), datetime(2024, 3, 1, 23)),
+            (datetime(2024, 3, 1, 23), datetime(2024, 3, 2, 0)),
+            (datetime(2024, 3, 2, 0), datetime(2024, 3, 2, 1)),
+            (datetime(2024, 3, 2, 1), datetime(2024, 3, 2, 2)),
+        ]
+        for (segment_start, _), chart in segments:
+            assert chart == BaziCalendar.get_all_pillars(segment_start)
+
+    def test_charts_in_range_jieqi(self):
+        """测试范围内的节气交接单独分段，且各段首尾八字与逐点排盘一致"""
+        lichun = JieqiCalculator.calculate_jieqi_datetime(2024, 0)
+        start, end = datetime(2024, 1, 20), datetime(2024, 2, 20)
+        segments = BaziCalendar.get_chart_codes_in_range(start, end)
+        assert segments[0][0] == start and segments[-1][1] == end
+        assert any(segment_start == lichun for segment_start, _, _ in segments)
+        for (segment_start, segment_end, codes), following in zip(segments, segments[1:] + [None]):
+            assert codes == BaziCalendar.get_chart_codes(segment_start)
+            assert codes == BaziCalendar.get_chart_codes(segment_end - timedelta(seconds=1))
+            if following is not None:
+                assert following[0] == segment_end
+
+        assert BaziCalendar.get_chart_codes_in_range(end, start) == []
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,78 @@
+"""批量八字排盘模块测试"""
+
+import random
+import pytest
+import numpy as np
+from datetime import datetime, timedelta
+from bazi_calculator.core.calendar import BaziCalendar
+from bazi_calculator.core.calendar_batch import BaziColumns
+from bazi_calculator.core.ganzhi import GanzhiCalculator
+from bazi_calculator.core.jieqi import JieqiCalculator
+
+
+class TestBaziColumns:
+    """测试批量四柱计算"""
+
+    def test_matches_scalar_random(self):
+        """测试随机时间与逐条计算结果一致"""
+        rng = random.Random(42)
+        start = datetime(1901, 1, 1)
+        dates = [start + timedelta(seconds=rng.randrange(199 * 365 * 86400)) for _ in range(300)]
+        columns = BaziCalendar.get_all_pillars_many(dates)
+        assert len(columns) == 300
+        for i, date in enumerate(dates):
+            assert columns.to_dict(i) == BaziCalendar.get_all_pillars(date)
+
+    def test_matches_scalar_at_boundaries(self):
+        """测试节气交接与时辰交界处与逐条计算一致"""
+        dates = []
+        for i in range(24):
+            jieqi_time = JieqiCalculator.calculate_jieqi_datetime(2024, i)
+            dates.extend([jieqi_time, jieqi_time - timedelta(seconds=1)])
+        dates.extend([datetime(2024, 1, 1, 0, 0), datetime(2024, 1, 1, 22, 59, 59), datetime(2024, 1, 1, 23, 0)])
+        columns = BaziCalendar.get_all_pillars_many(dates)
+        assert columns.to_dicts() == [BaziCalendar.get_all_pillars(d) for d in dates]
+
+    def test_datetime64_input(self):
+        """测试 datetime64 数组输入"""
+        dates = np.array(["2024-03-21T12:30:00", "1990-08-08T14:00:00"], dtype="datetime64[s]")
+        columns = BaziCalendar.get_all_pillars_many(dates)
+        assert columns.to_dict(1) == BaziCalendar.get_all_pillars(datetime(1990, 8, 8, 14, 0))
+
+    def test_codes_and_strings(self):
+        """测试编码矩阵与字符串视图"""
+        date = datetime(2024, 3, 15, 10, 30)
+        columns = BaziCalendar.get_all_pillars_many([date])
+        bazi = BaziCalendar.get_all_pillars(date)
+        assert columns.codes.shape == (1, 8)
+        for pillar in BaziColumns.PILLARS:
+            assert columns.gan_strings(pillar)[0] == bazi[pillar]["gan"]
+            assert columns.zhi_strings(pillar)[0] == bazi[pillar]["zhi"]
+            assert columns.full_strings(pillar)[0] == bazi[pillar]["full"]
+        assert columns.jieqi_names()[0] == bazi["month"]["jieqi"]
+
+    def test_shishen_matches_scalar(self):
+        """测试批量十神与逐条计算一致"""
+        rng = random.Random(7)
+        start = datetime(1950, 1, 1)
+        dates = [start + timedelta(seconds=rng.randrange(100 * 365 * 86400)) for _ in range(200)]
+        columns = BaziCalendar.get_all_pillars_many(dates)
+        gan_shishen = columns.gan_shishen()
+        weights = columns.shishen_weights()
+        assert weights.shape == (200, 10)
+        for i, date in enumerate(dates):
+            shishen = BaziCalendar.get_all_pillars(date, include_shishen=True)["shishen"]
+            assert list(weights[i]) == pytest.approx(list(shishen["weights"].values()))
+            assert gan_shishen[i, 2] == 0
+            for column, pillar in ((0, "year"), (1, "month"), (3, "hour")):
+                assert GanzhiCalculator.SHISHEN[gan_shishen[i, column]] == shishen["gan"][pillar]
+
+    def test_empty_input(self):
+        """测试空输入"""
+        columns = BaziCalendar.get_all_pillars_many([])
+        assert len(columns) == 0
+        assert columns.codes.shape == (0, 8)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,106 @@
+"""八字区间索引模块测试"""
+
+import pytest
+from datetime import datetime, timedelta
+from bazi_calculator.core.calendar import BaziCalendar
+from bazi_calculator.core.chart_index import ChartIndex, main
+from bazi_calculator.core.jieqi import JieqiCalculator
+
+
+@pytest.fixture(scope="module")
+def index():
+    """构建小范围索引"""
+    return ChartIndex.build(2023, 2024)
+
+
+class TestChartIndex:
+    """测试八字区间索引"""
+
+    def test_entry_count(self, index):
+        """测试区间数：每日13个边界加上节气交接"""
+        assert len(index) == (365 + 366) * 13 + 48
+
+    def test_lookup_matches_calendar(self, index):
+        """测试查找结果与逐次计算一致"""
+        date = datetime(2023, 1, 1)
+        while date.year < 2025:
+            assert index.lookup_codes(date) == BaziCalendar.get_chart_codes(date)
+            date += timedelta(minutes=137)
+
+    def test_jieqi_boundaries(self, index):
+        """测试节气交接时刻前后"""
+        for year in (2023, 2024):
+            for i in range(24):
+                jieqi_time = JieqiCalculator.calculate_jieqi_datetime(year, i)
+                for date in (jieqi_time - timedelta(seconds=1), jieqi_time):
+                    if index.covers(date):
+                        assert index.lookup_codes(date) == BaziCalendar.get_chart_codes(date)
+
+    def test_lookup_dict(self, index):
+        """测试返回 get_all_pillars 的字典结构"""
+        date = datetime(2024, 2, 10, 14, 30)
+        assert index.lookup(date) == BaziCalendar.get_all_pillars(date)
+
+    def test_get_interval(self, index):
+        """测试区间起止"""
+        lichun = JieqiCalculator.calculate_jieqi_datetime(2024, 0)
+        start, end = index.get_interval(lichun)
+        assert start == lichun
+        assert end == lichun.replace(minute=0, second=0) + timedelta(hours=1 + lichun.hour % 2)
+
+    def test_lookup_many(self, index):
+        """测试批量查找"""
+        dates = [datetime(2023, 3, 1) + timedelta(hours=7 * i, seconds=i) for i in range(500)]
+        columns = index.lookup_many(dates)
+        assert (columns.codes == BaziCalendar.get_all_pillars_many(dates).codes).all()
+
+    def test_out_of_range(self, index):
+        """测试超出索引范围"""
+        assert not index.covers(datetime(2022, 12, 31, 23))
+        with pytest.raises(KeyError):
+            index.lookup_codes(datetime(2025, 1, 1))
+        with pytest.raises(KeyError):
+            index.lookup_many([datetime(2025, 1, 1)])
+
+    def test_invalid_range(self):
+        """测试无效年份范围"""
+        with pytest.raises(ValueError):
+            ChartIndex.build(2024, 2023)
+        with pytest.raises(ValueError):
+            ChartIndex.build(1000, 2000)
+
+
+class TestChartIndexFile:
+    """测试索引文件读写"""
+
+    def test_save_and_load(self, index, tmp_path):
+        """测试写入后内存映射读取"""
+        path = str(tmp_path / "chart.idx")
+        size = index.save(path)
+        assert size == ChartIndex.HEADER.size + len(index) * 8
+
+        with ChartIndex.load(path) as loaded:
+            assert (loaded.start_year, loaded.end_year) == (2023, 2024)
+            assert len(loaded) == len(index)
+            date = datetime(2023, 8, 8, 8, 8)
+            assert loaded.lookup_codes(date) == index.lookup_codes(date)
+
+    def test_invalid_file(self, tmp_path):
+        """测试无效文件"""
+        path = tmp_path / "bad.idx"
+        path.write_bytes(b"not a chart index file")
+        with pytest.raises(ValueError):
+            ChartIndex.load(str(path))
+
+    def test_command_line(self, tmp_path, capsys):
+        """测试命令行生成与基准测试"""
+        path = str(tmp_path / "chart.idx")
+        main(["--start", "2024", "--end", "2024", "--output", path, "--benchmark"])
+        output = capsys.readouterr().out
+        assert "加载耗时" in output
+        with ChartIndex.load(path) as loaded:
+            assert loaded.covers(datetime(2024, 6, 1))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,107 @@
+"""节气历表文件模块测试"""
+
+import pytest
+from datetime import datetime
+from bazi_calculator.core.ephemeris import JieqiEphemeris, main
+from bazi_calculator.core.jieqi import JieqiCalculator
+
+
+@pytest.fixture
+def ephemeris_path(tmp_path):
+    """生成小范围历表文件"""
+    path = tmp_path / "jieqi.eph"
+    JieqiEphemeris.build(str(path), 1580, 1620)
+    return str(path)
+
+
+@pytest.fixture
+def configured(ephemeris_path):
+    """配置历表并在测试后取消"""
+    JieqiCalculator.configure_ephemeris(ephemeris_path)
+    yield ephemeris_path
+    JieqiCalculator.configure_ephemeris(None)
+
+
+class TestJieqiEphemeris:
+    """测试节气历表读取器"""
+
+    def test_file_size(self, ephemeris_path, tmp_path):
+        """测试文件为定长记录"""
+        size = (tmp_path / "jieqi.eph").stat().st_size
+        assert size == JieqiEphemeris.HEADER.size + 41 * JieqiEphemeris.RECORD.size
+
+    def test_read_matches_solver(self, ephemeris_path):
+        """测试读取结果与迭代求解一致"""
+        with JieqiEphemeris(ephemeris_path) as ephemeris:
+            assert ephemeris.start_year == 1580
+            assert ephemeris.end_year == 1620
+            for year in (1580, 1582, 1583, 1620):
+                for i in range(24):
+                    expected = JieqiCalculator._find_jieqi_time(year, JieqiCalculator.JIEQI_LONGITUDE[i])
+                    assert ephemeris.get_jieqi(year, i) == expected
+
+    def test_covers(self, ephemeris_path):
+        """测试年份范围判断"""
+        with JieqiEphemeris(ephemeris_path) as ephemeris:
+            assert ephemeris.covers(1600)
+            assert not ephemeris.covers(1579)
+            assert not ephemeris.covers(1621)
+            with pytest.raises(KeyError):
+                ephemeris.get_year_jieqi(1700)
+
+    def test_invalid_file(self, tmp_path):
+        """测试无效文件"""
+        path = tmp_path / "bad.eph"
+        path.write_bytes(b"not an ephemeris file at all......")
+        with pytest.raises(ValueError):
+            JieqiEphemeris(str(path))
+        # 短于文件头与空文件
+        path.write_bytes(JieqiEphemeris.MAGIC)
+        with pytest.raises(ValueError):
+            JieqiEphemeris(str(path))
+        path.write_bytes(b"")
+        with pytest.raises(ValueError):
+            JieqiEphemeris(str(path))
+
+    def test_invalid_range(self, tmp_path):
+        """测试无效年份范围"""
+        with pytest.raises(ValueError):
+            JieqiEphemeris.build(str(tmp_path / "x.eph"), 2000, 1990)
+        with pytest.raises(ValueError):
+            JieqiEphemeris.build(str(tmp_path / "x.eph"), 0, 10)
+
+    def test_command_line(self, tmp_path, capsys):
+        """测试命令行生成"""
+        path = tmp_path / "cli.eph"
+        main(["--start", "1000", "--end", "1001", "--output", str(path)])
+        assert "1000-1001" in capsys.readouterr().out
+        with JieqiEphemeris(str(path)) as ephemeris:
+            assert ephemeris.get_jieqi(1001, 0).month == 2
+
+
+class TestJieqiCalculatorWithEphemeris:
+    """测试 JieqiCalculator 使用历表"""
+
+    def test_calculate_jieqi_datetime(self, configured):
+        """测试节气时间从历表读取"""
+        assert JieqiCalculator._ephemeris.covers(1600)
+        expected = JieqiCalculator._find_jieqi_time(1600, 315)
+        assert JieqiCalculator.calculate_jieqi_datetime(1600, 0) == expected
+
+    def test_get_current_jieqi(self, configured):
+        """测试当前节气查找与求解结果一致"""
+        date = datetime(1600, 1, 3)
+        current_jieqi, current_time, next_time = JieqiCalculator.get_current_jieqi(date)
+        assert current_jieqi == "冬至"
+        assert current_time == JieqiCalculator._find_jieqi_time(1599, 270)
+        assert next_time == JieqiCalculator._find_jieqi_time(1599, 285)
+
+    def test_unconfigure(self, configured):
+        """测试取消配置"""
+        JieqiCalculator.configure_ephemeris(None)
+        assert JieqiCalculator._ephemeris is None
+        assert JieqiCalculator.calculate_jieqi_datetime(1600, 0) == JieqiCalculator._find_jieqi_time(1600, 315)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
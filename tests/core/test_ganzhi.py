@@ -164,6 +164,76 @@ class TestGanzhiCalculator:
         assert GanzhiCalculator.JIAZI[1] == "乙丑"
         assert GanzhiCalculator.JIAZI[12] == "丙子"
         assert GanzhiCalculator.JIAZI[60 - 1] == "癸亥"
+    
+    def test_get_index(self):
+        """测试干支字符到索引"""
+        assert GanzhiCalculator.get_tiangan_index("甲") == 0
+        assert GanzhiCalculator.get_tiangan_index("癸") == 9
+        assert GanzhiCalculator.get_dizhi_index("子") == 0
+        assert GanzhiCalculator.get_dizhi_index("亥") == 11
+        with pytest.raises(ValueError):
+            GanzhiCalculator.get_tiangan_index("子")
+        with pytest.raises(ValueError):
+            GanzhiCalculator.get_dizhi_index("甲")
+    
+    def test_get_jiazi_index(self):
+        """测试干支索引到六十甲子索引"""
+        for i in range(60):
+            assert GanzhiCalculator.get_jiazi_index(i % 10, i % 12) == i
+        with pytest.raises(ValueError):
+            GanzhiCalculator.get_jiazi_index(0, 1)
+    
+    def test_nayin(self):
+        """测试纳音"""
+        assert GanzhiCalculator.get_nayin(0) == "海中金"
+        assert GanzhiCalculator.get_nayin(1) == "海中金"
+        assert GanzhiCalculator.get_nayin(GanzhiCalculator.get_jiazi_index(6, 6)) == "路旁土"
+        assert GanzhiCalculator.get_nayin(59) == "大海水"
+        with pytest.raises(IndexError):
+            GanzhiCalculator.get_nayin(60)
+    
+    def test_shishen_matrix(self):
+        """测试十神矩阵与五行生克一致"""
+        for day_gan in GanzhiCalculator.TIANGAN:
+            day_wuxing = GanzhiCalculator.TIANGAN_WUXING[day_gan]
+            for gan in GanzhiCalculator.TIANGAN:
+                wuxing = GanzhiCalculator.TIANGAN_WUXING[gan]
+                same = GanzhiCalculator.get_tiangan_index(gan) % 2 == GanzhiCalculator.get_tiangan_index(day_gan) % 2
+                if wuxing == day_wuxing:
+                    kind = ("比肩", "劫财")
+                elif GanzhiCalculator.WUXING_SHENG[day_wuxing] == wuxing:
+                    kind = ("食神", "伤官")
+                elif GanzhiCalculator.WUXING_KE[day_wuxing] == wuxing:
+                    kind = ("偏财", "正财")
+                elif GanzhiCalculator.WUXING_KE[wuxing] == day_wuxing:
+                    kind = ("七杀", "正官")
+                else:
+                    kind = ("偏印", "正印")
+                assert GanzhiCalculator.get_shishen(day_gan, gan) == kind[0 if same else 1]
+        assert GanzhiCalculator.get_shishen("甲", "辛") == "正官"
+        assert GanzhiCalculator.get_shishen("丙", "己") == "伤官"
+    
+    def test_canggan(self):
+        """测试地支藏干"""
+        assert GanzhiCalculator.get_canggan("子") == [("癸", 1.0)]
+        assert GanzhiCalculator.get_canggan("寅")[0] == ("甲", 0.6)
+        for zhi in GanzhiCalculator.DIZHI:
+            canggan = GanzhiCalculator.get_canggan(zhi)
+            assert sum(weight for _, weight in canggan) == pytest.approx(1.0)
+            # 本气与地支五行相同
+            assert GanzhiCalculator.TIANGAN_WUXING[canggan[0][0]] == GanzhiCalculator.DIZHI_WUXING[zhi]
+        with pytest.raises(ValueError):
+            GanzhiCalculator.get_canggan("甲")
+    
+    def test_chart_shishen(self):
+        """测试整盘十神"""
+        # 庚午 丙寅 甲子 丙寅
+        result = GanzhiCalculator.get_chart_shishen((6, 6, 2, 2, 0, 0, 2, 2))
+        assert result["gan"] == {"year": "七杀", "month": "食神", "day": "日主", "hour": "食神"}
+        assert result["canggan"]["day"] == [{"gan": "癸", "shishen": "正印", "weight": 1.0}]
+        assert [item["shishen"] for item in result["canggan"]["year"]] == ["伤官", "正财"]
+        assert result["weights"]["食神"] == pytest.approx(2.6)
+        assert sum(result["weights"].values()) == pytest.approx(7.0)
 
 
 if __name__ == "__main__":
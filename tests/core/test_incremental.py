@@ -0,0 +1,92 @@
+"""增量排盘模块测试"""
+
+import random
+import pytest
+from datetime import datetime, timedelta
+from bazi_calculator.core.calendar import BaziCalendar
+from bazi_calculator.core.incremental import IncrementalChart
+from bazi_calculator.core.jieqi import JieqiCalculator
+from bazi_calculator.core.mingge import MingGeAnalyzer
+from bazi_calculator.core.wuxing import WuxingAnalyzer
+
+
+BIRTH = datetime(1990, 3, 15, 10, 30)
+
+
+class TestIncrementalChart:
+    """测试增量排盘"""
+
+    def test_matches_full_recompute(self):
+        """测试随机修改出生时间后与重新排盘结果一致"""
+        rng = random.Random(0)
+        chart = IncrementalChart(BIRTH)
+        birth_date = BIRTH
+        for _ in range(500):
+            birth_date += timedelta(minutes=rng.choice([rng.randint(-300, 300), rng.randint(-50000, 50000)]))
+            previous = dict(chart.bazi)
+            changed = chart.update(birth_date)
+            expected = BaziCalendar.get_all_pillars(birth_date)
+            assert chart.bazi == expected
+            assert chart.codes == BaziCalendar.get_chart_codes(birth_date)
+            assert changed == [p for p in ("year", "month", "day", "hour") if previous[p] != expected[p]]
+
+    def test_changed_pillars(self):
+        """测试只重算可能变化的柱"""
+        chart = IncrementalChart(BIRTH)
+        assert chart.update(datetime(1990, 3, 15, 10, 50)) == []
+        assert chart.update(datetime(1990, 3, 15, 11, 30)) == ["hour"]
+        assert chart.update(datetime(1990, 3, 16, 11, 30)) == ["day", "hour"]
+
+        lichun = JieqiCalculator.calculate_jieqi_datetime(2024, 0)
+        chart = IncrementalChart(lichun - timedelta(minutes=1))
+        assert chart.update(lichun) == ["year", "month"]
+
+    def test_analysis_cache(self):
+        """测试依赖的五行未变时沿用分析结果，变化时重新计算"""
+        chart = IncrementalChart(BIRTH)
+        wuxing = chart.get_analysis("wuxing")
+        mingge = chart.get_analysis("mingge")
+        assert wuxing == WuxingAnalyzer.analyze_comprehensive(chart.bazi)
+        assert mingge == MingGeAnalyzer.analyze_comprehensive(chart.bazi, wuxing)
+
+        # 己巳时改为庚午时，时柱五行由土火变为金火
+        assert chart.update(datetime(1990, 3, 15, 11, 30)) == ["hour"]
+        assert chart.get_stale_analyses() == ["wuxing", "mingge"]
+        assert chart.get_analysis("wuxing") == WuxingAnalyzer.analyze_comprehensive(chart.bazi)
+        assert chart.get_stale_analyses() == ["mingge"]
+        chart.get_analysis("mingge")
+
+        # 同一时辰内修改分钟，沿用缓存
+        cached = chart.get_analysis("wuxing")
+        chart.update(datetime(1990, 3, 15, 12, 45))
+        assert chart.get_stale_analyses() == []
+        assert chart.get_analysis("wuxing") == cached
+
+        # 修改返回值不影响缓存
+        cached["scores"]["yin"] = -1.0
+        cached["yong_shen_info"]["ji_shen"].append("X")
+        assert chart.get_analysis("wuxing") == WuxingAnalyzer.analyze_comprehensive(chart.bazi)
+
+    def test_custom_analysis(self):
+        """测试注册额外的下游分析"""
+        calls = []
+
+        def compute(chart):
+            calls.append(chart.birth_date)
+            return {"day_master": chart.bazi["day"]["gan"]}
+
+        chart = IncrementalChart(BIRTH, analyses={"day_master": (lambda c: c.bazi["day"]["gan"], compute)})
+        chart.get_analysis("day_master")
+        chart.update(datetime(1990, 3, 15, 20, 0))
+        chart.get_analysis("day_master")
+        assert len(calls) == 1
+        chart.update(datetime(1990, 3, 16, 20, 0))
+        assert chart.get_analysis("day_master") == {"day_master": "庚"}
+        assert len(calls) == 2
+
+        with pytest.raises(KeyError):
+            chart.get_analysis("unknown")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
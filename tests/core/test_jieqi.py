@@ -1,7 +1,7 @@
 """节气计算模块测试"""
 
 import pytest
-from datetime import datetime
+from datetime import datetime, timedelta
 from bazi_calculator.core.jieqi import JieqiCalculator
 
 
@@ -151,5 +151,136 @@ class TestJieqiCalculator:
             assert idx == i
 
 
+class TestJieqiTable:
+    """测试预计算节气表"""
+
+    def test_table_size_and_order(self):
+        """测试节气表覆盖范围且按时间有序"""
+        table = JieqiCalculator._get_jieqi_table()
+        years = JieqiCalculator.TABLE_END_YEAR - JieqiCalculator.TABLE_START_YEAR + 1
+        assert len(table) == years * 24
+        assert all(table[i] < table[i + 1] for i in range(len(table) - 1))
+
+    def test_table_matches_solver(self):
+        """测试查表结果与迭代求解结果一致"""
+        for year in (1900, 1949, 2024, 2100):
+            for i in range(24):
+                expected = JieqiCalculator._find_jieqi_time(year, JieqiCalculator.JIEQI_LONGITUDE[i])
+                assert JieqiCalculator.calculate_jieqi_datetime(year, i) == expected
+
+    def test_current_jieqi_early_january(self):
+        """测试一月上旬仍处于冬至"""
+        current_jieqi, current_time, next_time = JieqiCalculator.get_current_jieqi(datetime(2024, 1, 2))
+        assert current_jieqi == "冬至"
+        assert current_time == JieqiCalculator.calculate_jieqi_datetime(2023, 21)
+        assert next_time == JieqiCalculator.calculate_jieqi_datetime(2023, 22)
+
+    def test_current_jieqi_after_dahan(self):
+        """测试大寒至立春之间处于大寒"""
+        current_jieqi, _, next_time = JieqiCalculator.get_current_jieqi(datetime(2024, 2, 1))
+        assert current_jieqi == "大寒"
+        assert next_time == JieqiCalculator.calculate_jieqi_datetime(2024, 0)
+
+    def test_current_jieqi_boundary(self):
+        """测试节气交接时刻"""
+        lixia = JieqiCalculator.calculate_jieqi_datetime(2024, 6)
+        assert JieqiCalculator.get_current_jieqi(lixia)[0] == "立夏"
+        assert JieqiCalculator.get_current_jieqi(lixia - timedelta(seconds=1))[0] == "谷雨"
+
+    def test_out_of_range_fallback(self):
+        """测试超出预计算范围时回退到迭代求解"""
+        date = datetime(1850, 1, 3)
+        current_jieqi, current_time, next_time = JieqiCalculator.get_current_jieqi(date)
+        assert current_jieqi == "冬至"
+        assert current_time < date < next_time
+        assert next_time == JieqiCalculator._find_jieqi_time(1849, 285)
+
+        lichun = JieqiCalculator.calculate_jieqi_datetime(2150, 0)
+        assert lichun == JieqiCalculator._find_jieqi_time(2150, 315)
+        assert JieqiCalculator.get_current_jieqi(lichun)[0] == "立春"
+
+
+class TestJieqiSolver:
+    """测试节气求解模式与收敛信息"""
+
+    def test_analytic_derivative(self):
+        """测试解析导数与数值差分一致"""
+        jd = 2460000.3
+        h = 0.01
+        numeric = (JieqiCalculator._get_solar_longitude(jd + h) - JieqiCalculator._get_solar_longitude(jd - h)) / (2 * h)
+        assert JieqiCalculator._get_solar_longitude_rate(jd) == pytest.approx(numeric, abs=1e-6)
+
+    def test_analytic_mode_converges_fast(self):
+        """测试解析模式在3次迭代内收敛到亚秒精度"""
+        for year in (1800, 1949, 2024, 2250):
+            for i in range(24):
+                result = JieqiCalculator.solve_jieqi(year, i)
+                assert result["converged"] is True
+                assert result["iterations"] <= 3
+                assert result["residual_seconds"] < 1.0
+
+    def test_modes_agree(self):
+        """测试两种求解模式得到同一节气"""
+        for i in range(24):
+            analytic = JieqiCalculator.solve_jieqi(2024, i, mode="analytic")
+            fixed_rate = JieqiCalculator.solve_jieqi(2024, i, mode="fixed_rate")
+            assert abs(analytic["julian_day"] - fixed_rate["julian_day"]) * 86400 < 30
+            assert fixed_rate["datetime"] == JieqiCalculator.calculate_jieqi_datetime(2024, i)
+
+    def test_telemetry_fields(self):
+        """测试求解结果包含收敛信息"""
+        result = JieqiCalculator.solve_jieqi(2024, 0)
+        assert result["jieqi"] == "立春"
+        assert result["mode"] == "analytic"
+        assert result["datetime"].month == 2
+        assert set(result) >= {"julian_day", "iterations", "residual", "residual_seconds", "converged"}
+
+    def test_invalid_arguments(self):
+        """测试无效参数"""
+        with pytest.raises(IndexError):
+            JieqiCalculator.solve_jieqi(2024, 24)
+        with pytest.raises(ValueError):
+            JieqiCalculator.solve_jieqi(2024, 0, mode="bisection")
+
+
+class TestJieqiAdaptive:
+    """测试两级精度节气定位"""
+
+    def test_estimate_matches_locate(self):
+        """测试估计结果与精确定位一致"""
+        date = datetime(1850, 1, 1, 3)
+        while date.year < 2250:
+            year, jieqi_index, _ = JieqiCalculator.estimate_jieqi(date)
+            assert (year, jieqi_index) == JieqiCalculator.locate_jieqi(date)
+            date += timedelta(days=13, hours=7, minutes=11)
+
+    def test_margin(self):
+        """测试距节气交接的小时数"""
+        lixia = JieqiCalculator.calculate_jieqi_datetime(2024, 6)
+        assert JieqiCalculator.estimate_jieqi(lixia + timedelta(hours=12))[2] < 13
+        assert JieqiCalculator.estimate_jieqi(lixia + timedelta(days=7))[2] > 24 * 6
+
+    def test_locate_interval(self):
+        """测试节气区间的起止时间"""
+        lichun = JieqiCalculator.calculate_jieqi_datetime(2024, 0)
+        yushui = JieqiCalculator.calculate_jieqi_datetime(2024, 1)
+        assert JieqiCalculator.locate_jieqi_interval(lichun) == (2024, 0, lichun, yushui)
+        assert JieqiCalculator.locate_jieqi_interval(yushui - timedelta(seconds=1)) == (2024, 0, lichun, yushui)
+        assert JieqiCalculator.locate_jieqi_interval(lichun - timedelta(seconds=1))[:2] == (2023, 23)
+
+    def test_tiers(self):
+        """测试节气表内一律精确定位，表外只在窗口内精确定位"""
+        lichun = JieqiCalculator.calculate_jieqi_datetime(2024, 0)
+        for date in (lichun - timedelta(seconds=1), lichun, datetime(2024, 3, 1)):
+            year, jieqi_index, tier = JieqiCalculator.locate_jieqi_adaptive(date)
+            assert tier == "precise"
+            assert (year, jieqi_index) == JieqiCalculator.locate_jieqi(date)
+
+        lichun = JieqiCalculator.calculate_jieqi_datetime(2150, 0)
+        assert JieqiCalculator.locate_jieqi_adaptive(lichun)[2] == "precise"
+        assert JieqiCalculator.locate_jieqi_adaptive(datetime(2150, 3, 1))[2] == "estimate"
+        assert JieqiCalculator.locate_jieqi_adaptive(lichun + timedelta(hours=30))[2] == "precise"
+        assert JieqiCalculator.locate_jieqi_adaptive(lichun + timedelta(hours=30), window_hours=24)[2] == "estimate"
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,114 @@
+"""批量节气计算模块测试"""
+
+import pytest
+import numpy as np
+from datetime import datetime
+from bazi_calculator.core.jieqi import JieqiCalculator
+from bazi_calculator.core.jieqi_batch import BatchJieqiCalculator
+
+
+class TestBatchJieqiCalculator:
+    """测试批量节气计算器"""
+
+    def test_julian_days_match_scalar(self):
+        """测试批量儒略日与标量结果一致"""
+        dates = [datetime(1900, 1, 1), datetime(1949, 10, 1, 12), datetime(2024, 12, 31, 23, 59, 59)]
+        jd = BatchJieqiCalculator.get_julian_days(dates)
+        expected = [JieqiCalculator._get_julian_day(d) for d in dates]
+        assert jd == pytest.approx(expected, abs=1e-8)
+
+    def test_datetime64_input(self):
+        """测试 datetime64 数组输入"""
+        dates = np.array(["2024-02-04T08:13:18", "1990-08-08T14:00:00"], dtype="datetime64[s]")
+        jd = BatchJieqiCalculator.get_julian_days(dates)
+        assert jd[0] == pytest.approx(JieqiCalculator._get_julian_day(datetime(2024, 2, 4, 8, 13, 18)), abs=1e-8)
+
+    def test_julian_days_roundtrip(self):
+        """测试儒略日与 datetime64 往返转换"""
+        dates = np.array(["1901-03-05T01:02:03", "2099-11-30T23:59:59"], dtype="datetime64[s]")
+        jd = BatchJieqiCalculator.get_julian_days(dates) + 1e-6
+        assert np.array_equal(BatchJieqiCalculator.julian_days_to_datetime64(jd), dates)
+
+    def test_solar_longitudes_match_scalar(self):
+        """测试批量太阳黄经与标量结果一致"""
+        jd = np.linspace(2415020.5, 2488069.5, 50)
+        longitudes = BatchJieqiCalculator.get_solar_longitudes(jd)
+        expected = [JieqiCalculator._get_solar_longitude(x) for x in jd]
+        assert longitudes == pytest.approx(expected, abs=1e-9)
+
+    def test_find_jieqi_matches_scalar(self):
+        """测试批量节气求解与标量求解一致"""
+        years = np.array([1900, 1949, 2000, 2024, 2100])
+        indices = np.array([0, 3, 9, 21, 23])
+        result = BatchJieqiCalculator.find_jieqi_datetimes(years, indices)
+        for y, i, value in zip(years, indices, result):
+            expected = JieqiCalculator._find_jieqi_time(int(y), JieqiCalculator.JIEQI_LONGITUDE[i])
+            assert value == np.datetime64(expected, "s")
+
+    def test_year_table(self):
+        """测试整年节气表"""
+        table = BatchJieqiCalculator.get_year_jieqi_table(2023, 2025)
+        assert table.shape == (3, 24)
+        assert np.all(np.diff(table.ravel()) > 0)
+        lichun = BatchJieqiCalculator.julian_days_to_datetime64(table[1, 0])
+        assert lichun == np.datetime64(JieqiCalculator.calculate_jieqi_datetime(2024, 0), "s")
+
+    def test_invalid_index(self):
+        """测试无效节气索引"""
+        with pytest.raises(IndexError):
+            BatchJieqiCalculator.find_jieqi_julian_days([2024], [24])
+
+
+class TestLongitudeCrossings:
+    """测试任意黄经交点搜索"""
+
+    def test_jieqi_match_analytic(self):
+        """测试节气黄经的交点与解析求解一致"""
+        crossings = list(BatchJieqiCalculator.find_longitude_crossings(
+            JieqiCalculator.JIEQI_LONGITUDE, datetime(2023, 2, 1), datetime(2025, 2, 1)
+        ))
+        assert len(crossings) == 48
+        for longitude, moment in crossings:
+            index = JieqiCalculator.JIEQI_LONGITUDE.index(longitude)
+            year = moment.year - 1 if index >= 22 else moment.year
+            assert moment == JieqiCalculator.solve_jieqi(year, index)["datetime"]
+
+    def test_sorted_and_in_range(self):
+        """测试结果按时间排序且位于区间内"""
+        start, end = datetime(1999, 12, 25), datetime(2001, 3, 1)
+        crossings = list(BatchJieqiCalculator.find_longitude_crossings(range(0, 360, 7), start, end))
+        moments = [m for _, m in crossings]
+        assert moments == sorted(moments)
+        assert start <= moments[0] and moments[-1] < end
+        assert {longitude for longitude, _ in crossings} == set(range(0, 360, 7))
+
+    def test_arbitrary_longitude(self):
+        """测试任意角度，与 360 度同余的黄经结果相同"""
+        crossings = list(BatchJieqiCalculator.find_longitude_crossings(123.4, datetime(2024, 1, 1), datetime(2026, 1, 1)))
+        assert [m.year for _, m in crossings] == [2024, 2025]
+        for _, moment in crossings:
+            longitude = JieqiCalculator._get_solar_longitude(JieqiCalculator._get_julian_day(moment))
+            assert longitude == pytest.approx(123.4, abs=1e-4)
+
+        (_, a), (_, b) = BatchJieqiCalculator.find_longitude_crossings([0, 360], datetime(2024, 3, 1), datetime(2024, 4, 1))
+        assert a == b
+
+    def test_generator(self):
+        """测试按需生成"""
+        crossings = BatchJieqiCalculator.find_longitude_crossings(0, datetime(1900, 1, 1), datetime(9000, 1, 1))
+        assert next(crossings)[1].year == 1900
+        assert next(crossings)[1].year == 1901
+
+    def test_hou(self):
+        """测试七十二候"""
+        hou = list(BatchJieqiCalculator.find_hou(datetime(2024, 2, 1), datetime(2025, 2, 1)))
+        assert len(hou) == 72
+        assert len(JieqiCalculator.HOU_NAMES) == 72
+        index, name, moment = hou[0]
+        assert (index, name) == (0, "东风解冻")
+        assert moment == JieqiCalculator.solve_jieqi(2024, 0)["datetime"]
+        assert [h[0] for h in hou] == list(range(72))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,108 @@
+"""大运流年模块测试"""
+
+import pytest
+from datetime import datetime, timedelta
+from itertools import islice
+from bazi_calculator.core.calendar import BaziCalendar
+from bazi_calculator.core.jieqi import JieqiCalculator
+from bazi_calculator.core.luck import LuckTimeline
+
+
+BIRTH = datetime(1990, 3, 15, 10, 30)
+
+
+class TestLuckTimeline:
+    """测试大运流年"""
+
+    def test_relation(self):
+        """测试五行与日主的关系"""
+        assert LuckTimeline.get_relation("木", "木") == "比劫"
+        assert LuckTimeline.get_relation("木", "水") == "印星"
+        assert LuckTimeline.get_relation("木", "火") == "食伤"
+        assert LuckTimeline.get_relation("木", "土") == "财星"
+        assert LuckTimeline.get_relation("木", "金") == "官杀"
+
+    def test_direction(self):
+        """测试阳年男、阴年女顺行"""
+        assert LuckTimeline.get_direction(0, "男") == 1
+        assert LuckTimeline.get_direction(0, "女") == -1
+        assert LuckTimeline.get_direction(1, "男") == -1
+        assert LuckTimeline.get_direction(1, "女") == 1
+        with pytest.raises(ValueError):
+            LuckTimeline.get_direction(0, "未知")
+
+    def test_start(self):
+        """测试起运：顺行取下一个节，逆行取上一个节，三天折一年"""
+        forward = LuckTimeline.get_start(BIRTH, "男")
+        assert forward["jieqi"] == "清明"
+        assert forward["jieqi_time"] == JieqiCalculator.calculate_jieqi_datetime(1990, 4)
+        distance = forward["jieqi_time"] - BIRTH
+        assert forward["start_age"] == pytest.approx(distance.total_seconds() / 86400 / 3)
+        assert forward["start_date"] == BIRTH + timedelta(days=forward["start_age"] * 365.2425)
+
+        backward = LuckTimeline.get_start(BIRTH, "女")
+        assert backward["direction"] == -1
+        assert backward["jieqi"] == "惊蛰"
+        assert backward["jieqi_time"] < BIRTH
+
+    def test_start_date_matches_age(self):
+        """测试起运日期与起运岁数一致，各步大运的日期与岁数也一致"""
+        birth = datetime(1990, 3, 25, 12, 0)
+        start = LuckTimeline.get_start(birth, "男")
+        assert start["start_age"] == pytest.approx(3.514, abs=1e-3)
+        assert (start["start_date"] - birth) / timedelta(days=365.2425) == pytest.approx(start["start_age"])
+        for dayun in LuckTimeline.iter_dayun(birth, "男", count=3):
+            age = (dayun["start_date"] - birth) / timedelta(days=365.2425)
+            assert age == pytest.approx(dayun["start_age"])
+
+    def test_dayun(self):
+        """测试大运由月柱顺排、逆排"""
+        assert BaziCalendar.get_all_pillars(BIRTH)["month"]["full"] == "己卯"
+        forward = [d["pillar"]["full"] for d in LuckTimeline.iter_dayun(BIRTH, "男", count=3)]
+        backward = [d["pillar"]["full"] for d in LuckTimeline.iter_dayun(BIRTH, "女", count=3)]
+        assert forward == ["庚辰", "辛巳", "壬午"]
+        assert backward == ["戊寅", "丁丑", "丙子"]
+
+        first, second = islice(LuckTimeline.iter_dayun(BIRTH, "男"), 2)
+        assert second["start_age"] == pytest.approx(first["start_age"] + 10)
+        assert first["end_date"] == second["start_date"]
+        # 日主己土：庚金为土所生，辰土同类
+        assert first["pillar"]["gan_relation"] == "食伤"
+        assert first["pillar"]["zhi_relation"] == "比劫"
+
+    def test_liunian_liuyue(self):
+        """测试流年以立春为界、流月以节为界"""
+        years = list(LuckTimeline.iter_liunian("庚", 2024, 2025))
+        assert [y["pillar"]["full"] for y in years] == ["甲辰", "乙巳"]
+        assert years[0]["start"] == JieqiCalculator.calculate_jieqi_datetime(2024, 0)
+
+        months = list(LuckTimeline.iter_liuyue("庚", 2024))
+        assert len(months) == 12
+        assert months[0]["pillar"]["full"] == "丙寅"
+        for month in months:
+            assert BaziCalendar.get_all_pillars(month["start"])["month"]["full"] == month["pillar"]["full"]
+
+    def test_timeline(self):
+        """测试合并时间线按时间排序，流年、流月、大运数量正确"""
+        records = list(LuckTimeline.iter_timeline(BIRTH, "女", years=30))
+        times = [r["time"] for r in records]
+        assert times == sorted(times)
+        levels = [r["level"] for r in records]
+        assert levels.count("year") == 31
+        assert levels.count("dayun") == 3
+        assert records[0]["level"] == "year" and records[0]["nominal_age"] == 1
+        assert records[1]["level"] == "month" and records[1]["start"] <= BIRTH
+
+        years_only = LuckTimeline.iter_timeline(BIRTH, "女", years=30, include_months=False)
+        assert {r["level"] for r in years_only} == {"year", "dayun"}
+
+    def test_timeline_lazy(self):
+        """测试时间线可提前停止"""
+        timeline = LuckTimeline.iter_timeline(BIRTH, "男", years=200)
+        page = list(islice(timeline, 50))
+        assert len(page) == 50
+        assert page[-1]["time"] < BIRTH + timedelta(days=5 * 366)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
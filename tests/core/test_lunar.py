@@ -0,0 +1,92 @@
+"""农历计算模块测试"""
+
+import pytest
+from datetime import date, datetime, timedelta
+from bazi_calculator.core.lunar import LunarCalendar
+
+
+class TestLunarCalendar:
+    """测试农历计算器"""
+
+    def test_new_year(self):
+        """测试正月初一日期"""
+        assert LunarCalendar.get_new_year(1900) == date(1900, 1, 31)
+        assert LunarCalendar.get_new_year(1949) == date(1949, 1, 29)
+        assert LunarCalendar.get_new_year(2000) == date(2000, 2, 5)
+        assert LunarCalendar.get_new_year(2024) == date(2024, 2, 10)
+        assert LunarCalendar.get_new_year(2100) == date(2100, 2, 9)
+
+    def test_table_consistency(self):
+        """测试数据表中的正月初一偏移与各月天数一致"""
+        for year in range(LunarCalendar.START_YEAR, LunarCalendar.END_YEAR):
+            days = (LunarCalendar.get_new_year(year + 1) - LunarCalendar.get_new_year(year)).days
+            assert days == LunarCalendar.get_year_days(year)
+            assert days in (353, 354, 355, 383, 384, 385)
+
+    def test_leap_month(self):
+        """测试闰月"""
+        assert LunarCalendar.get_leap_month(2023) == 2
+        assert LunarCalendar.get_leap_month(2020) == 4
+        assert LunarCalendar.get_leap_month(2024) == 0
+        assert len(LunarCalendar.get_year_months(2023)) == 13
+        assert LunarCalendar.lunar_to_solar(2023, 2, 1, is_leap=True) == date(2023, 3, 22)
+        assert LunarCalendar.solar_to_lunar(date(2023, 3, 22)) == (2023, 2, 1, True)
+        assert LunarCalendar.solar_to_lunar(date(2023, 4, 20)) == (2023, 3, 1, False)
+
+    def test_known_dates(self):
+        """测试已知日期的互转"""
+        assert LunarCalendar.solar_to_lunar(date(2024, 2, 9)) == (2023, 12, 30, False)
+        assert LunarCalendar.solar_to_lunar(datetime(2024, 9, 17, 20, 0)) == (2024, 8, 15, False)
+        assert LunarCalendar.lunar_to_solar(1949, 8, 10) == date(1949, 10, 1)
+
+    def test_roundtrip(self):
+        """测试全范围逐日互转一致"""
+        day = LunarCalendar.get_new_year(LunarCalendar.START_YEAR)
+        end = LunarCalendar.get_new_year(LunarCalendar.END_YEAR) + timedelta(
+            days=LunarCalendar.get_year_days(LunarCalendar.END_YEAR)
+        )
+        previous = None
+        while day < end:
+            lunar = LunarCalendar.solar_to_lunar(day)
+            assert LunarCalendar.lunar_to_solar(*lunar) == day
+            if previous is not None and lunar[2] != 1:
+                assert lunar[2] == previous[2] + 1
+            previous = lunar
+            day += timedelta(days=1)
+
+    def test_invalid_dates(self):
+        """测试无效日期"""
+        with pytest.raises(ValueError):
+            LunarCalendar.lunar_to_solar(2024, 2, 1, is_leap=True)
+        with pytest.raises(ValueError):
+            LunarCalendar.lunar_to_solar(2024, 13, 1)
+        with pytest.raises(ValueError):
+            LunarCalendar.lunar_to_solar(2024, 1, 0)
+        with pytest.raises(ValueError):
+            LunarCalendar.lunar_to_solar(1899, 1, 1)
+        with pytest.raises(ValueError):
+            LunarCalendar.solar_to_lunar(date(1900, 1, 30))
+        with pytest.raises(ValueError):
+            LunarCalendar.solar_to_lunar(date(2101, 6, 1))
+
+    def test_month_days(self):
+        """测试大小月"""
+        month_days = [LunarCalendar.get_month_days(2024, month) for month in range(1, 13)]
+        assert sum(month_days) == LunarCalendar.get_year_days(2024)
+        with pytest.raises(ValueError):
+            LunarCalendar.lunar_to_solar(2024, 1, 30) if month_days[0] == 29 else LunarCalendar.lunar_to_solar(2024, 2, 31)
+
+    def test_to_solar_datetime(self):
+        """测试农历出生时间换算"""
+        assert LunarCalendar.to_solar_datetime(2024, 1, 1, 10, 30) == datetime(2024, 2, 10, 10, 30)
+
+    def test_format_lunar_date(self):
+        """测试农历日期格式化"""
+        assert LunarCalendar.format_lunar_date(2023, 2, 1, True) == "2023年闰二月初一"
+        assert LunarCalendar.format_lunar_date(2024, 12, 29) == "2024年腊月廿九"
+        assert LunarCalendar.format_lunar_date(2024, 8, 15) == "2024年八月十五"
+        assert LunarCalendar.format_lunar_date(2024, 11, 20) == "2024年冬月二十"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,43 @@
+"""批量农历转换模块测试"""
+
+import numpy as np
+import pytest
+from bazi_calculator.core.lunar import LunarCalendar
+from bazi_calculator.core.lunar_batch import BatchLunarCalendar
+
+
+class TestBatchLunarCalendar:
+    """测试批量农历转换"""
+
+    def test_matches_scalar(self):
+        """测试与标量转换一致"""
+        dates = np.arange(np.datetime64("1900-01-31"), np.datetime64("2101-01-29"), 37)
+        years, months, days, leaps = BatchLunarCalendar.solar_to_lunar(dates)
+        for i in range(len(dates)):
+            expected = LunarCalendar.solar_to_lunar(dates[i].astype(object))
+            assert (years[i], months[i], days[i], leaps[i]) == expected
+
+    def test_roundtrip(self):
+        """测试全范围互转一致"""
+        dates = np.arange(np.datetime64("1900-01-31"), np.datetime64("2101-01-29"))
+        lunar = BatchLunarCalendar.solar_to_lunar(dates)
+        assert (BatchLunarCalendar.lunar_to_solar(*lunar) == dates).all()
+
+    def test_broadcast(self):
+        """测试参数广播"""
+        result = BatchLunarCalendar.lunar_to_solar(2024, np.arange(1, 13), 1)
+        assert result[0] == np.datetime64("2024-02-10")
+        assert len(result) == 12
+
+    def test_invalid(self):
+        """测试无效日期"""
+        with pytest.raises(ValueError):
+            BatchLunarCalendar.lunar_to_solar([2024], [2], [1], [True])
+        with pytest.raises(ValueError):
+            BatchLunarCalendar.lunar_to_solar([2024, 2024], [1, 1], [1, 31])
+        with pytest.raises(ValueError):
+            BatchLunarCalendar.solar_to_lunar(["1900-01-01"])
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,134 @@
+"""命格分析模块测试"""
+
+import random
+import pytest
+import numpy as np
+from datetime import datetime, timedelta
+from bazi_calculator.core.calendar import BaziCalendar
+from bazi_calculator.core.mingge import (
+    MingGeAnalyzer, _compile_pattern_rules, _pattern_count_buckets, _pattern_count_wuxing,
+)
+from bazi_calculator.core.wuxing import WuxingAnalyzer
+from bazi_calculator.core.wuxing_batch import WUXING
+from tests.core.helpers import random_codes
+
+
+class TestPatternRules:
+    """测试格局规则表"""
+
+    def test_compiled_table(self):
+        """测试决策表的维度与优先顺序"""
+        rules = MingGeAnalyzer.PATTERN_RULES
+        table = MingGeAnalyzer.PATTERN_TABLE
+        assert MingGeAnalyzer.PATTERN_COUNT_WUXING == ("金", "木")
+        # 金、木数量均按 0-2、3-8 分为两段
+        assert MingGeAnalyzer.PATTERN_COUNT_BUCKETS.tolist() == [[0, 0, 0, 1, 1, 1, 1, 1, 1]] * 2
+        assert table.shape == (2, 3, 5, 2, 2, 3, 2, 2)
+        # 化气优先于其他全部规则
+        assert (table[1] == 0).all()
+        assert rules[table[0, 0, 0, 1, 0, 0, 0, 0]]["name"] == "建禄格"
+        assert rules[table[0, 2, 0, 1, 1, 1, 0, 0]]["name"] == "从官格"
+        assert rules[table[0, 1, 3, 0, 0, 0, 1, 1]]["name"] == "财格"
+        assert rules[table[0, 1, 4, 0, 0, 0, 1, 1]]["name"] == "普通格局"
+        assert MingGeAnalyzer.PATTERNS[0] == ("正格", "普通格局", "")
+
+    def test_new_rule(self):
+        """测试新增规则只需加入规则表"""
+        rules = MingGeAnalyzer.PATTERN_RULES[:-1] + [
+            {"type": "正格", "name": "润下格", "strength": ("强",), "counts": {"水": (5, 8)}},
+            MingGeAnalyzer.PATTERN_RULES[-1],
+        ]
+        assert _pattern_count_wuxing(rules) == ("金", "木", "水")
+        assert _pattern_count_buckets(rules)[2].tolist() == [0, 0, 0, 0, 0, 1, 1, 1, 1]
+        table = _compile_pattern_rules(rules)
+        assert table.shape[-3:] == (2, 2, 2)
+        assert rules[table[0, 0, 2, 0, 0, 0, 0, 0, 1]]["name"] == "润下格"
+        assert rules[table[0, 0, 2, 1, 0, 0, 0, 0, 1]]["name"] == "建禄格"
+
+    def test_rules_on_all_wuxing_stay_small(self):
+        """测试规则引用全部五行数量时决策表仍按区段而非数量取值增长"""
+        rules = MingGeAnalyzer.PATTERN_RULES[:-1] + [
+            {"type": "正格", "name": f"{wuxing}旺格", "counts": {wuxing: (4, 8)}} for wuxing in ("水", "火", "土")
+        ] + [
+            {"type": "正格", "name": "五行俱全", "counts": {wuxing: (1, 8) for wuxing in ("金", "木", "水", "火", "土")}},
+            MingGeAnalyzer.PATTERN_RULES[-1],
+        ]
+        buckets = _pattern_count_buckets(rules)
+        table = _compile_pattern_rules(rules)
+        assert table.size < 360 * 4 ** 5
+        # 非化气、中和、日主为土、月令不同、非从格、财星最旺时，逐个核对第一条满足的规则
+        def matches(rule, counts):
+            return not rule.get("huaqi") and not rule.get("month_same") and not rule.get("cong") \
+                and "中和" in rule.get("strength", ("中和",)) and "土" in rule.get("day_master_wuxing", ("土",)) \
+                and rule.get("dominant", "cai") == "cai" \
+                and all(low <= counts[WUXING.index(wuxing)] <= high for wuxing, (low, high) in rule.get("counts", {}).items())
+
+        for counts in np.random.default_rng(3).integers(0, 9, (500, 5)):
+            expected = next(index for index, rule in enumerate(rules) if matches(rule, counts))
+            key = (0, 1, 4, 0, 0, 0) + tuple(buckets[i, counts[i]] for i in range(5))
+            assert table[key] == expected
+
+    def test_matches_on_random_dates(self):
+        """测试随机出生时间的批量格局与逐盘判断一致"""
+        rng = random.Random(5)
+        dates = [datetime(1901, 1, 1) + timedelta(seconds=rng.randrange(199 * 365 * 86400)) for _ in range(300)]
+        columns = BaziCalendar.get_all_pillars_many(dates)
+        patterns = MingGeAnalyzer.determine_pattern_many(columns.codes)
+        for i, bazi in enumerate(columns.to_dicts()):
+            expected = MingGeAnalyzer.determine_pattern(bazi)
+            codes = tuple(int(code) for code in columns.codes[i])
+            assert MingGeAnalyzer.describe_pattern(patterns[i], codes, expected["strength"]) == expected
+
+    def test_batch_covers_all_patterns(self):
+        """测试随机干支组合覆盖全部格局且与逐盘判断一致"""
+        codes = random_codes(20000, 8)
+        patterns = MingGeAnalyzer.determine_pattern_many(codes)
+        assert set(patterns.tolist()) >= set(range(7))
+        for i in range(0, len(codes), 10):
+            bazi = BaziCalendar.codes_to_pillars(tuple(int(code) for code in codes[i]), 0, datetime(2000, 1, 1))
+            pattern_type, pattern_name, _ = MingGeAnalyzer.PATTERNS[patterns[i]]
+            result = MingGeAnalyzer.determine_pattern(bazi)
+            assert (result["pattern_type"], result["pattern_name"]) == (pattern_type, pattern_name)
+
+
+class TestRuleTables:
+    """测试性格、事业财运与健康规则表"""
+
+    def test_personality(self):
+        """测试性格表按日主查找且返回副本"""
+        bazi = BaziCalendar.get_all_pillars(datetime(1990, 3, 15, 10, 30))
+        personality = MingGeAnalyzer.analyze_personality(bazi)
+        assert personality["description"].startswith("己土日主")
+        personality["traits"].append("测试")
+        assert "测试" not in MingGeAnalyzer.PERSONALITY_TRAITS["己"]["traits"]
+        bazi["day"]["gan"] = "?"
+        assert MingGeAnalyzer.analyze_personality(bazi)["description"].startswith("?日主")
+
+    def test_career_wealth(self):
+        """测试事业财运按用神、喜神与评分查表"""
+        bazi = BaziCalendar.get_all_pillars(datetime(1990, 3, 15, 10, 30))
+        analysis = WuxingAnalyzer.analyze_comprehensive(bazi)
+        info = analysis["yong_shen_info"]
+        result = MingGeAnalyzer.analyze_career_wealth(bazi, analysis)
+        careers = MingGeAnalyzer.WUXING_CAREERS
+        assert result["suitable_careers"] == list(set(careers[info["yong_shen"]] + careers[info["xi_shen"]]))
+
+        analysis["scores"] = dict(analysis["scores"], cai=5.5, guansha=2.0)
+        analysis["yong_shen_info"] = dict(info, ji_shen=["水"])
+        result = MingGeAnalyzer.analyze_career_wealth(bazi, analysis)
+        assert result["wealth_analysis"] == ["财星较旺，财运较佳，善于理财", "水为忌神，不宜投资航运、水产等"]
+        assert result["career_achievement"] == ["官星较弱，不宜追求权力，适合技术或专业领域"]
+
+    def test_health(self):
+        """测试健康提示"""
+        bazi = BaziCalendar.get_all_pillars(datetime(1990, 3, 15, 10, 30))
+        context = WuxingAnalyzer.build_context(bazi)
+        context.wuxing_count = {"金": 0, "木": 5, "水": 1, "火": 1, "土": 1}
+        result = MingGeAnalyzer.analyze_health(bazi, context)
+        assert result["health_issues"] == ["缺金，注意肺,呼吸系统,皮肤,大肠健康", "木过多，肝,胆,眼睛,筋骨可能过旺"]
+        assert result["health_suggestions"][-1] == "日主为土，要特别注意脾,胃,肌肉,消化系统的保养"
+        assert result["main_organs"] == MingGeAnalyzer.WUXING_HEALTH["土"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
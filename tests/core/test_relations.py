@@ -0,0 +1,77 @@
+"""干支关系模块测试"""
+
+import random
+import pytest
+import numpy as np
+from datetime import datetime, timedelta
+from bazi_calculator.core.calendar import BaziCalendar
+from bazi_calculator.core.mingge import MingGeAnalyzer
+from bazi_calculator.core.relations import GanzhiRelations
+from tests.core.helpers import pillar_codes
+
+
+class TestGanzhiRelations:
+    """测试干支关系检测"""
+
+    def test_pair_matrices(self):
+        """测试两两关系矩阵"""
+        R = GanzhiRelations
+        for i in range(12):
+            assert R.get_zhi_relation(i, (i + 6) % 12) & R.CHONG
+            for j in range(12):
+                assert R.get_zhi_relation(i, j) == R.get_zhi_relation(j, i)
+        assert R.get_zhi_relation(0, 1) == R.LIUHE
+        assert R.get_zhi_relation(5, 8) == R.LIUHE | R.XING | R.PO
+        assert R.get_zhi_relation(2, 5) == R.XING | R.HAI
+        assert R.get_zhi_relation(6, 6) == R.ZIXING
+        assert R.get_zhi_relation(0, 0) == 0
+        assert R.get_gan_relation(0, 5) == R.GAN_HE
+        assert R.get_gan_relation(0, 6) == R.GAN_CHONG
+        assert R.get_gan_he(5, 0) == ("土", "甲己化土")
+        assert R.get_gan_he(9, 4) == ("火", "戊癸化火")
+        assert R.get_gan_he(0, 1) == ("", "")
+
+    def test_detect(self):
+        """测试整盘检测"""
+        # 甲申 丙子 戊辰 庚午：申子辰三合水局、子午冲、甲庚冲
+        result = GanzhiRelations.detect(pillar_codes("甲申", "丙子", "戊辰", "庚午"))
+        assert result["triples"] == [{
+            "pillars": ("year", "month", "day"), "relation": "三合",
+            "name": "申子辰三合水局", "wuxing": "水",
+        }]
+        zhi_names = [item["name"] for item in result["zhi"]]
+        assert "子午冲" in zhi_names
+        assert "申子半合" in zhi_names
+        assert [item["name"] for item in result["gan"]] == ["甲庚冲"]
+        assert set(result["names"]) == {"天干相冲", "半合", "六冲", "三合"}
+
+        result = GanzhiRelations.detect(pillar_codes("甲寅", "己巳", "甲申", "丙寅"))
+        assert result["gan"][0]["wuxing"] == "土"
+        assert [item["name"] for item in result["triples"]] == ["寅巳申三刑"]
+
+    def test_flags_many_matches_scalar(self):
+        """测试批量位掩码与逐盘计算一致"""
+        rng = random.Random(3)
+        dates = [datetime(1901, 1, 1) + timedelta(seconds=rng.randrange(199 * 365 * 86400)) for _ in range(500)]
+        columns = BaziCalendar.get_all_pillars_many(dates)
+        flags = GanzhiRelations.get_flags_many(columns.codes)
+        for i, date in enumerate(dates):
+            codes = BaziCalendar.get_chart_codes(date)[:8]
+            assert int(flags[i]) == GanzhiRelations.get_flags(codes)
+            assert GanzhiRelations.detect(codes)["flags"] == int(flags[i])
+        assert GanzhiRelations.get_flags_many(np.empty((0, 8), dtype=np.int8)).shape == (0,)
+
+    def test_huaqi(self):
+        """测试化气格使用天干五合"""
+        bazi = BaziCalendar.get_all_pillars(datetime(2024, 3, 15, 10, 30))
+        bazi["month"].update(gan="己", gan_wuxing="土")
+        bazi["day"].update(gan="甲", gan_wuxing="木")
+        bazi["year"].update(zhi="辰", zhi_wuxing="土")
+        result = MingGeAnalyzer._check_huaqi(bazi)
+        assert result["is_huaqi"]
+        assert result["pattern_name"] == "甲己化土"
+        assert "月干己" in result["description"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,83 @@
+"""八字反查模块测试"""
+
+import pytest
+from datetime import datetime, timedelta
+from bazi_calculator.core.calendar import BaziCalendar
+from bazi_calculator.core.jieqi import JieqiCalculator
+from bazi_calculator.core.reverse import BaziReverseSearch
+
+
+def _bazi_string(birth_date: datetime) -> str:
+    """排盘并返回八字字符串"""
+    bazi = BaziCalendar.get_all_pillars(birth_date)
+    return " ".join(bazi[pillar]["full"] for pillar in ("year", "month", "day", "hour"))
+
+
+class TestBaziReverseSearch:
+    """测试八字反查"""
+
+    def test_parse_pillars(self):
+        """测试四柱解析"""
+        assert BaziReverseSearch.parse_pillars("甲子 乙丑 丙寅 丁卯") == (0, 1, 2, 3)
+        assert BaziReverseSearch.parse_pillars("甲子乙丑丙寅丁卯") == (0, 1, 2, 3)
+        assert BaziReverseSearch.parse_pillars(["甲子", "乙丑", "丙寅", "丁卯"]) == (0, 1, 2, 3)
+
+    def test_parse_invalid(self):
+        """测试无效四柱"""
+        with pytest.raises(ValueError):
+            BaziReverseSearch.parse_pillars("甲辰 丁卯 庚午")
+        with pytest.raises(ValueError):
+            BaziReverseSearch.parse_pillars("甲丑 丁卯 庚午 辛巳")
+        with pytest.raises(ValueError):
+            BaziReverseSearch.parse_pillars("甲辰 丁卯 庚午 辛X")
+
+    def test_known_chart(self):
+        """测试已知八字的反查结果"""
+        intervals = BaziReverseSearch.find_intervals(
+            "甲辰 丁卯 庚午 辛巳", datetime(1900, 1, 1), datetime(2100, 1, 1)
+        )
+        assert intervals == [
+            (datetime(1964, 3, 22, 9), datetime(1964, 3, 22, 11)),
+            (datetime(2024, 3, 7, 9), datetime(2024, 3, 7, 11)),
+        ]
+
+    def test_roundtrip(self):
+        """测试排盘结果反查后包含原时刻，且各区间排盘结果相同"""
+        start, end = datetime(1950, 1, 1), datetime(2050, 1, 1)
+        birth_date = datetime(1951, 1, 3, 5, 7)
+        while birth_date < end:
+            bazi = _bazi_string(birth_date)
+            intervals = BaziReverseSearch.find_intervals(bazi, start, end)
+            assert any(a <= birth_date < b for a, b in intervals)
+            for a, b in intervals:
+                assert _bazi_string(a) == bazi
+                assert _bazi_string(b - timedelta(seconds=1)) == bazi
+            birth_date += timedelta(days=367, hours=5, minutes=13)
+
+    def test_jieqi_boundary_clipped(self):
+        """测试区间在节气交接时刻截断"""
+        lichun = JieqiCalculator.calculate_jieqi_datetime(2024, 0)
+        before = _bazi_string(lichun - timedelta(seconds=1))
+        after = _bazi_string(lichun)
+        start, end = datetime(2024, 1, 1), datetime(2025, 1, 1)
+        assert BaziReverseSearch.find_intervals(before, start, end)[-1][1] == lichun
+        assert BaziReverseSearch.find_intervals(after, start, end)[0][0] == lichun
+
+    def test_zi_hour_two_slots(self):
+        """测试子时包括当日0时和23时两段"""
+        bazi = _bazi_string(datetime(2024, 6, 1, 0, 30))
+        intervals = BaziReverseSearch.find_intervals(bazi, datetime(2024, 6, 1), datetime(2024, 6, 2))
+        assert intervals == [
+            (datetime(2024, 6, 1, 0), datetime(2024, 6, 1, 1)),
+            (datetime(2024, 6, 1, 23), datetime(2024, 6, 2, 0)),
+        ]
+
+    def test_impossible_chart(self):
+        """测试五虎遁、五鼠遁不符的八字无结果"""
+        start, end = datetime(1900, 1, 1), datetime(2100, 1, 1)
+        assert BaziReverseSearch.find_intervals("甲辰 甲寅 庚午 辛巳", start, end) == []
+        assert BaziReverseSearch.find_intervals("甲辰 丁卯 庚午 丙申", start, end) == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,55 @@
+"""神煞模块测试"""
+
+import random
+import pytest
+from datetime import datetime, timedelta
+from bazi_calculator.core.calendar import BaziCalendar
+from bazi_calculator.core.shensha import ShenshaCalculator
+from tests.core.helpers import pillar_codes
+
+
+class TestShenshaCalculator:
+    """测试神煞计算"""
+
+    def test_detect(self):
+        """测试单盘神煞及所在柱"""
+        # 庚午 己卯 己卯 己巳
+        result = ShenshaCalculator.detect(pillar_codes("庚午", "己卯", "己卯", "己巳"))
+        assert result["pillars"] == {
+            "禄神": ["year"], "桃花": ["month", "day"], "驿马": ["hour"], "将星": ["month"],
+        }
+        assert result["names"] == ["禄神", "桃花", "驿马", "将星"]
+        assert ShenshaCalculator.flag_names(result["flags"]) == result["names"]
+
+    def test_day_pillar_shensha(self):
+        """测试魁罡、空亡、天乙贵人与月德"""
+        # 辛丑 丙寅 庚辰 乙酉：庚辰魁罡，甲戌旬空申酉，日干庚见丑、年干辛见寅为贵人
+        result = ShenshaCalculator.detect(pillar_codes("辛丑", "丙寅", "庚辰", "乙酉"))
+        assert result["pillars"]["魁罡"] == ["day"]
+        assert result["pillars"]["空亡"] == ["hour"]
+        assert result["pillars"]["天乙贵人"] == ["year", "month"]
+        # 寅月月德在丙
+        assert result["pillars"]["月德"] == ["month"]
+
+    def test_flags_many_matches_scalar(self):
+        """测试批量位掩码与逐盘计算一致"""
+        rng = random.Random(5)
+        dates = [datetime(1901, 1, 1) + timedelta(seconds=rng.randrange(199 * 365 * 86400)) for _ in range(500)]
+        columns = BaziCalendar.get_all_pillars_many(dates)
+        flags = columns.shensha_flags()
+        for i, date in enumerate(dates):
+            bazi = BaziCalendar.get_all_pillars(date, include_shensha=True)
+            assert int(flags[i]) == bazi["shensha"]["flags"]
+            assert int(flags[i]) == ShenshaCalculator.get_flags(BaziCalendar.get_chart_codes(date)[:8])
+            assert columns.nayin_strings("day")[i] == bazi["day"]["nayin"]
+
+    def test_shensha_opt_in(self):
+        """测试神煞默认不附带在四柱字典中"""
+        date = datetime(1990, 3, 15, 10, 30)
+        assert "shensha" not in BaziCalendar.get_all_pillars(date)
+        codes = BaziCalendar.get_chart_codes(date)[:8]
+        assert BaziCalendar.get_all_pillars(date, include_shensha=True)["shensha"] == ShenshaCalculator.detect(codes)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,74 @@
+"""真太阳时模块测试"""
+
+import pytest
+from datetime import datetime
+from bazi_calculator.core.calendar import BaziCalendar
+from bazi_calculator.core.solar_time import TrueSolarTime
+from bazi_calculator.data.city_gazetteer import CityGazetteer
+
+
+class TestCityGazetteer:
+    """测试城市经纬度查询"""
+
+    def test_get_longitude(self):
+        """测试经度查询与名称规范化"""
+        assert CityGazetteer.get_longitude("北京") == 116.41
+        assert CityGazetteer.get_longitude("北京市") == 116.41
+        assert CityGazetteer.get_longitude(" 乌鲁木齐市 ") == 87.62
+        assert CityGazetteer.get_longitude("香港特别行政区") == 114.17
+        assert CityGazetteer.get_longitude("不存在的城市") is None
+
+    def test_all_cities_in_range(self):
+        """测试收录城市的经纬度范围"""
+        for name in CityGazetteer.get_all_cities():
+            longitude, latitude = CityGazetteer.get_location(name)
+            assert 73 <= longitude <= 135
+            assert 18 <= latitude <= 54
+
+
+class TestTrueSolarTime:
+    """测试真太阳时换算"""
+
+    def test_equation_of_time_table(self):
+        """测试均时差表的极值位置"""
+        table = TrueSolarTime.EQUATION_OF_TIME
+        assert len(table) == 366
+        assert -15 * 60 < min(table) < -14 * 60
+        assert 16 * 60 < max(table) < 17 * 60
+        assert datetime(2023, 2, 12).timetuple().tm_yday - 1 == pytest.approx(table.index(min(table)), abs=2)
+        assert datetime(2023, 11, 3).timetuple().tm_yday - 1 == pytest.approx(table.index(max(table)), abs=2)
+
+    def test_longitude_offset(self):
+        """测试经度时差：每度4分钟"""
+        date = datetime(2024, 4, 15, 12, 0)
+        equation = TrueSolarTime.get_equation_of_time(date)
+        assert TrueSolarTime.get_correction(date, 120.0) == equation
+        assert TrueSolarTime.get_correction(date, 90.0) == equation - 120 * 60
+        assert TrueSolarTime.get_correction(date, 75.0, standard_meridian=75.0) == equation
+
+    def test_correct_by_city(self):
+        """测试按城市换算"""
+        date = datetime(2024, 2, 11, 12, 0)
+        assert TrueSolarTime.correct(date, "乌鲁木齐") == TrueSolarTime.correct(date, 87.62)
+        assert TrueSolarTime.correct(date, "上海") > TrueSolarTime.correct(date, "北京")
+
+    def test_invalid_location(self):
+        """测试无效出生地"""
+        with pytest.raises(ValueError):
+            TrueSolarTime.correct(datetime(2024, 1, 1), "不存在的城市")
+        with pytest.raises(ValueError):
+            TrueSolarTime.correct(datetime(2024, 1, 1), 200)
+
+    def test_hour_pillar_changes(self):
+        """测试西部城市的时柱按真太阳时确定"""
+        date = datetime(2024, 6, 1, 9, 30)
+        clock = BaziCalendar.get_all_pillars(date)
+        solar = BaziCalendar.get_all_pillars(date, location="乌鲁木齐")
+        assert clock["hour"]["zhi"] == "巳"
+        assert solar["hour"]["zhi"] == "辰"
+        assert solar["birth_info"]["date"] == date
+        assert solar["birth_info"]["true_solar_time"] == TrueSolarTime.correct(date, "乌鲁木齐")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,93 @@
+"""日主强弱评分模型模块测试"""
+
+import json
+import pytest
+import numpy as np
+from datetime import datetime
+from unittest.mock import patch
+from bazi_calculator.core.calendar import BaziCalendar
+from bazi_calculator.core.strength import StrengthModel
+from bazi_calculator.core.wuxing import WuxingAnalyzer
+from bazi_calculator.core.wuxing_batch import BatchWuxingAnalyzer, SCORE_NAMES, STRENGTHS
+from tests.core.helpers import random_codes
+
+
+class TestStrengthModel:
+    """测试强弱评分模型"""
+
+    def test_default_matches_analyzer(self):
+        """测试默认模型与 WuxingAnalyzer 的评分逐位一致"""
+        model = StrengthModel()
+        codes = random_codes(2000, 1)
+        scores, strength = model.score_many(codes)
+        expected = BatchWuxingAnalyzer.score_strength(codes)
+        assert (scores == expected[0]).all() and (strength == expected[1]).all()
+        for row in codes[:300].tolist():
+            bazi = BaziCalendar.codes_to_pillars(tuple(row), 0, datetime(2000, 1, 1))
+            assert model.score(row) == WuxingAnalyzer.analyze_day_master_strength(bazi)[::-1]
+
+    def test_tensor(self):
+        """测试旺相休囚死分值张量"""
+        model = StrengthModel.from_preset("seasonal")
+        assert model.tensor.shape == (2, 5, 5, 12)
+        # 日主为金（编号0），寅月（木当令）：木为财星且旺，金囚，火相，水休，土死
+        assert model.tensor[0, 0, :, 2].tolist() == pytest.approx([8.0, 7.5, 4.0, 7.2, 4.8])
+        assert model.tensor[1, 0, 1, 2] == 2.5 * 1.5
+
+    def test_hidden_stems(self):
+        """测试按藏干计分"""
+        model = StrengthModel.from_preset("hidden_stems")
+        # 日主甲，寅支藏甲0.6、丙0.3、戊0.1：比劫3.6、食伤0.6、财星0.25
+        row = model.zhi_kernel[1, 2, 2]
+        assert dict(zip(SCORE_NAMES, row.tolist())) == pytest.approx(
+            {"day_master": 0, "yin": 0, "bijie": 3.6, "shishang": 0.6, "cai": 0.25, "guansha": 0}
+        )
+
+    def test_models_side_by_side(self):
+        """测试多个模型并列批量评分与逐盘评分一致"""
+        models = [StrengthModel.from_preset(name) for name in StrengthModel.PRESETS]
+        models.append(StrengthModel({"thresholds": {"strong": 2.0}}))
+        codes = random_codes(500, 2)
+        scores, strength = StrengthModel.score_models_many(models, codes)
+        assert scores.shape == (4, 500, 6) and strength.shape == (4, 500)
+        for m, model in enumerate(models):
+            for i, row in enumerate(codes.tolist()):
+                result, label = model.score(row)
+                assert [result[name] for name in SCORE_NAMES] == scores[m, i].tolist()
+                assert STRENGTHS.index(label) == strength[m, i]
+        assert (strength[3] >= strength[0]).all()
+
+    def test_context_uses_model(self):
+        """测试分析上下文与批量分析按模型评分"""
+        model = StrengthModel.from_preset("seasonal")
+        bazi = BaziCalendar.get_all_pillars(datetime(1990, 3, 15, 10, 30))
+        with patch.object(WuxingAnalyzer, "_judge_strength") as judge:
+            context = WuxingAnalyzer.build_context(bazi, model)
+        # 指定模型时不再做默认评分，只统计五行
+        assert judge.call_count == 0
+        assert context.wuxing_count == WuxingAnalyzer.count_wuxing_in_bazi(bazi)
+        assert (context.scores, context.strength) == model.score_bazi(bazi)
+        analysis = WuxingAnalyzer.analyze_comprehensive(bazi, context)
+
+        codes = BaziCalendar.get_chart_codes(datetime(1990, 3, 15, 10, 30))[:8]
+        result = BatchWuxingAnalyzer.analyze(np.array([codes]), model)
+        assert result.to_dict(0) == analysis
+
+    def test_config(self, tmp_path):
+        """测试配置文件与无效配置"""
+        path = tmp_path / "model.json"
+        path.write_text(json.dumps({"name": "custom", "gan_points": {"same": 12}}), encoding="utf-8")
+        model = StrengthModel.load(str(path))
+        assert model.name == "custom"
+        assert model.gan_points["same"] == 12.0 and model.gan_points["yin"] == 8.0
+        assert StrengthModel(model.to_config()).to_config() == model.to_config()
+        with pytest.raises(ValueError):
+            StrengthModel({"weights": {}})
+        with pytest.raises(ValueError):
+            StrengthModel({"seasonal": {"旺盛": 1.2}})
+        with pytest.raises(ValueError):
+            StrengthModel.from_preset("unknown")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,70 @@
+"""五行分析模块测试"""
+
+import pytest
+from datetime import datetime
+from unittest.mock import patch
+from bazi_calculator.core.calendar import BaziCalendar
+from bazi_calculator.core.mingge import MingGeAnalyzer, main
+from bazi_calculator.core.relations import GanzhiRelations
+from bazi_calculator.core.wuxing import WuxingAnalyzer
+
+
+BAZI = BaziCalendar.get_all_pillars(datetime(1990, 3, 15, 10, 30))
+
+
+class TestAnalysisContext:
+    """测试分析上下文"""
+
+    def test_context_values(self):
+        """测试上下文中的统计与评分"""
+        context = WuxingAnalyzer.build_context(BAZI)
+        assert context.wuxing_count == WuxingAnalyzer.count_wuxing_in_bazi(BAZI)
+        assert context.day_master == "己"
+        assert context.wuxing_relation["火"] == "yin"
+        assert context.wuxing_relation["木"] == "guansha"
+        assert WuxingAnalyzer.analyze_day_master_strength(BAZI) == (context.strength, context.scores)
+        assert context.relations == GanzhiRelations.detect_bazi(BAZI)
+
+    def test_full_report_computes_once(self):
+        """测试共用上下文的完整报告中强弱、用神、干支关系各只计算一次"""
+        with patch.object(WuxingAnalyzer, "_judge_strength", wraps=WuxingAnalyzer._judge_strength) as judge, \
+                patch.object(WuxingAnalyzer, "_determine_yong_shen", wraps=WuxingAnalyzer._determine_yong_shen) as yong, \
+                patch.object(GanzhiRelations, "detect_bazi", wraps=GanzhiRelations.detect_bazi) as detect:
+            context = WuxingAnalyzer.build_context(BAZI)
+            wuxing = WuxingAnalyzer.analyze_comprehensive(BAZI, context)
+            mingge = MingGeAnalyzer.analyze_comprehensive(BAZI, wuxing, context)
+        assert judge.call_count == 1
+        assert yong.call_count == 1
+        assert detect.call_count == 1
+        assert wuxing == WuxingAnalyzer.analyze_comprehensive(BAZI)
+        assert mingge == MingGeAnalyzer.analyze_comprehensive(BAZI, wuxing)
+
+    def test_results_do_not_alias_context(self):
+        """测试修改分析结果不影响共用上下文的后续分析"""
+        context = WuxingAnalyzer.build_context(BAZI)
+        expected_wuxing = WuxingAnalyzer.analyze_comprehensive(BAZI)
+        expected_mingge = MingGeAnalyzer.analyze_comprehensive(BAZI, expected_wuxing)
+
+        result = WuxingAnalyzer.analyze_comprehensive(BAZI, context)
+        result["scores"]["yin"] = -1.0
+        result["yong_shen_info"]["yong_shen"] = "X"
+        result["yong_shen_info"]["ji_shen"].append("X")
+        result["yong_shen_info"]["scores"]["cai"] = -1.0
+        info = WuxingAnalyzer.determine_yong_shen(BAZI, context)
+        info["xi_shen"] = "X"
+        WuxingAnalyzer.analyze_day_master_strength(BAZI, context)[1]["bijie"] = -1.0
+        mingge = MingGeAnalyzer.analyze_comprehensive(BAZI, expected_wuxing, context)
+        mingge["relation_analysis"]["names"].append("X")
+        mingge["relation_analysis"]["zhi"][0]["name"] = "X"
+
+        assert WuxingAnalyzer.analyze_comprehensive(BAZI, context) == expected_wuxing
+        assert MingGeAnalyzer.analyze_comprehensive(BAZI, expected_wuxing, context) == expected_mingge
+
+    def test_benchmark(self, capsys):
+        """测试基准测试命令"""
+        main(["--benchmark", "--count", "20"])
+        assert "共用上下文" in capsys.readouterr().out
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,56 @@
+"""批量五行分析模块测试"""
+
+import random
+import pytest
+import numpy as np
+from datetime import datetime, timedelta
+from bazi_calculator.core.calendar import BaziCalendar
+from bazi_calculator.core.wuxing import WuxingAnalyzer
+from bazi_calculator.core.wuxing_batch import BatchWuxingAnalyzer, SCORE_NAMES, STRENGTHS, WUXING
+from tests.core.helpers import random_codes
+
+
+class TestBatchWuxingAnalyzer:
+    """测试批量五行分析"""
+
+    def test_matches_scalar_on_random_dates(self):
+        """测试随机出生时间的批量结果与逐盘综合分析一致"""
+        rng = random.Random(7)
+        dates = [datetime(1901, 1, 1) + timedelta(seconds=rng.randrange(199 * 365 * 86400)) for _ in range(500)]
+        columns = BaziCalendar.get_all_pillars_many(dates)
+        result = BatchWuxingAnalyzer.analyze(columns.codes)
+        assert len(result) == len(dates)
+        for i, bazi in enumerate(columns.to_dicts()):
+            assert result.to_dict(i) == WuxingAnalyzer.analyze_comprehensive(bazi)
+
+    def test_matches_scalar_on_random_codes(self):
+        """测试随机干支组合（覆盖三种强弱与各种用神取法）与逐盘综合分析一致"""
+        codes = random_codes(3000, 11)
+        result = BatchWuxingAnalyzer.analyze(codes)
+        assert set(result.strength_names()) == set(STRENGTHS)
+        for i in range(len(codes)):
+            bazi = BaziCalendar.codes_to_pillars(tuple(int(code) for code in codes[i]), 0, datetime(2000, 1, 1))
+            context = WuxingAnalyzer.build_context(bazi)
+            assert [result.scores[i, j] for j in range(6)] == [context.scores[name] for name in SCORE_NAMES]
+            assert result.to_dict(i) == WuxingAnalyzer.analyze_comprehensive(bazi, context)
+
+    def test_columns(self):
+        """测试按列结果"""
+        codes = BaziCalendar.get_chart_codes(datetime(1990, 3, 15, 10, 30))[:8]
+        result = BatchWuxingAnalyzer.analyze(np.array([codes]))
+        bazi = BaziCalendar.get_all_pillars(datetime(1990, 3, 15, 10, 30))
+        count = WuxingAnalyzer.count_wuxing_in_bazi(bazi)
+        assert result.wuxing_count[0].tolist() == [count[wuxing] for wuxing in WUXING]
+        assert BatchWuxingAnalyzer.count_wuxing(codes).shape == (1, 5)
+        empty = BatchWuxingAnalyzer.analyze(np.empty((0, 8), dtype=np.int8))
+        assert len(empty) == 0 and empty.to_dicts() == []
+
+    def test_analyze_many_hour_variants(self):
+        """测试十二时辰八字经 analyze_many 批量分析与逐盘综合分析一致"""
+        bazis = BaziCalendar.get_hour_variants(datetime(1990, 3, 15))
+        assert WuxingAnalyzer.analyze_many(bazis) == [WuxingAnalyzer.analyze_comprehensive(bazi) for bazi in bazis]
+        assert WuxingAnalyzer.analyze_many([]) == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
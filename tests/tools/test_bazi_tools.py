@@ -3,6 +3,8 @@
 import pytest
 from datetime import datetime
 
+from bazi_calculator.core.incremental import IncrementalChart
+from bazi_calculator.tools.bazi.intelligent_parser import IntelligentBaziCalculator
 from bazi_calculator.tools.bazi.time_parser import parse_birth_time, validate_time
 from bazi_calculator.tools.bazi.year_pillar import calculate_year_pillar
 from bazi_calculator.tools.bazi.month_pillar import calculate_month_pillar
@@ -46,6 +48,37 @@ class TestBaziTimeParser:
         assert result["month"] == 3
         assert result["day"] == 15
 
+    def test_parse_birth_time_lunar(self):
+        """测试农历时间换算为公历"""
+        result = parse_birth_time.invoke({
+            "time_description": "2023年闰2月29日10点30分",
+            "gender": "男",
+            "calendar_type": "农历"
+        })
+
+        assert result["month"] == 2
+        assert result["day"] == 29
+        assert result["is_leap_month"] is True
+        assert result["date"] == datetime(2023, 4, 19, 10, 30)
+
+        result = parse_birth_time.invoke({
+            "time_description": "2024年2月30日8点",
+            "gender": "女",
+            "calendar_type": "农历"
+        })
+
+        assert result["is_leap_month"] is False
+        assert result["date"] == datetime(2024, 4, 8, 8, 0)
+
+    def test_parse_birth_time_date_only(self):
+        """测试只有日期（时辰未知）的时间描述"""
+        result = parse_birth_time.invoke({
+            "time_description": "1990年3月15日",
+            "gender": "男"
+        })
+
+        assert result["date"] == datetime(1990, 3, 15)
+
     def test_validate_time_valid(self):
         """测试验证有效时间"""
         result = validate_time.invoke(datetime(2024, 3, 15, 10, 30))
@@ -143,3 +176,23 @@ class TestBaziWuxingAnalysis:
         assert "xi_shen" in result
         assert "ji_shen" in result
         assert "strength" in result
+
+
+class TestIntelligentUpdateBirthTime:
+    """测试智能计算器修改出生时间"""
+
+    def test_update_uses_given_result(self):
+        """测试传入较早的结果时按该结果的出生时间增量重算，而不是沿用最近一次排盘"""
+        calculator = IntelligentBaziCalculator(None)
+        first = {"parsed_info": {"solar_date": datetime(1990, 3, 15, 10, 30)}}
+        other = {"parsed_info": {"solar_date": datetime(2001, 8, 1, 2, 0)}}
+        new_date = datetime(1990, 3, 15, 23, 30)
+
+        calculator.update_birth_time(other, datetime(2001, 8, 1, 5, 0))
+        updated = calculator.update_birth_time(first, new_date)
+
+        expected = IncrementalChart(first["parsed_info"]["solar_date"])
+        assert updated["changed_pillars"] == expected.update(new_date)
+        assert updated["parsed_info"]["solar_date"] == new_date
+        assert updated["bazi_result"]["day"]["full"] == expected.bazi["day"]["full"]
+        assert calculator.update_birth_time(updated, new_date)["changed_pillars"] == []